@@ -2,6 +2,7 @@
 PyNOX — WC3 자동 재접속 매크로 (엔트리포인트)
 """
 import ctypes
+import multiprocessing
 import os
 import sys
 
@@ -11,6 +12,11 @@ if getattr(sys, "frozen", False):
     if _base not in sys.path:
         sys.path.insert(0, _base)
 
+# --headless: Qt 없이 워커만 실행 (PySide6 import 전에 분기 → 빠른 시작·저메모리)
+if __name__ == "__main__" and "--headless" in sys.argv:
+    from src.macro.cli import main as _headless_main
+    sys.exit(_headless_main([a for a in sys.argv[1:] if a != "--headless"]))
+
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QColor, QFont, QLinearGradient, QPainter
 from PySide6.QtWidgets import QApplication, QLabel, QProgressBar, QVBoxLayout, QWidget
@@ -100,6 +106,9 @@ class _Splash(QWidget):
 
 
 if __name__ == "__main__":
+    # 워커 자식 프로세스(spawn)로 실행된 경우 여기서 자식 역할만 수행 후 종료 (exe 빌드 필수)
+    multiprocessing.freeze_support()
+
     if not _is_admin():
         ctypes.windll.shell32.ShellExecuteW(
             None, "runas", sys.executable,
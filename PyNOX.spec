@@ -70,6 +70,8 @@ a = Analysis(
         # 프로세스
         "psutil",
         "psutil._pswindows",
+        # 워커 프로세스 상태 공유 (macro/worker_process.py)
+        "multiprocessing.shared_memory",
         # 키보드 후킹
         "pynput",
         "pynput.keyboard",
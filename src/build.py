@@ -14,7 +14,7 @@ _DIST_TMP = os.path.join(_ROOT, "dist", "_build_tmp")  # PyInstaller 임시 출
 _SRC     = os.path.join(_ROOT, "src")
 
 # 배포 폴더에 복사하지 않을 파일 (개발 도구)
-_SRC_EXCLUDES = {"build.py", "release.py", "__pycache__"}
+_SRC_EXCLUDES = {"build.py", "release.py", "__pycache__", "sim"}
 
 
 def _folder_size_mb(path: str) -> float:
@@ -0,0 +1,66 @@
+"""
+core/cancel.py — threading.Event 기반 취소 토큰 (중지·사망 신호로 대기 즉시 해제)
+"""
+import threading
+import weakref
+
+from src.core.clock import MONOTONIC
+
+
+class CancelToken:
+    """취소 토큰.
+
+    - wait(timeout): 취소되면 즉시 True 반환 (폴링 없이 블록)
+    - sleep(seconds): 끝까지 잤으면 True, 도중 취소되면 False
+    - child(): 부모 취소 시 함께 취소되는 하위 토큰 (하위 취소는 부모에 영향 없음)
+    - is_set()/set() 별칭 제공 → threading.Event 자리에 그대로 사용 가능
+    - 대기는 주입된 시계(clock)를 따른다 (하위 토큰은 부모 시계 상속)
+    """
+
+    def __init__(self, parent: "CancelToken | None" = None, clock=None):
+        self._clock    = clock or (parent._clock if parent is not None else MONOTONIC)
+        self._event    = self._clock.event()
+        self._lock     = threading.Lock()
+        self._children: "weakref.WeakSet[CancelToken]" = weakref.WeakSet()
+        if parent is not None:
+            parent._adopt(self)
+
+    def _adopt(self, child: "CancelToken"):
+        with self._lock:
+            if not self._event.is_set():
+                self._children.add(child)
+                return
+        child.cancel()
+
+    # ── 상태 ──────────────────────────────────────
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            children = list(self._children)
+            self._children.clear()
+        for c in children:
+            c.cancel()
+
+    def child(self) -> "CancelToken":
+        return CancelToken(parent=self)
+
+    # ── 대기 ──────────────────────────────────────
+    def wait(self, timeout: "float | None" = None) -> bool:
+        """취소될 때까지(최대 timeout 초) 대기. 취소됐으면 True."""
+        return self._clock.wait(self._event, timeout)
+
+    def sleep(self, seconds: float) -> bool:
+        """seconds 동안 대기. 중간에 취소되면 즉시 False."""
+        if seconds <= 0:
+            return not self._event.is_set()
+        return not self._clock.wait(self._event, seconds)
+
+    # ── threading.Event 호환 ──────────────────────
+    is_set = cancelled.fget
+    set    = cancel
@@ -213,3 +213,108 @@ def _get_pixel_at_cursor() -> "tuple[int, int, int] | None":
     if color == 0xFFFFFFFF:
         return None
     return (color & 0xFF, (color >> 8) & 0xFF, (color >> 16) & 0xFF)
+
+
+# ══════════════════════════════════════════════════
+#  다중 픽셀 프로브 (GDI 리소스 재사용)
+# ══════════════════════════════════════════════════
+class PixelProbe:
+    """여러 클라이언트 좌표 픽셀을 한 번의 캡처로 샘플링하는 프로브.
+
+    mode="printwindow": PrintWindow 렌더 (백그라운드 동작). 메모리 DC/비트맵은
+                        창 크기가 바뀔 때만 재생성해 매 샘플 생성/해제 비용을 없앰.
+    mode="region":      좌표 묶음의 외접 사각형만 클라이언트 DC 에서 BitBlt
+                        (포어그라운드 전용, 가장 저렴).
+    """
+
+    def __init__(self, points: "list[tuple[int, int]]", mode: str = "printwindow"):
+        if not points:
+            raise ValueError("points 가 비어 있습니다")
+        self.points = [(int(x), int(y)) for x, y in points]
+        self.mode   = mode if mode in ("printwindow", "region") else "printwindow"
+        xs = [x for x, _ in self.points]
+        ys = [y for _, y in self.points]
+        self._bbox = (min(xs), min(ys), max(xs) + 1, max(ys) + 1)
+        self._key      = None    # (hwnd, w, h) — 캐시된 GDI 리소스 키
+        self._mfc_dc   = None
+        self._save_dc  = None
+        self._bmp      = None
+        self._hwnd_dc  = None
+
+    def _release(self):
+        if self._bmp is not None:
+            try:
+                win32gui.DeleteObject(self._bmp.GetHandle())
+            except Exception:
+                pass
+        if self._save_dc is not None:
+            try:
+                self._save_dc.DeleteDC()
+            except Exception:
+                pass
+        if self._mfc_dc is not None:
+            try:
+                self._mfc_dc.DeleteDC()
+            except Exception:
+                pass
+        if self._hwnd_dc is not None and self._key is not None:
+            try:
+                win32gui.ReleaseDC(self._key[0], self._hwnd_dc)
+            except Exception:
+                pass
+        self._key = self._mfc_dc = self._save_dc = self._bmp = self._hwnd_dc = None
+
+    def close(self):
+        self._release()
+
+    def _ensure(self, hwnd: int, w: int, h: int) -> bool:
+        key = (hwnd, w, h)
+        if key == self._key:
+            return True
+        self._release()
+        hwnd_dc = (win32gui.GetWindowDC(hwnd) if self.mode == "printwindow"
+                   else win32gui.GetDC(hwnd))
+        if not hwnd_dc:
+            return False
+        self._key     = key
+        self._hwnd_dc = hwnd_dc
+        self._mfc_dc  = win32ui.CreateDCFromHandle(hwnd_dc)
+        self._save_dc = self._mfc_dc.CreateCompatibleDC()
+        self._bmp     = win32ui.CreateBitmap()
+        self._bmp.CreateCompatibleBitmap(self._mfc_dc, w, h)
+        self._save_dc.SelectObject(self._bmp)
+        return True
+
+    def sample(self, hwnd: "int | None" = None) -> "list[tuple[int, int, int]] | None":
+        """각 좌표의 RGB 목록 반환. 창 없음/좌표 범위 밖/캡처 실패 시 None."""
+        hwnd = hwnd or find_war3_hwnd()
+        if not hwnd:
+            return None
+        try:
+            rc = ctypes.wintypes.RECT()
+            _user32.GetClientRect(hwnd, ctypes.byref(rc))
+            cw, ch = rc.right, rc.bottom
+            x0, y0, x1, y1 = self._bbox
+            if cw <= 0 or ch <= 0 or x0 < 0 or y0 < 0 or x1 > cw or y1 > ch:
+                return None
+
+            if self.mode == "region":
+                w, h = x1 - x0, y1 - y0
+                if not self._ensure(hwnd, w, h):
+                    return None
+                self._save_dc.BitBlt((0, 0), (w, h), self._mfc_dc, (x0, y0), 0x00CC0020)  # SRCCOPY
+                ox, oy = x0, y0
+            else:
+                w, h = cw, ch
+                if not self._ensure(hwnd, w, h):
+                    return None
+                if not ctypes.windll.user32.PrintWindow(hwnd, self._save_dc.GetSafeHdc(), 3):
+                    return None
+                ox, oy = 0, 0
+
+            arr = np.frombuffer(self._bmp.GetBitmapBits(True), dtype=np.uint8).reshape(h, w, 4)
+            return [(int(arr[y - oy, x - ox, 2]), int(arr[y - oy, x - ox, 1]), int(arr[y - oy, x - ox, 0]))
+                    for x, y in self.points]
+        except Exception:
+            self._release()
+            return None
@@ -0,0 +1,166 @@
+"""
+core/clock.py — 주입 가능한 시계 (운영: MonotonicClock / 테스트·소크: VirtualClock)
+"""
+import contextlib
+import contextvars
+import threading
+import time
+
+
+class MonotonicClock:
+    """실제 시간. 운영 기본값."""
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def event(self) -> threading.Event:
+        return threading.Event()
+
+    def wait(self, event: threading.Event, timeout: "float | None" = None) -> bool:
+        return event.wait(timeout)
+
+    def participant(self):
+        return contextlib.nullcontext()
+
+    def spawn(self, target, *args, name: "str | None" = None, daemon: bool = True) -> threading.Thread:
+        """스레드 시작. 호출 스레드의 contextvars (War3 인스턴스 바인딩 등) 를 물려준다."""
+        ctx = contextvars.copy_context()
+        t = threading.Thread(target=ctx.run, args=(target, *args), name=name, daemon=daemon)
+        t.start()
+        return t
+
+
+MONOTONIC = MonotonicClock()
+
+
+class _VirtualEvent(threading.Event):
+    """set() 시 VirtualClock 대기자를 깨우는 Event."""
+
+    def __init__(self, clock: "VirtualClock"):
+        super().__init__()
+        self._clock = clock
+
+    def set(self):
+        super().set()
+        self._clock._notify()
+
+
+class VirtualClock:
+    """가상 시간. 등록된 참여 스레드가 모두 시계 대기(sleep/wait) 중이면
+    가장 가까운 deadline 으로 즉시 시간을 점프한다.
+
+    - participant(): 현재 스레드를 참여자로 등록 (with 블록)
+    - spawn(): 참여자로 등록된 스레드 시작
+    - 시계 밖(Lock, 실제 time.sleep 등)에서 블록된 참여자는 '실행 중'으로 간주 → 시간 정지
+    - 참여자가 아닌 스레드도 sleep/wait 는 쓸 수 있으나 시간 진행 판정에는 포함되지 않는다
+    """
+
+    def __init__(self, start: float = 0.0):
+        self._now        = start
+        self._cond       = threading.Condition()
+        self._local      = threading.local()
+        self._registered = 0
+        self._blocked    = 0
+        self._waiters: "list[tuple[float | None, threading.Event | None]]" = []  # (deadline, event)
+        self.jumps       = 0   # 시간 점프 횟수 (진단용)
+
+    # ── 시간 ──────────────────────────────────────
+    def now(self) -> float:
+        with self._cond:
+            return self._now
+
+    def advance(self, seconds: float):
+        """수동 시간 진행 (단일 스레드 테스트용)."""
+        with self._cond:
+            self._now += max(0.0, seconds)
+            self._cond.notify_all()
+
+    # ── 참여자 ────────────────────────────────────
+    @contextlib.contextmanager
+    def participant(self):
+        if getattr(self._local, "member", False):
+            yield
+            return
+        with self._cond:
+            self._registered += 1
+        self._local.member = True
+        try:
+            yield
+        finally:
+            self._local.member = False
+            with self._cond:
+                self._registered -= 1
+                self._maybe_advance()
+
+    def spawn(self, target, *args, name: "str | None" = None, daemon: bool = True) -> threading.Thread:
+        # 시작 전에 등록 수를 올려 두지 않으면 첫 sleep 전에 시간이 흐를 수 있음
+        with self._cond:
+            self._registered += 1
+        ctx = contextvars.copy_context()
+
+        def _boot():
+            self._local.member = True
+            try:
+                ctx.run(target, *args)
+            finally:
+                self._local.member = False
+                with self._cond:
+                    self._registered -= 1
+                    self._maybe_advance()
+        t = threading.Thread(target=_boot, name=name, daemon=daemon)
+        t.start()
+        return t
+
+    # ── 대기 ──────────────────────────────────────
+    def event(self) -> threading.Event:
+        return _VirtualEvent(self)
+
+    def _notify(self):
+        with self._cond:
+            self._cond.notify_all()
+
+    def _maybe_advance(self):
+        # _cond 보유 상태에서 호출. 깨어날 대기자(event SET)가 있으면 시간을 멈춘다.
+        if not self._registered or self._blocked < self._registered:
+            return
+        if any(ev is not None and ev.is_set() for _, ev in self._waiters):
+            self._cond.notify_all()
+            return
+        deadlines = [d for d, _ in self._waiters if d is not None]
+        if deadlines:
+            target = min(deadlines)
+            if target > self._now:
+                self._now = target
+                self.jumps += 1
+            self._cond.notify_all()
+
+    def wait(self, event: "threading.Event | None", timeout: "float | None" = None) -> bool:
+        """event SET 또는 가상 timeout 경과까지 대기. event 가 SET 이면 True.
+        event 는 self.event() 로 만든 것이어야 즉시 깨어난다."""
+        member = getattr(self._local, "member", False)
+        with self._cond:
+            if event is not None and event.is_set():
+                return True
+            deadline = None if timeout is None else self._now + max(0.0, timeout)
+            entry    = (deadline, event)
+            self._waiters.append(entry)
+            if member:
+                self._blocked += 1
+            try:
+                self._maybe_advance()
+                while not (event is not None and event.is_set()):
+                    if deadline is not None and self._now >= deadline:
+                        break
+                    self._cond.wait()
+            finally:
+                if member:
+                    self._blocked -= 1
+                self._waiters.remove(entry)
+            return event is not None and event.is_set()
+
+    def sleep(self, seconds: float):
+        self.wait(None, seconds)
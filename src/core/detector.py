@@ -0,0 +1,83 @@
+"""
+core/detector.py — 시간적 투표(N-of-M) + 히스테리시스 디바운스 감지기
+"""
+import collections
+import time
+
+
+class VotingDetector:
+    """프레임별 매칭 신뢰도를 누적해 이벤트 ON/OFF 를 판정하는 감지기.
+
+    - 최근 `window`(M) 샘플 중 `votes`(N) 개 이상이 진입 임계값 이상이면 활성화
+    - 활성 상태에서는 해제 임계값(exit_threshold)으로 판정 → N 개 이상 미달 시 해제 (히스테리시스)
+    - 활성화 후 최소 `min_hold` 초 동안은 해제하지 않음
+
+    스스로 캡처하지 않는다. 호출자가 이미 폴링 중인 프레임의 결과를 update() 로 넣는다.
+    """
+
+    def __init__(self, votes: int = 1, window: int = 1,
+                 enter: float = 0.8, exit_threshold: "float | None" = None,
+                 min_hold: float = 0.0, clock=time.monotonic):
+        if not (1 <= votes <= window):
+            raise ValueError(f"votes({votes}) 는 1 이상 window({window}) 이하여야 합니다")
+        self._votes    = votes
+        self._samples: "collections.deque[bool]" = collections.deque(maxlen=window)
+        self._enter    = enter
+        self._exit     = enter if exit_threshold is None else exit_threshold
+        self._min_hold = min_hold
+        self._clock    = clock
+        self._active   = False
+        self._since    = 0.0
+        self._rose     = False
+        self._fell     = False
+
+    # ── 상태 ──────────────────────────────────────
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    @property
+    def pending(self) -> bool:
+        """비활성 상태에서 투표가 1개 이상 쌓인 후보 상태."""
+        return not self._active and any(self._samples)
+
+    @property
+    def rose(self) -> bool:
+        """직전 update() 에서 비활성 → 활성으로 전환됐는지."""
+        return self._rose
+
+    @property
+    def fell(self) -> bool:
+        """직전 update() 에서 활성 → 비활성으로 전환됐는지."""
+        return self._fell
+
+    @property
+    def hits(self) -> int:
+        return sum(self._samples)
+
+    def reset(self):
+        self._samples.clear()
+        self._active = False
+        self._rose = self._fell = False
+
+    # ── 샘플 입력 ─────────────────────────────────
+    def update(self, confidence: "float | bool", now: "float | None" = None) -> bool:
+        """샘플 1개 입력 후 현재 활성 여부 반환.
+        confidence 는 매칭 신뢰도(0~1, 캡처 실패 시 음수) 또는 bool."""
+        t = self._clock() if now is None else now
+        thr = self._exit if self._active else self._enter
+        self._samples.append(float(confidence) >= thr)
+        self._rose = self._fell = False
+
+        if not self._active:
+            if self.hits >= self._votes:
+                self._active = True
+                self._since  = t
+                self._rose   = True
+        else:
+            misses = len(self._samples) - self.hits
+            if misses >= self._votes and (t - self._since) >= self._min_hold:
+                self._active = False
+                self._fell   = True
+                self._samples.clear()
+        return self._active
@@ -0,0 +1,105 @@
+"""
+core/events.py — 워커 이벤트 버스 (순수 파이썬, Qt 비의존). Qt·콘솔·파일·자식 프로세스 파이프는 구독자일 뿐
+"""
+import threading
+import traceback
+from typing import Callable, NamedTuple
+
+
+# ── 이벤트 타입 ──────────────────────────────────
+class LogEvent(NamedTuple):
+    """새 로그 줄."""
+    text:  str
+    level: str = "info"
+
+
+class UpdateEvent(NamedTuple):
+    """마지막 로그 줄 덮어쓰기."""
+    text:  str
+    level: str = "info"
+
+
+class StatusEvent(NamedTuple):
+    text:  str
+    color: str
+
+
+class OverlayEvent(NamedTuple):
+    """매칭 위치 (클라이언트 좌표)."""
+    cx: int
+    cy: int
+    tw: int
+    th: int
+
+
+class TraceEvent(NamedTuple):
+    cycle: object          # TraceCycle (사이클 종료 시)
+
+
+class CpuEvent(NamedTuple):
+    report: dict           # {index, pid, worker_pct, war3_pct}
+
+
+class FinishedEvent(NamedTuple):
+    pass
+
+
+EVENT_TYPES = (LogEvent, UpdateEvent, StatusEvent, OverlayEvent, TraceEvent, CpuEvent, FinishedEvent)
+
+
+# ── 버스 ──────────────────────────────────────────
+class EventBus:
+    """타입별 구독 + 전체 구독. publish() 는 발행 스레드에서 구독자를 동기 호출한다.
+
+    - 구독자 예외는 출력만 하고 다른 구독자 호출은 계속 (워커 흐름 보호)
+    - 스레드 전환이 필요한 구독자(Qt UI 등)는 스스로 큐잉해야 한다
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subs: "dict[type | None, tuple[Callable, ...]]" = {}
+
+    def subscribe(self, event_type: "type | None", fn: Callable) -> Callable[[], None]:
+        """event_type 이벤트마다 fn(event) 호출 (None = 모든 이벤트). 구독 해제 함수 반환."""
+        with self._lock:
+            self._subs[event_type] = self._subs.get(event_type, ()) + (fn,)
+
+        def _unsubscribe():
+            with self._lock:
+                subs = list(self._subs.get(event_type, ()))
+                if fn in subs:
+                    subs.remove(fn)
+                    self._subs[event_type] = tuple(subs)
+        return _unsubscribe
+
+    def subscribe_all(self, fn: Callable) -> Callable[[], None]:
+        return self.subscribe(None, fn)
+
+    def publish(self, event: tuple):
+        # 구독 목록은 튜플 교체 방식 → 발행 중 잠금 불필요
+        subs = self._subs
+        for fn in subs.get(type(event), ()) + subs.get(None, ()):
+            try:
+                fn(event)
+            except Exception:
+                traceback.print_exc()
+
+    def channel(self, event_type: type) -> "Channel":
+        return Channel(self, event_type)
+
+
+class Channel:
+    """이벤트 타입 1개에 묶인 발행/구독 핸들. Qt Signal 과 같은 emit(*args) / connect(fn) 모양."""
+
+    __slots__ = ("_bus", "_type")
+
+    def __init__(self, bus: EventBus, event_type: type):
+        self._bus  = bus
+        self._type = event_type
+
+    def emit(self, *args):
+        self._bus.publish(self._type(*args))
+
+    def connect(self, fn: Callable) -> Callable[[], None]:
+        """fn(*필드) 로 호출 (Signal 슬롯과 동일한 인자)."""
+        return self._bus.subscribe(self._type, lambda ev: fn(*ev))
@@ -0,0 +1,382 @@
+"""
+core/hangul.py — 한글 타이핑 키 입력 계획 (문자열 → 최소 키 시퀀스, LRU 캐시) + 가짜 IME 정확도 하네스
+
+    type_text("라하린 숲 사냥 1")           # 계획·컴파일 결과는 텍스트별 캐시 → 두 번째부터 분해 비용 0
+
+    python -m src.core.hangul plan "방 제목 123"
+    python -m src.core.hangul tune --toggle-latency 0.06 --min-interval 0.01 "방 제목" "ㄱㅅ 테스트"
+
+계획 규칙
+    - 한/영 전환은 한글 구간 진입 시 1회, 문자열 끝에서 원복 1회 (원래 상태 = 영문 가정)
+    - 한글 사이의 공백·숫자는 IME 를 끈 채로가 아니라 실제 키(VK)로 입력 → 조합 확정 + 같은 문자, 전환 불필요
+    - 그 밖의 비한글 문자는 IME 를 끄고 KEYEVENTF_UNICODE 로 입력
+    - 낱자모(ㄱ, ㅏ…)는 입력 후 → 키로 조합 확정, 조합 중인 음절 바로 뒤면 입력 전에도 확정 ("가ㄴ" ≠ "간")
+"""
+import argparse
+import functools
+import json
+import sys
+from typing import NamedTuple
+
+from src.core.input import (
+    _JAMO_VK, _COMPOUND_JONG, _COMPOUND_JUNG, _CHOSUNG, _JUNGSUNG, _JONGSUNG, _decompose_jamos,
+    _VK_HANGUL, _VK_SHIFT, _VK_RIGHT, _KEYEVENTF_KEYUP, _KEYEVENTF_UNICODE,
+)
+from src.utils.config import load_config
+
+_VK_SPACE = 0x20
+
+# 계획 op: ("ime",) 한/영 전환 | ("key", vk, shift) 자모·공백·숫자 키 | ("commit",) → 키 | ("uni", ch) 유니코드 문자
+_IME    = ("ime",)
+_COMMIT = ("commit",)
+
+
+class HangulTiming(NamedTuple):
+    """타이핑 간격 (초). 설정 hangul_timing 에 일부 키만 넣어 덮어쓸 수 있다."""
+    ime_settle: float = 0.2    # 한/영 전환 후 대기
+    key_hold:   float = 0.02   # 키 누름 유지
+    shift_hold: float = 0.02   # Shift↓ → 키, 키↑ → Shift↑
+    jamo_gap:   float = 0.08   # 자모·공백·숫자 키 사이
+    char_gap:   float = 0.05   # 유니코드 문자 사이
+    tail:       float = 0.2    # 끝난 뒤 대기 (마지막 조합 반영)
+
+
+def current_timing() -> HangulTiming:
+    over = load_config().get("hangul_timing") or {}
+    return HangulTiming(**{k: float(v) for k, v in over.items() if k in HangulTiming._fields})
+
+
+# ══════════════════════════════════════════════════
+#  계획 (문자열 → op 튜플)
+# ══════════════════════════════════════════════════
+def _is_syllable(ch: str) -> bool:
+    return 0xAC00 <= ord(ch) <= 0xD7A3
+
+
+def _is_jamo(ch: str) -> bool:
+    return 0x3131 <= ord(ch) <= 0x3163
+
+
+def _is_ime_neutral(ch: str) -> bool:
+    """한글 모드에서도 같은 문자가 입력되고 조합을 확정하는 키 (공백·숫자)."""
+    return ch == " " or "0" <= ch <= "9"
+
+
+def _jamo_keys(jamos) -> "list[tuple]":
+    keys = []
+    for jamo in jamos:
+        vk, shift = _JAMO_VK.get(jamo, (None, False))
+        if vk is not None:
+            keys.append(("key", vk, shift))
+    return keys
+
+
+@functools.lru_cache(maxsize=128)
+def plan_text(text: str) -> "tuple[tuple, ...]":
+    """text 를 입력하는 최소 키 계획. 같은 텍스트는 캐시에서 바로 반환."""
+    plan: "list[tuple]" = []
+    korean = False
+    composing = False   # 직전 op 가 음절 자모 → IME 가 아직 조합 중
+    for i, ch in enumerate(text):
+        if _is_syllable(ch) or _is_jamo(ch):
+            if not korean:
+                plan.append(_IME)
+                korean = True
+            if _is_syllable(ch):
+                plan += _jamo_keys(_decompose_jamos(ch))
+                composing = True
+            else:
+                if composing:
+                    plan.append(_COMMIT)   # 앞 음절에 받침·겹모음으로 붙지 않도록 먼저 확정
+                plan += _jamo_keys(_COMPOUND_JONG.get(ch, _COMPOUND_JUNG.get(ch, ch)))
+                plan.append(_COMMIT)
+                composing = False
+        elif korean and _is_ime_neutral(ch) and _korean_ahead(text, i):
+            plan.append(("key", _VK_SPACE if ch == " " else ord(ch), False))
+            composing = False
+        else:
+            composing = False
+            if korean:
+                plan.append(_IME)
+                korean = False
+            plan.append(("uni", ch))
+    if korean:
+        plan.append(_IME)   # 원래(영문) 상태로 — 마지막 조합도 여기서 확정
+    return tuple(plan)
+
+
+def _korean_ahead(text: str, i: int) -> bool:
+    """i 이후 공백·숫자 구간이 끝나면 다시 한글인지 (그렇지 않으면 지금 IME 를 끄는 편이 전환 수가 같고 안전)."""
+    for ch in text[i + 1:]:
+        if not _is_ime_neutral(ch):
+            return _is_syllable(ch) or _is_jamo(ch)
+    return False
+
+
+def plan_toggles(plan: "tuple[tuple, ...]") -> int:
+    return sum(1 for op in plan if op == _IME)
+
+
+# ══════════════════════════════════════════════════
+#  계획 → 이벤트 (vk, scan, flags) / 간격
+# ══════════════════════════════════════════════════
+def _expand(plan: "tuple[tuple, ...]", t: HangulTiming) -> list:
+    """op 계획을 (vk, ch, flags) 이벤트와 float 간격 목록으로. 실제 전송·하네스가 공유."""
+    out: list = []
+
+    def _tap(vk: int, flags: int = 0):
+        out.append((vk, "", flags))
+        out.append(t.key_hold)
+        out.append((vk, "", flags | _KEYEVENTF_KEYUP))
+
+    for op in plan:
+        kind = op[0]
+        if kind == "ime":
+            _tap(_VK_HANGUL)
+            out.append(t.ime_settle)
+        elif kind == "key":
+            _, vk, shift = op
+            if shift:
+                out.append((_VK_SHIFT, "", 0))
+                out.append(t.shift_hold)
+            _tap(vk)
+            if shift:
+                out.append(t.shift_hold)
+                out.append((_VK_SHIFT, "", _KEYEVENTF_KEYUP))
+            out.append(t.jamo_gap)
+        elif kind == "commit":
+            _tap(_VK_RIGHT, 0x0001)   # EXTENDEDKEY
+            out.append(t.jamo_gap)
+        else:
+            out.append((0, op[1], _KEYEVENTF_UNICODE))
+            out.append(t.key_hold)
+            out.append((0, op[1], _KEYEVENTF_UNICODE | _KEYEVENTF_KEYUP))
+            out.append(t.char_gap)
+    out.append(t.tail)
+    return out
+
+
+def plan_duration(plan: "tuple[tuple, ...]", t: HangulTiming) -> float:
+    return sum(x for x in _expand(plan, t) if isinstance(x, float))
+
+
+@functools.lru_cache(maxsize=64)
+def _compiled(text: str, timing: HangulTiming):
+    from src.core.keyseq import KeySeq
+    seq = KeySeq()
+    for x in _expand(plan_text(text), timing):
+        if isinstance(x, float):
+            seq.gap(x)
+        elif x[2] & _KEYEVENTF_UNICODE:
+            seq.raw(0, ord(x[1]), x[2])
+        elif x[2] & _KEYEVENTF_KEYUP:
+            seq.up(x[0], extended=bool(x[2] & 0x0001))
+        else:
+            seq.down(x[0], extended=bool(x[2] & 0x0001))
+    return seq.compile()
+
+
+def type_text(text: str, timing: "HangulTiming | None" = None, clock=None):
+    """text 타이핑 (ASCII + 두벌식 한글). 계획·INPUT 배열은 (text, timing) 별 캐시."""
+    _compiled(text, timing or current_timing()).send(clock)
+
+
+def cache_info() -> dict:
+    p, c = plan_text.cache_info(), _compiled.cache_info()
+    return {"plan_hits": p.hits, "plan_misses": p.misses, "compiled_hits": c.hits, "compiled_misses": c.misses}
+
+
+# ══════════════════════════════════════════════════
+#  가짜 IME (두벌식 조합기 + 타이밍 모델) — 계획 검증·간격 튜닝용
+# ══════════════════════════════════════════════════
+_VK_JAMO = {(vk, shift): jamo for jamo, (vk, shift) in _JAMO_VK.items()}
+_JONG_JOIN = {v: k for k, v in _COMPOUND_JONG.items()}
+_JUNG_JOIN = {v: k for k, v in _COMPOUND_JUNG.items()}
+_VOWELS = set(_JUNGSUNG)
+
+
+class FakeIme:
+    """SendInput 이벤트 타임라인을 받아 입력창에 남는 문자열을 재현.
+
+    타이밍 모델 (실측값으로 설정):
+        toggle_latency — 한/영 전환이 반영되기까지 걸리는 시간. 그 전에 온 키는 이전 모드로 해석
+        min_interval   — 직전 키 누름과 이 간격보다 가까운 키 누름은 유실
+        shift_latency  — Shift↓ 후 이 시간 안에 눌린 키는 Shift 미적용
+    """
+
+    def __init__(self, toggle_latency: float = 0.05, min_interval: float = 0.0, shift_latency: float = 0.0):
+        self.toggle_latency = toggle_latency
+        self.min_interval   = min_interval
+        self.shift_latency  = shift_latency
+
+    def replay(self, events: list) -> str:
+        out: "list[str]" = []
+        comp = ["", "", ""]           # 초성, 중성, 종성
+        korean, switch_at = False, None
+        shift_at: "float | None" = None
+        last_down = -1e9
+        now = 0.0
+
+        def _commit():
+            cho, jung, jong = comp
+            if cho and jung:
+                idx = (_CHOSUNG.index(cho) * 21 + _JUNGSUNG.index(jung)) * 28 + _JONGSUNG.index(jong)
+                out.append(chr(0xAC00 + idx))
+            elif cho or jung:
+                out.append(cho or jung)
+            comp[:] = ["", "", ""]
+
+        for x in events:
+            if isinstance(x, float):
+                now += x
+                continue
+            vk, ch, flags = x
+            if switch_at is not None and now >= switch_at:
+                korean, switch_at = not korean, None
+            if vk == _VK_SHIFT:
+                shift_at = None if flags & _KEYEVENTF_KEYUP else now
+                continue
+            if flags & _KEYEVENTF_KEYUP:
+                continue
+            if now - last_down < self.min_interval:
+                continue                                   # 너무 빠른 입력 유실
+            last_down = now
+            if vk == _VK_HANGUL:
+                _commit()
+                switch_at = now + self.toggle_latency
+            elif flags & _KEYEVENTF_UNICODE:
+                _commit()
+                out.append(ch)
+            elif vk == _VK_RIGHT:
+                _commit()
+            elif vk == _VK_SPACE or ord("0") <= vk <= ord("9"):
+                _commit()
+                out.append(chr(vk))
+            elif korean:
+                shift = shift_at is not None and now - shift_at >= self.shift_latency
+                jamo = _VK_JAMO.get((vk, shift)) or _VK_JAMO.get((vk, False))
+                if jamo:
+                    self._feed(comp, jamo, _commit)
+            else:
+                shift = shift_at is not None and now - shift_at >= self.shift_latency
+                out.append(chr(vk) if shift else chr(vk).lower())
+        _commit()
+        return "".join(out)
+
+    @staticmethod
+    def _feed(comp: list, j: str, commit):
+        cho, jung, jong = comp
+        if j in _VOWELS:
+            if cho and not jung:
+                comp[1] = j
+            elif jung and not jong and (jung + j) in _JUNG_JOIN:
+                comp[1] = _JUNG_JOIN[jung + j]
+            elif jong:
+                parts = _COMPOUND_JONG.get(jong)
+                keep, move = (parts[0], parts[1]) if parts else ("", jong)
+                comp[2] = keep
+                commit()
+                comp[0], comp[1] = move, j
+            else:
+                commit()
+                comp[1] = j
+        else:
+            if cho and not jung:
+                if (cho + j) in _JONG_JOIN:              # 자음군 낱자 (ㄳ 등)
+                    comp[0] = _JONG_JOIN[cho + j]
+                else:
+                    commit()
+                    comp[0] = j
+            elif cho and jung and not jong and j in _JONGSUNG:
+                comp[2] = j
+            elif jong and (jong + j) in _JONG_JOIN:
+                comp[2] = _JONG_JOIN[jong + j]
+            else:
+                commit()
+                comp[0] = j
+
+
+def accuracy(samples: "list[str]", timing: HangulTiming, ime: FakeIme) -> float:
+    """samples 중 가짜 IME 재생 결과가 원문과 같은 비율."""
+    ok = sum(1 for s in samples if ime.replay(_expand(plan_text(s), timing)) == s)
+    return ok / len(samples) if samples else 1.0
+
+
+# 가짜 IME 가 관찰할 수 없는 필드 (입력 후 게임 반영 지연) → 튜닝하지 않고 base 값 유지
+_UNTUNED = frozenset({"tail"})
+
+
+def tune_timing(samples: "list[str]", ime: FakeIme, base: "HangulTiming | None" = None,
+                margin: float = 1.25, steps: int = 10) -> "tuple[HangulTiming, float]":
+    """정확도 100% 를 유지하는 가장 짧은 간격 탐색 (필드별 이분 탐색, 총 시간 기여가 큰 필드부터).
+
+    결과 간격에는 margin 배 여유를 둔다 (실제 환경의 지터 대비). base 에서도 100% 가 아니면 base 그대로 반환.
+    _UNTUNED 필드(tail)는 재생 결과에 영향이 없어 0 까지 줄어들므로 base 값을 그대로 둔다.
+    """
+    base = t = base or current_timing()
+    acc = accuracy(samples, t, ime)
+    if acc < 1.0:
+        return t, acc
+    unit = {f: HangulTiming(**{g: float(g == f) for g in HangulTiming._fields}) for f in HangulTiming._fields}
+    weight = {f: sum(plan_duration(plan_text(s), unit[f]) for s in samples) * getattr(t, f)
+              for f in HangulTiming._fields}
+    for field in sorted((f for f in HangulTiming._fields if f not in _UNTUNED), key=lambda f: -weight[f]):
+        lo, hi = 0.0, getattr(t, field)
+        for _ in range(steps):
+            mid = (lo + hi) / 2
+            if accuracy(samples, t._replace(**{field: mid}), ime) >= 1.0:
+                hi = mid
+            else:
+                lo = mid
+        t = t._replace(**{field: hi})
+    tuned = HangulTiming(*(min(round(v * margin, 4), b) for v, b in zip(t, base)))
+    return tuned, accuracy(samples, tuned, ime)
+
+
+# ══════════════════════════════════════════════════
+#  CLI
+# ══════════════════════════════════════════════════
+def _legacy_toggles(text: str) -> int:
+    """기존 type_string 의 전환 횟수 (한글↔비한글 경계마다 1회, 끝 원복 없음)."""
+    n, korean = 0, False
+    for ch in text:
+        k = _is_syllable(ch) or _is_jamo(ch)
+        if k != korean:
+            n += 1
+            korean = k
+    return n
+
+
+def main(argv: "list[str] | None" = None) -> int:
+    ap = argparse.ArgumentParser(description="한글 타이핑 계획 확인 / 가짜 IME 로 간격 튜닝")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p_plan = sub.add_parser("plan", help="계획 op·전환 횟수·예상 소요 시간")
+    p_plan.add_argument("text", nargs="+")
+    p_tune = sub.add_parser("tune", help="정확도 100%% 를 유지하는 최단 간격 (설정 hangul_timing 용 JSON 출력)")
+    p_tune.add_argument("text", nargs="+")
+    p_tune.add_argument("--toggle-latency", type=float, default=0.05)
+    p_tune.add_argument("--min-interval", type=float, default=0.0)
+    p_tune.add_argument("--shift-latency", type=float, default=0.0)
+    p_tune.add_argument("--margin", type=float, default=1.25)
+    a = ap.parse_args(argv)
+
+    t = current_timing()
+    if a.cmd == "plan":
+        for s in a.text:
+            plan = plan_text(s)
+            ok = FakeIme().replay(_expand(plan, t)) == s
+            print(f"{s!r}: op {len(plan)}개, 전환 {plan_toggles(plan)}회 (기존 {_legacy_toggles(s)}회), "
+                  f"예상 {plan_duration(plan, t) * 1000:.0f}ms, 가짜 IME {'OK' if ok else '불일치'}")
+        return 0
+
+    ime = FakeIme(a.toggle_latency, a.min_interval, a.shift_latency)
+    tuned, acc = tune_timing(a.text, ime, t, margin=a.margin)
+    before = sum(plan_duration(plan_text(s), t) for s in a.text)
+    after  = sum(plan_duration(plan_text(s), tuned) for s in a.text)
+    print(f"정확도 {acc * 100:.0f}% / 합계 {before * 1000:.0f}ms → {after * 1000:.0f}ms")
+    print(json.dumps({"hangul_timing": tuned._asdict()}, indent=2))
+    return 0 if acc >= 1.0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
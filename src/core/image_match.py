@@ -3,6 +3,8 @@ core/image_match.py — 템플릿 매칭 + LRU 캐시
 """
 import os
 import sys
+import threading
+import time
 from functools import lru_cache
 
 import cv2
@@ -12,6 +14,7 @@ from src.core.capture import (
     _capture_war3_gray, _capture_war3_gray_background,
     _capture_war3_bgr,  _capture_war3_bgr_background,
 )
+from src.utils.recorder import note_match
 
 
 def _resource_path(rel: str) -> str:
@@ -43,6 +46,57 @@ _CHAR_IMAGES: "dict[str, str]" = {
 }
 
 
+class MatchPool:
+    """모든 워커(클라이언트)가 공유하는 매칭 슬롯. 동시에 도는 matchTemplate 수를 size 로 제한
+    → 클라이언트가 늘어도 코어를 과점유하지 않는다. 매칭은 호출 스레드에서 실행 (핸드오프 없음)."""
+
+    def __init__(self, size: int):
+        self._lock  = threading.Lock()
+        self.resize(size)
+
+    def resize(self, size: int):
+        with self._lock:
+            self.size    = max(1, int(size))
+            self._sem    = threading.BoundedSemaphore(self.size)
+            self.calls   = 0
+            self.waited  = 0      # 슬롯 대기가 발생한 호출 수
+            self.wait_s  = 0.0    # 누적 대기 시간
+
+    def run(self, fn, *args):
+        sem = self._sem
+        if sem.acquire(blocking=False):
+            waited = 0.0
+        else:
+            t0 = time.perf_counter()
+            sem.acquire()
+            waited = time.perf_counter() - t0
+        try:
+            return fn(*args)
+        finally:
+            sem.release()
+            with self._lock:
+                self.calls += 1
+                if waited:
+                    self.waited += 1
+                    self.wait_s += waited
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": self.size, "calls": self.calls, "waited": self.waited,
+                    "wait_ms_avg": self.wait_s / self.waited * 1000.0 if self.waited else 0.0}
+
+
+MATCH_POOL = MatchPool(max(1, (os.cpu_count() or 2) - 1))
+
+# 매칭한 프레임을 받아 가는 콜백 (자식 프로세스 워커 → 공유 메모리 게시). None = 비활성
+_frame_sink = None
+
+
+def set_frame_sink(fn):
+    global _frame_sink
+    _frame_sink = fn
+
+
 @lru_cache(maxsize=64)
 def _load_template(filename: str, screen_w: int, screen_h: int) -> "tuple | None":
     """스케일된 템플릿을 캐시. 해상도 변경 시 자동 무효화 (screen_w/h 키에 포함).
@@ -88,42 +142,56 @@ def _load_template(filename: str, screen_w: int, screen_h: int) -> "tuple | None
     return (tmpl_gray, tmpl_bgr, mask, nw, nh)
 
 
-def _image_match(
+def _capture_frame(background: bool = False) -> "np.ndarray | None":
+    """여러 템플릿을 한 프레임에서 매칭할 때 쓰는 컬러(BGR) 1회 캡처."""
+    return _capture_war3_bgr_background() if background else _capture_war3_bgr()
+
+
+def _match_frame(
     filename: str,
+    frame: "np.ndarray",
     threshold: float = 0.8,
-    background: bool = False,
     edges: bool = False,
 ) -> "tuple[bool, float, tuple | None, tuple]":
-    """(matched, confidence, coords|None, (nw, nh)) 반환."""
-    edges = edges or (filename in _EDGE_MATCH_IMAGES)
+    """이미 캡처된 프레임(BGR 또는 GRAY)에 대해 템플릿 매칭. 추가 캡처 없음.
+    (matched, confidence, coords|None, (nw, nh)) 반환. 녹화기 활성 시 프레임·결과 기록."""
+    result = MATCH_POOL.run(_match_frame_raw, filename, frame, threshold, edges)
+    note_match(filename, frame, threshold, edges, result, color=_uses_mask(filename, frame, edges))
+    sink = _frame_sink
+    if sink is not None:
+        sink(frame)
+    return result
 
-    # 마스크 있으면 컬러 캡처로 결정 (템플릿 로드 전에 스크린 먼저 캡처하여 해상도 확인)
-    # 임시 그레이 캡처로 해상도 확인
-    _tmp = _capture_war3_gray_background() if background else _capture_war3_gray()
-    if _tmp is None:
-        return (False, -1.0, None, (0, 0))
-    sh, sw = _tmp.shape[:2]
+
+def _uses_mask(filename: str, frame: "np.ndarray", edges: bool = False) -> bool:
+    """_match_frame_raw 가 알파 마스크(컬러 SQDIFF) 경로를 타는지. 녹화기가 이 프레임을 컬러로 보관할지 판단."""
+    if edges or filename in _EDGE_MATCH_IMAGES or frame.ndim != 3:
+        return False
+    tmpl_data = _load_template(filename, frame.shape[1], frame.shape[0])
+    return tmpl_data is not None and tmpl_data[2] is not None
+
+
+def _match_frame_raw(
+    filename: str,
+    frame: "np.ndarray",
+    threshold: float = 0.8,
+    edges: bool = False,
+) -> "tuple[bool, float, tuple | None, tuple]":
+    """_match_frame 본체 (녹화 없음 — recorder replay 에서 사용)."""
+    edges = edges or (filename in _EDGE_MATCH_IMAGES)
+    sh, sw = frame.shape[:2]
 
     tmpl_data = _load_template(filename, sw, sh)
     if tmpl_data is None:
         return (False, 0.0, None, (0, 0))
 
     tmpl_gray, tmpl_bgr, mask, nw, nh = tmpl_data
-    use_color = (mask is not None) and (not edges)
-
-    if use_color:
-        screen = _capture_war3_bgr_background() if background else _capture_war3_bgr()
-    else:
-        screen = _tmp
-    if screen is None:
-        return (False, -1.0, None, (0, 0))
-
     if tmpl_gray.shape[0] > sh or tmpl_gray.shape[1] > sw:
         return (False, 0.0, None, (nw, nh))
 
     # ── 엣지 매칭 ──
     if edges:
-        screen_g = screen if screen.ndim == 2 else cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY)
+        screen_g = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
         result   = cv2.matchTemplate(
             cv2.Canny(screen_g, 80, 200), cv2.Canny(tmpl_gray, 80, 200),
             cv2.TM_CCOEFF_NORMED
@@ -133,9 +201,9 @@ def _image_match(
             return (True, max_val, (max_loc[0] + nw // 2, max_loc[1] + nh // 2), (nw, nh))
         return (False, max_val, None, (nw, nh))
 
-    # ── 알파 마스크 매칭 ──
-    if mask is not None:
-        result  = cv2.matchTemplate(screen, tmpl_bgr, cv2.TM_SQDIFF, mask=mask)
+    # ── 알파 마스크 매칭 (컬러 프레임일 때만) ──
+    if mask is not None and frame.ndim == 3:
+        result  = cv2.matchTemplate(frame, tmpl_bgr, cv2.TM_SQDIFF, mask=mask)
         min_val, _, min_loc, _ = cv2.minMaxLoc(result)
         n_px    = max(1, int(np.sum(mask > 0)))
         confidence = max(0.0, 1.0 - (min_val / (n_px * 4800.0)))
@@ -144,13 +212,45 @@ def _image_match(
         return (False, confidence, None, (nw, nh))
 
     # ── 기본 그레이 매칭 ──
-    result = cv2.matchTemplate(screen, tmpl_gray, cv2.TM_CCOEFF_NORMED)
+    screen_g = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    result = cv2.matchTemplate(screen_g, tmpl_gray, cv2.TM_CCOEFF_NORMED)
     _, max_val, _, max_loc = cv2.minMaxLoc(result)
     if max_val >= threshold:
         return (True, max_val, (max_loc[0] + nw // 2, max_loc[1] + nh // 2), (nw, nh))
     return (False, max_val, None, (nw, nh))
 
 
+def _image_match(
+    filename: str,
+    threshold: float = 0.8,
+    background: bool = False,
+    edges: bool = False,
+) -> "tuple[bool, float, tuple | None, tuple]":
+    """(matched, confidence, coords|None, (nw, nh)) 반환."""
+    edges = edges or (filename in _EDGE_MATCH_IMAGES)
+
+    # 마스크 있으면 컬러 캡처로 결정 (템플릿 로드 전에 스크린 먼저 캡처하여 해상도 확인)
+    # 임시 그레이 캡처로 해상도 확인
+    _tmp = _capture_war3_gray_background() if background else _capture_war3_gray()
+    if _tmp is None:
+        return (False, -1.0, None, (0, 0))
+    sh, sw = _tmp.shape[:2]
+
+    tmpl_data = _load_template(filename, sw, sh)
+    if tmpl_data is None:
+        return (False, 0.0, None, (0, 0))
+
+    mask = tmpl_data[2]
+    if (mask is not None) and (not edges):
+        screen = _capture_frame(background)
+    else:
+        screen = _tmp
+    if screen is None:
+        return (False, -1.0, None, (0, 0))
+
+    return _match_frame(filename, screen, threshold, edges=edges)
+
+
 def image_search(filename: str, threshold: float = 0.8) -> "tuple[int, int] | None":
     matched, _, coords, _ = _image_match(filename, threshold)
     return coords if matched else None
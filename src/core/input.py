@@ -4,14 +4,20 @@ core/input.py — 키보드/마우스 SendInput 유틸
 import ctypes
 import ctypes.wintypes
 import time
+from typing import NamedTuple
 
-_user32 = ctypes.windll.user32
+from src.core.input_backend import user32 as _user32   # 현재 입력 백엔드 프록시 (기본 Win32, import 시 DLL 로드 없음)
+from src.core.input_backend import _SCAN_CACHE         # vk → 스캔 코드 (백엔드 교체 시 비움)
+from src.utils.recorder import note_event
 
 # ── 마우스 이벤트 플래그 ─────────────────────────────────────────────────────
 _MOUSEEVENTF_LEFTDOWN  = 0x0002
 _MOUSEEVENTF_LEFTUP    = 0x0004
 _MOUSEEVENTF_RIGHTDOWN = 0x0008
 _MOUSEEVENTF_RIGHTUP   = 0x0010
+_MOUSEEVENTF_MOVE        = 0x0001
+_MOUSEEVENTF_VIRTUALDESK = 0x4000
+_MOUSEEVENTF_ABSOLUTE    = 0x8000
 
 # ── 키보드 이벤트 플래그 ─────────────────────────────────────────────────────
 _KEYEVENTF_UNICODE     = 0x0004
@@ -25,6 +31,7 @@ _VK_TAB     = 0x09
 _VK_SHIFT   = 0x10
 _VK_CONTROL = 0x11
 _VK_HANGUL  = 0x15
+_VK_HOME    = 0x24
 _VK_LEFT    = 0x25
 _VK_RIGHT   = 0x27
 _VK_MENU    = 0x12   # Alt
@@ -131,6 +138,7 @@ def _send_mouse_click(flags: int):
     inp.type       = 0
     inp.mi.dwFlags = flags
     _user32.SendInput(1, ctypes.byref(inp), ctypes.sizeof(inp))
+    note_event("mouse", flags=flags)
 
 
 def _send_key(vk: int = 0, scan: int = 0, flags: int = 0):
@@ -141,10 +149,18 @@ def _send_key(vk: int = 0, scan: int = 0, flags: int = 0):
     inp.ki.wScan   = scan
     inp.ki.dwFlags = flags
     _user32.SendInput(1, ctypes.byref(inp), ctypes.sizeof(inp))
+    note_event("key", vk=vk, scan=scan, flags=flags)
+
+
+def _scan_code(vk: int) -> int:
+    scan = _SCAN_CACHE.get(vk)
+    if scan is None:
+        scan = _SCAN_CACHE[vk] = _user32.MapVirtualKeyW(vk, 0)
+    return scan
 
 
 def _press_vk(vk: int, keyup: bool = False, extended: bool = False):
-    scan  = _user32.MapVirtualKeyW(vk, 0)
+    scan  = _scan_code(vk)
     flags = 0
     if keyup:    flags |= _KEYEVENTF_KEYUP
     if extended: flags |= _KEYEVENTF_EXTENDEDKEY
@@ -152,57 +168,9 @@ def _press_vk(vk: int, keyup: bool = False, extended: bool = False):
 
 
 def type_string(text: str):
-    """ASCII + 한글(두벌식) 문자열을 SendInput으로 타이핑."""
-    in_korean = False
-    for ch in text:
-        is_syllable = 0xAC00 <= ord(ch) <= 0xD7A3
-        is_jamo     = 0x3131 <= ord(ch) <= 0x3163
-
-        if is_syllable:
-            if not in_korean:
-                _press_vk(_VK_HANGUL); time.sleep(0.02)
-                _press_vk(_VK_HANGUL, keyup=True); time.sleep(0.2)
-                in_korean = True
-            for jamo in _decompose_jamos(ch):
-                vk, need_shift = _JAMO_VK.get(jamo, (None, False))
-                if vk is None: continue
-                if need_shift:
-                    _press_vk(_VK_SHIFT); time.sleep(0.02)
-                _press_vk(vk); time.sleep(0.02)
-                _press_vk(vk, keyup=True)
-                if need_shift:
-                    time.sleep(0.02); _press_vk(_VK_SHIFT, keyup=True)
-                time.sleep(0.08)
-
-        elif is_jamo:
-            if not in_korean:
-                _press_vk(_VK_HANGUL); time.sleep(0.02)
-                _press_vk(_VK_HANGUL, keyup=True); time.sleep(0.2)
-                in_korean = True
-            comps = list(_COMPOUND_JONG.get(ch, _COMPOUND_JUNG.get(ch, ch)))
-            for comp in comps:
-                vk, need_shift = _JAMO_VK.get(comp, (None, False))
-                if vk is None: continue
-                if need_shift:
-                    _press_vk(_VK_SHIFT); time.sleep(0.02)
-                _press_vk(vk); time.sleep(0.02)
-                _press_vk(vk, keyup=True)
-                if need_shift:
-                    time.sleep(0.02); _press_vk(_VK_SHIFT, keyup=True)
-                time.sleep(0.05)
-            _press_vk(_VK_RIGHT, extended=True); time.sleep(0.02)
-            _press_vk(_VK_RIGHT, keyup=True, extended=True); time.sleep(0.08)
-
-        else:
-            if in_korean:
-                _press_vk(_VK_HANGUL); time.sleep(0.02)
-                _press_vk(_VK_HANGUL, keyup=True); time.sleep(0.2)
-                in_korean = False
-            code = ord(ch)
-            _send_key(0, code, _KEYEVENTF_UNICODE); time.sleep(0.02)
-            _send_key(0, code, _KEYEVENTF_UNICODE | _KEYEVENTF_KEYUP); time.sleep(0.05)
-
-    time.sleep(0.2)
+    """ASCII + 한글(두벌식) 문자열을 SendInput으로 타이핑 (키 계획·간격은 core/hangul.py, 텍스트별 캐시)."""
+    from src.core.hangul import type_text
+    type_text(text)
 
 
 def press_enter():
@@ -212,60 +180,121 @@ def press_enter():
     _press_vk(_VK_RETURN, keyup=True)
 
 
-def click_image_center(client_x: int, client_y: int) -> bool:
-    """WC3 클라이언트 좌표 → 스크린 좌표 변환 후 좌클릭."""
-    from src.utils.process import find_war3_hwnd
+# ── 클릭 (클라이언트 → 스크린 변환 캐시 + 이동·누름·뗌 단일 SendInput) ─────────────
+class _ClientXform(NamedTuple):
+    hwnd: int
+    ox:   int   # 클라이언트 (0,0) 의 스크린 좌표
+    oy:   int
+    cw:   int   # 클라이언트 크기
+    ch:   int
+    vx:   int   # 가상 데스크톱 (다중 모니터) 원점·크기 — ABSOLUTE 정규화용
+    vy:   int
+    vw:   int
+    vh:   int
+    t:    float
+
+
+_XFORM_TTL = 0.5   # 초. 창 이동/재시작은 이 안에 반영
+_XFORMS: "dict[int | None, _ClientXform]" = {}   # War3 인스턴스 index → 변환
+
+
+def _client_xform() -> "_ClientXform | None":
+    """현재 War3 창의 좌표 변환 (TTL 캐시 — 클릭마다 창 탐색·ClientToScreen 하지 않음)."""
+    from src.utils.process import current_instance, find_war3_hwnd
+    inst = current_instance()
+    key  = inst.index if inst is not None else None
+    now  = time.monotonic()
+    x = _XFORMS.get(key)
+    if x is not None and now - x.t < _XFORM_TTL:
+        return x
     hwnd = find_war3_hwnd()
     if not hwnd:
-        return False
-    pt = ctypes.wintypes.POINT(client_x, client_y)
+        _XFORMS.pop(key, None)
+        return None
+    pt = ctypes.wintypes.POINT(0, 0)
     _user32.ClientToScreen(hwnd, ctypes.byref(pt))
-    _user32.SetCursorPos(pt.x, pt.y)
-    time.sleep(0.05)
-    _send_mouse_click(_MOUSEEVENTF_LEFTDOWN)
-    time.sleep(0.05)
-    _send_mouse_click(_MOUSEEVENTF_LEFTUP)
+    rc = ctypes.wintypes.RECT()
+    _user32.GetClientRect(hwnd, ctypes.byref(rc))
+    vx, vy = _user32.GetSystemMetrics(76), _user32.GetSystemMetrics(77)   # SM_X/YVIRTUALSCREEN
+    vw, vh = _user32.GetSystemMetrics(78), _user32.GetSystemMetrics(79)   # SM_CX/CYVIRTUALSCREEN
+    if vw <= 0 or vh <= 0:
+        vx, vy, vw, vh = 0, 0, _user32.GetSystemMetrics(0), _user32.GetSystemMetrics(1)
+    x = _XFORMS[key] = _ClientXform(hwnd, pt.x, pt.y, rc.right, rc.bottom,
+                                    vx, vy, max(vw, 2), max(vh, 2), now)
+    return x
+
+
+def invalidate_click_cache():
+    """창 이동·해상도 변경을 즉시 반영 (다음 클릭에서 다시 계산)."""
+    _XFORMS.clear()
+
+
+def _send_mouse_batch(events: "list[tuple[int, int, int]]"):
+    """(dx, dy, flags) 목록을 SendInput 1회로 전송."""
+    arr = (_MOUSE_INPUT * len(events))()
+    for i, (dx, dy, flags) in enumerate(events):
+        arr[i].type       = 0
+        arr[i].mi.dx      = dx
+        arr[i].mi.dy      = dy
+        arr[i].mi.dwFlags = flags
+        note_event("mouse", flags=flags)
+    _user32.SendInput(len(events), arr, ctypes.sizeof(_MOUSE_INPUT))
+
+
+def _abs_move(x: _ClientXform, client_x: int, client_y: int) -> "tuple[int, int, int]":
+    """스크린 픽셀 → 0~65535 정규 좌표 (픽셀 중심 기준 — Windows 역변환 n*w/65536 이 정확히 같은 픽셀)."""
+    sx, sy = x.ox + client_x - x.vx, x.oy + client_y - x.vy
+    return ((2 * sx + 1) * 65536 // (2 * x.vw), (2 * sy + 1) * 65536 // (2 * x.vh),
+            _MOUSEEVENTF_MOVE | _MOUSEEVENTF_ABSOLUTE | _MOUSEEVENTF_VIRTUALDESK)
+
+
+def click_at(client_x: int, client_y: int, button: str = "left",
+             double: bool = False, settle: float = 0.05) -> bool:
+    """WC3 클라이언트 좌표 클릭. 이동(ABSOLUTE)·누름·뗌 (더블이면 ×2) 을 SendInput 1회로.
+
+    War3 창이 이미 전면이면 대기 없이 바로, 아니면 이동 후 settle 초 대기 뒤 클릭 (기존 동작).
+    """
+    x = _client_xform()
+    if x is None:
+        return False
+    down, up = ((_MOUSEEVENTF_RIGHTDOWN, _MOUSEEVENTF_RIGHTUP) if button == "right"
+                else (_MOUSEEVENTF_LEFTDOWN, _MOUSEEVENTF_LEFTUP))
+    move = _abs_move(x, client_x, client_y)
+    note_event("move", x=client_x, y=client_y)
+    events = [move]
+    if settle > 0 and _user32.GetForegroundWindow() != x.hwnd:
+        _send_mouse_batch(events)
+        time.sleep(settle)
+        events = []
+    events += [(0, 0, down), (0, 0, up)] * (2 if double else 1)
+    _send_mouse_batch(events)
     return True
 
 
+def click_image_center(client_x: int, client_y: int) -> bool:
+    """WC3 클라이언트 좌표 좌클릭."""
+    return click_at(client_x, client_y)
+
+
 def right_click_image_center(client_x: int, client_y: int) -> bool:
-    """WC3 클라이언트 좌표 → 스크린 좌표 변환 후 우클릭."""
-    from src.utils.process import find_war3_hwnd
-    hwnd = find_war3_hwnd()
-    if not hwnd:
-        return False
-    pt = ctypes.wintypes.POINT(client_x, client_y)
-    _user32.ClientToScreen(hwnd, ctypes.byref(pt))
-    _user32.SetCursorPos(pt.x, pt.y)
-    time.sleep(0.05)
-    _send_mouse_click(_MOUSEEVENTF_RIGHTDOWN)
-    time.sleep(0.05)
-    _send_mouse_click(_MOUSEEVENTF_RIGHTUP)
-    return True
+    """WC3 클라이언트 좌표 우클릭."""
+    return click_at(client_x, client_y, "right")
 
 
 def move_cursor_to(client_x: int, client_y: int) -> bool:
-    """WC3 클라이언트 좌표 → 스크린 좌표 변환 후 커서만 이동."""
-    from src.utils.process import find_war3_hwnd
-    hwnd = find_war3_hwnd()
-    if not hwnd:
+    """WC3 클라이언트 좌표로 커서만 이동."""
+    x = _client_xform()
+    if x is None:
         return False
-    pt = ctypes.wintypes.POINT(client_x, client_y)
-    _user32.ClientToScreen(hwnd, ctypes.byref(pt))
-    _user32.SetCursorPos(pt.x, pt.y)
+    _user32.SetCursorPos(x.ox + client_x, x.oy + client_y)
+    note_event("move", x=client_x, y=client_y)
     return True
 
 
 def _scale_coords(ref_x: int, ref_y: int) -> "tuple[int, int]":
     """1920×1080 기준 좌표를 현재 WC3 클라이언트 해상도 비율로 보정."""
-    from src.utils.process import find_war3_hwnd
-    hwnd = find_war3_hwnd()
-    if not hwnd:
-        return ref_x, ref_y
-    rc = ctypes.wintypes.RECT()
-    _user32.GetClientRect(hwnd, ctypes.byref(rc))
-    sw, sh = rc.right, rc.bottom
-    if sw <= 0 or sh <= 0:
+    x = _client_xform()
+    if x is None or x.cw <= 0 or x.ch <= 0:
         return ref_x, ref_y
     _REF_W, _REF_H = 1920, 1080
-    return int(ref_x * sw / _REF_W), int(ref_y * sh / _REF_H)
+    return int(ref_x * x.cw / _REF_W), int(ref_y * x.ch / _REF_H)
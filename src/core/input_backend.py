@@ -0,0 +1,222 @@
+"""
+core/input_backend.py — 입력 백엔드 (SendInput · SetCursorPos · ClientToScreen · MapVirtualKeyW)
+
+input.py 의 _user32 는 현재 백엔드로 위임하는 프록시다. import 시점에 ctypes.windll 을 건드리지 않으므로
+Windows 가 아닌 환경에서도 입력 경로를 import·측정할 수 있다.
+
+    Win32Backend      실제 user32 (첫 호출 시 로드)
+    RecordingBackend  모든 이벤트를 타임스탬프와 함께 기록, target(예: sim FakeUser32) 이 있으면 그대로 전달
+
+    with use_backend(RecordingBackend()) as rec:
+        KeySeq().chord(_VK_CONTROL, _VK_V).compile().send()
+    rec.events   # [InputRecord(t, "key", vk, scan, flags), ...]
+"""
+import abc
+import contextlib
+import ctypes
+import threading
+import time
+from typing import NamedTuple
+
+
+class InputBackend(abc.ABC):
+    """백엔드 인터페이스. 메서드 이름·인자는 user32 와 같다 (기존 _user32 호출부 그대로 사용).
+
+    필수: SendInput, SetCursorPos, ClientToScreen, MapVirtualKeyW.
+    그 밖의 user32 함수 (SetForegroundWindow, GetClientRect …) 는 구현체가 __getattr__ 로 제공한다.
+    """
+
+    @abc.abstractmethod
+    def SendInput(self, n: int, p_inputs, cb_size: int) -> int: ...
+
+    @abc.abstractmethod
+    def SetCursorPos(self, x: int, y: int) -> int: ...
+
+    @abc.abstractmethod
+    def ClientToScreen(self, hwnd: int, ppt) -> int: ...
+
+    @abc.abstractmethod
+    def MapVirtualKeyW(self, vk: int, map_type: int) -> int: ...
+
+
+class Win32Backend(InputBackend):
+    """ctypes.windll.user32. DLL 은 첫 호출 시 로드하고, 조회한 함수는 인스턴스에 캐시."""
+
+    def __init__(self):
+        self._dll = None
+
+    def _load(self):
+        if self._dll is None:
+            self._dll = ctypes.windll.user32
+        return self._dll
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        fn = getattr(self._load(), name)
+        setattr(self, name, fn)   # 다음부터 __getattr__ 생략
+        return fn
+
+    def SendInput(self, n, p_inputs, cb_size):
+        fn = self.__dict__["SendInput"] = self._load().SendInput
+        return fn(n, p_inputs, cb_size)
+
+    def SetCursorPos(self, x, y):
+        fn = self.__dict__["SetCursorPos"] = self._load().SetCursorPos
+        return fn(x, y)
+
+    def ClientToScreen(self, hwnd, ppt):
+        fn = self.__dict__["ClientToScreen"] = self._load().ClientToScreen
+        return fn(hwnd, ppt)
+
+    def MapVirtualKeyW(self, vk, map_type):
+        fn = self.__dict__["MapVirtualKeyW"] = self._load().MapVirtualKeyW
+        return fn(vk, map_type)
+
+
+class InputRecord(NamedTuple):
+    t:    float   # time.perf_counter()
+    kind: str     # "key" | "mouse" | "cursor" | "focus"
+    a:    int     # key: vk   / mouse: dwFlags / cursor: x / focus: hwnd
+    b:    int     # key: scan / mouse: dx / cursor: y
+    c:    int     # key: dwFlags / mouse: dy
+
+
+class RecordingBackend(InputBackend):
+    """모든 입력을 기록하는 백엔드. target 이 있으면 기록 후 target 으로 전달 (SimScreen 구동 등).
+
+    target 이 없을 때: 창 좌표 = 스크린 좌표, 클라이언트 1920×1080, MapVirtualKeyW(vk) = vk.
+    """
+
+    def __init__(self, target=None, limit: int = 1_000_000):
+        self.target  = target
+        self.limit   = limit
+        self.events: "list[InputRecord]" = []
+        self.calls   = 0       # SendInput 호출 수 (배치 수)
+        self._cursor = (0, 0)
+        self._fg     = 0
+        self._lock   = threading.Lock()
+
+    def _add(self, rec: InputRecord):
+        if len(self.events) < self.limit:
+            self.events.append(rec)
+
+    # ── 인터페이스 ────────────────────────────────
+    def SendInput(self, n, p_inputs, cb_size):
+        t = time.perf_counter()
+        obj   = getattr(p_inputs, "_obj", p_inputs)
+        items = list(obj)[:n] if hasattr(obj, "_length_") else [obj]
+        with self._lock:
+            self.calls += 1
+            for inp in items:
+                if inp.type == 1:
+                    self._add(InputRecord(t, "key", inp.ki.wVk, inp.ki.wScan, inp.ki.dwFlags))
+                else:
+                    self._add(InputRecord(t, "mouse", inp.mi.dwFlags, inp.mi.dx, inp.mi.dy))
+        if self.target is not None:
+            return self.target.SendInput(n, p_inputs, cb_size)
+        return n
+
+    def SetCursorPos(self, x, y):
+        self._cursor = (int(x), int(y))
+        with self._lock:
+            self._add(InputRecord(time.perf_counter(), "cursor", int(x), int(y), 0))
+        return self.target.SetCursorPos(x, y) if self.target is not None else 1
+
+    def ClientToScreen(self, hwnd, ppt):
+        return self.target.ClientToScreen(hwnd, ppt) if self.target is not None else 1
+
+    def MapVirtualKeyW(self, vk, map_type):
+        return self.target.MapVirtualKeyW(vk, map_type) if self.target is not None else vk
+
+    # ── 자주 쓰는 나머지 user32 ───────────────────
+    def GetCursorPos(self, ppt):
+        if self.target is not None:
+            return self.target.GetCursorPos(ppt)
+        pt = getattr(ppt, "_obj", ppt)
+        pt.x, pt.y = self._cursor
+        return 1
+
+    def SetForegroundWindow(self, hwnd):
+        self._fg = hwnd
+        with self._lock:
+            self._add(InputRecord(time.perf_counter(), "focus", int(hwnd or 0), 0, 0))
+        return self.target.SetForegroundWindow(hwnd) if self.target is not None else 1
+
+    def GetForegroundWindow(self):
+        return self.target.GetForegroundWindow() if self.target is not None else self._fg
+
+    def GetSystemMetrics(self, idx):
+        if self.target is not None:
+            return self.target.GetSystemMetrics(idx)
+        return {0: 1920, 1: 1080, 78: 1920, 79: 1080}.get(idx, 0)
+
+    def GetClientRect(self, hwnd, prc):
+        if self.target is not None:
+            return self.target.GetClientRect(hwnd, prc)
+        rc = getattr(prc, "_obj", prc)
+        rc.left, rc.top, rc.right, rc.bottom = 0, 0, 1920, 1080
+        return 1
+
+    def __getattr__(self, name):
+        if name.startswith("__") or name in ("target", "events"):
+            raise AttributeError(name)
+        if self.target is not None:
+            return getattr(self.target, name)
+        return lambda *_a, **_k: 0
+
+    # ── 분석 ──────────────────────────────────────
+    def clear(self):
+        with self._lock:
+            self.events.clear()
+            self.calls = 0
+
+    def keys(self) -> "list[InputRecord]":
+        return [e for e in self.events if e.kind == "key"]
+
+    def stats(self) -> dict:
+        """기록 구간의 이벤트 수·배치 수·초당 이벤트."""
+        ev = [e for e in self.events if e.kind in ("key", "mouse")]
+        span = ev[-1].t - ev[0].t if len(ev) > 1 else 0.0
+        return {"events": len(ev), "batches": self.calls, "span_s": span,
+                "events_per_s": len(ev) / span if span > 0 else float("inf") if ev else 0.0}
+
+
+# ══════════════════════════════════════════════════
+#  현재 백엔드 + 프록시
+# ══════════════════════════════════════════════════
+_backend: InputBackend = Win32Backend()
+_SCAN_CACHE: "dict[int, int]" = {}   # vk → 스캔 코드 (input._scan_code 가 채움, 키보드 배열이 바뀌지 않는 한 불변)
+
+
+def get_backend() -> InputBackend:
+    return _backend
+
+
+def set_backend(backend: InputBackend) -> InputBackend:
+    """백엔드 교체. 이전 백엔드 반환 (복원용)."""
+    global _backend
+    prev, _backend = _backend, backend
+    _SCAN_CACHE.clear()   # 백엔드마다 MapVirtualKeyW 결과가 다를 수 있음
+    return prev
+
+
+@contextlib.contextmanager
+def use_backend(backend: InputBackend):
+    prev = set_backend(backend)
+    try:
+        yield backend
+    finally:
+        set_backend(prev)
+
+
+class _BackendProxy:
+    """모든 속성 접근을 현재 백엔드로 위임 (input.py 의 _user32)."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        return getattr(_backend, name)
+
+
+user32 = _BackendProxy()
@@ -0,0 +1,268 @@
+"""
+core/keyseq.py — 키/마우스 입력 시퀀스 컴파일러 (INPUT 배열 사전 생성 + 배치 SendInput + 정밀 대기)
+
+    CTRL_V = KeySeq().chord(_VK_CONTROL, _VK_V).compile()
+    CTRL_V.send()                                  # SendInput 1회
+
+    seq = KeySeq().tap(_VK_TAB).gap(0.3).tap(_VK_G).compile()
+    seq.send(clock=self._clock)                    # 배치 2회 + 0.3초 정밀 대기
+
+간격이 없는 연속 이벤트는 하나의 INPUT 배열로 묶여 SendInput 1회로 전송된다.
+간격은 sleep(대부분) + spin(마지막 ~2ms) 으로 대기해 Windows 기본 15.6ms 타이머 해상도와 무관하게
+서브ms 정확도를 유지한다 (VirtualClock 등 주입된 시계는 그 시계의 sleep 사용).
+"""
+import ctypes
+import sys
+import threading
+import time
+from typing import Callable, NamedTuple
+
+from src.core.clock import MONOTONIC
+from src.core.input import (
+    _user32, _KEYBDINPUT, _MOUSEINPUT, _scan_code,
+    _KEYEVENTF_KEYUP, _KEYEVENTF_UNICODE, _KEYEVENTF_EXTENDEDKEY,
+    _MOUSEEVENTF_LEFTDOWN, _MOUSEEVENTF_LEFTUP, _MOUSEEVENTF_RIGHTDOWN, _MOUSEEVENTF_RIGHTUP,
+    move_cursor_to,
+)
+from src.utils.recorder import note_event
+
+_INPUT_MOUSE    = 0
+_INPUT_KEYBOARD = 1
+
+# 확장 키 (방향키·Insert/Delete·Home/End·PgUp/PgDn) — EXTENDEDKEY 플래그 자동 부여
+_EXTENDED_VKS = frozenset({0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27, 0x28, 0x2D, 0x2E})
+
+
+class _INPUT(ctypes.Structure):
+    """키보드/마우스 공용 INPUT (한 배열에 섞어 SendInput 1회로 전송)."""
+    class _U(ctypes.Union):
+        _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT), ("_pad", ctypes.c_byte * 32)]
+    _anonymous_ = ("_u",)
+    _fields_    = [("type", ctypes.c_ulong), ("_u", _U)]
+
+
+# ══════════════════════════════════════════════════
+#  정밀 대기 (sleep + spin)
+# ══════════════════════════════════════════════════
+_SPIN_MARGIN = 0.002   # 마지막 2ms 는 spin (timeBeginPeriod(1) 후 sleep 오차 ≤ ~1ms)
+_timer_lock  = threading.Lock()
+_timer_res   = False
+_timer_count = 0
+_timer_over_total = 0.0
+_timer_over_max   = 0.0
+
+
+def _raise_timer_resolution():
+    """프로세스 타이머 해상도 1ms 로 (최초 1회). 실패해도 spin 구간을 늘려 정확도 유지."""
+    global _timer_res, _SPIN_MARGIN
+    with _timer_lock:
+        if _timer_res:
+            return
+        _timer_res = True
+        if sys.platform != "win32":
+            return              # 비 Windows: sleep 해상도가 이미 충분
+        try:
+            if ctypes.windll.winmm.timeBeginPeriod(1) != 0:
+                raise OSError
+        except Exception:
+            _SPIN_MARGIN = 0.016
+
+
+def precise_sleep(seconds: float):
+    """seconds 만큼 대기. 대부분은 sleep, 마지막 _SPIN_MARGIN 은 perf_counter spin."""
+    if seconds > 0:
+        sleep_until(time.perf_counter() + seconds)
+
+
+def sleep_until(end: float):
+    """perf_counter 가 end 에 도달할 때까지 대기 (이미 지났으면 즉시 반환, 오차 누적 없음)."""
+    global _timer_count, _timer_over_total, _timer_over_max
+    if not _timer_res:
+        _raise_timer_resolution()
+    coarse = end - time.perf_counter() - _SPIN_MARGIN
+    if coarse > 0:
+        time.sleep(coarse)
+    while time.perf_counter() < end:
+        time.sleep(0)   # GIL 양보 (다른 스레드 굶기지 않음)
+    over = time.perf_counter() - end
+    _timer_count += 1
+    _timer_over_total += over
+    if over > _timer_over_max:
+        _timer_over_max = over
+
+
+def timer_stats() -> dict:
+    """precise_sleep 호출 수와 목표 대비 초과 지연 (µs)."""
+    return {"sleeps": _timer_count,
+            "over_avg_us": _timer_over_total / _timer_count * 1e6 if _timer_count else 0.0,
+            "over_max_us": _timer_over_max * 1e6}
+
+
+# ══════════════════════════════════════════════════
+#  시퀀스 빌더 → 컴파일
+# ══════════════════════════════════════════════════
+class _Ev(NamedTuple):
+    kind:  int     # _INPUT_KEYBOARD / _INPUT_MOUSE
+    vk:    int
+    scan:  int
+    flags: int
+
+
+class KeySeq:
+    """선언형 입력 스크립트. 메서드 체이닝으로 작성 후 compile()."""
+
+    def __init__(self):
+        self._steps: list = []   # _Ev | float(간격) | (cx, cy)(커서 이동)
+
+    # ── 키보드 ────────────────────────────────────
+    def down(self, vk: int, extended: "bool | None" = None) -> "KeySeq":
+        self._steps.append(self._key(vk, 0, extended))
+        return self
+
+    def up(self, vk: int, extended: "bool | None" = None) -> "KeySeq":
+        self._steps.append(self._key(vk, _KEYEVENTF_KEYUP, extended))
+        return self
+
+    def tap(self, vk: int, hold: float = 0.0, times: int = 1) -> "KeySeq":
+        for _ in range(times):
+            self.down(vk)
+            if hold:
+                self.gap(hold)
+            self.up(vk)
+        return self
+
+    def chord(self, *vks: int) -> "KeySeq":
+        """vks[:-1] 을 누른 채 vks[-1] 탭 (Ctrl+V, Shift+←…) → 역순 해제."""
+        for vk in vks:
+            self.down(vk)
+        for vk in reversed(vks):
+            self.up(vk)
+        return self
+
+    def raw(self, vk: int, scan: int, flags: int) -> "KeySeq":
+        """플래그를 직접 지정한 키보드 이벤트 1개 (UNICODE 단독 ↓/↑ 등)."""
+        self._steps.append(_Ev(_INPUT_KEYBOARD, vk, scan, flags))
+        return self
+
+    def text(self, s: str) -> "KeySeq":
+        """KEYEVENTF_UNICODE 문자 입력 (IME 상태와 무관)."""
+        for ch in s:
+            self._steps.append(_Ev(_INPUT_KEYBOARD, 0, ord(ch), _KEYEVENTF_UNICODE))
+            self._steps.append(_Ev(_INPUT_KEYBOARD, 0, ord(ch), _KEYEVENTF_UNICODE | _KEYEVENTF_KEYUP))
+        return self
+
+    # ── 마우스 ────────────────────────────────────
+    def at(self, client_x: int, client_y: int) -> "KeySeq":
+        """커서를 WC3 클라이언트 좌표로 이동 (실행 시점에 스크린 좌표 변환)."""
+        self._steps.append((client_x, client_y))
+        return self
+
+    def click(self, button: str = "left") -> "KeySeq":
+        down, up = ((_MOUSEEVENTF_RIGHTDOWN, _MOUSEEVENTF_RIGHTUP) if button == "right"
+                    else (_MOUSEEVENTF_LEFTDOWN, _MOUSEEVENTF_LEFTUP))
+        self._steps.append(_Ev(_INPUT_MOUSE, 0, 0, down))
+        self._steps.append(_Ev(_INPUT_MOUSE, 0, 0, up))
+        return self
+
+    # ── 타이밍 ────────────────────────────────────
+    def gap(self, seconds: float) -> "KeySeq":
+        if seconds > 0:
+            self._steps.append(float(seconds))
+        return self
+
+    def then(self, other: "KeySeq") -> "KeySeq":
+        self._steps.extend(other._steps)
+        return self
+
+    def compile(self) -> "CompiledSeq":
+        return CompiledSeq(self._steps)
+
+    @staticmethod
+    def _key(vk: int, flags: int, extended: "bool | None") -> _Ev:
+        if extended if extended is not None else vk in _EXTENDED_VKS:
+            flags |= _KEYEVENTF_EXTENDEDKEY
+        return _Ev(_INPUT_KEYBOARD, vk, _scan_code(vk), flags)
+
+
+class CompiledSeq:
+    """사전 생성된 INPUT 배열 구간 + 간격. send() 는 구조체를 새로 만들지 않는다."""
+
+    __slots__ = ("_segments", "events", "batches", "duration", "sends")
+
+    def __init__(self, steps: list):
+        segments: list = []   # (INPUT 배열, 개수, 원본 이벤트) | float | (cx, cy)
+        run: "list[_Ev]" = []
+
+        def _flush():
+            if run:
+                arr = (_INPUT * len(run))()
+                for i, ev in enumerate(run):
+                    arr[i].type = ev.kind
+                    if ev.kind == _INPUT_KEYBOARD:
+                        arr[i].ki.wVk, arr[i].ki.wScan, arr[i].ki.dwFlags = ev.vk, ev.scan, ev.flags
+                    else:
+                        arr[i].mi.dwFlags = ev.flags
+                segments.append((arr, len(run), tuple(run)))
+                run.clear()
+
+        for step in steps:
+            if isinstance(step, _Ev):
+                run.append(step)
+                continue
+            _flush()
+            if isinstance(step, float) and segments and isinstance(segments[-1], float):
+                segments[-1] += step   # 연속 간격 병합
+            else:
+                segments.append(step)
+        _flush()
+        self._segments = tuple(segments)
+        self.events   = sum(s[1] for s in segments if isinstance(s, tuple) and len(s) == 3)
+        self.batches  = sum(1 for s in segments if isinstance(s, tuple) and len(s) == 3)
+        self.duration = sum(s for s in segments if isinstance(s, float))
+        self.sends    = 0
+
+    def schedule(self) -> "list[float]":
+        """배치별 예정 전송 시각 (첫 배치 기준 초). 지터 측정용."""
+        out, t = [], 0.0
+        for seg in self._segments:
+            if isinstance(seg, float):
+                t += seg
+            elif len(seg) == 3:
+                out.append(t)
+        return [x - out[0] for x in out] if out else []
+
+    def send(self, clock=None, cancelled: "Callable[[], bool] | None" = None) -> bool:
+        """시퀀스 실행. cancelled() 가 True 가 되면 다음 구간부터 중단 → False.
+
+        clock: 간격 대기에 쓸 시계. None/MONOTONIC = 시작 시각 기준 절대 마감 (간격 오차가 뒤로 누적되지 않음),
+               그 외 (VirtualClock) = clock.sleep.
+        """
+        precise = clock is None or clock is MONOTONIC
+        size  = ctypes.sizeof(_INPUT)
+        due   = time.perf_counter()
+        for seg in self._segments:
+            if cancelled is not None and cancelled():
+                return False
+            if isinstance(seg, float):
+                if precise:
+                    due += seg
+                    sleep_until(due)
+                else:
+                    clock.sleep(seg)
+            elif len(seg) == 3:
+                arr, n, evs = seg
+                _user32.SendInput(n, arr, size)
+                for ev in evs:
+                    if ev.kind == _INPUT_KEYBOARD:
+                        note_event("key", vk=ev.vk, scan=ev.scan, flags=ev.flags)
+                    else:
+                        note_event("mouse", flags=ev.flags)
+            else:
+                move_cursor_to(*seg)
+        self.sends += 1
+        return True
+
+
+def send_keys(seq: KeySeq, clock=None) -> bool:
+    """일회성 시퀀스 (사전 컴파일할 필요 없는 경우)."""
+    return seq.compile().send(clock)
@@ -0,0 +1,188 @@
+"""
+core/scheduler.py — 워커 보조 작업용 단일 스레드 타이머 스케줄러 (deadline 힙)
+"""
+import heapq
+import itertools
+import threading
+from typing import Callable
+
+from src.core.clock import MONOTONIC
+
+
+class Handle:
+    """예약된 작업 1개. cancel() 후에는 다시 실행되지 않는다."""
+
+    __slots__ = ("_sched", "_fn", "_args", "_interval", "deadline", "_cancelled", "_scope")
+
+    def __init__(self, sched: "Scheduler", fn: Callable, args: tuple,
+                 deadline: float, interval: "float | None"):
+        self._sched     = sched
+        self._fn        = fn
+        self._args      = args
+        self._interval  = interval
+        self.deadline   = deadline
+        self._cancelled = False
+        self._scope: "CancelScope | None" = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self):
+        """취소. 다른 스레드에서 호출 시 실행 중인 콜백이 끝날 때까지 대기 (구조적 취소)."""
+        self._sched._cancel(self)
+
+
+class CancelScope:
+    """작업 묶음. 스코프 취소(또는 with 블록 종료) 시 소속 작업이 모두 취소된다."""
+
+    def __init__(self, sched: "Scheduler"):
+        self._sched   = sched
+        self._handles: "list[Handle]" = []
+        self._lock    = threading.Lock()
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def _add(self, h: Handle) -> Handle:
+        with self._lock:
+            if self._cancelled:
+                h._cancelled = True
+                return h
+            self._handles = [x for x in self._handles if not x._cancelled]
+            self._handles.append(h)
+            h._scope = self
+        return self._sched._push(h)
+
+    def call_at(self, deadline: float, fn: Callable, *args) -> Handle:
+        return self._add(Handle(self._sched, fn, args, deadline, None))
+
+    def call_later(self, delay: float, fn: Callable, *args) -> Handle:
+        return self.call_at(self._sched.clock() + max(0.0, delay), fn, *args)
+
+    def every(self, interval: float, fn: Callable, *args, first: "float | None" = None) -> Handle:
+        """interval 초마다 fn 실행. fn 이 False 를 반환하면 반복 종료."""
+        deadline = self._sched.clock() + (interval if first is None else max(0.0, first))
+        return self._add(Handle(self._sched, fn, args, deadline, interval))
+
+    def cancel(self):
+        with self._lock:
+            self._cancelled = True
+            handles, self._handles = self._handles, []
+        for h in handles:
+            h.cancel()
+
+    def __enter__(self) -> "CancelScope":
+        return self
+
+    def __exit__(self, *exc):
+        self.cancel()
+        return False
+
+
+class Scheduler:
+    """단일 스레드에서 deadline 순으로 콜백을 실행하는 스케줄러.
+
+    - 타이머는 만료 시점에 정확히 1회 깨어난다 (주기 폴링 없음)
+    - 콜백은 짧게 유지해야 한다 (대기가 필요하면 call_later 로 이어서 예약)
+    - 스레드 수는 작업 수와 무관하게 1개
+    """
+
+    def __init__(self, name: str = "scheduler", clock=None):
+        self._clock  = clock or MONOTONIC
+        self.clock   = self._clock.now
+        self._name   = name
+        self._heap: "list[tuple[float, int, Handle]]" = []
+        self._seq    = itertools.count()
+        self._cond   = threading.Condition()
+        self._wake   = self._clock.event()   # 새 작업 / 종료 알림
+        self._thread: "threading.Thread | None" = None
+        self._closed = False
+        self._current: "Handle | None" = None
+        self._root   = CancelScope(self)
+
+    # ── 예약 (루트 스코프) ─────────────────────────
+    def call_at(self, deadline: float, fn: Callable, *args) -> Handle:
+        return self._root.call_at(deadline, fn, *args)
+
+    def call_later(self, delay: float, fn: Callable, *args) -> Handle:
+        return self._root.call_later(delay, fn, *args)
+
+    def every(self, interval: float, fn: Callable, *args, first: "float | None" = None) -> Handle:
+        return self._root.every(interval, fn, *args, first=first)
+
+    def scope(self) -> CancelScope:
+        return CancelScope(self)
+
+    # ── 수명 ──────────────────────────────────────
+    def start(self):
+        if self._thread is None:
+            self._closed = False
+            self._thread = self._clock.spawn(self._loop, name=self._name)
+
+    def close(self):
+        """모든 작업 취소 후 스레드 종료."""
+        self._root.cancel()
+        with self._cond:
+            self._closed = True
+            self._heap.clear()
+            self._cond.notify_all()
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    # ── 내부 ──────────────────────────────────────
+    def _push(self, h: Handle) -> Handle:
+        with self._cond:
+            if self._closed:
+                h._cancelled = True
+                return h
+            heapq.heappush(self._heap, (h.deadline, next(self._seq), h))
+            first = self._heap[0][2] is h
+        if first:
+            self._wake.set()
+        return h
+
+    def _cancel(self, h: Handle):
+        with self._cond:
+            h._cancelled = True
+            if threading.current_thread() is self._thread:
+                return
+            while self._current is h:
+                self._cond.wait()
+
+    def _loop(self):
+        while True:
+            self._wake.clear()
+            with self._cond:
+                if self._closed:
+                    return
+                while self._heap and self._heap[0][2]._cancelled:
+                    heapq.heappop(self._heap)
+                delay = (self._heap[0][0] - self.clock()) if self._heap else None
+                h = None
+                if delay is not None and delay <= 0:
+                    _, _, h = heapq.heappop(self._heap)
+                    self._current = h
+            if h is None:
+                # 다음 deadline 까지 (또는 새 작업 알림까지) 시계 대기
+                self._clock.wait(self._wake, delay)
+                continue
+            again = None
+            try:
+                again = h._fn(*h._args)
+            except Exception:
+                import traceback
+                traceback.print_exc()
+            with self._cond:
+                self._current = None
+                self._cond.notify_all()
+                if h._interval is not None and again is not False and not h._cancelled and not self._closed:
+                    # 드리프트 방지: 이전 deadline 기준으로 다음 실행 시점 계산
+                    h.deadline = max(h.deadline + h._interval, self.clock())
+                    heapq.heappush(self._heap, (h.deadline, next(self._seq), h))
+                else:
+                    h._cancelled = True
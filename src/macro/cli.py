@@ -0,0 +1,98 @@
+"""
+macro/cli.py — 헤드리스 실행 (Qt 없이 WatchWorker 구동, 로그는 콘솔/파일)
+
+    python -m src.macro.cli [--ingame] [--client N] [--log FILE] [--quiet]
+    PyNOX.exe --headless ...   (같은 인자)
+"""
+import argparse
+import os
+import sys
+import threading
+
+from src.core.events import LogEvent, UpdateEvent, StatusEvent, FinishedEvent
+
+
+class ConsoleSink:
+    """로그·상태 이벤트를 콘솔(및 파일)에 출력하는 구독자."""
+
+    _COLORS = {"warn": "\x1b[33m", "error": "\x1b[31m", "success": "\x1b[32m"}
+
+    FALLBACK_LOG = "pynox_headless.log"   # 콘솔 없는 빌드(console=False)에서 --log 미지정 시
+
+    def __init__(self, path: "str | None" = None, quiet: bool = False, color: bool = True):
+        # 창 모드 빌드는 sys.stdout 이 None → 콘솔 출력 없이 파일로만 기록
+        self._out   = sys.stdout
+        if self._out is None and not path:
+            from src.utils.config import _exe_dir
+            path = os.path.join(_exe_dir(), self.FALLBACK_LOG)
+        self._file  = open(path, "a", encoding="utf-8") if path else None
+        self._quiet = quiet
+        self._color = color and self._out is not None and self._out.isatty()
+        self._lock  = threading.Lock()
+
+    def __call__(self, ev: tuple):
+        if isinstance(ev, (LogEvent, UpdateEvent)):
+            self._write(ev.text, ev.level)
+        elif isinstance(ev, StatusEvent):
+            self._write(f"[상태] {ev.text}", "info")
+
+    def _write(self, line: str, level: str):
+        with self._lock:
+            if self._file is not None:
+                self._file.write(f"{level:<7} {line}\n")
+                self._file.flush()
+            if self._out is None or (self._quiet and level == "info"):
+                return
+            if self._color and level in self._COLORS:
+                line = f"{self._COLORS[level]}{line}\x1b[0m"
+            print(line, file=self._out, flush=True)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def main(argv: "list[str] | None" = None) -> int:
+    ap = argparse.ArgumentParser(description="PyNOX 헤드리스 워커 (GUI 없이 실행, Ctrl+C 로 중지)")
+    ap.add_argument("--ingame", action="store_true", help="인게임 상태에서 시작 (로비 단계 생략)")
+    ap.add_argument("--client", type=int, default=0,
+                    help="담당 클라이언트 번호 (1~N, 다중 클라이언트). 0 = 첫 War3")
+    ap.add_argument("--log", metavar="FILE", help="로그를 파일에도 기록 (추가 모드)")
+    ap.add_argument("-q", "--quiet", action="store_true", help="콘솔에는 warn 이상만 출력")
+    ap.add_argument("--no-color", action="store_true")
+    a = ap.parse_args(argv)
+
+    from src.macro.worker import WatchWorker
+    from src.utils.process import War3Instance, claim_war3, release_war3
+
+    instance = None
+    if a.client > 0:
+        instance = War3Instance(a.client - 1)
+        if not claim_war3(instance):
+            print(f"[#{a.client}] 배정 가능한 War3 없음 → 실행 후 자동 배정 대기", flush=True)
+
+    worker = WatchWorker(ingame=a.ingame, instance=instance)
+    sink   = ConsoleSink(a.log, quiet=a.quiet, color=not a.no_color)
+    worker.events.subscribe_all(sink)
+    done = threading.Event()
+    worker.events.subscribe(FinishedEvent, lambda _ev: done.set())
+
+    # 워커는 별도 스레드 — 메인 스레드는 Ctrl+C 를 받기 위해 대기만 한다
+    th = threading.Thread(target=worker.start, name="worker", daemon=True)
+    th.start()
+    try:
+        while not done.wait(0.5):
+            pass
+    except KeyboardInterrupt:
+        print("중지 요청...", flush=True)
+        worker.stop()
+        th.join(10.0)
+    finally:
+        release_war3(instance)
+        sink.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,413 @@
 """
 macro/combat.py — 보스전투, 사망감지
-WatchWorker._boss_fight_macro(), run_death_monitor() 등을 포함.
-현재는 macro/worker.py 의 WatchWorker 메서드로 구현되어 있음.
+DeathWatchdog: 워커가 소유하는 단일 사망 감시 서비스.
+SkillRotation: 쿨다운·커맨드 카드 픽셀 기반 보스 스킬 로테이션.
+BossHpTracker: 보스 HP 바 채움 비율 → 처치·교착 감지, 남은 시간(ETA) 추정.
+보스 전투 루프(WatchWorker._boss_fight_macro() 등)는 macro/worker.py 에 구현되어 있음.
 """
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+import numpy as np
+
+from src.core.capture import PixelProbe
+from src.core.clock import MONOTONIC
+from src.core.scheduler import Handle, Scheduler
+
+
+# 40번 사망로직 픽셀 (클라이언트 좌표) — 영웅 초상화 영역이 검정(0,0,0)이면 사망
+DEATH_PROBE_POINTS: "list[tuple[int, int]]" = [(13, 49)]
+DEATH_PROBE_MAX_HZ = 10.0
+
+
+class DeathWatchdog:
+    """사망 감시 서비스 (워커당 1개, 워커 스케줄러의 주기 작업 1개).
+
+    서브시스템은 subscribe(stop_event) 로 threading.Event 를 받고,
+    사망 감지 시 모든 구독 이벤트가 SET 된다. stop_event 가 SET 되면 구독은 자동 해제.
+    구독자가 없으면 샘플링하지 않는다.
+    사망 반응 지연(마지막 생존 샘플 → 사망 확정)을 기록한다.
+    """
+
+    def __init__(self,
+                 is_running: Callable[[], bool],
+                 points: "list[tuple[int, int]] | None" = None,
+                 rate_hz: float = 1.0,
+                 mode: str = "printwindow",
+                 log: "Optional[Callable[[str, str], None]]" = None,
+                 on_sample: "Optional[Callable[[tuple, bool], None]]" = None,
+                 clock=None):
+        self._is_running = is_running
+        self._clock      = clock or MONOTONIC
+        self._probe      = PixelProbe(points or DEATH_PROBE_POINTS, mode=mode)
+        self._interval   = 1.0 / max(0.1, min(DEATH_PROBE_MAX_HZ, rate_hz))
+        self._log        = log
+        self._on_sample  = on_sample
+        self._lock       = threading.Lock()
+        self._subs: "list[tuple[threading.Event, threading.Event]]" = []  # (death, stop)
+        self._handle: "Handle | None" = None
+        self._last_alive_t: "float | None" = None
+        self.last_death_t:  "float | None" = None
+        self.latencies: "list[float]" = []
+
+    # ── 구독 ──────────────────────────────────────
+    def subscribe(self, stop_event: threading.Event,
+                  death: "threading.Event | None" = None) -> threading.Event:
+        """사망 이벤트 구독. stop_event SET 시 자동 해제.
+        death 를 넘기면(예: CancelToken 하위 토큰) 그 객체를 SET 한다."""
+        if death is None:
+            death = threading.Event()
+        with self._lock:
+            self._subs.append((death, stop_event))
+        return death
+
+    def _prune(self) -> "list[threading.Event]":
+        with self._lock:
+            self._subs = [(d, s) for d, s in self._subs if not s.is_set() and not d.is_set()]
+            return [d for d, _ in self._subs]
+
+    # ── 수명 ──────────────────────────────────────
+    def start(self, scheduler: Scheduler):
+        if self._handle is None:
+            self._handle = scheduler.every(self._interval, self._tick, first=0.0)
+
+    def close(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._probe.close()
+
+    # ── 통계 ──────────────────────────────────────
+    def stats(self) -> "dict":
+        lat = self.latencies
+        return {
+            "deaths":  len(lat),
+            "avg_ms":  (sum(lat) / len(lat) * 1000.0) if lat else 0.0,
+            "max_ms":  (max(lat) * 1000.0) if lat else 0.0,
+        }
+
+    # ── 샘플링 루프 ───────────────────────────────
+    def sample_once(self) -> bool:
+        """1회 샘플링. 사망 확정 시 True (구독자 이벤트 SET)."""
+        subs = self._prune()
+        if not subs:
+            self._last_alive_t = None
+            return False
+        rgbs = self._probe.sample()
+        now_t = self._clock.now()
+        if rgbs is None:
+            return False
+        dead = all(rgb == (0, 0, 0) for rgb in rgbs)
+        if self._on_sample:
+            self._on_sample(rgbs[0], dead)
+        if not dead:
+            self._last_alive_t = now_t
+            return False
+        latency = (now_t - self._last_alive_t) if self._last_alive_t is not None else 0.0
+        self.latencies.append(latency)
+        self.last_death_t  = now_t
+        self._last_alive_t = None
+        if self._log:
+            self._log(f"[사망감지] 영웅 사망 확정 (감지 지연 ≤ {latency * 1000:.0f}ms) → suicide 루프 재시작", "warn")
+        for d in subs:
+            d.set()
+        return True
+
+    def _tick(self) -> bool:
+        # 구독자가 없으면 sample_once() 가 캡처 없이 즉시 반환
+        if not self._is_running():
+            return False
+        self.sample_once()
+        return True
+
+
+# ══════════════════════════════════════════════════
+#  보스 스킬 로테이션
+# ══════════════════════════════════════════════════
+# 목록 순서 = 우선순위. cooldown 기본값은 기존 고정 순환(5키 × ~0.12s)과 같은 키당 0.6초.
+# probe: 커맨드 카드 버튼의 클라이언트 좌표 (선택). 쿨다운 중인 버튼은 어둡게 그려진다.
+DEFAULT_BOSS_SKILLS: "list[dict]" = [
+    {"key": "D", "cooldown": 0.6, "probe": None},
+    {"key": "W", "cooldown": 0.6, "probe": None},
+    {"key": "E", "cooldown": 0.6, "probe": None},
+    {"key": "R", "cooldown": 0.6, "probe": None},
+    {"key": "T", "cooldown": 0.6, "probe": None},
+]
+BOSS_SKILL_TARGET   = (50, 75)   # 스킬 대상 좌클릭 좌표
+SKILL_READY_MIN     = 60         # 버튼 픽셀 평균 밝기 ≥ 이 값이면 준비 완료
+SKILL_CONFIRM_S     = 0.35       # 누른 뒤 이 시간 안에 버튼이 어두워지지 않으면 헛누름
+
+
+class _Skill:
+    __slots__ = ("key", "vk", "cooldown", "probe", "seq", "ready_at", "fired_at",
+                 "pending", "dark", "casts", "presses", "wasted", "held", "observed")
+
+    def __init__(self, key: str, vk: int, cooldown: float, probe, seq):
+        self.key      = key
+        self.vk       = vk
+        self.cooldown = cooldown
+        self.probe    = probe              # (x, y) | None
+        self.seq      = seq                # CompiledSeq: 스킬 키 → 대상 클릭 → 영웅 부대 선택
+        self.ready_at = 0.0
+        self.fired_at = 0.0
+        self.pending  = False              # 누름 후 시전 확인 대기 (probe 있는 스킬만)
+        self.dark     = False              # 시전 확인 후 버튼이 아직 어두움 (쿨다운 진행 중)
+        self.casts    = 0
+        self.presses  = 0
+        self.wasted   = 0
+        self.held     = 0                  # 설정 쿨다운은 끝났지만 버튼이 아직 어두웠던 횟수
+        self.observed: "float | None" = None   # probe 로 관측한 실제 쿨다운
+
+
+class SkillRotation:
+    """쿨다운 기반 보스 스킬 로테이션.
+
+    config "boss_skills" (없으면 DEFAULT_BOSS_SKILLS) 의 순서가 우선순위이며,
+    step() 1회에 준비된 스킬 중 가장 앞선 1개만 시전한다.
+    probe 좌표가 있는 스킬은 PixelProbe 1회 캡처로 버튼 밝기를 함께 읽어
+    - 타이머가 끝났어도 버튼이 어두우면 누르지 않고 (held),
+    - 누른 뒤 SKILL_CONFIRM_S 안에 어두워지면 시전 확정, 아니면 헛누름(wasted) 으로 집계한다.
+    probe 가 없는 스킬은 누름 = 시전으로 센다.
+    """
+
+    def __init__(self,
+                 hero_vk: int,
+                 skills: "list[dict] | None" = None,
+                 target: "tuple[int, int]" = BOSS_SKILL_TARGET,
+                 ready_min: int = SKILL_READY_MIN,
+                 min_gap: float = 0.1,
+                 mode: str = "printwindow",
+                 clock=None):
+        from src.core.keyseq import KeySeq
+        self._clock    = clock or MONOTONIC
+        self.ready_min = ready_min
+        self.min_gap   = min_gap
+        self.skills: "list[_Skill]" = []
+        for spec in skills or DEFAULT_BOSS_SKILLS:
+            key = str(spec.get("key", "")).upper()
+            if len(key) != 1:
+                continue
+            vk    = ord(key)
+            probe = spec.get("probe")
+            probe = (int(probe[0]), int(probe[1])) if probe else None
+            seq   = (KeySeq().tap(vk, hold=0.02).at(*target).click().tap(hero_vk)).compile()
+            self.skills.append(_Skill(key, vk, max(0.0, float(spec.get("cooldown", 0.6))), probe, seq))
+        if not self.skills:
+            raise ValueError("boss_skills 에 유효한 스킬이 없습니다")
+        points = [s.probe for s in self.skills if s.probe is not None]
+        self._probe   = PixelProbe(points, mode=mode) if points else None
+        self._started = self._clock.now()
+        self._next_t  = self._started      # 전역 최소 간격 (대상 클릭·부대 선택이 처리될 시간)
+
+    # ── 준비 상태 ─────────────────────────────────
+    def _bright(self) -> "dict[tuple[int, int], bool] | None":
+        """probe 좌표 → 준비(밝음) 여부. probe 없음/캡처 실패 시 None (타이머만 사용)."""
+        if self._probe is None:
+            return None
+        rgbs = self._probe.sample()
+        if rgbs is None:
+            return None
+        return {pt: sum(rgb) / 3 >= self.ready_min for pt, rgb in zip(self._probe.points, rgbs)}
+
+    def _settle(self, sk: _Skill, bright: "bool | None", now: float):
+        """시전 확인 대기 중인 스킬의 결과 반영 + 실제 쿨다운 관측."""
+        if bright is None:
+            return
+        if sk.pending:
+            if not bright:
+                sk.pending = False
+                sk.dark    = True
+                sk.casts  += 1
+            elif now - sk.fired_at >= SKILL_CONFIRM_S:
+                sk.pending  = False
+                sk.wasted  += 1
+                sk.ready_at = now          # 시전 안 됨 → 곧바로 다시 후보
+        elif bright and sk.dark:
+            sk.dark     = False
+            sk.observed = now - sk.fired_at
+
+    # ── 실행 ──────────────────────────────────────
+    def step(self, cancelled: "Callable[[], bool] | None" = None) -> "str | None":
+        """준비된 최우선 스킬 1개 시전. 시전한 키 (없으면 None)."""
+        now = self._clock.now()
+        if now < self._next_t:
+            return None
+        states = self._bright()
+        pick: "_Skill | None" = None
+        for sk in self.skills:
+            bright = states.get(sk.probe) if states is not None and sk.probe is not None else None
+            self._settle(sk, bright, now)
+            if pick is not None or sk.pending or now < sk.ready_at:
+                continue
+            if bright is False:
+                if sk.ready_at <= sk.fired_at + sk.cooldown:
+                    sk.held += 1           # 쿨다운 1회당 1번만 집계
+                sk.ready_at = now + self.min_gap
+                continue
+            pick = sk
+        if pick is None:
+            return None
+        if not pick.seq.send(self._clock, cancelled):
+            return None
+        now = self._clock.now()
+        pick.presses += 1
+        pick.fired_at = now
+        pick.ready_at = now + pick.cooldown
+        if pick.probe is not None and states is not None:
+            pick.pending = True
+        else:
+            pick.casts += 1
+        self._next_t = now + self.min_gap
+        return pick.key
+
+    def wait_hint(self, cap: float = 0.25) -> float:
+        """다음 시전 후보까지 남은 시간 (cap 이하). 루프의 대기 시간으로 사용."""
+        now = self._clock.now()
+        due = [sk.ready_at for sk in self.skills if not sk.pending]
+        if any(sk.pending for sk in self.skills):
+            due.append(now + 0.05)         # 확인 대기 중이면 짧게 재샘플
+        t = max(min(due, default=now + cap), self._next_t)
+        return max(0.0, min(cap, t - now))
+
+    def close(self):
+        if self._probe is not None:
+            self._probe.close()
+
+    # ── 통계 ──────────────────────────────────────
+    def stats(self) -> dict:
+        elapsed = max(1e-6, self._clock.now() - self._started)
+        casts   = sum(sk.casts for sk in self.skills)
+        return {
+            "elapsed_s": elapsed,
+            "casts":     casts,
+            "presses":   sum(sk.presses for sk in self.skills),
+            "wasted":    sum(sk.wasted for sk in self.skills),
+            "held":      sum(sk.held for sk in self.skills),
+            "cpm":       casts / elapsed * 60.0,
+            "per_skill": {sk.key: {"casts": sk.casts, "presses": sk.presses, "wasted": sk.wasted,
+                                   "held": sk.held, "observed_cd": sk.observed}
+                          for sk in self.skills},
+        }
+
+
+# ══════════════════════════════════════════════════
+#  보스 HP 추적
+# ══════════════════════════════════════════════════
+# HP 바 픽셀: 초록→노랑→빨강으로 변하는 채도 높은 색. 빈 부분은 검정/어두운 회색.
+HP_MIN_CHROMA  = 60      # max(B,G,R) - min(B,G,R)
+HP_MIN_VALUE   = 80      # max(B,G,R)
+HP_COL_FILLED  = 0.5     # 세로 픽셀 중 이 비율 이상이 바 색이면 채워진 열
+
+
+def hp_fill_ratio(bgr: "np.ndarray") -> float:
+    """HP 바 영역(BGR) 의 채움 비율 0.0~1.0. 열 단위로 바 색 여부를 판정 (벡터 연산)."""
+    if bgr is None or bgr.size == 0 or bgr.ndim != 3:
+        return 0.0
+    px = bgr[:, :, :3].astype(np.int16)
+    hi = px.max(axis=2)
+    lo = px.min(axis=2)
+    bar = (hi - lo >= HP_MIN_CHROMA) & (hi >= HP_MIN_VALUE)
+    return float((bar.mean(axis=0) >= HP_COL_FILLED).mean())
+
+
+class BossHpTracker:
+    """보스 HP 바 영역을 프레임마다 읽어 처치·교착·ETA 를 판정.
+
+    region: 1920×1080 기준 클라이언트 좌표 (x0, y0, x1, y1). 프레임 크기에 맞춰 비율 보정.
+    - visible: HP 바가 한 번이라도 VISIBLE_MIN 이상으로 보였는지 (보스 존재)
+    - killed:  보인 뒤 채움 비율이 kill_ratio 이하로 kill_votes 회 연속 (직전 비율 ≤ KILL_FROM)
+    - stalled: stall_s 초 동안 최저 비율이 min_drop 이상 줄지 않음
+    - eta():   최근 window_s 초 선형 회귀 기울기로 0% 까지 남은 초
+    """
+
+    VISIBLE_MIN = 0.05
+    KILL_FROM   = 0.30   # 빈 바 직전 마지막 비율이 이 이하여야 처치
+
+    def __init__(self,
+                 region: "tuple[int, int, int, int]",
+                 kill_ratio: float = 0.01,
+                 kill_votes: int = 3,
+                 stall_s: float = 20.0,
+                 min_drop: float = 0.005,
+                 window_s: float = 10.0,
+                 clock=None):
+        x0, y0, x1, y1 = (int(v) for v in region)
+        if x1 <= x0 or y1 <= y0:
+            raise ValueError(f"잘못된 HP 바 영역: {region}")
+        self.region     = (x0, y0, x1, y1)
+        self.kill_ratio = kill_ratio
+        self.kill_votes = max(1, kill_votes)
+        self.stall_s    = stall_s
+        self.min_drop   = min_drop
+        self.window_s   = window_s
+        self._clock     = clock or MONOTONIC
+        self._hist: "deque[tuple[float, float]]" = deque()
+        self._low       = 0
+        self._last      = 1.0
+        self._best      = 1.0
+        self._best_t    = self._clock.now()
+        self.ratio: "float | None" = None
+        self.visible    = False
+        self.killed     = False
+        self.samples    = 0
+
+    def _crop(self, frame: "np.ndarray") -> "np.ndarray":
+        h, w = frame.shape[:2]
+        x0, y0, x1, y1 = self.region
+        sx, sy = w / 1920.0, h / 1080.0
+        return frame[int(y0 * sy):max(int(y1 * sy), int(y0 * sy) + 1),
+                     int(x0 * sx):max(int(x1 * sx), int(x0 * sx) + 1)]
+
+    def update(self, frame: "np.ndarray | None") -> "float | None":
+        """BGR 프레임 1장 반영. 채움 비율 (프레임 없음 → None, 상태 유지)."""
+        if frame is None or frame.ndim != 3:
+            return None
+        r   = hp_fill_ratio(self._crop(frame))
+        now = self._clock.now()
+        self.samples += 1
+        self.ratio = r
+        if r >= self.VISIBLE_MIN:
+            self.visible = True
+        if not self.visible:
+            self._best_t = now    # 바가 보이기 전에는 교착 타이머 정지
+        elif r <= self.kill_ratio:
+            # 빈 바: 직전 비율이 낮았을 때만 처치로 인정 (높은 HP 에서 바가 가려진 경우 제외)
+            self._low += 1
+            if self._low >= self.kill_votes and self._last <= self.KILL_FROM:
+                self.killed = True
+        else:
+            self._low  = 0
+            self._last = r
+            if r < self._best - self.min_drop or not self._hist:
+                self._best, self._best_t = min(r, self._best), now
+            self._hist.append((now, r))
+            while self._hist and now - self._hist[0][0] > self.window_s:
+                self._hist.popleft()
+        return r
+
+    @property
+    def stalled(self) -> bool:
+        return (self.visible and not self.killed
+                and self._clock.now() - self._best_t >= self.stall_s)
+
+    def eta(self) -> "float | None":
+        """0% 까지 남은 초 (감소 추세가 없으면 None)."""
+        if len(self._hist) < 3 or self.ratio is None:
+            return None
+        t = np.fromiter((p[0] for p in self._hist), float, len(self._hist))
+        y = np.fromiter((p[1] for p in self._hist), float, len(self._hist))
+        t -= t.mean()
+        den = float((t * t).sum())
+        if den <= 0:
+            return None
+        slope = float((t * (y - y.mean())).sum()) / den
+        if slope >= -1e-4:
+            return None
+        return self.ratio / -slope
+
+    def status_text(self) -> str:
+        if self.ratio is None or not self.visible:
+            return "보스 HP 대기 중"
+        eta = self.eta()
+        return f"보스 HP {self.ratio * 100:.0f}%" + (f" · ETA {eta:.0f}초" if eta is not None else "")
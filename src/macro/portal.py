@@ -1,5 +1,211 @@
 """
-macro/portal.py — 포탈 구역 사냥 로직
-WatchWorker._post_portal_zone_hunt(), _move_to_zone() 등을 포함.
-현재는 macro/worker.py 의 WatchWorker 메서드로 구현되어 있음.
+macro/portal.py — 포탈 보스 경로 계획 (미니맵 웨이포인트 그래프)
+좌표 데이터는 macro/zones.py, 실제 이동(WatchWorker._move_to_zone())은 macro/worker.py 에 있음.
+
+보스 데이터의 pos~pos3 / boss_exit 로부터 영역(필드·서브맵) 그래프를 만든다.
+    영역   = 지나온 서브맵 입구 좌표의 튜플 (필드 = ())
+    입구   = 보스 출구 단계 수(d) 만큼 앞쪽 이동 좌표 (늪의 거인: 입구 2개 → 필드 ⊃ 킹크랩 서브맵 ⊃ 거인 서브맵)
+    출구   = 한 단계 바깥 영역의 입구 좌표로 나온다
+같은 영역 안의 좌표끼리는 직접 이동할 수 있으므로, 예를 들어 늪의 거인 → 킹크랩은
+필드까지 나갔다 다시 들어가지 않고 안쪽 출구 1번 + 킹크랩 좌표 1번으로 이동한다.
+보스 데이터의 수동 shortcuts 는 그래프보다 우선한다.
+
+    route = plan_boss_route(PORTALS[key].bosses, enabled)
+    route.bosses   # 방문 순서
+    route.legs     # [Leg(시작 → 첫 보스), Leg(보스1 → 보스2), …]
 """
+import heapq
+import itertools
+import math
+from typing import NamedTuple
+
+STEP_S     = 2.0    # 이동 명령 1회 고정 비용 (우클릭 1초 + 29/30번 감지)
+SEC_PER_PX = 0.12   # 미니맵 1px 당 이동 시간
+PORTAL_S   = 1.5    # 서브맵 입구/출구 통과 (화면 전환)
+MAX_PERMUTE = 6     # 활성 보스가 이보다 많으면 순서 탐색 대신 설정 순서 유지
+
+
+class Leg(NamedTuple):
+    name:  str                          # 로그용 "A → B"
+    steps: "tuple[tuple[int, int], ...]"  # 순서대로 우클릭할 미니맵 좌표
+    cost:  float                        # 예상 소요 (초)
+    via:   str                          # "경로" | "숏컷"
+
+
+class BossRoute(NamedTuple):
+    bosses:   list          # 방문 순서 (보스 구역 dict)
+    legs:     "list[Leg]"   # legs[i] = i 번째 보스까지 (legs[0] 은 현재 위치에서 출발)
+    back:     "Leg | None"  # 마지막 보스 → 필드
+    cost:     float         # legs + back 예상 합계
+    baseline: float         # 설정 순서 그대로 (출구 → 재진입) 갔을 때 예상 합계
+
+
+def _dist(a: "tuple[int, int] | None", b: "tuple[int, int]") -> float:
+    return math.hypot(a[0] - b[0], a[1] - b[1]) if a is not None else 0.0
+
+
+class _State(NamedTuple):
+    region: tuple
+    pos:    "tuple[int, int] | None"   # None = 영역 내 위치 모름 (포탈 도착 직후 등)
+
+
+class WaypointGraph:
+    """보스 구역 목록 → 영역별 클릭 지점·입구·출구."""
+
+    def __init__(self, bosses: list):
+        self.points:    "dict[tuple, set]" = {}
+        self.entrances: "dict[tuple, tuple]" = {}   # (영역, 좌표) → 안쪽 영역
+        self.exits:     "dict[tuple, tuple]" = {}   # (영역, 좌표) → 바깥 영역
+        self.arrival:   "dict[tuple, tuple[int, int]]" = {}   # 영역 진입 직후 위치 (출구 근처)
+        self.targets:   "dict[str, _State]" = {}
+        self.shortcuts: "dict[tuple[str, str], tuple]" = {}
+        self._cache:    dict = {}
+        for b in bosses:
+            self._add_boss(b)
+
+    @staticmethod
+    def _pt(p) -> "tuple[int, int]":
+        return (int(p[0]), int(p[1]))   # 같은 지점 = 같은 좌표 (데이터가 공용 입구·출구를 같은 값으로 씀)
+
+    def _add_boss(self, b: dict):
+        entry = [self._pt(b[k]) for k in ("pos", "pos2", "pos3") if b.get(k)]
+        if not entry:
+            return
+        ex    = b.get("boss_exit") or {}
+        exits = [self._pt(ex[k]) for k in ("pos", "pos2") if ex.get(k)]
+        depth = min(len(exits), len(entry) - 1)
+        for i, p in enumerate(entry):
+            region = tuple(entry[:min(i, depth)])
+            self.points.setdefault(region, set()).add(p)
+            if i < depth:
+                self.entrances[(region, p)] = region + (p,)
+        inner = tuple(entry[:depth])
+        self.targets[b.get("key", b["name"])] = _State(inner, entry[-1])
+        for j, e in enumerate(exits[:depth]):
+            region = inner[:depth - j]
+            self.points.setdefault(region, set()).add(e)
+            self.exits[(region, e)] = region[:-1]
+            self.arrival.setdefault(region, e)
+        for other, sc in (b.get("shortcuts") or {}).items():
+            steps = tuple(self._pt(sc[k]) for k in ("pos", "pos2", "pos3") if sc.get(k))
+            if steps:
+                self.shortcuts[(b.get("key", b["name"]), other)] = steps
+
+    # ── 최단 경로 ─────────────────────────────────
+    def _edges(self, st: _State):
+        for q in self.points.get(st.region, ()):
+            c = STEP_S + _dist(st.pos, q) * SEC_PER_PX
+            key = (st.region, q)
+            if key in self.entrances:
+                child = self.entrances[key]
+                yield q, c + PORTAL_S, _State(child, self.arrival.get(child))
+            elif key in self.exits:
+                yield q, c + PORTAL_S, _State(self.exits[key], st.region[-1])
+            elif q != st.pos:
+                yield q, c, _State(st.region, q)
+
+    def path(self, start: _State, goal) -> "tuple[float, tuple, _State] | None":
+        """start → goal (_State, 또는 영역 튜플 = 그 영역 아무 곳). (비용, 클릭 좌표, 도착 상태)."""
+        ck = (start, goal)
+        if ck in self._cache:
+            return self._cache[ck]
+
+        def _done(s: _State) -> bool:
+            return s == goal if isinstance(goal, _State) else s.region == goal
+
+        seen: set = set()
+        heap = [(0.0, 0, start, ())]
+        tie  = itertools.count(1)
+        res  = None
+        while heap:
+            cost, _, st, steps = heapq.heappop(heap)
+            if _done(st):
+                res = (cost, steps, st)
+                break
+            if st in seen:
+                continue
+            seen.add(st)
+            for q, c, nxt in self._edges(st):
+                if nxt not in seen:
+                    heapq.heappush(heap, (cost + c, next(tie), nxt, steps + (q,)))
+        self._cache[ck] = res
+        return res
+
+    def steps_cost(self, start: _State, steps: tuple) -> "tuple[float, _State]":
+        """정해진 클릭 순서(수동 숏컷)의 예상 비용과 도착 상태."""
+        st, total = start, 0.0
+        for q in steps:
+            total += STEP_S + _dist(st.pos, q) * SEC_PER_PX
+            st = _State(st.region, q)
+        return total, st
+
+
+# ══════════════════════════════════════════════════
+#  경로 계획
+# ══════════════════════════════════════════════════
+_GRAPHS: "dict[int, WaypointGraph]" = {}
+
+
+def graph_for(bosses: list) -> WaypointGraph:
+    """보스 목록(zones.py 의 모듈 상수) 별 그래프 캐시."""
+    g = _GRAPHS.get(id(bosses))
+    if g is None:
+        g = _GRAPHS[id(bosses)] = WaypointGraph(bosses)
+    return g
+
+
+def _key(b: dict) -> str:
+    return b.get("key", b["name"])
+
+
+def _walk(g: WaypointGraph, order: list, optimized: bool) -> "tuple[float, list[Leg], Leg | None]":
+    """order 순서로 방문할 때의 구간들. optimized=False 면 기존 방식 (출구로 필드까지 나갔다 재진입)."""
+    st    = _State((), None)
+    legs: "list[Leg]" = []
+    total = 0.0
+    prev  = None
+    for b in order:
+        name = f"{prev['name'] if prev else '현재 위치'} → {b['name']}"
+        sc   = g.shortcuts.get((_key(prev), _key(b))) if prev else None
+        if sc:
+            cost, st = g.steps_cost(st, sc)
+            legs.append(Leg(name, sc, cost, "숏컷"))
+        else:
+            steps, cost = (), 0.0
+            if not optimized and st.region:
+                r = g.path(st, ())
+                if r is None:
+                    return math.inf, [], None
+                cost, steps, st = r
+            r = g.path(st, g.targets[_key(b)])
+            if r is None:
+                return math.inf, [], None
+            cost, steps, st = cost + r[0], steps + r[1], r[2]
+            legs.append(Leg(name, steps, cost, "경로"))
+        total += legs[-1].cost
+        prev = b
+    back = None
+    if st.region:
+        r = g.path(st, ())
+        if r is None:
+            return math.inf, [], None
+        back = Leg(f"{prev['name']} → 필드", r[1], r[0], "경로")
+        total += r[0]
+    return total, legs, back
+
+
+def plan_boss_route(bosses: list, enabled: list, optimize: bool = True) -> BossRoute:
+    """enabled(설정 순서) 보스를 모두 도는 최단 순서. 동률이면 설정 순서 유지."""
+    g = graph_for(bosses)
+    enabled = [b for b in enabled if _key(b) in g.targets]
+    baseline, legs, back = _walk(g, enabled, optimized=False)
+    best = (math.inf, enabled, [], None)
+    orders = (itertools.permutations(enabled) if optimize and len(enabled) <= MAX_PERMUTE
+              else [tuple(enabled)])
+    for order in orders:
+        cost, o_legs, o_back = _walk(g, list(order), optimized=True)
+        if cost < best[0] - 1e-9:
+            best = (cost, list(order), o_legs, o_back)
+    if not best[2] and enabled:   # 그래프로 못 찾음 → 기존 경로
+        return BossRoute(enabled, legs, back, baseline, baseline)
+    return BossRoute(best[1], best[2], best[3], best[0], baseline)
@@ -0,0 +1,61 @@
+"""
+macro/qt_worker.py — 워커 이벤트 버스 → Qt Signal 브리지 (UI 는 이 모듈만 PySide6 에 의존)
+"""
+from PySide6.QtCore import QObject, Signal
+
+from src.core.events import (
+    LogEvent, UpdateEvent, StatusEvent, OverlayEvent, TraceEvent, CpuEvent, FinishedEvent,
+)
+
+# 이벤트 타입 → Signal 이름
+_SIGNAL_OF = {
+    LogEvent:      "log_signal",
+    UpdateEvent:   "update_signal",
+    StatusEvent:   "status_signal",
+    OverlayEvent:  "overlay_signal",
+    TraceEvent:    "trace_signal",
+    CpuEvent:      "cpu_signal",
+    FinishedEvent: "finished",
+}
+
+
+class WorkerSignals(QObject):
+    """WatchWorker 이벤트와 1:1 대응하는 Qt Signal 묶음.
+    워커 스레드에서 emit → 메인 스레드 슬롯은 Qt 큐 연결로 호출된다."""
+
+    log_signal     = Signal(str, str)
+    update_signal  = Signal(str, str)
+    status_signal  = Signal(str, str)
+    overlay_signal = Signal(int, int, int, int)
+    trace_signal   = Signal(object)
+    cpu_signal     = Signal(object)
+    finished       = Signal()
+
+    def _dispatch(self, event: tuple):
+        getattr(self, _SIGNAL_OF[type(event)]).emit(*event)
+
+
+class QtWorker(WorkerSignals):
+    """스레드 내 WatchWorker 의 Qt 래퍼. moveToThread 후 thread.started → run 연결.
+
+    WatchWorker 와 같은 stop() / _running / _instance 를 노출 → WorkerProcess 와 교체 사용 가능.
+    """
+
+    def __init__(self, worker):
+        super().__init__()
+        self._worker = worker
+        worker.events.subscribe_all(self._dispatch)
+
+    @property
+    def _running(self) -> bool:
+        return self._worker._running
+
+    @property
+    def _instance(self):
+        return self._worker._instance
+
+    def run(self):
+        self._worker.start()
+
+    def stop(self):
+        self._worker.stop()
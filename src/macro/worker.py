@@ -1,39 +1,50 @@
 """
-macro/worker.py — WatchWorker (QObject, PySide6)
+macro/worker.py — WatchWorker (Qt 비의존, 이벤트 버스로 로그·상태 발행)
 """
 import ctypes
 import ctypes.wintypes
 import os
 import sys
 import random
-import time
 import threading
 
 import psutil
-import pymem
-import pymem.process
 import win32api
 
-from PySide6.QtCore import QObject, Signal
-
 from datetime import datetime
 def now() -> str:
     return datetime.now().strftime("%H:%M:%S")
 
 from src.utils.config import load_config, save_config
-from src.utils.process import find_war3_hwnd
-from src.utils.memory import write_game_delay, write_start_speed_zero, patch_war3_preferences, patch_war3_resolution_registry, send_chat_memory
-from src.core.image_match import _image_match, image_exists, image_search, _CHAR_IMAGES
+from src.utils.process import (
+    find_war3_hwnd, find_war3_process, kill_war3_processes, bind_instance,
+    War3Instance, CpuMeter,
+)
+from src.utils.memory import CHAINS, acquire_session, drop_session, release_session, session_stats, write_game_delay, write_start_speed_zero, patch_war3_preferences, patch_war3_resolution_registry
+from src.core.image_match import _image_match, _match_frame, _capture_frame, image_exists, image_search, _CHAR_IMAGES
+from src.core.detector import VotingDetector
+from src.core.scheduler import Scheduler, Handle
+from src.core.cancel import CancelToken
+from src.core.clock import MONOTONIC
+from src.core.keyseq import KeySeq, CompiledSeq, timer_stats
+from src.core.events import (
+    EventBus, LogEvent, UpdateEvent, StatusEvent, OverlayEvent, TraceEvent, CpuEvent, FinishedEvent,
+)
+from src.utils.trace import Tracer, traced
+from src.utils import recorder
+from src.utils.chat import chat_dispatcher, close_dispatcher, transport_ranking, transport_stats, set_clipboard
+from src.utils.memstate import MemStatePublisher, acquire_publisher, release_publisher
 from src.constants import IMG
 from src.core.input import (
-    _user32, _press_vk, _send_key, click_image_center, right_click_image_center,
+    _user32, _send_key, click_at, click_image_center, right_click_image_center,
     move_cursor_to, _scale_coords, type_string, press_enter,
     _VK_RETURN, _VK_CONTROL, _VK_SHIFT, _VK_TAB, _VK_ESCAPE,
-    _VK_C, _VK_G, _VK_V, _VK_S, _VK_LEFT, _VK_RIGHT,
-    _KBD_INPUT, _KEYEVENTF_KEYUP, _KEYEVENTF_UNICODE,
+    _VK_C, _VK_G, _VK_V, _VK_S, _VK_HOME, _VK_LEFT, _VK_RIGHT,
     _PORTAL_COORDS,
 )
-from src.core.capture import _get_pixel_at_client
+from src.macro.combat import BossHpTracker, DeathWatchdog, SkillRotation
+from src.macro.portal import plan_boss_route
+from src.macro.zones import DEFAULT_PORTAL, portal_info
 from src.ui.theme import TEXT, GREEN, RED, YELLOW
 
 from src.utils.crypto import decrypt_password
@@ -45,23 +56,57 @@ _IMAGE_DIR = os.path.join(
     "image_search",
 )
 
-
-class WatchWorker(QObject):
-    log_signal     = Signal(str, str)        # 새 줄 추가
-    update_signal  = Signal(str, str)        # 마지막 줄 덮어쓰기
-    status_signal  = Signal(str, str)
-    overlay_signal = Signal(int, int, int, int)  # cx, cy, tw, th (클라이언트 좌표)
-    finished       = Signal()
-
-    def __init__(self, ingame: bool = False):
-        super().__init__()
-        self._running            = False
+# ── 사전 컴파일 입력 시퀀스 (INPUT 배열 재사용, 간격 없는 이벤트는 SendInput 1회) ──
+_SEQ_ENTER  = KeySeq().tap(_VK_RETURN).compile()
+_SEQ_ESC    = KeySeq().tap(_VK_ESCAPE).compile()
+_SEQ_C      = KeySeq().tap(_VK_C).compile()
+_SEQ_CTRL_V = KeySeq().chord(_VK_CONTROL, _VK_V).compile()
+_SEQ_CTRL_C = KeySeq().chord(_VK_CONTROL, _VK_C).compile()
+_SEQ_TAB_G  = KeySeq().tap(_VK_TAB).gap(0.3).tap(_VK_G).compile()
+_SEQ_TAB_C  = KeySeq().tap(_VK_TAB).gap(0.3).tap(_VK_C).compile()
+# Shift+Home (커서 앞 남은 입력 전체 선택) → Ctrl+V 로 덮어쓰기 — 입력창이 비어 있으면 Ctrl+V 와 같음
+_SEQ_PASTE_OVER = KeySeq().chord(_VK_SHIFT, _VK_HOME).chord(_VK_CONTROL, _VK_V).compile()
+
+
+class WatchWorker:
+    """재접속·사냥 흐름 워커. start() 를 호출한 스레드에서 블록 실행된다.
+
+    출력은 모두 self.events (EventBus) 로 발행 — Qt UI(QtWorker)·CLI·자식 프로세스 파이프가 구독.
+    *_signal 채널은 Signal 과 같은 emit/connect 모양 (기존 연결 코드 호환).
+    """
+
+    def __init__(self, ingame: bool = False, clock=None, instance: "War3Instance | None" = None):
+        self.events         = EventBus()
+        self.log_signal     = self.events.channel(LogEvent)      # 새 줄 추가
+        self.update_signal  = self.events.channel(UpdateEvent)   # 마지막 줄 덮어쓰기
+        self.status_signal  = self.events.channel(StatusEvent)
+        self.overlay_signal = self.events.channel(OverlayEvent)  # cx, cy, tw, th (클라이언트 좌표)
+        self.trace_signal   = self.events.channel(TraceEvent)    # TraceCycle (사이클 종료 시)
+        self.cpu_signal     = self.events.channel(CpuEvent)      # {index, pid, worker_pct, war3_pct} (인스턴스 CPU 보고)
+        self.finished       = self.events.channel(FinishedEvent)
+        self._instance           = instance  # 담당 War3 (None = 단일 클라이언트, 첫 War3 사용)
+        self._cpu                = CpuMeter()
+        self._clock              = clock or MONOTONIC  # 모든 시간 측정·대기의 기준 (테스트: VirtualClock)
+        self._token              = CancelToken(clock=self._clock)  # 중지 토큰 (start() 마다 새로 발급)
+        self._token.cancel()
         self._ingame             = ingame
         self._boss_priority_done = False  # 보스 우선 토벌 1회 사용 여부
         self._fm_blacklist: dict = {}     # 프리매치 블랙리스트 {방ID: 만료timestamp}
+        self._fm_join_times: "dict[str, list[float]]" = {"clipboard": [], "typing": []}  # 경로별 방 선택→입장 소요(초)
+        self._route_times: "list[tuple[float, float]]" = []   # 보스 경로 구간별 (예상, 실제) 초
+        self._sched = Scheduler(name="worker-sched", clock=self._clock)  # 보조 작업(워처·타이머·커서) 전용 스레드 1개
+        self._death_watchdog: "DeathWatchdog | None" = None
+        self._death_status_t = float("-inf")   # 사망감지 상태바 마지막 갱신 (가상 시계 기준)
+        self._tracer = Tracer(clock=self._clock.now)  # 재접속 파이프라인 span 기록 (War3 재시작 → 사냥터 복귀)
+        self._memstate: "MemStatePublisher | None" = None  # 채팅창·인게임·방 인원 메모리 상태 (템플릿 전 1차 확인)
+
+    @property
+    def _running(self) -> bool:
+        return not self._token.cancelled
 
     def log(self, msg: str, level: str = "info"):
         self.log_signal.emit(f"[{now()}] {msg}", level)
+        recorder.note_event("log", msg=msg, level=level)
 
     def update_log(self, msg: str, level: str = "info"):
         self.update_signal.emit(f"[{now()}] {msg}", level)
@@ -70,41 +115,178 @@ class WatchWorker(QObject):
         self.status_signal.emit(msg, color)
 
     def start(self):
-        self._running = True
+        # 인스턴스 바인딩은 이 스레드와 clock.spawn·스케줄러 스레드에 상속된다
+        with self._clock.participant(), bind_instance(self._instance):
+            self._start()
+
+    def _start(self):
+        self._token = CancelToken(clock=self._clock)
+        cfg = load_config()
+        self._death_watchdog = DeathWatchdog(
+            is_running=lambda: self._running,
+            points=[tuple(p) for p in cfg.get("death_probe_points", [])] or None,
+            rate_hz=cfg.get("death_probe_hz", 1.0),
+            mode=cfg.get("death_probe_mode", "printwindow"),
+            log=self.log,
+            on_sample=self._on_death_sample,
+            clock=self._clock,
+        )
+        recorder.install(recorder.from_config(cfg, clock=self._clock.now))  # 실패 재현용 세션 녹화 (기본 OFF)
+        self._memstate = acquire_publisher(self._instance)
+        self._sched.start()
+        self._death_watchdog.start(self._sched)
+        self._cpu = CpuMeter()
+        self._cpu.add_thread()
+        cpu_iv = cfg.get("cpu_report_interval", 30)
+        if cpu_iv > 0:
+            self._sched.every(cpu_iv, self._cpu_tick, first=0.0)
+        failure = None
         try:
             self._run()
         except Exception as e:
             import traceback
+            failure = f"워커 예외: {e}"
             self.log_signal.emit(
                 f"[{now()}] [치명적 오류] 워커 예외: {e}", "error")
             self.log_signal.emit(
                 f"[{now()}] {traceback.format_exc()}", "error")
         finally:
-            self._running = False
+            if failure is None and not self._token.cancelled:
+                failure = "중지 요청 없이 흐름 종료"   # 감지 실패·시간 초과로 _run 반환
+            self._token.cancel()
+            self._tracer.end_cycle(ok=False)
+            if failure is not None:
+                self._dump_recording(failure)
+            recorder.install(None)
+            stats = self._death_watchdog.stats()
+            if stats["deaths"]:
+                self.log_signal.emit(
+                    f"[{now()}] [사망감지] 사망 {stats['deaths']}회 / 감지 지연 "
+                    f"평균 {stats['avg_ms']:.0f}ms, 최대 {stats['max_ms']:.0f}ms", "info")
+            self._death_watchdog.close()
+            release_publisher(self._memstate)
+            self._memstate = None
+            cs = chat_dispatcher().stats()
+            close_dispatcher(self._instance)   # 인스턴스별 전송 스레드 종료 (재시작 시 새 인스턴스로 다시 생성)
+            if cs["sent"] or cs["failed"]:
+                self.log(f"[채팅] 전송 {cs['sent']}회 (실패 {cs['failed']}, 병합 {cs['coalesced']}) / "
+                         f"지연 p50 {cs['p50_ms']:.0f}ms, p95 {cs['p95_ms']:.0f}ms", "info")
+                paths = [f"{name} {st['ok']}/{st['ok'] + st['fail']} p50 {st['p50_ms'] or 0:.0f}ms "
+                         f"p95 {st['p95_ms'] or 0:.0f}ms"
+                         for name, st in transport_stats().items() if st["ok"] or st["fail"]]
+                self.log(f"[채팅] 경로별: {', '.join(paths)} → 현재 순위 {' > '.join(transport_ranking())}", "info")
+            if self._route_times:
+                plan = sum(p for p, _ in self._route_times)
+                real = sum(r for _, r in self._route_times)
+                self.log(f"[보스경로] 이동 {len(self._route_times)}구간 / 예상 {plan:.0f}초, 실제 {real:.0f}초 "
+                         f"(구간 평균 오차 {(real - plan) / len(self._route_times):+.1f}초)", "info")
+            ts = timer_stats()
+            if ts["sleeps"]:
+                self.log(f"[입력] 정밀 대기 {ts['sleeps']}회 / 목표 대비 초과 평균 {ts['over_avg_us']:.0f}µs, "
+                         f"최대 {ts['over_max_us']:.0f}µs", "info")
+            ms = session_stats()
+            reads = sum(x["reads"] for x in ms["sessions"])
+            if ms["attaches"]:
+                avg = (sum(x["read_avg_us"] * x["reads"] for x in ms["sessions"]) / reads) if reads else 0.0
+                mx  = max((x["read_max_us"] for x in ms["sessions"]), default=0.0)
+                hits  = sum(x["chain_hits"] for x in ms["sessions"])
+                walks = sum(x["chain_walks"] for x in ms["sessions"])
+                self.log(f"[메모리] attach {ms['attaches']}회 / 읽기 {reads}회 "
+                         f"평균 {avg:.0f}µs, 최대 {mx:.0f}µs / 체인 캐시 {hits}회, 탐색 {walks}회", "info")
+            self._sched.close()
             self.finished.emit()
 
     def stop(self):
-        self._running = False
+        """중지 요청. 토큰 대기 중인 모든 루프가 즉시 깨어난다."""
+        self._token.cancel()
+
+    # ── 사망 감시 ─────────────────────────────────
+    def _subscribe_death(self, stop_event: "threading.Event", enabled: bool = True) -> "threading.Event":
+        """사망 이벤트 구독 → 워커 토큰의 하위 토큰 반환 (사망 또는 중지 시 SET).
+        enabled=False(사냥터 복귀 OFF) 면 중지 시에만 SET 된다."""
+        death = self._token.child()
+        if enabled and self._death_watchdog is not None:
+            self._death_watchdog.subscribe(stop_event, death)
+        return death
+
+    def _start_boss_timer(self, seconds: float, boss_event: "threading.Event",
+                          death_event: "threading.Event",
+                          stop_event: "threading.Event") -> Handle:
+        """보스 타이머 예약. 만료 시점에 1회만 깨어나 boss_event 를 SET."""
+        self.log(f"[보스 타이머] {seconds:.3f}초 후 보스 이동 예정", "info")
+
+        def _expire():
+            if self._running and not death_event.is_set() and not stop_event.is_set():
+                self.log("[보스 타이머] 타이머 만료 → 자동사냥 해제 후 보스 이동", "warn")
+                boss_event.set()
+        return self._sched.call_later(seconds, _expire)
+
+    def _on_death_sample(self, rgb: tuple, dead: bool):
+        if dead:
+            self.status("영웅 사망 감지!", RED)
+            return
+        # 살아있음 → 상태바에만 표시 (로그 패널 덮어쓰기 방지), 프로브 주기와 무관하게 ~1Hz
+        t = self._clock.now()
+        if t - self._death_status_t < 1.0:
+            return
+        self._death_status_t = t
+        pr, pg, pb = rgb
+        level = int(max(pr, pg, pb) / 255.0 * 10)
+        self.status(f"사망감지 ({pr},{pg},{pb}) [{'█' * level}{'░' * (10 - level)}]", GREEN)
+
+    def _end_trace_cycle(self, ok: bool = True):
+        """진행 중 사이클 종료 → Chrome trace 저장 + UI 분석표 갱신."""
+        cyc = self._tracer.end_cycle(ok=ok)
+        if cyc is None:
+            return
+        self.log(f"[추적] {cyc.name} 사이클 {cyc.total:.1f}초"
+                 + (f" → {os.path.basename(cyc.path)}" if cyc.path else ""), "info")
+        self.trace_signal.emit(cyc)
+
+    def _cpu_tick(self):
+        """인스턴스 CPU 비용 보고 (스케줄러 스레드). 첫 호출은 기준점 기록."""
+        first = self._cpu._last is None
+        if first:
+            self._cpu.add_thread()   # 스케줄러 스레드 자신
+        pid = self._instance.pid if self._instance is not None else None
+        try:
+            worker_pct, war3_pct = self._cpu.sample(pid)
+        except Exception:
+            return
+        if first:
+            return
+        idx = self._instance.index if self._instance is not None else 0
+        self.cpu_signal.emit({"index": idx, "pid": pid,
+                              "worker_pct": worker_pct, "war3_pct": war3_pct})
+
+    def _dump_recording(self, reason: str):
+        """세션 녹화 링버퍼 → 아카이브 저장 (녹화기 비활성 시 무시)."""
+        rec = recorder.active()
+        if rec is None:
+            return
+        path = rec.dump(reason)
+        if path:
+            self.log(f"[녹화] {reason} → {os.path.basename(path)} 저장 "
+                     f"(replay: python -m src.utils.recorder replay)", "warn")
 
-    def _sleep(self, seconds: float, step: float = 0.1) -> bool:
+    def _sleep(self, seconds: float) -> bool:
         """`seconds` 동안 대기. 중지 요청 시 즉시 False 반환."""
-        deadline = time.time() + seconds
-        while time.time() < deadline:
-            if not self._running:
-                return False
-            remaining = min(step, deadline - time.time())
-            if remaining > 0:
-                time.sleep(remaining)
-        return True
+        return self._token.sleep(seconds)
+
+    def _send_seq(self, seq: CompiledSeq) -> bool:
+        """입력 시퀀스 전송 (간격은 워커 시계로 정밀 대기, 중지 요청 시 다음 구간부터 생략)."""
+        return seq.send(self._clock, cancelled=lambda: not self._running)
 
     # ── 흐름 ──────────────────────────────────────
     def _run(self):
         while self._running:
+            self._tracer.begin_cycle("_run" if not self._ingame else "_run_ingame")
             if not self._ingame:
                 # STEP 1: War3.exe 프로세스 대기
                 self.log("War3.exe 프로세스 대기 중...")
                 self.status("War3.exe 대기 중...", YELLOW)
-                proc = self._wait_for_process("War3.exe", timeout=60)
+                with self._tracer.span("wait_process"):
+                    proc = self._wait_for_process("War3.exe", timeout=60)
                 if proc is None:
                     self.log("[오류] War3.exe 프로세스를 찾지 못했습니다.", "error")
                     self.status("War3.exe 감지 실패", RED)
@@ -114,7 +296,8 @@ class WatchWorker(QObject):
                 # STEP 2: WC3 창 대기
                 self.log("WC3 창 대기 중...")
                 self.status("WC3 창 대기 중...", YELLOW)
-                hwnd = self._wait_for_hwnd(timeout=60)
+                with self._tracer.span("wait_hwnd"):
+                    hwnd = self._wait_for_hwnd(timeout=60)
                 if hwnd is None:
                     self.log("[오류] WC3 창을 찾지 못했습니다.", "error")
                     self.status("WC3 창 감지 실패", RED)
@@ -130,7 +313,8 @@ class WatchWorker(QObject):
 
                 self.log(f"메인 화면 감지 대기 중... ({img})")
                 self.status("메인 화면 대기 중...", YELLOW)
-                ok, _ = self._wait_for_image(img, timeout=120, click=True)
+                with self._tracer.span("main_screen"):
+                    ok, _ = self._wait_for_image(img, timeout=120, click=True)
                 if not ok:
                     self.log("[경고] 메인 화면 감지 시간 초과 (120초)", "warn")
                     self.status("메인 화면 감지 실패", RED)
@@ -164,7 +348,7 @@ class WatchWorker(QObject):
 
         # ── 13번 or 37번 동시 서치 → 우클릭 → 26번 다이얼로그 대기 루프 ──
         while self._running:
-            found_event = threading.Event()
+            found_event = self._token.child()   # 감지 또는 중지 시 SET
             result = [False, None]  # [ok, coords]
 
             def _search(filename):
@@ -174,19 +358,20 @@ class WatchWorker(QObject):
                     found_event.set()
 
             threads = [
-                threading.Thread(target=_search, args=(IMG.LOADING_CURSOR,), daemon=True),
-                threading.Thread(target=_search, args=(IMG.HUNT_ON_CHECK,),    daemon=True),
+                self._clock.spawn(_search, IMG.LOADING_CURSOR),
+                self._clock.spawn(_search, IMG.HUNT_ON_CHECK),
             ]
-            for t in threads: t.start()
             found_event.wait(timeout=2.5)
             for t in threads: t.join(timeout=0)
 
+            if not self._running:
+                break
             if not result[0]:
                 self.log("[자동사냥] 13번/37번 미감지 → 재시도", "warn")
                 continue
             coords13 = result[1]
             move_cursor_to(coords13[0], coords13[1])
-            time.sleep(0.1)
+            self._sleep(0.1)
             right_click_image_center(coords13[0], coords13[1])
             self.log("[자동사냥] 감지 → 우클릭", "info")
 
@@ -201,7 +386,7 @@ class WatchWorker(QObject):
             return
 
         # ── 제자리사냥 ON/OFF 설정 ──
-        time.sleep(0.5)
+        self._sleep(0.5)
         ok24, val24, coords24, _ = _image_match(IMG.HUNT_STAY,     threshold=0.75)
         ok27, val27, coords27, _ = _image_match(IMG.HUNT_STAY_OFF, threshold=0.85)
         self.log(f"[자동사냥] 24번 신뢰도={val24:.3f} coords={coords24} / 27번 신뢰도={val27:.3f} coords={coords27}", "info")
@@ -242,12 +427,12 @@ class WatchWorker(QObject):
         for _ in range(26):
             if not self._running: break
             click_image_center(btn_minus[0], btn_minus[1])
-            time.sleep(0.08)
+            self._sleep(0.08)
         # 2) 목표값까지 증가
         for _ in range(up_clicks):
             if not self._running: break
             click_image_center(btn_plus[0], btn_plus[1])
-            time.sleep(0.08)
+            self._sleep(0.08)
         self.log(f"[자동사냥] 사냥반경 설정 완료: {target_radius}", "success")
 
         # ── 확인 버튼 클릭 → 다이얼로그 닫힘 확인 ──
@@ -258,7 +443,7 @@ class WatchWorker(QObject):
         else:
             self.log("[자동사냥] 확인 버튼 미감지", "warn")
 
-        time.sleep(0.3)
+        self._sleep(0.3)
         ok26_check, _, _, _ = _image_match(IMG.HUNT_DIALOG)
         if ok26_check:
             self.log("[자동사냥] 다이얼로그 미닫힘 → 확인 버튼 재클릭", "warn")
@@ -274,6 +459,7 @@ class WatchWorker(QObject):
         self.status("자동사냥 설정 완료!", GREEN)
 
     # ── 부대지정 루프 ──────────────────────────────────
+    @traced()
     def _assign_control_groups(self):
         """좌표 클릭 → Ctrl+번호 부대지정 → 22번 이미지로 검증.
         영웅 선택 시 22번 감지, 창고 선택 시 22번 미감지이면 통과."""
@@ -285,6 +471,11 @@ class WatchWorker(QObject):
 
         _VK_9 = ord('9')
         _VK_0 = ord('0')
+        # Ctrl 누른 채 부대번호 → 9/0 (SendInput 1회) / 부대 선택 키
+        group_hero     = KeySeq().down(_VK_CONTROL).tap(hero_vk).gap(0.02).tap(_VK_9).up(_VK_CONTROL).compile()
+        group_storage  = KeySeq().down(_VK_CONTROL).tap(storage_vk).gap(0.02).tap(_VK_0).up(_VK_CONTROL).compile()
+        select_hero    = KeySeq().tap(hero_vk).compile()
+        select_storage = KeySeq().tap(storage_vk).compile()
         self.log(f"부대지정 시작 (영웅:{hero_num}번+9번, 창고:{storage_num}번+0번)", "info")
         self.status("부대지정 중...", YELLOW)
 
@@ -292,48 +483,37 @@ class WatchWorker(QObject):
             hwnd = find_war3_hwnd()
             if hwnd:
                 _user32.SetForegroundWindow(hwnd)
-                deadline_fg = time.time() + 1.0
-                while time.time() < deadline_fg:
+                deadline_fg = self._clock.now() + 1.0
+                while self._clock.now() < deadline_fg:
                     if _user32.GetForegroundWindow() == hwnd:
                         break
-                    time.sleep(0.05)
+                    self._clock.sleep(0.05)
 
             # ① 영웅 클릭 → Ctrl+영웅번호, Ctrl+9
             hx, hy = _scale_coords(62, 88)
             click_image_center(hx, hy)
-            time.sleep(0.2)
-            _press_vk(_VK_CONTROL)
-            _press_vk(hero_vk);       time.sleep(0.05)
-            _press_vk(hero_vk, keyup=True); time.sleep(0.05)
-            _press_vk(_VK_9);         time.sleep(0.05)
-            _press_vk(_VK_9, keyup=True)
-            _press_vk(_VK_CONTROL, keyup=True)
-            time.sleep(0.2)
+            self._sleep(0.2)
+            self._send_seq(group_hero)
+            self._sleep(0.2)
             self.log(f"영웅 부대지정: Ctrl+{hero_num} + Ctrl+9", "info")
 
             # ② 창고 클릭 → Ctrl+창고번호, Ctrl+0
             sx, sy = _scale_coords(57, 738)
             click_image_center(sx, sy)
-            time.sleep(0.2)
-            _press_vk(_VK_CONTROL)
-            _press_vk(storage_vk);    time.sleep(0.05)
-            _press_vk(storage_vk, keyup=True); time.sleep(0.05)
-            _press_vk(_VK_0);         time.sleep(0.05)
-            _press_vk(_VK_0, keyup=True)
-            _press_vk(_VK_CONTROL, keyup=True)
-            time.sleep(0.2)
+            self._sleep(0.2)
+            self._send_seq(group_storage)
+            self._sleep(0.2)
             self.log(f"창고 부대지정: Ctrl+{storage_num} + Ctrl+0", "info")
 
             # ③ 검증 1: 영웅번호 키 → 최대 3초 내 22번 감지되면 통과
-            _press_vk(hero_vk);       time.sleep(0.05)
-            _press_vk(hero_vk, keyup=True)
+            self._send_seq(select_hero)
             ok22_hero = False
-            deadline22 = time.time() + 3
-            while self._running and time.time() < deadline22:
+            deadline22 = self._clock.now() + 3
+            while self._running and self._clock.now() < deadline22:
                 ok22_hero, _, _, _ = _image_match(IMG.UNIT_GROUP, background=True)
                 if ok22_hero:
                     break
-                time.sleep(0.25)
+                self._sleep(0.25)
             if not ok22_hero:
                 if self._running:
                     self.log(f"[검증 실패] 영웅({hero_num}번) 22번 미감지 → 재시도", "warn")
@@ -341,15 +521,14 @@ class WatchWorker(QObject):
             self.log(f"[검증 통과] 영웅({hero_num}번) 확인", "success")
 
             # ④ 검증 2: 창고번호 키 → 최대 3초 내 22번 미감지면 통과
-            _press_vk(storage_vk);    time.sleep(0.05)
-            _press_vk(storage_vk, keyup=True)
+            self._send_seq(select_storage)
             ok22_storage = False
-            deadline22 = time.time() + 3
-            while self._running and time.time() < deadline22:
+            deadline22 = self._clock.now() + 3
+            while self._running and self._clock.now() < deadline22:
                 ok22_storage, _, _, _ = _image_match(IMG.UNIT_GROUP, background=True)
                 if not ok22_storage:
                     break
-                time.sleep(0.25)
+                self._sleep(0.25)
             if ok22_storage:
                 if self._running:
                     self.log(f"[검증 실패] 창고({storage_num}번) 22번 감지됨 → 재시도", "warn")
@@ -358,19 +537,20 @@ class WatchWorker(QObject):
 
             self.log("부대지정 완료!", "success")
             self.status("부대지정 완료!", GREEN)
-            _press_vk(hero_vk); time.sleep(0.05)
-            _press_vk(hero_vk, keyup=True)
+            self._send_seq(select_hero)
             self.log(f"영웅 재선택: {hero_num}번 키 입력", "info")
             break
 
     def _run_ingame(self):
         """인게임 루틴. 백그라운드 워처가 이벤트 감지 시 재시작 or 종료."""
         while self._running:
+            if not self._tracer.active:
+                self._tracer.begin_cycle("_run_ingame")
             # ── 인게임 상태 확인 ──
             self.log("인게임 상태 확인 → 부대지정 검증 시작", "info")
             self.status("인게임 확인 중...", YELLOW)
-            ok, _ = self._wait_for_image(IMG.INGAME_CHECK, timeout=10,
-                                         click=False, background=True)
+            ok = self._mem_in_game() or self._wait_for_image(IMG.INGAME_CHECK, timeout=10,
+                                                             click=False, background=True)[0]
             if not ok:
                 self.log("[오류] 인게임 상태 확인 실패 → 중단", "error")
                 self.status("인게임 확인 실패", RED)
@@ -390,80 +570,88 @@ class WatchWorker(QObject):
                 if self._portal_active():
                     self._enter_portal_suicide()
                 if not self._running: return
+                self._end_trace_cycle()
                 self.log("인게임 매크로 완료 → 대기 중...", "success")
                 self.status("인게임 대기 중...", GREEN)
-                while self._running:
-                    self._sleep(1)
+                self._token.wait()
                 return
 
-            event_flag   = threading.Event()   # 이벤트 감지 시 SET
+            event_flag   = self._token.child()   # 이벤트 감지(또는 중지) 시 SET
             event_reason = [None]              # 감지 이유 저장 (리스트로 mutable)
 
-            def _watcher():
-                while self._running and not event_flag.is_set():
-                    m42, _, coords42, size42 = _image_match(IMG.PLAYER_LEFT, background=True)
-                    m41, _, coords41, size41 = _image_match(IMG.MISSION_END, background=True)
-                    first_match = m42 or m41
-                    if first_match:
-                        reason_candidate = "player_left" if m42 else "mission_end"
-                        coords_c = coords42 if m42 else coords41
-                        size_c   = size42   if m42 else size41
-                        self.log(f"이벤트 후보 감지 ({reason_candidate}) → 0.25초 간격 5회 확인 시작", "warn")
-                        confirm = 0
-                        for _ in range(5):
-                            time.sleep(0.25)
-                            if not self._running or event_flag.is_set():
-                                return
-                            cm42, _, _, _ = _image_match(IMG.PLAYER_LEFT, background=True)
-                            cm41, _, _, _ = _image_match(IMG.MISSION_END, background=True)
-                            if cm42 or cm41:
-                                confirm += 1
-                        if confirm == 5:
-                            if coords_c:
-                                self.overlay_signal.emit(coords_c[0], coords_c[1], size_c[0], size_c[1])
-                            self.log(f"이벤트 확정 ({reason_candidate}) → -save 전송 후 War3 종료", "warn")
-                            self._send_chat_instant("-save")
-                            time.sleep(1)
-                            for p in psutil.process_iter(['name']):
-                                if p.info['name'].lower() == 'war3.exe':
-                                    try:
-                                        p.kill()
-                                        self.log("War3.exe 강제 종료 (이벤트 감지)", "info")
-                                    except Exception as e:
-                                        self.log(f"[경고] War3 종료 실패: {e}", "warn")
-                            event_reason[0] = reason_candidate
-                            event_flag.set()
-                            break
-                        else:
-                            self.log(f"오감지 ({confirm}/5) → 계속 감시", "info")
-                    time.sleep(1)
+            # 워처·자동 세이브는 워커 스케줄러에서 실행 (이 라운드 전용 스코프)
+            side_tasks = self._sched.scope()
 
-            # ── 자동 세이브 워처 ──
-            def _auto_save_watcher():
-                cfg = load_config()
-                if not cfg.get("auto_save_enabled", True):
+            # 1프레임(컬러 캡처 1회)으로 42번/41번 동시 매칭 → 6회 연속 일치로 확정 (War3 강제 종료이므로 기존 엄격도 유지)
+            # 후보 상태에서만 0.25초 간격으로 폴링 (추가 버스트 캡처 없음)
+            detector = VotingDetector(votes=6, window=6, clock=self._clock.now)
+            cand     = {"reason": None, "coords": None, "size": (0, 0)}
+
+            def _kill_war3():
+                try:
+                    if kill_war3_processes():
+                        self.log("War3.exe 강제 종료 (이벤트 감지)", "info")
+                except Exception as e:
+                    self.log(f"[경고] War3 종료 실패: {e}", "warn")
+                event_reason[0] = cand["reason"]
+                event_flag.set()
+
+            def _watch_tick():
+                if not self._running or event_flag.is_set():
+                    return
+                frame = _capture_frame(background=True)
+                if frame is None:
+                    detector.update(-1.0)
+                else:
+                    m42, v42, c42, s42 = _match_frame(IMG.PLAYER_LEFT, frame)
+                    m41, v41, c41, s41 = _match_frame(IMG.MISSION_END, frame)
+                    was_pending = detector.pending
+                    detector.update(max(v42, v41))
+                    if m42 or m41:
+                        cand["reason"] = "player_left" if m42 else "mission_end"
+                        cand["coords"] = c42 if m42 else c41
+                        cand["size"]   = s42 if m42 else s41
+                        if not was_pending and not detector.active:
+                            self.log(f"이벤트 후보 감지 ({cand['reason']}) → 0.25초 간격 투표 확인 시작", "warn")
+                    elif was_pending and not detector.pending:
+                        self.log("오감지 → 계속 감시", "info")
+                if detector.rose:
+                    coords_c, size_c = cand["coords"], cand["size"]
+                    if coords_c:
+                        self.overlay_signal.emit(coords_c[0], coords_c[1], size_c[0], size_c[1])
+                    self.log(f"이벤트 확정 ({cand['reason']}, {detector.hits}/6) → -save 전송 후 War3 종료", "warn")
+
+                    # 스케줄러 스레드에서 전송 완료를 기다리지 않음 → 완료 통지 후 종료 예약
+                    def _saved(ticket):
+                        ok, msg = ticket.result
+                        self.log(msg, "success" if ok else "warn")
+                        side_tasks.call_later(1.0, _kill_war3)
+                    chat_dispatcher().submit("-save").add_done_callback(_saved)
                     return
-                interval = max(300, cfg.get("auto_save_interval", 300))
+                side_tasks.call_later(0.25 if detector.pending else 1, _watch_tick)
+
+            # ── 자동 세이브 워처 ──
+            def _auto_save_tick():
+                if not self._running or event_flag.is_set():
+                    return False
+                self.log("자동 세이브 실행 (-save)", "info")
+                chat_dispatcher().submit("-save").add_done_callback(
+                    lambda t: self.log(t.result[1], "success" if t.result[0] else "warn"))
+                return True
+
+            side_tasks.call_later(0, _watch_tick)
+            _as_cfg = load_config()
+            if _as_cfg.get("auto_save_enabled", True):
+                interval = max(300, _as_cfg.get("auto_save_interval", 300))
                 self.log(f"자동 세이브 워처 시작 ({interval}초 간격)", "info")
-                elapsed = 0
-                while self._running and not event_flag.is_set():
-                    time.sleep(1)
-                    elapsed += 1
-                    if elapsed >= interval:
-                        self.log("자동 세이브 실행 (-save)", "info")
-                        self._send_chat_instant("-save")
-                        elapsed = 0
-
-            watcher         = threading.Thread(target=_watcher,          daemon=True)
-            auto_save_watch = threading.Thread(target=_auto_save_watcher, daemon=True)
-            watcher.start()
-            auto_save_watch.start()
+                side_tasks.every(interval, _auto_save_tick)
 
             # ── 메인 루틴 실행 (워처와 병렬) ──
             if load_config().get("auto_hunt", False):
                 self._run_auto_hunt()
             if not self._running:
                 event_flag.set()
+                side_tasks.cancel()
                 return
             if load_config().get("control_group_enabled", True):
                 self._assign_control_groups()
@@ -471,22 +659,24 @@ class WatchWorker(QObject):
                 self.log("부대지정 스킵", "info")
             if not self._running:
                 event_flag.set()
+                side_tasks.cancel()
                 return
             if self._portal_active():
                 self._enter_portal_suicide()
             if not self._running:
                 event_flag.set()
+                side_tasks.cancel()
                 return
 
+            self._end_trace_cycle()
             self.log("인게임 매크로 완료 → 이벤트 대기 중...", "success")
             self.status("인게임 대기 중...", GREEN)
 
             # ── 워처가 이벤트를 감지할 때까지 대기 ──
-            while self._running and not event_flag.is_set():
-                self._sleep(1)
+            event_flag.wait()
 
-            event_flag.set()   # 워처 종료 보장
-            watcher.join(timeout=3)
+            event_flag.set()
+            side_tasks.cancel()   # 워처·자동 세이브 취소 (실행 중인 콜백 종료까지 대기)
 
             if not self._running:
                 return
@@ -494,7 +684,7 @@ class WatchWorker(QObject):
             # ── 이벤트 감지 후 인게임 여부 판단 ──
             reason = event_reason[0]
             self.log(f"이벤트 감지: {reason}", "warning")
-            if image_exists(IMG.INGAME_CHECK, background=True):
+            if self._mem_in_game() or image_exists(IMG.INGAME_CHECK, background=True):
                 self.log("인게임 유지 → 루틴 재시작", "info")
                 self.status("루틴 재시작...", YELLOW)
                 continue
@@ -504,21 +694,36 @@ class WatchWorker(QObject):
                 return
 
     # ── 폴링 헬퍼 ─────────────────────────────────
+    def _mem_in_game(self) -> bool:
+        """메모리 상태 퍼블리셔 기준 인게임 여부 (비용 0). True 일 때만 신뢰 —
+        False·미확인(읽기 실패·오래된 값)이면 호출 측이 템플릿으로 확인."""
+        st = self._memstate.fresh(1.0) if self._memstate is not None else None
+        if st is not None and st.in_game:
+            self.log("[메모리] 인게임 확인 → 템플릿 생략", "info")
+            return True
+        return False
+
     def _wait_for_process(self, name: str, timeout: float) -> "psutil.Process | None":
-        deadline = time.time() + timeout
-        while time.time() < deadline:
+        """War3 프로세스 대기. 다중 클라이언트면 다른 워커가 잡지 않은 War3 를 배정받는다."""
+        deadline = self._clock.now() + timeout
+        while self._clock.now() < deadline:
             if not self._running:
                 return None
-            for p in psutil.process_iter(['name']):
-                if p.info['name'].lower() == name.lower():
+            if name.lower() == "war3.exe":
+                p = find_war3_process()
+                if p is not None:
                     return p
+            else:
+                for p in psutil.process_iter(['name']):
+                    if p.info['name'].lower() == name.lower():
+                        return p
             if not self._sleep(1):
                 return None
         return None
 
     def _wait_for_hwnd(self, timeout: float) -> "int | None":
-        deadline = time.time() + timeout
-        while time.time() < deadline:
+        deadline = self._clock.now() + timeout
+        while self._clock.now() < deadline:
             if not self._running:
                 return None
             hwnd = find_war3_hwnd()
@@ -541,9 +746,9 @@ class WatchWorker(QObject):
         반환: (성공여부, 클릭좌표|None)"""
         prefix = "[비활성서치]" if background else "[서치]"
         first = True
-        start_t  = time.time()
+        start_t  = self._clock.now()
         deadline = start_t + timeout
-        while time.time() < deadline:
+        while self._clock.now() < deadline:
             if not self._running:
                 return False, None
             try:
@@ -554,7 +759,7 @@ class WatchWorker(QObject):
                 self.log_signal.emit(f"[{now()}] [오류] _image_match 예외: {e}", "error")
                 if not self._sleep(interval): return False, None
                 continue
-            remaining = max(0.0, deadline - time.time())  # 매치 완료 후 실제 남은 시간
+            remaining = max(0.0, deadline - self._clock.now())  # 매치 완료 후 실제 남은 시간
             if val < 0:
                 msg   = f"{prefix} {filename} → WC3 창 없음  ({remaining:.1f}s 남음)"
                 level = "warn"
@@ -580,12 +785,13 @@ class WatchWorker(QObject):
                 self.log_signal.emit(f"[{now()}] {msg}", level)
                 first = False
             if not self._sleep(interval): return False, None
-        elapsed = time.time() - start_t
+        elapsed = self._clock.now() - start_t
         if not silent:
             self.log_signal.emit(
                 f"[{now()}] [타임아웃] {filename} — {elapsed:.1f}초 경과", "warn")
         return False, None
 
+    @traced()
     def _login_loop(self) -> bool:
         """1번 클릭 후 2번 1초 대기 루프 → 3번 20초 대기.
         3번 감지 성공 시 True, 워커 중단 시 False."""
@@ -653,8 +859,7 @@ class WatchWorker(QObject):
                             _user32.SetForegroundWindow(hwnd)
                             if not self._sleep(0.1): return False
                         self.log("4번 감지 → C 키 입력", "info")
-                        _press_vk(_VK_C); time.sleep(0.05)
-                        _press_vk(_VK_C, keyup=True)
+                        self._send_seq(_SEQ_C)
 
                         self.log("5.커스텀채널입장.png 대기 중... (5초)", "info")
                         self.status("커스텀채널 감지 중...", YELLOW)
@@ -690,16 +895,9 @@ class WatchWorker(QObject):
                             type_string(room_name)
                             if not self._sleep(0.1): return False
                             n = len(room_name)
-                            _press_vk(_VK_SHIFT)
-                            for _ in range(n):
-                                _press_vk(_VK_LEFT, extended=True); time.sleep(0.02)
-                                _press_vk(_VK_LEFT, keyup=True, extended=True); time.sleep(0.02)
-                            _press_vk(_VK_SHIFT, keyup=True)
+                            self._send_seq(KeySeq().down(_VK_SHIFT).tap(_VK_LEFT, times=n).up(_VK_SHIFT).compile())
                             if not self._sleep(0.2): return False
-                            _press_vk(_VK_CONTROL)
-                            _press_vk(_VK_C); time.sleep(0.02)
-                            _press_vk(_VK_C, keyup=True)
-                            _press_vk(_VK_CONTROL, keyup=True)
+                            self._send_seq(_SEQ_CTRL_C)
                             if not self._sleep(0.2): return False
                             self.log("방 제목 입력 + 선택 + 복사 완료", "success")
                         else:
@@ -708,10 +906,7 @@ class WatchWorker(QObject):
 
                     if proceed:
                         # ── Tab + G ──
-                        _press_vk(_VK_TAB); time.sleep(0.02)
-                        _press_vk(_VK_TAB, keyup=True); time.sleep(0.3)
-                        _press_vk(_VK_G); time.sleep(0.02)
-                        _press_vk(_VK_G, keyup=True); time.sleep(0.3)
+                        self._send_seq(_SEQ_TAB_G); self._sleep(0.3)
                         self.log("Tab + G 입력 완료", "info")
 
                         # ── 7번: 방 목록 입장 서치 ──
@@ -754,6 +949,7 @@ class WatchWorker(QObject):
 
         return False
 
+    @traced()
     def _guest_loop(self):
         """승객 전용: Ctrl+V+Enter → 방 입장 or 실패 복구 무한 루프.
         8.방입장체크(동맹).png 감지 시 종료."""
@@ -765,22 +961,18 @@ class WatchWorker(QObject):
             if hwnd:
                 _user32.SetForegroundWindow(hwnd)
                 if not self._sleep(0.1): return
-            _press_vk(_VK_CONTROL)
-            _press_vk(_VK_V); time.sleep(0.02)
-            _press_vk(_VK_V, keyup=True)
-            _press_vk(_VK_CONTROL, keyup=True)
-            time.sleep(0.3)
-            _press_vk(_VK_RETURN); time.sleep(0.02)
-            _press_vk(_VK_RETURN, keyup=True)
+            self._send_seq(_SEQ_CTRL_V)
+            self._sleep(0.3)
+            self._send_seq(_SEQ_ENTER)
             self.log("Ctrl+V + Enter 입력 완료", "info")
 
             # ── 6번(실패) or 8번(성공) 감지 ──
             self.log("6번(입장 실패) / 8번(입장 성공) 감지 대기 중...", "info")
             self.status("방 입장 대기 중...", YELLOW)
-            deadline = time.time() + 30
+            deadline = self._clock.now() + 30
             joined = False
             first8g = True
-            while self._running and time.time() < deadline:
+            while self._running and self._clock.now() < deadline:
                 ok6, _, coords6, _ = _image_match(IMG.LOGIN_WRONG_PW)
                 if ok6 and coords6:
                     self.log("입장 실패 감지 → 클릭 → ESC → 5번 재서치", "warn")
@@ -789,18 +981,14 @@ class WatchWorker(QObject):
                     if not self._sleep(1): return
                     # ESC → 5번 감지 루프
                     while self._running:
-                        _press_vk(_VK_ESCAPE); time.sleep(0.02)
-                        _press_vk(_VK_ESCAPE, keyup=True)
+                        self._send_seq(_SEQ_ESC)
                         ok5, _ = self._wait_for_image(
                             IMG.CUSTOM_CHANNEL, timeout=5, click=False)
                         if ok5:
                             break
                         self.log("5번 미감지 → ESC 재시도", "warn")
                     # Tab + G → 7번 → 다음 Ctrl+V 시도
-                    _press_vk(_VK_TAB); time.sleep(0.02)
-                    _press_vk(_VK_TAB, keyup=True); time.sleep(0.3)
-                    _press_vk(_VK_G); time.sleep(0.02)
-                    _press_vk(_VK_G, keyup=True); time.sleep(0.3)
+                    self._send_seq(_SEQ_TAB_G); self._sleep(0.3)
                     self.log("Tab + G 재입력", "info")
                     self._wait_for_image(IMG.ROOM_LIST, timeout=15, click=False)
                     if not self._running: return
@@ -808,7 +996,7 @@ class WatchWorker(QObject):
                     break  # 다시 Ctrl+V 루프로
 
                 ok8, val8g, _, _ = _image_match(IMG.ROOM_ENTER)
-                remaining8g = max(0.0, deadline - time.time())
+                remaining8g = max(0.0, deadline - self._clock.now())
                 if val8g >= 0:
                     bar8g = "█" * int(val8g * 10) + "░" * (10 - int(val8g * 10))
                     if ok8:
@@ -834,10 +1022,7 @@ class WatchWorker(QObject):
                 if result == "ejected":
                     # 5번 → Tab+G → 7번 → Ctrl+V 루프 재시작
                     self.log("로딩 중 강퇴/이탈 → 방 목록 재진입", "warn")
-                    _press_vk(_VK_TAB); time.sleep(0.02)
-                    _press_vk(_VK_TAB, keyup=True); time.sleep(0.3)
-                    _press_vk(_VK_G); time.sleep(0.02)
-                    _press_vk(_VK_G, keyup=True); time.sleep(0.3)
+                    self._send_seq(_SEQ_TAB_G); self._sleep(0.3)
                     self._wait_for_image(IMG.ROOM_LIST, timeout=15, click=False)
                     if not self._running: return
                     continue  # Ctrl+V 루프 처음으로
@@ -845,8 +1030,9 @@ class WatchWorker(QObject):
             if not self._running:
                 return
 
+    @traced()
     def _freematch_loop(self):
-        """프리매치: hera.pet API → 필터 → 랜덤 선택 → 방제입력+복사+Tab+G → 방 입장 무한 루프."""
+        """프리매치: hera.pet API → 필터 → 랜덤 선택 → 방제 클립보드+Tab+G → 붙여넣기 → 방 입장 무한 루프."""
         from src.utils.room_list import fetch_rooms
 
         self.log("=== 프리매치 매크로 시작 ===", "info")
@@ -870,7 +1056,7 @@ class WatchWorker(QObject):
             # ── 필터링 (방제/방장/인원/블랙리스트) ──
             candidates = []
             for room in rooms:
-                if time.time() < self._fm_blacklist.get(room["id"], 0):
+                if self._clock.now() < self._fm_blacklist.get(room["id"], 0):
                     continue
                 if room["players"] >= fm_max:
                     continue
@@ -892,33 +1078,28 @@ class WatchWorker(QObject):
                 "info"
             )
 
-            # ── 커스텀채널 검색창에 방 제목 입력 → 선택 → 복사 ──
+            # ── 방 제목 → 클립보드 (직접 기록, 실패 시 검색창 입력 → 선택 → 복사) ──
+            t_pick = self._clock.now()
             hwnd = find_war3_hwnd()
             if hwnd:
                 _user32.SetForegroundWindow(hwnd)
                 if not self._sleep(0.1): return
-            self.log(f"방 제목 입력: {room['name']}", "info")
-            type_string(room["name"])
-            if not self._sleep(0.1): return
-            n = len(room["name"])
-            _press_vk(_VK_SHIFT)
-            for _ in range(n):
-                _press_vk(_VK_LEFT, extended=True); time.sleep(0.02)
-                _press_vk(_VK_LEFT, keyup=True, extended=True); time.sleep(0.02)
-            _press_vk(_VK_SHIFT, keyup=True)
-            if not self._sleep(0.1): return
-            _press_vk(_VK_CONTROL)
-            _press_vk(_VK_C); time.sleep(0.02)
-            _press_vk(_VK_C, keyup=True)
-            _press_vk(_VK_CONTROL, keyup=True)
-            if not self._sleep(0.1): return
-            self.log("방 제목 입력 + 선택 + 복사 완료", "info")
+            path = "clipboard" if cfg.get("fm_fast_entry", True) and set_clipboard(room["name"]) else "typing"
+            if path == "clipboard":
+                self.log(f"방 제목 클립보드 기록: {room['name']}", "info")
+            else:
+                self.log(f"방 제목 입력: {room['name']}", "info")
+                type_string(room["name"])
+                if not self._sleep(0.1): return
+                n = len(room["name"])
+                self._send_seq(KeySeq().down(_VK_SHIFT).tap(_VK_LEFT, times=n).up(_VK_SHIFT).compile())
+                if not self._sleep(0.1): return
+                self._send_seq(_SEQ_CTRL_C)
+                if not self._sleep(0.1): return
+                self.log("방 제목 입력 + 선택 + 복사 완료", "info")
 
             # ── Tab + G → 7번(방목록) 대기 ──
-            _press_vk(_VK_TAB); time.sleep(0.02)
-            _press_vk(_VK_TAB, keyup=True); time.sleep(0.3)
-            _press_vk(_VK_G); time.sleep(0.02)
-            _press_vk(_VK_G, keyup=True)
+            self._send_seq(_SEQ_TAB_G)
             self.log("Tab + G 입력", "info")
 
             ok7, _ = self._wait_for_image(IMG.ROOM_LIST, timeout=15, click=False)
@@ -927,27 +1108,23 @@ class WatchWorker(QObject):
                 self.log("7번(방목록) 미감지 → 재시도", "warn")
                 continue
 
-            # ── Ctrl+V → Enter (방 이름 붙여넣기 후 입장) ──
+            # ── (남은 입력 선택) → Ctrl+V → Enter (방 이름 붙여넣기 후 입장) ──
             if not self._sleep(0.2): return
-            _press_vk(_VK_CONTROL)
-            _press_vk(_VK_V); time.sleep(0.02)
-            _press_vk(_VK_V, keyup=True)
-            _press_vk(_VK_CONTROL, keyup=True)
-            time.sleep(0.1)
-            _press_vk(_VK_RETURN); time.sleep(0.02)
-            _press_vk(_VK_RETURN, keyup=True)
+            self._send_seq(_SEQ_PASTE_OVER)
+            self._sleep(0.1)
+            self._send_seq(_SEQ_ENTER)
             self.log("Ctrl+V + Enter 입력", "info")
 
             # ── 8번(성공) or 6번(실패) 대기 (30초) ──
-            deadline  = time.time() + 30
+            deadline  = self._clock.now() + 30
             joined    = False
             fail_by_6 = False
             first_log = True
-            while self._running and time.time() < deadline:
+            while self._running and self._clock.now() < deadline:
                 ok6, _, coords6, _ = _image_match(IMG.LOGIN_WRONG_PW)
                 if ok6 and coords6:
                     self.log("입장 실패(6번) → 60초 블랙리스트 추가", "warn")
-                    self._fm_blacklist[room["id"]] = time.time() + 60
+                    self._fm_blacklist[room["id"]] = self._clock.now() + 60
                     click_image_center(coords6[0], coords6[1])
                     fail_by_6 = True
                     break
@@ -957,9 +1134,10 @@ class WatchWorker(QObject):
                     self.log("입장 성공(8번) 감지!", "success")
                     self.status("방 입장 완료!", GREEN)
                     joined = True
+                    self._log_join_time(path, self._clock.now() - t_pick)
                     break
 
-                remaining = max(0.0, deadline - time.time())
+                remaining = max(0.0, deadline - self._clock.now())
                 msg = f"[서치] 8.방입장체크 → 대기 중... ({remaining:.1f}s 남음)"
                 if first_log:
                     self.log_signal.emit(f"[{now()}] {msg}", "warn")
@@ -972,8 +1150,7 @@ class WatchWorker(QObject):
                 # 1초 대기 후 ESC → 5번 재서치 → API 재조회
                 if not self._sleep(1): return
                 while self._running:
-                    _press_vk(_VK_ESCAPE); time.sleep(0.02)
-                    _press_vk(_VK_ESCAPE, keyup=True)
+                    self._send_seq(_SEQ_ESC)
                     ok5, _ = self._wait_for_image(IMG.CUSTOM_CHANNEL, timeout=5, click=False)
                     if ok5:
                         break
@@ -983,7 +1160,7 @@ class WatchWorker(QObject):
             if not joined:
                 # 30초 내 미입장 → 블랙리스트 + 재시도
                 self.log(f"30초 내 미입장 → 60초 블랙리스트: {room['id']}", "warn")
-                self._fm_blacklist[room["id"]] = time.time() + 60
+                self._fm_blacklist[room["id"]] = self._clock.now() + 60
                 continue
 
             # ── 방 입장 성공 → 로딩 대기 ──
@@ -992,25 +1169,31 @@ class WatchWorker(QObject):
                 return
             if result == "ejected":
                 self.log("로딩 중 강퇴/이탈 → 60초 블랙리스트 추가 후 재시도", "warn")
-                self._fm_blacklist[room["id"]] = time.time() + 60
+                self._fm_blacklist[room["id"]] = self._clock.now() + 60
                 continue
             # timeout
             self.log("로딩 타임아웃(5분) → 60초 블랙리스트 추가 + War3 재실행", "error")
-            self._fm_blacklist[room["id"]] = time.time() + 60
+            self._fm_blacklist[room["id"]] = self._clock.now() + 60
             self._relaunch_war3()
             return
 
+    def _log_join_time(self, path: str, seconds: float):
+        """방 선택 → 입장 확인 소요 시간 기록 + 경로별 평균 (클립보드 vs 타이핑) 로그."""
+        times = self._fm_join_times[path]
+        times.append(seconds)
+        parts = [f"{name} {sum(ts) / len(ts):.2f}s ({len(ts)}회)"
+                 for name, ts in self._fm_join_times.items() if ts]
+        self.log(f"[프리매치] 입장 소요 {seconds:.2f}s ({path}) / 경로별 평균: {', '.join(parts)}", "info")
+
     # ── War3 재실행 ──────────────────────────────────
     def _relaunch_war3(self):
         """War3.exe 강제 종료 후 JNLoader 재실행."""
         import subprocess
-        for p in psutil.process_iter(['name']):
-            if p.info['name'].lower() == 'war3.exe':
-                try:
-                    p.kill()
-                    self.log("War3.exe 강제 종료", "info")
-                except Exception as e:
-                    self.log(f"[경고] War3 종료 실패: {e}", "warn")
+        try:
+            if kill_war3_processes():
+                self.log("War3.exe 강제 종료", "info")
+        except Exception as e:
+            self.log(f"[경고] War3 종료 실패: {e}", "warn")
         if not self._sleep(2): return
         cfg = load_config()
         jn_dir = cfg.get("jnloader_path", "")
@@ -1033,6 +1216,7 @@ class WatchWorker(QObject):
             self.log(f"[오류] JNLoader 재실행 실패: {e}", "error")
 
     # ── 캐릭터 선택 루프 ──────────────────────────────
+    @traced()
     def _select_character(self):
         """캐릭터 이미지 서치 → 더블클릭 → 21.캐릭터선택체크.png 검증 루프.
         21번 감지 시 종료."""
@@ -1054,9 +1238,7 @@ class WatchWorker(QObject):
 
             # ② 커서 이동 + 더블클릭
             self.log(f"{char_name} 감지 → 더블클릭", "info")
-            click_image_center(coords_c[0], coords_c[1])
-            time.sleep(0.15)
-            click_image_center(coords_c[0], coords_c[1])
+            click_at(coords_c[0], coords_c[1], double=True)
 
             # ③ 21.캐릭터선택체크.png 검증 (5초)
             ok21, _ = self._wait_for_image(IMG.CHAR_SELECT, timeout=5, click=False)
@@ -1067,6 +1249,7 @@ class WatchWorker(QObject):
             self.log("21번 미감지 (5s) → 캐릭터 재선택", "warn")
 
     # ── 로딩 완료 대기 ────────────────────────────────
+    @traced()
     def _wait_loading(self, relaunch_on_timeout: bool = True) -> str:
         """8번 감지 후 11.로딩완료.png 를 300초 대기.
         0.25초마다 5.커스텀채널입장.png 도 체크 (강퇴/이탈 감지).
@@ -1074,15 +1257,15 @@ class WatchWorker(QObject):
         반환: 'loaded' | 'ejected' | 'timeout'"""
         self.log("11.로딩완료.png 대기 중... (최대 300초)", "info")
         self.status("게임 로딩 대기 중...", YELLOW)
-        deadline = time.time() + 300
+        deadline = self._clock.now() + 300
         first = True
-        while self._running and time.time() < deadline:
+        while self._running and self._clock.now() < deadline:
             # 강퇴/이탈 체크 (5번)
             try:
                 ok5, val5, _, _ = _image_match(IMG.CUSTOM_CHANNEL)
             except Exception as e:
                 self.log_signal.emit(f"[{now()}] [오류] 5번 서치 예외: {e}", "error")
-                time.sleep(0.25)
+                self._sleep(0.25)
                 continue
             if ok5:
                 self.log("5번 감지 → 방 이탈/강퇴!", "warn")
@@ -1093,7 +1276,7 @@ class WatchWorker(QObject):
                 ok11, val11, _, _ = _image_match(IMG.LOADING_DONE)
             except Exception as e:
                 self.log_signal.emit(f"[{now()}] [오류] 11번 서치 예외: {e}", "error")
-                time.sleep(0.25)
+                self._sleep(0.25)
                 continue
             if ok11:
                 self.log("데이터 셋 로드 완료!!", "error")  # error = 빨간색
@@ -1117,7 +1300,7 @@ class WatchWorker(QObject):
                         self.status("출석체크 중...", YELLOW)
                         self._wait_for_image(IMG.ATTENDANCE, timeout=5, click=True)
                 return "loaded"
-            remaining = max(0.0, deadline - time.time())
+            remaining = max(0.0, deadline - self._clock.now())
             val11_clamped = max(0.0, min(1.0, val11))
             bar = "█" * int(val11_clamped * 10) + "░" * (10 - int(val11_clamped * 10))
             conf_str = f"{val11:.3f}" if val11 >= 0 else "WC3없음"
@@ -1125,7 +1308,7 @@ class WatchWorker(QObject):
             if first:
                 self.log_signal.emit(msg, "warn")
                 first = False
-            time.sleep(0.25)
+            self._sleep(0.25)
 
         if not self._running:
             return "timeout"
@@ -1139,223 +1322,144 @@ class WatchWorker(QObject):
         return "timeout"
 
     # ── 인게임 채팅 입력 ─────────────────────────────
-    def _send_ingame_chat(self, text: str):
-        """Enter → 텍스트 입력 → Enter 로 인게임 채팅 전송."""
-        hwnd = find_war3_hwnd()
-        if hwnd:
-            _user32.SetForegroundWindow(hwnd)
-            time.sleep(0.1)
-        self.log(f"채팅 입력: {text}", "info")
-        _press_vk(_VK_RETURN); time.sleep(0.1)
-        _press_vk(_VK_RETURN, keyup=True); time.sleep(0.2)
-        type_string(text)
-        time.sleep(0.1)
-        _press_vk(_VK_RETURN); time.sleep(0.02)
-        _press_vk(_VK_RETURN, keyup=True)
-        self.log(f"채팅 전송 완료: {text}", "success")
-
-    def _send_chat_fast(self, text: str):
-        """클립보드 붙여넣기 방식으로 빠르게 채팅 커맨드 전송 (Enter → Ctrl+V → Enter)."""
-        import win32clipboard
-        hwnd = find_war3_hwnd()
-        if not hwnd:
-            self.log("[채팅] WC3 창 없음", "warn")
-            return
-        win32clipboard.OpenClipboard()
-        win32clipboard.EmptyClipboard()
-        win32clipboard.SetClipboardText(text, win32clipboard.CF_UNICODETEXT)
-        win32clipboard.CloseClipboard()
-        _user32.SetForegroundWindow(hwnd)
-        time.sleep(0.05)
-        _press_vk(_VK_RETURN);          time.sleep(0.02)
-        _press_vk(_VK_RETURN, keyup=True); time.sleep(0.05)
-        _press_vk(_VK_CONTROL)
-        _press_vk(_VK_V);               time.sleep(0.02)
-        _press_vk(_VK_V, keyup=True)
-        _press_vk(_VK_CONTROL, keyup=True); time.sleep(0.05)
-        _press_vk(_VK_RETURN);          time.sleep(0.02)
-        _press_vk(_VK_RETURN, keyup=True)
-        self.log(f"[채팅] 전송: {text}", "success")
-
-    def _send_chat_instant(self, text: str):
-        """단일 SendInput 배치로 딜레이 없이 채팅 전송. KEYEVENTF_UNICODE로 한글 포함 전 유니코드 지원."""
-        hwnd = find_war3_hwnd()
-        if not hwnd:
-            self.log("[채팅] WC3 창 없음", "warn")
-            return
-        _user32.SetForegroundWindow(hwnd)
-        deadline_fg = time.time() + 1.0
-        while time.time() < deadline_fg:
-            if _user32.GetForegroundWindow() == hwnd:
-                break
-            time.sleep(0.05)
-        # 이벤트 목록: Enter↓↑ + 문자별 Unicode↓↑ + Enter↓↑ — 단일 배치
-        events: list[tuple[int, int, int]] = []  # (vk, scan, flags)
-        events.append((_VK_RETURN, _user32.MapVirtualKeyW(_VK_RETURN, 0), 0))
-        events.append((_VK_RETURN, _user32.MapVirtualKeyW(_VK_RETURN, 0), _KEYEVENTF_KEYUP))
-        for ch in text:
-            code = ord(ch)
-            events.append((0, code, _KEYEVENTF_UNICODE))
-            events.append((0, code, _KEYEVENTF_UNICODE | _KEYEVENTF_KEYUP))
-        events.append((_VK_RETURN, _user32.MapVirtualKeyW(_VK_RETURN, 0), 0))
-        events.append((_VK_RETURN, _user32.MapVirtualKeyW(_VK_RETURN, 0), _KEYEVENTF_KEYUP))
-        arr = (_KBD_INPUT * len(events))()
-        for i, (vk, scan, flags) in enumerate(events):
-            ctypes.memset(ctypes.byref(arr[i]), 0, ctypes.sizeof(_KBD_INPUT))
-            arr[i].type       = 1  # INPUT_KEYBOARD
-            arr[i].ki.wVk     = vk
-            arr[i].ki.wScan   = scan
-            arr[i].ki.dwFlags = flags
-        _user32.SendInput(len(events), arr, ctypes.sizeof(_KBD_INPUT))
-        self.log(f"[채팅] 즉시 전송: {text}", "success")
+    def _send_chat(self, text: str) -> bool:
+        """채팅 전송 — 디스패처 → send_chat() (측정 지연 순으로 메모리/유니코드/붙여넣기/타이핑 경로 시도, 실패 시 폴백)."""
+        ok, msg = chat_dispatcher().send(text)
+        self.log(msg, "success" if ok else "warn")
+        return ok
+
+    @traced()
+    def _portal_enter(self, attempt: int) -> "dict | None":
+        """-suicide → 정지 → 포탈 이동 → 포탈 선택 → 진입 확인 1회. 성공 시 설정 dict, 실패 시 None."""
+        self.log(f"[포탈] -suicide 전송 (시도 {attempt}회)", "info")
+        self.status("포탈 진입 중...", YELLOW)
+        self._send_chat("-suicide")
+        self._sleep(1.0)
+        # 34.공격(x).png 서치 — 미감지 시 영웅 미선택 상태로 판단, 영웅 선택 후 재시도
+        ok_atk, _ = self._wait_for_image(IMG.ATTACK_X, timeout=5.0, threshold=0.90, click=False)
+        if not ok_atk:
+            self.log("[포탈] 공격X 미감지 → 영웅 선택 후 재시도", "warn")
+            move_cursor_to(55, 80)
+            self._clock.sleep(0.05)
+            click_image_center(55, 80)
+            return None
+        ok, _ = self._wait_for_image(IMG.STOP, timeout=5.0, click=False)
+        if not ok:
+            self.log("[포탈] 정지 화면 미감지 → -suicide 재시도", "warn")
+            return None
+        self.log("[포탈] 정지 화면 확인 → 자살 성공", "success")
+        self.status("포탈 이동 중...", YELLOW)
+        # (34, 849) 좌더블클릭
+        click_at(34, 849, double=True)
+        # 1초 병렬 타이머 동안 0.25초마다 우클릭
+        deadline = self._clock.now() + 1.0
+        while self._running and self._clock.now() < deadline:
+            right_click_image_center(34, 849)
+            self._sleep(0.25)
+        # 30.이동(X).png 서치 (5초) — 미감지 시 suicide 루프 처음으로
+        ok_move, _ = self._wait_for_image(IMG.MOVE_X, timeout=5.0, click=False)
+        if not ok_move:
+            self.log("[포탈] 이동 미확인 → -suicide 재시도", "warn")
+            return None
+        self.log("[포탈] 이동 확인 → 포탈 진입 중...", "success")
+        self.status("포탈 진입 중...", YELLOW)
+        click_at(1042, 344, double=True)
+        # 35.포탈검증.png 서치 (5초) — 미감지 시 suicide 루프 처음으로
+        ok_portal, _ = self._wait_for_image(IMG.PORTAL_CHECK, timeout=5.0, click=False)
+        if not ok_portal:
+            self.log("[포탈] 포탈 검증 실패 → -suicide 재시도", "warn")
+            return None
+        self.log("[포탈] 포탈 검증 완료", "success")
+        self.status("포탈 검증 완료", GREEN)
+        # 설정된 포탈 키 좌표로 이동 후 좌클릭
+        _cfg = load_config()
+        if _cfg.get("normal_hunt_enabled"):
+            _portal_key = _cfg.get("normal_hunt_portal_key", "Q 포탈 | 라하린 숲")
+        else:
+            _portal_key = _cfg.get("boss_raid_portal_key", "Q 포탈 | 라하린 숲")
+        _pt = _PORTAL_COORDS.get(_portal_key)
+        if _pt:
+            click_at(_pt[0], _pt[1])
+            self.log(f"[포탈] 클릭 ({_pt[0]}, {_pt[1]}) - {_portal_key} 진입", "success")
+        ok_hold, _ = self._wait_for_image(IMG.HOLD_CHECK, timeout=5.0, click=False)
+        if not ok_hold:
+            self.log("[포탈] 영웅이 포탈에 진입하지 못했습니다", "warn")
+            return None
+        self.log(f"[포탈] 영웅이 {_portal_key}에 진입했습니다", "success")
+        return _cfg
 
     def _enter_portal_suicide(self):
-        """-suicide 전송 후 31.정지.png 감지될 때까지 무한 재시도."""
+        """-suicide 전송 후 31.정지.png 감지될 때까지 무한 재시도.
+        포탈 모드에서는 사냥 루프에서 돌아오지 않으므로, 사냥터 진입(사냥·보스 구간 시작) 시점에 추적 사이클을 닫는다."""
         attempt = 0
         while self._running:
             attempt += 1
-            self.log(f"[포탈] -suicide 전송 (시도 {attempt}회)", "info")
-            self.status("포탈 진입 중...", YELLOW)
-            self._send_chat_instant("-suicide")
-            time.sleep(1.0)
-            # 34.공격(x).png 서치 — 미감지 시 영웅 미선택 상태로 판단, 영웅 선택 후 재시도
-            ok_atk, _ = self._wait_for_image(IMG.ATTACK_X, timeout=5.0, threshold=0.90, click=False)
-            if not ok_atk:
-                self.log("[포탈] 공격X 미감지 → 영웅 선택 후 재시도", "warn")
-                move_cursor_to(55, 80)
-                time.sleep(0.05)
-                click_image_center(55, 80)
+            _cfg = self._portal_enter(attempt)
+            if _cfg is None:
                 continue
-            ok, _ = self._wait_for_image(IMG.STOP, timeout=5.0, click=False)
-            if ok:
-                self.log("[포탈] 정지 화면 확인 → 자살 성공", "success")
-                self.status("포탈 이동 중...", YELLOW)
-                # (34, 849) 좌더블클릭
-                move_cursor_to(34, 849)
-                time.sleep(0.05)
-                click_image_center(34, 849)
-                time.sleep(0.1)
-                click_image_center(34, 849)
-                # 1초 병렬 타이머 동안 0.25초마다 우클릭
-                deadline = time.time() + 1.0
-                while self._running and time.time() < deadline:
-                    right_click_image_center(34, 849)
-                    time.sleep(0.25)
-                # 30.이동(X).png 서치 (5초) — 미감지 시 suicide 루프 처음으로
-                ok_move, _ = self._wait_for_image(IMG.MOVE_X, timeout=5.0, click=False)
-                if ok_move:
-                    self.log("[포탈] 이동 확인 → 포탈 진입 중...", "success")
-                    self.status("포탈 진입 중...", YELLOW)
-                    move_cursor_to(1042, 344)
-                    time.sleep(0.05)
-                    click_image_center(1042, 344)
-                    time.sleep(0.1)
-                    click_image_center(1042, 344)
-                    # 35.포탈검증.png 서치 (5초) — 미감지 시 suicide 루프 처음으로
-                    ok_portal, _ = self._wait_for_image(IMG.PORTAL_CHECK, timeout=5.0, click=False)
-                    if ok_portal:
-                        self.log("[포탈] 포탈 검증 완료", "success")
-                        self.status("포탈 검증 완료", GREEN)
-                        # 설정된 포탈 키 좌표로 이동 후 좌클릭
-                        _cfg = load_config()
-                        if _cfg.get("normal_hunt_enabled"):
-                            _portal_key = _cfg.get("normal_hunt_portal_key", "Q 포탈 | 라하린 숲")
-                        else:
-                            _portal_key = _cfg.get("boss_raid_portal_key", "Q 포탈 | 라하린 숲")
-                        _pt = _PORTAL_COORDS.get(_portal_key)
-                        if _pt:
-                            move_cursor_to(_pt[0], _pt[1])
-                            time.sleep(0.05)
-                            click_image_center(_pt[0], _pt[1])
-                            self.log(f"[포탈] 클릭 ({_pt[0]}, {_pt[1]}) - {_portal_key} 진입", "success")
-                        ok_hold, _ = self._wait_for_image(IMG.HOLD_CHECK, timeout=5.0, click=False)
-                        if ok_hold:
-                            self.log(f"[포탈] 영웅이 {_portal_key}에 진입했습니다", "success")
-                            # ── 포탈 진입 후 액션 ──
-                            _action = _cfg.get(
-                                "normal_hunt_action" if _cfg.get("normal_hunt_enabled") else "boss_raid_action", 0
-                            )
-                            _boss_cfg  = self._get_portal_boss_cfg(_cfg)
-                            _use_boss  = _boss_cfg["use_boss"]
-                            _respawn_en = _cfg.get(
-                                "normal_hunt_respawn" if _cfg.get("normal_hunt_enabled") else "boss_raid_respawn", True
-                            )
-
-                            # 보스 우선 토벌: 전체 액션에서 최초 1회 적용
-                            if _use_boss and _boss_cfg["boss_priority"] and not self._boss_priority_done:
-                                self._boss_priority_done = True
-                                self.log(f"[보스 우선] {_boss_cfg['boss_zone']['name']} 바로 이동", "info")
-                                _de_p = threading.Event()
-                                _se_p = threading.Event()
-                                _dt_p = None
-                                if _respawn_en:
-                                    def _dcl_p(_de=_de_p, _se=_se_p):
-                                        _PIX_X, _PIX_Y = 13, 49
-                                        while self._running and not _se.is_set():
-                                            rgb = _get_pixel_at_client(_PIX_X, _PIX_Y)
-                                            if rgb is None: time.sleep(1.0); continue
-                                            pr, pg, pb = rgb
-                                            if pr == 0 and pg == 0 and pb == 0:
-                                                self.log("[사망감지] 영웅 사망 → suicide 재시작", "warn")
-                                                self.status("영웅 사망 감지!", RED)
-                                                _de.set(); return
-                                            time.sleep(1.0)
-                                    _dt_p = threading.Thread(target=_dcl_p, daemon=True)
-                                    _dt_p.start()
-                                _prio_ok = self._run_boss_sequence(_boss_cfg, _de_p, _se_p, _dt_p, _respawn_en)
-                                _se_p.set()
-                                if _dt_p: _dt_p.join(timeout=2.0)
-                                if not _prio_ok:
-                                    continue  # 사망 → suicide 루프 처음부터
-
-                            if _action == 0:
-                                alive = self._post_portal_instant_hunt(boss_cfg=_boss_cfg)
-                                if not alive:
-                                    continue  # 사망 → suicide 루프 처음부터
-                                if _use_boss: continue  # 보스 완료 → 재시작
-                                break
-                            elif _action == 1:
-                                alive = self._post_portal_zone_hunt(boss_cfg=_boss_cfg)
-                                if not alive:
-                                    continue  # 오류/사망 → suicide 루프 처음부터
-                                continue  # 정상 완료 → suicide 루프 재시작
-                            elif _action == 2:
-                                alive = self._post_portal_custom_hunt(boss_cfg=_boss_cfg)
-                                if not alive:
-                                    continue  # 사망 → suicide 루프 처음부터
-                                if _use_boss: continue  # 보스 완료 → 재시작
-                                break
-                        self.log("[포탈] 영웅이 포탈에 진입하지 못했습니다", "warn")
-                        continue
-                    self.log("[포탈] 포탈 검증 실패 → -suicide 재시도", "warn")
-                self.log("[포탈] 이동 미확인 → -suicide 재시도", "warn")
-            self.log("[포탈] 정지 화면 미감지 → -suicide 재시도", "warn")
+            # 사냥터 복귀 완료 → 재접속 사이클 종료 (이후 재진입은 진행 중 사이클이 없으므로 무시됨)
+            self._end_trace_cycle()
+            # ── 포탈 진입 후 액션 ──
+            _action = _cfg.get(
+                "normal_hunt_action" if _cfg.get("normal_hunt_enabled") else "boss_raid_action", 0
+            )
+            _boss_cfg  = self._get_portal_boss_cfg(_cfg)
+            _use_boss  = _boss_cfg["use_boss"]
+            _respawn_en = _cfg.get(
+                "normal_hunt_respawn" if _cfg.get("normal_hunt_enabled") else "boss_raid_respawn", True
+            )
+
+            # 보스 우선 토벌: 전체 액션에서 최초 1회 적용
+            if _use_boss and _boss_cfg["boss_priority"] and not self._boss_priority_done:
+                self._boss_priority_done = True
+                self.log(f"[보스 우선] {_boss_cfg['boss_zone']['name']} 바로 이동", "info")
+                _se_p = threading.Event()
+                _de_p = self._subscribe_death(_se_p, _respawn_en)
+                _prio_ok = self._run_boss_sequence(_boss_cfg, _de_p, _se_p, _respawn_en)
+                _se_p.set()
+                if not _prio_ok:
+                    continue  # 사망 → suicide 루프 처음부터
+
+            if _action == 0:
+                alive = self._post_portal_instant_hunt(boss_cfg=_boss_cfg)
+                if not alive:
+                    continue  # 사망 → suicide 루프 처음부터
+                if _use_boss: continue  # 보스 완료 → 재시작
+                break
+            elif _action == 1:
+                alive = self._post_portal_zone_hunt(boss_cfg=_boss_cfg)
+                if not alive:
+                    continue  # 오류/사망 → suicide 루프 처음부터
+                continue  # 정상 완료 → suicide 루프 재시작
+            elif _action == 2:
+                alive = self._post_portal_custom_hunt(boss_cfg=_boss_cfg)
+                if not alive:
+                    continue  # 사망 → suicide 루프 처음부터
+                if _use_boss: continue  # 보스 완료 → 재시작
+                break
 
     def _move_to_zone(self, zone: dict, death_event: "threading.Event",
                       stop_event: "threading.Event") -> bool:
-        """지정 구역으로 이동 (1차 + 필요 시 2차). 사망/중지 시 False 반환."""
-        _step_labels = ["", "2차 ", "3차 "]
-        for step, pos_key in enumerate(["pos", "pos2", "pos3"]):
-            coords = zone.get(pos_key)
+        """지정 구역으로 이동 (1차 + 필요 시 2차·3차, 또는 zone["steps"] 순서). 사망/중지 시 False 반환."""
+        steps = zone.get("steps") or [zone.get(k) for k in ("pos", "pos2", "pos3")]
+        for step, coords in enumerate(steps):
             if not coords:
                 continue
             x, y = coords
-            label = f"{_step_labels[step]}이동"
+            label = f"{step + 1}차 이동" if step else "이동"
             self.log(f"[구역이동] {zone['name']} {label} → ({x}, {y})", "info")
-            move_cursor_to(x, y)
-            time.sleep(0.05)
-            _rc_dl = time.time() + 1.0
-            while time.time() < _rc_dl and self._running and not death_event.is_set():
+            _rc_dl = self._clock.now() + 1.0
+            while self._clock.now() < _rc_dl and self._running and not death_event.is_set():
                 right_click_image_center(x, y)
-                time.sleep(0.25)
+                death_event.wait(0.25)
 
             # ── [1단계] 출발 확인: 29.이동.png OR 33.공격.png ──────────────────
             self.log(f"[구역이동][1단계] {label} 출발 확인 시작 (29번 or 33번, 최대 60초)", "info")
-            _dep_dl = time.time() + 60.0
+            _dep_dl = self._clock.now() + 60.0
             ok29 = False
             dep_by_move = False   # 실제 이동(29.이동.png)으로 출발 확인됐는지 추적
             _dep_iter = 0
-            while time.time() < _dep_dl and self._running and not death_event.is_set():
+            while self._clock.now() < _dep_dl and self._running and not death_event.is_set():
                 _dep_iter += 1
                 m29, v29, c29, _ = _image_match(IMG.MOVE)
                 m33, v33, c33, _ = _image_match(IMG.ATTACK, threshold=0.90)
@@ -1372,7 +1476,7 @@ class WatchWorker(QObject):
                 if m33:
                     self.log(f"[구역이동][1단계] 33번(공격) 감지 → 출발 확인(전투중이동) (v={v33:.3f}, coords={c33})", "warn")
                     ok29 = True; break
-                time.sleep(0.25)
+                death_event.wait(0.25)
             if not ok29 or death_event.is_set():
                 if death_event.is_set(): return False
                 self.log(f"[구역이동][1단계] {label} 29번/33번 모두 미감지 (60초 타임아웃) → 재시도", "warn")
@@ -1382,9 +1486,9 @@ class WatchWorker(QObject):
             # ── [2단계] 전투중이동 케이스: 실제 29번 이동 대기 ─────────────────
             if not dep_by_move:
                 self.log(f"[구역이동][2단계] 33번으로만 출발 확인 → 실제 이동(29번) 대기 시작 (최대 60초)", "warn")
-                _wait_move_dl = time.time() + 60.0
+                _wait_move_dl = self._clock.now() + 60.0
                 _wm_iter = 0
-                while time.time() < _wait_move_dl and self._running and not death_event.is_set():
+                while self._clock.now() < _wait_move_dl and self._running and not death_event.is_set():
                     _wm_iter += 1
                     m29b, v29b, c29b, _ = _image_match(IMG.MOVE)
                     m33b, v33b, _, _ = _image_match(IMG.ATTACK, threshold=0.90)
@@ -1398,7 +1502,7 @@ class WatchWorker(QObject):
                     if m29b:
                         self.log(f"[구역이동][2단계] 29번(이동) 감지 → 실제 이동 시작 확인 (v={v29b:.3f}, coords={c29b})", "success")
                         dep_by_move = True; break
-                    time.sleep(0.25)
+                    death_event.wait(0.25)
                 if not dep_by_move or death_event.is_set():
                     if death_event.is_set(): return False
                     self.log(f"[구역이동][2단계] {label} 전투 후 29번 이동 미감지 (60초) → 재시도", "warn")
@@ -1407,10 +1511,10 @@ class WatchWorker(QObject):
 
             # ── [3단계] 도착 확인: 30.이동(X).png OR 33.공격.png ──────────────
             self.log(f"[구역이동][3단계] {label} 도착 확인 시작 (30번 or 33번, 최대 60초)", "info")
-            _mv_dl = time.time() + 60.0
+            _mv_dl = self._clock.now() + 60.0
             ok30 = False
             _arr_iter = 0
-            while time.time() < _mv_dl and self._running and not death_event.is_set():
+            while self._clock.now() < _mv_dl and self._running and not death_event.is_set():
                 _arr_iter += 1
                 m30, v30, c30, _ = _image_match(IMG.MOVE_X)
                 m33, v33, c33, _ = _image_match(IMG.ATTACK, threshold=0.90)
@@ -1427,7 +1531,7 @@ class WatchWorker(QObject):
                 if m33:
                     self.log(f"[구역이동][3단계] 33번(공격) 감지 → 도착 판정(이동중블로킹) (v={v33:.3f}, coords={c33})", "warn")
                     ok30 = True; break
-                time.sleep(0.25)
+                death_event.wait(0.25)
 
             if death_event.is_set(): return False
             if not ok30:
@@ -1461,93 +1565,124 @@ class WatchWorker(QObject):
         return False
 
     def _boss_fight_macro(self, death_event: "threading.Event",
-                          stop_event: "threading.Event",
-                          death_thread: "threading.Thread | None") -> bool:
+                          stop_event: "threading.Event") -> bool:
         """보스 전투 매크로.
         33.공격.png 2회 연속 감지(0.25s 간격, 30s 타임아웃) 후 스킬 루프 진입.
         종료 조건: 사망 이벤트, 34.공격(x).png 2회 연속 감지(0.25s, 180s 타임아웃), 또는 타임아웃.
+        boss_hp_region(보스 패널에서 설정, 1920×1080 기준) 설정 시 보스 HP 바도 추적: 바가 보이면 33번 대기 없이 진입,
+        HP 0% 확정 시 즉시 종료, boss_hp_stall_s 초간 HP 가 줄지 않으면 전투 포기.
         종료 시 -return 전송 (사망 제외).
         반환: True=정상완료, False=사망(suicide 재시작 필요)"""
         self.log("[보스전투] 33.공격.png 서치 시작 (30초, 2회 연속)", "info")
         self.status("보스 전투 준비 중...", YELLOW)
 
+        cfg = load_config()
+        hp  = None
+        if cfg.get("boss_hp_region"):
+            try:
+                hp = BossHpTracker(tuple(cfg["boss_hp_region"]),
+                                   stall_s=float(cfg.get("boss_hp_stall_s", 20.0)),
+                                   clock=self._clock)
+            except (ValueError, TypeError) as e:
+                self.log(f"[보스전투] boss_hp_region 설정 오류 ({e}) → HP 추적 끔", "warn")
+
+        def _check(filename: str, threshold: float = 0.8) -> float:
+            """HP 추적 중이면 프레임 1장으로 템플릿 매칭 + HP 갱신, 아니면 기존 _image_match."""
+            if hp is None:
+                return _image_match(filename, threshold=threshold)[1]
+            frame = _capture_frame()
+            if frame is None:
+                return -1.0
+            hp.update(frame)
+            return _match_frame(filename, frame, threshold)[1]
+
         # ── Step 1: 33.공격.png 2회 연속 감지 (0.25s 간격, 30s 타임아웃) ──
-        deadline33 = time.time() + 30.0
-        consec33   = 0
+        deadline33 = self._clock.now() + 30.0
+        det33      = VotingDetector(votes=2, window=2, clock=self._clock.now)
         ok33       = False
-        while time.time() < deadline33 and self._running and not death_event.is_set():
-            matched, _, _, _ = _image_match(IMG.ATTACK)
-            if matched:
-                consec33 += 1
-                if consec33 >= 2:
-                    ok33 = True
-                    break
-            else:
-                consec33 = 0
-            time.sleep(0.25)
+        while self._clock.now() < deadline33 and self._running and not death_event.is_set():
+            val33 = _check(IMG.ATTACK)
+            if det33.update(val33) or (hp is not None and hp.visible):
+                ok33 = True
+                break
+            death_event.wait(0.25)
 
         if death_event.is_set():
             stop_event.set()
-            if death_thread: death_thread.join(timeout=2.0)
             return False
 
         if not ok33:
             self.log("[보스전투] 33번(공격) 30초 내 미감지 → 전투 스킵", "info")
             stop_event.set()
-            if death_thread: death_thread.join(timeout=2.0)
             return True
 
         self.log("[보스전투] 33번(공격) 2회 연속 감지 → 스킬 루프 시작", "success")
         self.status("보스 전투 중!", YELLOW)
 
-        # ── Step 2~4: 커서 이동(병렬) + 스킬 키 루프 + 34번 감지 ──
-        _boss_stop  = threading.Event()
-        _skill_keys = [ord('D'), ord('W'), ord('E'), ord('R'), ord('T')]
-        _hero_vk    = ord(str(load_config().get("hero_group", 1)))
-
-        def _cursor_loop():
-            while not _boss_stop.is_set() and self._running and not death_event.is_set():
-                move_cursor_to(50, 75)
-                time.sleep(0.1)
-
-        _cursor_thread = threading.Thread(target=_cursor_loop, daemon=True)
-        _cursor_thread.start()
-
-        deadline34 = time.time() + 180.0
-        consec34   = 0
+        # ── Step 2~4: 스킬 로테이션 + 34번 감지 ──
+        _hero_vk = ord(str(cfg.get("hero_group", 1)))
+        try:
+            rot = SkillRotation(_hero_vk, skills=cfg.get("boss_skills") or None,
+                                ready_min=int(cfg.get("boss_skill_ready_min", 60)),
+                                clock=self._clock)
+        except (ValueError, TypeError) as e:
+            self.log(f"[보스전투] boss_skills 설정 오류 ({e}) → 기본 스킬 사용", "warn")
+            rot = SkillRotation(_hero_vk, clock=self._clock)
+
+        def _cancelled() -> bool:
+            return not self._running or death_event.is_set()
+
+        timeout34  = float(cfg.get("boss_fight_timeout", 180.0))
+        deadline34 = self._clock.now() + timeout34
+        det34      = VotingDetector(votes=2, window=2, enter=0.90, clock=self._clock.now)
         ok34       = False
-        key_idx    = 0
-        while time.time() < deadline34 and self._running and not death_event.is_set():
-            vk = _skill_keys[key_idx % len(_skill_keys)]
-            # 스킬 키 → 좌클릭 → 영웅 번호 (딜레이 없이 즉시) → 0.1s → 다음 세트
-            _press_vk(vk); time.sleep(0.02); _press_vk(vk, keyup=True)
-            click_image_center(50, 75)
-            _press_vk(_hero_vk); _press_vk(_hero_vk, keyup=True)
-            key_idx += 1
-            time.sleep(0.1)
-
-            matched34, _, _, _ = _image_match(IMG.ATTACK_X, threshold=0.90)
-            if matched34:
-                consec34 += 1
-                if consec34 >= 2:
-                    ok34 = True
-                    break
-            else:
-                consec34 = 0
-
-        _boss_stop.set()
-        _cursor_thread.join(timeout=2.0)
-        stop_event.set()
-        if death_thread: death_thread.join(timeout=2.0)
+        end_reason = ""
+        next_check = self._clock.now()
+        next_hp_ui = self._clock.now()
+        try:
+            while self._clock.now() < deadline34 and not _cancelled():
+                rot.step(_cancelled)
+                # 34번 이미지 매칭은 0.1초 간격으로만 (시전 루프를 매칭 비용으로 늦추지 않음)
+                if self._clock.now() >= next_check:
+                    next_check = self._clock.now() + 0.1
+                    val34 = _check(IMG.ATTACK_X, threshold=0.90)
+                    if det34.update(val34):
+                        ok34 = True
+                        break
+                    if hp is not None:
+                        if hp.killed:
+                            end_reason = "killed"
+                            break
+                        if hp.stalled:
+                            end_reason = "stalled"
+                            break
+                        if self._clock.now() >= next_hp_ui:
+                            next_hp_ui = self._clock.now() + 1.0
+                            self.status(f"보스 전투 중! {hp.status_text()}", YELLOW)
+                death_event.wait(rot.wait_hint(0.1))
+        finally:
+            rot.close()
+            stop_event.set()
+            st = rot.stats()
+            per = ", ".join(f"{k} {v['casts']}/{v['presses']}" for k, v in st["per_skill"].items())
+            self.log(f"[보스전투] 스킬 {st['casts']}회 ({st['cpm']:.0f}/분) · 헛누름 {st['wasted']} · "
+                     f"쿨다운 대기 {st['held']} — {per}", "info")
 
         if death_event.is_set():
-            self.log("[보스전투] 사망 감지 → suicide 루프 재시작", "warn")
+            if self._running:
+                self.log("[보스전투] 사망 감지 → suicide 루프 재시작", "warn")
             return False
 
         if ok34:
             self.log("[보스전투] 34번(공격X) 2회 연속 감지 → 보스 전투 종료", "success")
+        elif end_reason == "killed":
+            self.log(f"[보스전투] 보스 HP 0% 확정 → 보스 전투 종료 "
+                     f"({timeout34 - (deadline34 - self._clock.now()):.0f}초)", "success")
+        elif end_reason == "stalled":
+            self.log(f"[보스전투] 보스 HP {hp.ratio * 100:.0f}% 에서 {hp.stall_s:.0f}초간 변화 없음 "
+                     f"→ 전투 포기", "warn")
         else:
-            self.log("[보스전투] 180초 타임아웃 → 보스 전투 종료", "warn")
+            self.log(f"[보스전투] {timeout34:.0f}초 타임아웃 → 보스 전투 종료", "warn")
         self.status("보스 전투 완료 → 재시작", YELLOW)
         return True
 
@@ -1559,158 +1694,27 @@ class WatchWorker(QObject):
             return {"use_boss": False, "boss_zone": None, "enabled_bosses": [],
                     "boss_timer_on": False, "boss_timer_sec": 60.0, "boss_priority": False}
 
-        # boss_exit: 보스맵 → 필드맵 복귀 좌표 (별도 서브맵인 경우). None = 같은 맵
-        _BOSS_ZONES_Q = [
-            {"key": "nh_zone_boss",       "name": "도적단장 - 칼레인",    "pos": (70,  884), "pos2": (237, 834), "pos3": None,       "boss_exit": {"pos": (237, 839), "pos2": None}},
-            {"key": "nh_q_boss_kingcrab", "name": "백년 묵은 킹크랩",     "pos": (76,  881), "pos2": (212, 869), "pos3": None,       "boss_exit": {"pos": (212, 874), "pos2": None}},
-            {"key": "nh_q_boss_giant",    "name": "늪의 거인",             "pos": (76,  881), "pos2": (211, 864), "pos3": (235, 863), "boss_exit": {"pos": (234, 872), "pos2": (212, 874)}},
-            {"key": "nh_q_boss_pap",      "name": "잊혀진 수호자 - 파프", "pos": (69,  873), "pos2": None,       "pos3": None,       "boss_exit": None},
-        ]
-        _BOSS_ZONE_W = {"name": "매직웨건", "pos": (29, 912), "pos2": (234, 849), "boss_exit": {"pos": (234, 855), "pos2": None}}
-        _BOSS_ZONES_E = [
-            {"key": "nh_e_boss_maureus",  "name": "마우레우스",        "pos": (28, 942), "pos2": (49, 986),  "pos3": None,       "boss_exit": {"pos": (49, 994),  "pos2": None}, "shortcuts": {"nh_e_boss_tarod":   {"pos": (49, 980), "pos2": (49, 972)}}},
-            {"key": "nh_e_boss_tarod",    "name": "타로드",            "pos": (28, 942), "pos2": (49, 980),  "pos3": (49, 972),  "boss_exit": {"pos": (49, 994),  "pos2": None}, "shortcuts": {"nh_e_boss_maureus": {"pos": (49, 979), "pos2": (49, 980)}}},
-            {"key": "nh_e_boss_colossus", "name": "바위거인 콜로서스", "pos": (49, 934), "pos2": (233, 883), "pos3": None,       "boss_exit": {"pos": (233, 887), "pos2": None}},
-            {"key": "nh_e_boss_tulak",    "name": "사도: 툴'락",       "pos": (53, 938), "pos2": (65, 934),  "pos3": None,       "boss_exit": {"pos": (52, 938),  "pos2": None}},
-        ]
-        _BOSS_ZONES_R = [
-            {"key": "nh_r_boss_hedan",    "name": "보급장교 헤단",   "pos": ( 94, 835), "pos2": (213, 883), "pos3": None, "boss_exit": {"pos": (212, 888), "pos2": None}},
-            {"key": "nh_r_boss_thanatos", "name": "사신 - 타나토스", "pos": (120, 857), "pos2": (279, 850), "pos3": None, "boss_exit": {"pos": (279, 857), "pos2": None}},
-        ]
-        _BOSS_ZONES_A = [
-            {"key": "nh_a_boss_bx485", "name": "BX-485",          "pos": (133, 878), "pos2": None, "pos3": None, "boss_exit": None},
-            {"key": "nh_a_boss_ivan",  "name": "엔지니어 - 이반", "pos": (133, 866), "pos2": None, "pos3": None, "boss_exit": None},
-        ]
-        _BOSS_ZONES_S = [
-            {"key": "nh_s_boss_callis", "name": "집행자 캘리스", "pos": (120, 909), "pos2": None,       "pos3": None, "boss_exit": None},
-            {"key": "nh_s_boss_kalipa", "name": "마룡: 칼리파",  "pos": (120, 917), "pos2": (256, 848), "pos3": None, "boss_exit": {"pos": (256, 856), "pos2": None}},
-        ]
-        _BOSS_ZONES_D = [
-            {"key": "nh_d_boss_klak",   "name": "클락",   "pos": (127, 941), "pos2": None,       "pos3": None, "boss_exit": None},
-            {"key": "nh_d_boss_mirdon", "name": "미르돈", "pos": (127, 954), "pos2": None,       "pos3": None, "boss_exit": None},
-            {"key": "nh_d_boss_rex",    "name": "렉스",   "pos": (142, 942), "pos2": (253, 864), "pos3": None, "boss_exit": {"pos": (263, 871), "pos2": None}},
-        ]
-        _BOSS_ZONES_F = [
-            {"key": "nh_f_boss_doombaou", "name": "둠바우", "pos": (186, 852), "pos2": None, "pos3": None, "boss_exit": None},
-        ]
-        _BOSS_ZONES_Z = [
-            {"key": "nh_z_boss_flame", "name": "플레임", "pos": (160, 867), "pos2": None, "pos3": None, "boss_exit": None},
-        ]
-
         is_nh      = cfg.get("normal_hunt_enabled", False)
-        portal_key = cfg.get(
-            "normal_hunt_portal_key" if is_nh else "boss_raid_portal_key",
-            "Q 포탈 | 라하린 숲"
+        portal_key = cfg.get("normal_hunt_portal_key" if is_nh else "boss_raid_portal_key", DEFAULT_PORTAL)
+        info       = portal_info(portal_key)
+        prefix     = info.prefix
+
+        _order = cfg.get(f"{prefix}_boss_order", [])
+        enabled_bosses = sorted(
+            [b for b in info.bosses if cfg.get(b["key"], False)],
+            key=lambda b: _order.index(b["key"]) if b["key"] in _order else len(_order),
         )
-
-        use_boss       = False
-        boss_zone      = None
-        enabled_bosses: list = []
-        _timer_key     = ""
-        _timer_sec_key = ""
-        _priority_key  = ""
-        _no_return_key = ""
-
-        if portal_key == "E 포탈 | 어둠얼음성채":
-            _order = cfg.get("nh_e_boss_order", [])
-            enabled_bosses = sorted(
-                [b for b in _BOSS_ZONES_E if cfg.get(b["key"], False)],
-                key=lambda b: _order.index(b["key"]) if b["key"] in _order else len(_order),
-            )
-            use_boss       = bool(enabled_bosses)
-            boss_zone      = enabled_bosses[0] if enabled_bosses else _BOSS_ZONES_E[0]
-            _timer_key     = "nh_e_boss_timer"
-            _timer_sec_key = "nh_e_boss_timer_sec"
-            _priority_key  = "nh_e_boss_priority"
-            _no_return_key = "nh_e_boss_no_return"
-        elif portal_key == "R 포탈 | 버려진 고성":
-            _order = cfg.get("nh_r_boss_order", [])
-            enabled_bosses = sorted(
-                [b for b in _BOSS_ZONES_R if cfg.get(b["key"], False)],
-                key=lambda b: _order.index(b["key"]) if b["key"] in _order else len(_order),
-            )
-            use_boss       = bool(enabled_bosses)
-            boss_zone      = enabled_bosses[0] if enabled_bosses else _BOSS_ZONES_R[0]
-            _timer_key     = "nh_r_boss_timer"
-            _timer_sec_key = "nh_r_boss_timer_sec"
-            _priority_key  = "nh_r_boss_priority"
-            _no_return_key = "nh_r_boss_no_return"
-        elif portal_key == "A 포탈 | 바위협곡":
-            _order = cfg.get("nh_a_boss_order", [])
-            enabled_bosses = sorted(
-                [b for b in _BOSS_ZONES_A if cfg.get(b["key"], False)],
-                key=lambda b: _order.index(b["key"]) if b["key"] in _order else len(_order),
-            )
-            use_boss       = bool(enabled_bosses)
-            boss_zone      = enabled_bosses[0] if enabled_bosses else _BOSS_ZONES_A[0]
-            _timer_key     = "nh_a_boss_timer"
-            _timer_sec_key = "nh_a_boss_timer_sec"
-            _priority_key  = "nh_a_boss_priority"
-            _no_return_key = "nh_a_boss_no_return"
-        elif portal_key == "S 포탈 | 바람의 협곡":
-            _order = cfg.get("nh_s_boss_order", [])
-            enabled_bosses = sorted(
-                [b for b in _BOSS_ZONES_S if cfg.get(b["key"], False)],
-                key=lambda b: _order.index(b["key"]) if b["key"] in _order else len(_order),
-            )
-            use_boss       = bool(enabled_bosses)
-            boss_zone      = enabled_bosses[0] if enabled_bosses else _BOSS_ZONES_S[0]
-            _timer_key     = "nh_s_boss_timer"
-            _timer_sec_key = "nh_s_boss_timer_sec"
-            _priority_key  = "nh_s_boss_priority"
-            _no_return_key = "nh_s_boss_no_return"
-        elif portal_key == "D 포탈 | 시계태엽 공장":
-            _order = cfg.get("nh_d_boss_order", [])
-            enabled_bosses = sorted(
-                [b for b in _BOSS_ZONES_D if cfg.get(b["key"], False)],
-                key=lambda b: _order.index(b["key"]) if b["key"] in _order else len(_order),
-            )
-            use_boss       = bool(enabled_bosses)
-            boss_zone      = enabled_bosses[0] if enabled_bosses else _BOSS_ZONES_D[0]
-            _timer_key     = "nh_d_boss_timer"
-            _timer_sec_key = "nh_d_boss_timer_sec"
-            _priority_key  = "nh_d_boss_priority"
-            _no_return_key = "nh_d_boss_no_return"
-        elif portal_key == "F 포탈 | 속삭임의 숲":
-            enabled_bosses = [b for b in _BOSS_ZONES_F if cfg.get(b["key"], False)]
-            use_boss       = bool(enabled_bosses)
-            boss_zone      = enabled_bosses[0] if enabled_bosses else _BOSS_ZONES_F[0]
-            _timer_key     = "nh_f_boss_timer"
-            _timer_sec_key = "nh_f_boss_timer_sec"
-            _priority_key  = "nh_f_boss_priority"
-            _no_return_key = "nh_f_boss_no_return"
-        elif portal_key == "Z 포탈 | 이그니스영역":
-            enabled_bosses = [b for b in _BOSS_ZONES_Z if cfg.get(b["key"], False)]
-            use_boss       = bool(enabled_bosses)
-            boss_zone      = enabled_bosses[0] if enabled_bosses else _BOSS_ZONES_Z[0]
-            _timer_key     = "nh_z_boss_timer"
-            _timer_sec_key = "nh_z_boss_timer_sec"
-            _priority_key  = "nh_z_boss_priority"
-            _no_return_key = "nh_z_boss_no_return"
-        elif portal_key == "X 포탈 | 정령계":
-            use_boss = False
-            _timer_key = "nh_x_boss_timer"; _timer_sec_key = "nh_x_boss_timer_sec"
-            _priority_key = "nh_x_boss_priority"; _no_return_key = "nh_x_boss_no_return"
-        elif portal_key == "W 포탈 | 아스탈 요새":
-            use_boss       = cfg.get("nh_w_zone_boss", False)
-            boss_zone      = _BOSS_ZONE_W
-            enabled_bosses = [_BOSS_ZONE_W] if use_boss else []
-            _timer_key     = "nh_w_boss_timer"
-            _timer_sec_key = "nh_w_boss_timer_sec"
-            _priority_key  = "nh_w_boss_priority"
-            _no_return_key = "nh_w_boss_no_return"
-        else:  # Q 포탈 | 라하린 숲
-            _order = cfg.get("nh_boss_order", [])
-            enabled_bosses = sorted(
-                [b for b in _BOSS_ZONES_Q if cfg.get(b["key"], False)],
-                key=lambda b: _order.index(b["key"]) if b["key"] in _order else len(_order),
-            )
-            use_boss       = bool(enabled_bosses)
-            boss_zone      = enabled_bosses[0] if enabled_bosses else _BOSS_ZONES_Q[0]
-            _timer_key     = "nh_boss_timer"
-            _timer_sec_key = "nh_boss_timer_sec"
-            _priority_key  = "nh_boss_priority"
-            _no_return_key = "nh_boss_no_return"
+        use_boss  = bool(enabled_bosses)
+        route     = None
+        if use_boss:
+            # 순서 재배치는 명시적으로 켠 경우만 (기본: 설정 순서 유지, 구간 경로만 그래프로 계산)
+            route = plan_boss_route(info.bosses, enabled_bosses,
+                                    optimize=cfg.get("boss_route_optimize", False))
+            if [b["key"] for b in route.bosses] != [b["key"] for b in enabled_bosses]:
+                self.log(f"[보스경로] 방문 순서 최적화: {' → '.join(b['name'] for b in route.bosses)} "
+                         f"(설정 순서: {' → '.join(b['name'] for b in enabled_bosses)})", "info")
+            enabled_bosses = route.bosses
+        boss_zone = enabled_bosses[0] if enabled_bosses else (info.bosses[0] if info.bosses else None)
 
         # 마지막 보스의 boss_exit 추출 (필드 복귀 시 사용)
         _boss_exit = enabled_bosses[-1].get("boss_exit") if enabled_bosses else None
@@ -1719,67 +1723,56 @@ class WatchWorker(QObject):
             "use_boss":       use_boss,
             "boss_zone":      boss_zone,
             "enabled_bosses": enabled_bosses,
-            "boss_timer_on":  cfg.get(_timer_key,     False) if _timer_key else False,
-            "boss_timer_sec": cfg.get(_timer_sec_key, 60.0)  if _timer_sec_key else 60.0,
-            "boss_priority":  cfg.get(_priority_key,  False) if _priority_key else False,
-            "boss_no_return": cfg.get(_no_return_key, False) if _no_return_key else False,
+            "boss_timer_on":  cfg.get(f"{prefix}_boss_timer", False),
+            "boss_timer_sec": cfg.get(f"{prefix}_boss_timer_sec", 60.0),
+            "boss_priority":  cfg.get(f"{prefix}_boss_priority", False),
+            "boss_no_return": cfg.get(f"{prefix}_boss_no_return", False),
             "boss_exit":      _boss_exit,
+            "route":          route,
         }
 
     def _fight_boss_and_extras(self, boss_cfg: dict, death_event: "threading.Event",
                                stop_event: "threading.Event",
-                               death_thread: "threading.Thread | None",
                                respawn_enabled: bool) -> bool:
         """현재 위치에서 보스 전투 + 추가 보스 순차 방문 (이동 없이 즉시 전투 시작).
-        보스 간 이동 시 현재 보스의 boss_exit가 있으면 서브맵 출구 경유 후 다음 보스로 이동.
+        보스 간 이동은 경로 계획(boss_cfg["route"])의 구간을 따른다 — 숏컷·공용 서브맵 재사용.
         반환: True=완료, False=사망"""
         bosses = boss_cfg["enabled_bosses"]
+        route  = boss_cfg.get("route")
 
-        # ── 첫 번째 보스: 별도 _se0 + death_thread=None → main death_thread 보호 ──
-        # _boss_fight_macro 는 종료 시 stop_event.set() + death_thread.join() 을 호출하므로
-        # main stop_event/death_thread 를 직접 넘기면 사망 감지 스레드가 조기 종료된다.
+        # ── 첫 번째 보스: 별도 _se0 → main 사망감지 구독 보호 ──
+        # _boss_fight_macro 는 종료 시 stop_event.set() 을 호출하므로
+        # main stop_event 를 직접 넘기면 사망감지 구독이 조기 해제된다.
         _se0 = threading.Event()
-        if not self._boss_fight_macro(death_event, _se0, None):
-            # 사망 → main death_thread 정리 후 반환
+        if not self._boss_fight_macro(death_event, _se0):
+            # 사망 → main 구독 정리 후 반환
             stop_event.set()
-            if death_thread: death_thread.join(timeout=2.0)
             return False
 
         for i, extra in enumerate(bosses[1:], 1):
             if not self._running:
-                return True  # death_thread 정리는 caller 담당
-
-            # 추가 보스마다 전용 사망감지 스레드 생성
-            _de2, _se2 = threading.Event(), threading.Event()
-            _dt2 = None
-            if respawn_enabled:
-                def _dcl(_de=_de2, _se=_se2):
-                    _PIX_X, _PIX_Y = 13, 49
-                    while self._running and not _se.is_set():
-                        rgb = _get_pixel_at_client(_PIX_X, _PIX_Y)
-                        if rgb is None: time.sleep(1.0); continue
-                        pr, pg, pb = rgb
-                        if pr == 0 and pg == 0 and pb == 0:
-                            self.log("[사망감지] 영웅 사망 → suicide 재시작", "warn")
-                            self.status("영웅 사망 감지!", RED)
-                            _de.set(); return
-                        time.sleep(1.0)
-                _dt2 = threading.Thread(target=_dcl, daemon=True)
-                _dt2.start()
-
-            # 보스 간 이동: main death_event 로 체크 (main death_thread 가 살아있으므로)
+                return True  # 구독 정리는 caller 담당
+
+            # 추가 보스마다 전용 사망감지 구독
+            _se2 = threading.Event()
+            _de2 = self._subscribe_death(_se2, respawn_enabled)
+
+            # 보스 간 이동: main death_event 로 체크 (main 구독이 살아있으므로)
             _prev      = bosses[i - 1]
             _next_key  = extra.get("key", "")
             _shortcuts = _prev.get("shortcuts", {})
-            if _next_key in _shortcuts:
+            if route is not None and i < len(route.legs):
+                if not self._move_leg(route.legs[i], death_event, _se2):
+                    _se2.set()
+                    stop_event.set()
+                    return False
+            elif _next_key in _shortcuts:
                 _sc = _shortcuts[_next_key]
                 _sc_zone = {"name": f"{_prev['name']} → {extra['name']} 숏컷", "pos": _sc["pos"], "pos2": _sc.get("pos2")}
                 self.log(f"[보스이동] {_prev['name']} → {extra['name']} 숏컷 경로 (서브맵 출구 스킵)", "info")
                 if not self._move_to_zone(_sc_zone, death_event, _se2):
                     _se2.set()
-                    if _dt2: _dt2.join(timeout=2.0)
                     stop_event.set()
-                    if death_thread: death_thread.join(timeout=2.0)
                     return False
             else:
                 _prev_exit = _prev.get("boss_exit")
@@ -1788,117 +1781,62 @@ class WatchWorker(QObject):
                     self.log(f"[보스이동] {_prev['name']} 서브맵 출구 경유 → {extra['name']}", "info")
                     if not self._move_to_zone(_exit_zone, death_event, _se2):
                         _se2.set()
-                        if _dt2: _dt2.join(timeout=2.0)
                         stop_event.set()
-                        if death_thread: death_thread.join(timeout=2.0)
                         return False
                 if not self._move_to_zone(extra, death_event, _se2):
                     _se2.set()
-                    if _dt2: _dt2.join(timeout=2.0)
                     stop_event.set()
-                    if death_thread: death_thread.join(timeout=2.0)
                     return False
 
-            if not self._boss_fight_macro(_de2, _se2, _dt2):
-                # 추가 보스 전투 중 사망 → main death_thread 정리
+            if not self._boss_fight_macro(_de2, _se2):
+                # 추가 보스 전투 중 사망 → main 구독 정리
                 stop_event.set()
-                if death_thread: death_thread.join(timeout=2.0)
                 return False
 
-        # 모든 보스 처치 완료 → death_thread 정리는 caller 담당
+        # 모든 보스 처치 완료 → 구독 정리는 caller 담당
         return True
 
     def _run_boss_sequence(self, boss_cfg: dict, death_event: "threading.Event",
                            stop_event: "threading.Event",
-                           death_thread: "threading.Thread | None",
                            respawn_enabled: bool) -> bool:
         """보스 위치로 이동 → 전투 → 추가 보스 순차 방문.
         반환: True=완료, False=사망"""
         boss_zone = boss_cfg["boss_zone"]
-        if not self._move_to_zone(boss_zone, death_event, stop_event):
+        route     = boss_cfg.get("route")
+        if route is not None and route.legs:
+            if len(route.bosses) > 1:
+                self.log(f"[보스경로] {' → '.join(b['name'] for b in route.bosses)} "
+                         f"(예상 {route.cost:.0f}초, 설정 순서 {route.baseline:.0f}초)", "info")
+            moved = self._move_leg(route.legs[0], death_event, stop_event)
+        else:
+            moved = self._move_to_zone(boss_zone, death_event, stop_event)
+        if not moved:
             stop_event.set()
-            if death_thread: death_thread.join(timeout=2.0)
             return False
-        return self._fight_boss_and_extras(boss_cfg, death_event, stop_event, death_thread, respawn_enabled)
+        return self._fight_boss_and_extras(boss_cfg, death_event, stop_event, respawn_enabled)
+
+    def _move_leg(self, leg, death_event: "threading.Event",
+                  stop_event: "threading.Event") -> bool:
+        """경로 계획 구간 1개 이동 + 예상/실제 소요 로그."""
+        t0 = self._clock.now()
+        ok = self._move_to_zone({"name": leg.name, "steps": leg.steps}, death_event, stop_event)
+        if ok:
+            dt = self._clock.now() - t0
+            self._route_times.append((leg.cost, dt))
+            self.log(f"[보스경로] {leg.name} ({leg.via} {len(leg.steps)}단계) "
+                     f"예상 {leg.cost:.1f}초 / 실제 {dt:.1f}초", "info")
+        return ok
 
     def _post_portal_zone_hunt(self, boss_cfg: dict) -> bool:
         """포탈 진입 후 특정 구역으로 이동 후 자동사냥 (액션 1).
         반환: True=정상완료, False=오류/사망(suicide 재시작 필요)"""
-        _ZONES_Q = [
-            {"name": "오래된 숲의 정령 (아래)", "pos": (34,  887), "pos2": None},
-            {"name": "오래된 숲의 정령 (위)",   "pos": (36,  876), "pos2": None},
-            {"name": "동굴 왕 두꺼비",          "pos": (35,  867), "pos2": None},
-            {"name": "토끼 굴",                 "pos": (28,  865), "pos2": (211, 834), "exit_pos": (208, 828)},
-            {"name": "그을음 도적단 부단장",    "pos": (67,  887), "pos2": None},
-        ]
-        _ZONES_W = [
-            {"name": "경비대장 로웰",           "pos": (62,  905), "pos2": None},
-            {"name": "무쇠발톱",                "pos": (58,  918), "pos2": None},
-            {"name": "TX-005",                  "pos": (48,  921), "pos2": None},
-            {"name": "드워프, 중갑차, 정예병",  "pos": (41,  914), "pos2": None},
-        ]
-        _ZONES_E = [
-            {"name": "바레스",                 "pos": (38, 937), "pos2": None},
-            {"name": "오래된 고대유적 수호자", "pos": (46, 936), "pos2": None},
-            {"name": "거울 여왕의 파편",       "pos": (32, 944), "pos2": None},
-        ]
-        _ZONES_R = [
-            {"name": "(LT)제국기사의 망령", "pos": ( 96, 841), "pos2": None},
-            {"name": "(RT)제국기사의 망령", "pos": (112, 834), "pos2": None},
-            {"name": "옛 수비대장 펠릭스",  "pos": (102, 846), "pos2": None},
-            {"name": "옛 집행관 라나",      "pos": (126, 832), "pos2": None},
-        ]
-        _ZONES_A = [
-            {"name": "(7시) 고블린",              "pos": (128, 886), "pos2": None},
-            {"name": "(5시) 고블린",              "pos": (137, 886), "pos2": None},
-            {"name": "(10시) 고블린",             "pos": (126, 871), "pos2": None},
-            {"name": "(2시) 고블린",              "pos": (139, 870), "pos2": None},
-            {"name": "깊은 동굴 - 거대한 숲 거인", "pos": (144, 878), "pos2": (276, 885), "exit_pos": (286, 885)},
-        ]
-        _ZONES_S = [
-            {"name": "(LT) 바람의 정령",      "pos": (101, 908), "pos2": None},
-            {"name": "(RT) 바람의 정령",      "pos": (111, 900), "pos2": None},
-            {"name": "중급 바람의 정령 윈디", "pos": ( 99, 912), "pos2": None},
-            {"name": "검은가죽 드루이드",     "pos": (115, 918), "pos2": None},
-            {"name": "동굴 깊은 곳",          "pos": (123, 909), "pos2": (277, 898), "exit_pos": (274, 894)},
-            {"name": "상급 바람의 정령 실프", "pos": (123, 909), "pos2": (280, 902), "exit_pos": (274, 894)},
-        ]
-        _ZONES_D = [
-            {"name": "(LT) 마정석 골렘", "pos": (117, 951), "pos2": None},
-            {"name": "(RT) 마정석 골렘", "pos": (131, 948), "pos2": None},
-        ]
-        _ZONES_F = [
-            {"name": "(위) 강철집게",   "pos": (183, 837), "pos2": None},
-            {"name": "(아래) 강철집게", "pos": (167, 851), "pos2": None},
-        ]
-        _ZONES_Z = [
-            {"name": "(입구) 용암굴", "pos": (178, 883), "pos2": None},
-            {"name": "(위) 용암굴",   "pos": (178, 869), "pos2": None},
-            {"name": "(LT) 용암굴",   "pos": (164, 870), "pos2": None},
-            {"name": "(아래) 용암굴", "pos": (160, 881), "pos2": None},
-        ]
-        _ZONES_X = [
-            {"name": "(LT) 정령계", "pos": (163, 925), "pos2": None},
-            {"name": "(RT) 정령계", "pos": (183, 921), "pos2": None},
-        ]
-
         cfg        = load_config()
         is_nh      = cfg.get("normal_hunt_enabled", False)
-        portal_key = cfg.get("normal_hunt_portal_key" if is_nh else "boss_raid_portal_key", "Q 포탈 | 라하린 숲")
+        portal_key = cfg.get("normal_hunt_portal_key" if is_nh else "boss_raid_portal_key", DEFAULT_PORTAL)
 
         # ── 포탈별 구역/zone_idx_key 선택 ──
-        _ZONE_MAP = {
-            "W 포탈 | 아스탈 요새":   (_ZONES_W, "nh_w_zone_idx"),
-            "E 포탈 | 어둠얼음성채":  (_ZONES_E, "nh_e_zone_idx"),
-            "R 포탈 | 버려진 고성":   (_ZONES_R, "nh_r_zone_idx"),
-            "A 포탈 | 바위협곡":      (_ZONES_A, "nh_a_zone_idx"),
-            "S 포탈 | 바람의 협곡":   (_ZONES_S, "nh_s_zone_idx"),
-            "D 포탈 | 시계태엽 공장": (_ZONES_D, "nh_d_zone_idx"),
-            "F 포탈 | 속삭임의 숲":   (_ZONES_F, "nh_f_zone_idx"),
-            "Z 포탈 | 이그니스영역":  (_ZONES_Z, "nh_z_zone_idx"),
-            "X 포탈 | 정령계":        (_ZONES_X, "nh_x_zone_idx"),
-        }
-        _ZONES, _zone_idx_key = _ZONE_MAP.get(portal_key, (_ZONES_Q, "nh_zone_idx"))
+        _info = portal_info(portal_key)
+        _ZONES, _zone_idx_key = _info.fields, _info.zone_idx_key
 
         # ── boss_cfg에서 보스 설정 추출 ──
         use_boss       = boss_cfg["use_boss"]
@@ -1920,39 +1858,8 @@ class WatchWorker(QObject):
         pos2 = zone["pos2"]
 
         # ── 포탈 진입 직후 사망 감지 시작 ──
-        _death_event = threading.Event()
         _stop_event  = threading.Event()
-
-        def _death_check_loop():
-            _PIX_X, _PIX_Y = 13, 49
-            self.log("[사망감지] 픽셀 감시 시작 (40번 X:13 Y:49)", "info")
-            while self._running and not _stop_event.is_set():
-                rgb = _get_pixel_at_client(_PIX_X, _PIX_Y)
-                if rgb is None:
-                    time.sleep(1.0)
-                    continue
-                pr, pg, pb = rgb
-                _is_black   = (pr == 0 and pg == 0 and pb == 0)
-                _brightness = max(pr, pg, pb) / 255.0
-                _bar        = "█" * int(_brightness * 10) + "░" * (10 - int(_brightness * 10))
-                # 살아있음 → 상태바에만 표시 (로그 패널 덮어쓰기 방지)
-                self.status(f"사망감지 ({pr},{pg},{pb}) [{_bar}]",
-                            RED if _is_black else GREEN)
-                if _is_black:
-                    self.log(
-                        f"[사망감지] 40번 픽셀 ({pr:3d},{pg:3d},{pb:3d}) [{_bar}] → 사망!",
-                        "warn"
-                    )
-                    self.log("[사망감지] 영웅 사망 확정 → suicide 루프 재시작", "warn")
-                    self.status("영웅 사망 감지!", RED)
-                    _death_event.set()
-                    return
-                time.sleep(1.0)
-
-        _death_thread = None
-        if _respawn_enabled:
-            _death_thread = threading.Thread(target=_death_check_loop, daemon=True)
-            _death_thread.start()
+        _death_event = self._subscribe_death(_stop_event, _respawn_enabled)
 
         # ── 보스 타이머는 구역 도착 후 루프 내에서 시작 ──
         _boss_event = threading.Event()
@@ -1961,19 +1868,16 @@ class WatchWorker(QObject):
         self.log(f"[구역이동] {name} → ({x}, {y}) 이동 시작", "info")
         self.status(f"구역 이동 중: {name}", YELLOW)
 
-        # ── 마우스 이동 후 1초간 0.25초마다 우클릭 (최대 4회) ──
-        move_cursor_to(x, y)
-        time.sleep(0.05)
-        _rc_deadline = time.time() + 1.0
-        while time.time() < _rc_deadline and self._running and not _death_event.is_set():
+        # ── 1초간 0.25초마다 우클릭 (최대 4회, 커서 이동은 우클릭 입력에 포함) ──
+        _rc_deadline = self._clock.now() + 1.0
+        while self._clock.now() < _rc_deadline and self._running and not _death_event.is_set():
             right_click_image_center(x, y)
-            time.sleep(0.25)
+            _death_event.wait(0.25)
 
         # ── 29.이동.png 서치 (타임아웃 1초) — 이동 시작 확인 ──
         ok29, _ = self._wait_for_image(IMG.MOVE, timeout=1.0, click=False)
         if not ok29 or _death_event.is_set():
             _stop_event.set()
-            if _death_thread: _death_thread.join(timeout=2.0)
             if _death_event.is_set():
                 return False
             self.log("[구역이동] 29번 이동 미감지 → 매크로 오류, 재시도", "warn")
@@ -1982,22 +1886,20 @@ class WatchWorker(QObject):
         self.log("[구역이동] 이동 확인 → 도착 대기 중...", "info")
 
         # ── 30.이동(X).png 서치 (타임아웃 60초, 사망 감지 시 즉시 중단) ──
-        _move_deadline = time.time() + 60.0
+        _move_deadline = self._clock.now() + 60.0
         ok30 = False
-        while time.time() < _move_deadline and self._running and not _death_event.is_set():
+        while self._clock.now() < _move_deadline and self._running and not _death_event.is_set():
             matched, _, _, _ = _image_match(IMG.MOVE_X)
             if matched:
                 ok30 = True
                 break
-            time.sleep(0.25)
+            _death_event.wait(0.25)
 
         if _death_event.is_set():
             _stop_event.set()
-            if _death_thread: _death_thread.join(timeout=2.0)
             return False
         if not ok30:
             _stop_event.set()
-            if _death_thread: _death_thread.join(timeout=2.0)
             self.log("[구역이동] 60초 이동 타임아웃 → 매크로 오류, 재시도", "warn")
             return False
 
@@ -2005,17 +1907,14 @@ class WatchWorker(QObject):
         if pos2 and not _death_event.is_set():
             x2, y2 = pos2
             self.log(f"[구역이동] {name} 2차 이동 → ({x2}, {y2})", "info")
-            move_cursor_to(x2, y2)
-            time.sleep(0.05)
-            _rc_deadline2 = time.time() + 1.0
-            while time.time() < _rc_deadline2 and self._running and not _death_event.is_set():
+            _rc_deadline2 = self._clock.now() + 1.0
+            while self._clock.now() < _rc_deadline2 and self._running and not _death_event.is_set():
                 right_click_image_center(x2, y2)
-                time.sleep(0.25)
+                _death_event.wait(0.25)
 
             ok29b, _ = self._wait_for_image(IMG.MOVE, timeout=1.0, click=False)
             if not ok29b or _death_event.is_set():
                 _stop_event.set()
-                if _death_thread: _death_thread.join(timeout=2.0)
                 if _death_event.is_set():
                     return False
                 self.log("[구역이동] 2차 이동 29번 미감지 → 매크로 오류, 재시도", "warn")
@@ -2023,22 +1922,20 @@ class WatchWorker(QObject):
 
             self.log("[구역이동] 2차 이동 확인 → 도착 대기 중...", "info")
 
-            _move_deadline2 = time.time() + 60.0
+            _move_deadline2 = self._clock.now() + 60.0
             ok30b = False
-            while time.time() < _move_deadline2 and self._running and not _death_event.is_set():
+            while self._clock.now() < _move_deadline2 and self._running and not _death_event.is_set():
                 matched, _, _, _ = _image_match(IMG.MOVE_X)
                 if matched:
                     ok30b = True
                     break
-                time.sleep(0.25)
+                _death_event.wait(0.25)
 
             if _death_event.is_set():
                 _stop_event.set()
-                if _death_thread: _death_thread.join(timeout=2.0)
                 return False
             if not ok30b:
                 _stop_event.set()
-                if _death_thread: _death_thread.join(timeout=2.0)
                 self.log("[구역이동] 2차 이동 60초 타임아웃 → 매크로 오류, 재시도", "warn")
                 return False
 
@@ -2060,31 +1957,19 @@ class WatchWorker(QObject):
                     self.status(f"필드 복귀 중: {zone['name']}", YELLOW)
                     if not self._move_to_zone(zone, _death_event, _stop_event):
                         _stop_event.set()
-                        if _death_thread: _death_thread.join(timeout=2.0)
                         return False
                 _first_iter = False
 
                 # 보스 타이머 시작 (구역 도착 후)
-                _boss_event = threading.Event()
-                def _boss_timer_fn(_be=_boss_event):
-                    self.log(f"[보스 타이머] {boss_timer_sec:.3f}초 후 보스 이동 예정", "info")
-                    deadline = time.time() + boss_timer_sec
-                    while time.time() < deadline:
-                        if not self._running or _death_event.is_set() or _stop_event.is_set():
-                            return
-                        time.sleep(0.25)
-                    if self._running and not _death_event.is_set() and not _stop_event.is_set():
-                        self.log("[보스 타이머] 타이머 만료 → 자동사냥 해제 후 보스 이동", "warn")
-                        _be.set()
-                _bt = threading.Thread(target=_boss_timer_fn, daemon=True)
-                _bt.start()
+                _boss_event = _death_event.child()   # 타이머 만료 또는 사망·중지 시 취소
+                _bt = self._start_boss_timer(boss_timer_sec, _boss_event, _death_event, _stop_event)
 
                 result = self._post_portal_instant_hunt(
                     death_event=_death_event, stop_event=_stop_event,
-                    death_thread=_death_thread, respawn_enabled=_respawn_enabled,
+                    respawn_enabled=_respawn_enabled,
                     boss_event=_boss_event,
                 )
-                if _bt: _bt.join(timeout=2.0)
+                _bt.cancel()
 
                 # 타이머 미만료 (세이브 인터벌·중지·사망) → 루프 탈출
                 if not _boss_event.is_set() or _death_event.is_set() or not self._running:
@@ -2093,7 +1978,6 @@ class WatchWorker(QObject):
                 # 보스 타이머 만료 → 자동사냥 OFF → (출구 경유) → 보스 이동 + 전투
                 if not self._turn_off_auto_hunt(_stop_event):
                     _stop_event.set()
-                    if _death_thread: _death_thread.join(timeout=2.0)
                     return False
                 _exit_pos = zone.get("exit_pos")
                 if _exit_pos and not _death_event.is_set():
@@ -2101,46 +1985,49 @@ class WatchWorker(QObject):
                     self.log(f"[구역이동] {zone['name']} 출구 경유 → {_exit_pos}", "info")
                     if not self._move_to_zone(_exit_zone, _death_event, _stop_event):
                         _stop_event.set()
-                        if _death_thread: _death_thread.join(timeout=2.0)
                         return False
 
-                boss_ok = self._run_boss_sequence(boss_cfg, _death_event, _stop_event, _death_thread, _respawn_enabled)
+                boss_ok = self._run_boss_sequence(boss_cfg, _death_event, _stop_event, _respawn_enabled)
                 if not boss_ok:
-                    # _fight_boss_and_extras 내 실패 경로에서 이미 death_thread 정리됨
+                    # _fight_boss_and_extras 내 실패 경로에서 이미 구독 정리됨
                     return False  # 사망
 
                 # boss_no_return=False: 기존 동작 → suicide 재시작
                 if not _boss_no_return:
                     _stop_event.set()
-                    if _death_thread: _death_thread.join(timeout=2.0)
                     return True
 
                 # boss_no_return=True: 보스 출구 경유 후 필드 복귀 루프
                 _boss_exit = boss_cfg.get("boss_exit")
-                if _boss_exit and not _death_event.is_set():
+                _route     = boss_cfg.get("route")
+                _planned   = _route is not None and bool(_route.legs)   # 그래프로 경로를 못 찾으면 기존 출구 좌표
+                if _planned and _route.back is not None and not _death_event.is_set():
+                    # 경로 계획의 마지막 보스 → 필드 구간 (중첩 서브맵 출구 순서대로)
+                    self.status("보스 출구 이동 중...", YELLOW)
+                    if not self._move_leg(_route.back, _death_event, _stop_event):
+                        _stop_event.set()
+                        return False
+                elif not _planned and _boss_exit and not _death_event.is_set():
                     _be_zone = {"name": "보스 출구", "pos": _boss_exit["pos"], "pos2": _boss_exit.get("pos2")}
                     self.log("[보스복귀] 보스 서브맵 출구 경유", "info")
                     self.status("보스 출구 이동 중...", YELLOW)
                     if not self._move_to_zone(_be_zone, _death_event, _stop_event):
                         _stop_event.set()
-                        if _death_thread: _death_thread.join(timeout=2.0)
                         return False
                 # 루프 상단에서 _move_to_zone(zone)으로 필드 복귀
 
             _stop_event.set()
-            if _death_thread: _death_thread.join(timeout=2.0)
             return False if _death_event.is_set() else result
 
         # 보스 구역 도착 → 현재 위치에서 바로 보스 전투 (이미 이동 완료)
         if use_boss:
-            result = self._fight_boss_and_extras(boss_cfg, _death_event, _stop_event, _death_thread, _respawn_enabled)
+            result = self._fight_boss_and_extras(boss_cfg, _death_event, _stop_event, _respawn_enabled)
             _stop_event.set()
-            if _death_thread: _death_thread.join(timeout=2.0)
             return result
 
         return self._post_portal_instant_hunt(
             death_event=_death_event, stop_event=_stop_event,
-            death_thread=_death_thread, respawn_enabled=_respawn_enabled
+            respawn_enabled=_respawn_enabled
         )
 
     def _post_portal_custom_hunt(self, boss_cfg: "dict | None" = None) -> bool:
@@ -2158,58 +2045,22 @@ class WatchWorker(QObject):
             self.log("[커스텀이동] 유효한 좌표 없음 → 즉시 자동사냥으로 대체", "warn")
             return self._post_portal_instant_hunt()
 
-        _death_event = threading.Event()
         _stop_event  = threading.Event()
         _respawn_enabled = cfg.get(
             "normal_hunt_respawn" if is_nh else "boss_raid_respawn", True
         )
-
-        def _death_check_loop():
-            _PIX_X, _PIX_Y = 13, 49
-            self.log("[사망감지] 픽셀 감시 시작 (40번 X:13 Y:49)", "info")
-            while self._running and not _stop_event.is_set():
-                rgb = _get_pixel_at_client(_PIX_X, _PIX_Y)
-                if rgb is None:
-                    time.sleep(1.0)
-                    continue
-                pr, pg, pb = rgb
-                _is_black   = (pr == 0 and pg == 0 and pb == 0)
-                _brightness = max(pr, pg, pb) / 255.0
-                _bar        = "█" * int(_brightness * 10) + "░" * (10 - int(_brightness * 10))
-                # 살아있음 → 상태바에만 표시 (로그 패널 덮어쓰기 방지)
-                self.status(f"사망감지 ({pr},{pg},{pb}) [{_bar}]",
-                            RED if _is_black else GREEN)
-                if _is_black:
-                    self.log(
-                        f"[사망감지] 40번 픽셀 ({pr:3d},{pg:3d},{pb:3d}) [{_bar}] → 사망!",
-                        "warn"
-                    )
-                    self.log("[사망감지] 영웅 사망 확정 → suicide 루프 재시작", "warn")
-                    self.status("영웅 사망 감지!", RED)
-                    _death_event.set()
-                    return
-                time.sleep(1.0)
-
-        if _respawn_enabled:
-            _death_thread = threading.Thread(target=_death_check_loop, daemon=True)
-            _death_thread.start()
-        else:
-            _death_thread = None
+        _death_event = self._subscribe_death(_stop_event, _respawn_enabled)
 
         # 경유지 순서대로 이동
         for idx, (x, y) in enumerate(waypoints, 1):
             if not self._running or _death_event.is_set():
                 _stop_event.set()
-                if _death_thread:
-                    _death_thread.join(timeout=2.0)
                 return False
             self.log(f"[커스텀이동] 경유지 {idx}/{len(waypoints)} → ({x}, {y})", "info")
             self.status(f"커스텀 경유지 {idx} 이동 중", YELLOW)
             zone = {"name": f"커스텀 경유지 {idx}", "pos": (x, y), "pos2": None}
             if not self._move_to_zone(zone, _death_event, _stop_event):
                 _stop_event.set()
-                if _death_thread:
-                    _death_thread.join(timeout=2.0)
                 return False
 
         self.log("[커스텀이동] 마지막 경유지 도착", "success")
@@ -2222,48 +2073,33 @@ class WatchWorker(QObject):
             if not boss_timer_on:
                 # 타이머 없음 → 즉시 보스 이동 + 전투
                 self.log("[커스텀이동] 보스 이동 시작", "info")
-                result = self._run_boss_sequence(boss_cfg, _death_event, _stop_event, _death_thread, _respawn_enabled)
+                result = self._run_boss_sequence(boss_cfg, _death_event, _stop_event, _respawn_enabled)
                 _stop_event.set()
-                if _death_thread: _death_thread.join(timeout=2.0)
                 return result
             else:
                 # 타이머 있음 → 자동사냥 후 타이머 만료 시 보스
-                _boss_event = threading.Event()
-                def _boss_timer():
-                    self.log(f"[보스 타이머] {boss_timer_sec:.3f}초 후 보스 이동 예정", "info")
-                    _dl = time.time() + boss_timer_sec
-                    while time.time() < _dl:
-                        if not self._running or _death_event.is_set() or _stop_event.is_set(): return
-                        time.sleep(0.25)
-                    if self._running and not _death_event.is_set() and not _stop_event.is_set():
-                        self.log("[보스 타이머] 타이머 만료 → 자동사냥 해제 후 보스 이동", "warn")
-                        _boss_event.set()
-                _bt = threading.Thread(target=_boss_timer, daemon=True)
-                _bt.start()
+                _boss_event = _death_event.child()   # 타이머 만료 또는 사망·중지 시 취소
+                _bt = self._start_boss_timer(boss_timer_sec, _boss_event, _death_event, _stop_event)
                 result = self._post_portal_instant_hunt(
                     death_event=_death_event, stop_event=_stop_event,
-                    death_thread=_death_thread, respawn_enabled=_respawn_enabled,
+                    respawn_enabled=_respawn_enabled,
                     boss_event=_boss_event,
                 )
-                if _bt: _bt.join(timeout=2.0)
+                _bt.cancel()
                 if _boss_event.is_set() and not _death_event.is_set() and self._running:
                     if not self._turn_off_auto_hunt(_stop_event):
                         _stop_event.set()
-                        if _death_thread: _death_thread.join(timeout=2.0)
                         return False
-                    result = self._run_boss_sequence(boss_cfg, _death_event, _stop_event, _death_thread, _respawn_enabled)
+                    result = self._run_boss_sequence(boss_cfg, _death_event, _stop_event, _respawn_enabled)
                     _stop_event.set()
-                    if _death_thread: _death_thread.join(timeout=2.0)
                     return result
                 _stop_event.set()
-                if _death_thread: _death_thread.join(timeout=2.0)
                 return result
 
         self.log("[커스텀이동] 자동사냥 시작", "success")
         return self._post_portal_instant_hunt(
             death_event=_death_event,
             stop_event=_stop_event,
-            death_thread=_death_thread,
             respawn_enabled=_respawn_enabled,
         )
 
@@ -2271,93 +2107,47 @@ class WatchWorker(QObject):
         self,
         death_event: "threading.Event | None" = None,
         stop_event:  "threading.Event | None" = None,
-        death_thread: "threading.Thread | None" = None,
         respawn_enabled: "bool | None" = None,
-        boss_event: "threading.Event | None" = None,
+        boss_event: "CancelToken | None" = None,
         boss_cfg: "dict | None" = None,
     ) -> bool:
         """포탈 진입 후 즉시 해당 맵 자동사냥 진행 (액션 0).
-        death_event/stop_event 가 전달되면 기존 스레드를 재사용 (액션 1에서 호출 시).
+        death_event/stop_event 가 전달되면 기존 사망감지 구독을 재사용 (액션 1에서 호출 시).
+        boss_event 는 death_event.child() 로 만든 토큰이어야 한다 (사망·중지 시 함께 깨어남).
         boss_cfg가 있으면 보스 로직도 처리 (standalone 호출 시만).
         반환: True=정상완료, False=사망 감지(suicide 재시작 필요)"""
         self.log("[자동사냥] 포탈 진입 후 즉시 자동사냥 시작", "info")
 
         # ── 외부에서 이벤트가 전달된 경우 재사용, 아니면 새로 생성 ──
         _owns_thread = death_event is None
-        _bt = None  # 내부 보스 타이머 스레드
+        _bt: "Handle | None" = None  # 내부 보스 타이머
         if _owns_thread:
-            _death_event = threading.Event()
             _stop_event  = threading.Event()
             _cfg = load_config()
             _respawn_enabled = _cfg.get(
                 "normal_hunt_respawn" if _cfg.get("normal_hunt_enabled") else "boss_raid_respawn",
                 True
             )
-
-            def _death_check_loop():
-                """병렬 사망 감지: 40번 픽셀 서치 (X:13, Y:49) — RGB=(0,0,0) → 사망"""
-                _PIX_X, _PIX_Y = 13, 49
-                self.log("[사망감지] 픽셀 감시 시작 (40번 X:13 Y:49)", "info")
-                while self._running and not _stop_event.is_set():
-                    rgb = _get_pixel_at_client(_PIX_X, _PIX_Y)
-                    if rgb is None:
-                        time.sleep(1.0)
-                        continue
-                    pr, pg, pb = rgb
-                    _is_black   = (pr == 0 and pg == 0 and pb == 0)
-                    _brightness = max(pr, pg, pb) / 255.0
-                    _bar        = "█" * int(_brightness * 10) + "░" * (10 - int(_brightness * 10))
-                    # 살아있음 → 상태바에만 표시 (로그 패널 덮어쓰기 방지)
-                    self.status(f"사망감지 ({pr},{pg},{pb}) [{_bar}]",
-                                RED if _is_black else GREEN)
-                    if _is_black:
-                        self.log(
-                            f"[사망감지] 40번 픽셀 ({pr:3d},{pg:3d},{pb:3d}) [{_bar}] → 사망!",
-                            "warn"
-                        )
-                        self.log("[사망감지] 영웅 사망 확정 → suicide 루프 재시작", "warn")
-                        self.status("영웅 사망 감지!", RED)
-                        _death_event.set()
-                        return
-                    time.sleep(1.0)
-
-            # 사냥터 복귀 체크박스가 ON일 때만 사망 감지 스레드 시작
-            if _respawn_enabled:
-                _death_thread = threading.Thread(target=_death_check_loop, daemon=True)
-                _death_thread.start()
-            else:
-                _death_thread = None
+            # 사냥터 복귀 체크박스가 ON일 때만 사망 감지 구독
+            _death_event = self._subscribe_death(_stop_event, _respawn_enabled)
 
             # ── standalone 호출 시 boss_cfg 처리 ──
             if boss_cfg and boss_cfg["use_boss"]:
                 if not boss_cfg["boss_timer_on"]:
                     # 타이머 없음 → 즉시 보스 이동 + 전투 (자동사냥 스킵)
                     self.log("[자동사냥] 보스 설정 감지 → 보스 이동 시작", "info")
-                    result = self._run_boss_sequence(boss_cfg, _death_event, _stop_event, _death_thread, _respawn_enabled)
+                    result = self._run_boss_sequence(boss_cfg, _death_event, _stop_event, _respawn_enabled)
                     _stop_event.set()
-                    if _death_thread: _death_thread.join(timeout=2.0)
                     return result
                 else:
                     # 타이머 있음 → 자동사냥 후 타이머 만료 시 보스
-                    _boss_timer_sec = boss_cfg["boss_timer_sec"]
-                    _be = threading.Event()
-                    def _boss_timer_fn(_be=_be):
-                        self.log(f"[보스 타이머] {_boss_timer_sec:.3f}초 후 보스 이동 예정", "info")
-                        _dl = time.time() + _boss_timer_sec
-                        while time.time() < _dl:
-                            if not self._running or _death_event.is_set() or _stop_event.is_set(): return
-                            time.sleep(0.25)
-                        if self._running and not _death_event.is_set() and not _stop_event.is_set():
-                            self.log("[보스 타이머] 타이머 만료 → 자동사냥 해제 후 보스 이동", "warn")
-                            _be.set()
-                    _bt = threading.Thread(target=_boss_timer_fn, daemon=True)
-                    _bt.start()
+                    _be = _death_event.child()   # 타이머 만료 또는 사망·중지 시 취소
+                    _bt = self._start_boss_timer(boss_cfg["boss_timer_sec"], _be, _death_event, _stop_event)
             else:
                 _be = boss_event  # None (no boss) or inherited boss_event
         else:
             _death_event     = death_event
             _stop_event      = stop_event
-            _death_thread    = death_thread
             _respawn_enabled = respawn_enabled
             _be = boss_event  # 보스 타이머 이벤트 (없으면 None)
 
@@ -2390,31 +2180,27 @@ class WatchWorker(QObject):
             self.log("[자동사냥] 자동사냥ON 검증 실패 → 13번부터 재시도", "warn")
 
         # ── Phase 2: 자동사냥 중 감시 (사망 또는 보스 타이머 만료까지 대기) ──
+        # 보스 이벤트는 사망 토큰의 하위 토큰 → 사망·중지·타이머 만료 어느 쪽이든 폴링 없이 즉시 깨어남
         if self._running and not _boss_or_death():
             self.log("[자동사냥] 사냥 중 감시 시작", "info")
-            while self._running and not _boss_or_death():
-                time.sleep(0.25)
+            (_be if _be is not None else _death_event).wait()
+        if _bt: _bt.cancel()
 
         # 보스 타이머 만료로 루프 탈출
         if _be is not None and _be.is_set() and not _death_event.is_set():
             if _owns_thread and boss_cfg and boss_cfg["use_boss"]:
                 # standalone 호출 → 자동사냥 OFF 후 보스 이동
-                if _bt: _bt.join(timeout=2.0)
                 if not self._turn_off_auto_hunt(_stop_event):
                     _stop_event.set()
-                    if _death_thread: _death_thread.join(timeout=2.0)
                     return False
-                result = self._run_boss_sequence(boss_cfg, _death_event, _stop_event, _death_thread, _respawn_enabled)
+                result = self._run_boss_sequence(boss_cfg, _death_event, _stop_event, _respawn_enabled)
                 _stop_event.set()
-                if _death_thread: _death_thread.join(timeout=2.0)
                 return result
             return True  # caller에서 보스 이동 처리 (zone_hunt 등)
 
         # 사망 감지 스레드 종료 (owns_thread일 때만)
         if _owns_thread:
             _stop_event.set()
-            if _death_thread:
-                _death_thread.join(timeout=2.0)
 
         if _death_event.is_set():
             return False  # 사망 → suicide 루프 재시작
@@ -2452,37 +2238,25 @@ class WatchWorker(QObject):
         return ok
 
     # ── 플레이어 수 읽기 (OpenCirnix 포팅) ──────────
-    _OSTCP_PATTERN = bytes([0x4C, 0x7F, 0x65, 0x07, 0x4C])
 
     def _read_player_count(self) -> "int | None":
-        """storm.dll+0x58160 → 포인터 체인 → +0x340 = 현재 방 인원 수"""
+        """storm.dll+0x58160 → 포인터 체인 → +0x340 = 현재 방 인원 수 (공유 메모리 세션 사용).
+        메모리 상태 퍼블리셔의 최근 값이 있으면 그대로 사용."""
+        st = self._memstate.fresh(0.5) if self._memstate is not None else None
+        if st is not None and st.player_count is not None:
+            return st.player_count
+        pm = None
         try:
-            pm = pymem.Pymem("War3.exe")
-            storm_base = None
-            for mod in pymem.process.enum_process_module(pm.process_handle):
-                if os.path.basename(mod.name).lower() == "storm.dll":
-                    storm_base = int(mod.lpBaseOfDll)
-                    break
-            if storm_base is None:
-                pm.close_process(); return None
-            ptr = pm.read_uint(storm_base + 0x58160)
-            if ptr == 0:
-                pm.close_process(); return None
-            pat_len = len(self._OSTCP_PATTERN)
-            for _ in range(2000):
-                try:
-                    data = pm.read_bytes(ptr, 4 + pat_len)
-                except Exception:
-                    pm.close_process(); return None
-                if data[4:4 + pat_len] == self._OSTCP_PATTERN:
-                    count = pm.read_int(ptr + 0x340)
-                    pm.close_process(); return count
-                next_ptr = int.from_bytes(data[:4], "little")
-                if next_ptr == 0: break
-                ptr = next_ptr
-            pm.close_process(); return None
+            pm = acquire_session()
+            node = pm.resolve_chain(*CHAINS["players"])   # 방 나감 등으로 노드가 바뀌면 재탐색
+            if node is None:
+                return None
+            return pm.read_int(node + 0x340)
         except Exception:
+            drop_session(pm)
             return None
+        finally:
+            release_session(pm)
 
     def _run_auto_start(self, required_count: int):
         """인원수 충족 시 10초 카운트다운 → Alt+S (게임 강제 시작).
@@ -2493,11 +2267,11 @@ class WatchWorker(QObject):
         self.log(f"자동 시작 대기 중... (목표 인원: {required_count}명{timeout_msg})", "info")
         self.status(f"자동 시작 대기 ({required_count}명)...", YELLOW)
 
-        deadline = (time.time() + wait_timeout) if wait_timeout > 0 else None
+        deadline = (self._clock.now() + wait_timeout) if wait_timeout > 0 else None
         timed_out = False
         first = True
         while self._running:
-            if deadline and time.time() >= deadline:
+            if deadline and self._clock.now() >= deadline:
                 cur = self._read_player_count() or 0
                 self.log(f"[타임아웃] {wait_timeout}초 경과 → 인원 무시하고 시작 ({cur}/{required_count}명)", "warn")
                 self.status("타임아웃 → 강제 시작", YELLOW)
@@ -2505,13 +2279,13 @@ class WatchWorker(QObject):
                 break
             count = self._read_player_count()
             if count is not None:
-                remaining_s = f"  ({max(0, deadline - time.time()):.0f}s 남음)" if deadline else ""
+                remaining_s = f"  ({max(0, deadline - self._clock.now()):.0f}s 남음)" if deadline else ""
                 msg = f"[{now()}] 현재 인원: {count}/{required_count}명{remaining_s}"
                 if first:
                     self.log_signal.emit(msg, "info"); first = False
                 if count >= required_count:
                     break
-            time.sleep(0.5)
+            self._sleep(0.5)
 
         if not self._running: return
 
@@ -2521,7 +2295,7 @@ class WatchWorker(QObject):
             ok12, _, coords12, _ = _image_match(IMG.LOADING_TIMEOUT)
             if ok12 and coords12:
                 click_image_center(coords12[0], coords12[1])
-                time.sleep(0.5)
+                self._sleep(0.5)
                 click_image_center(coords12[0], coords12[1])
                 self.log("12번 더블클릭 완료 → 강제 시작", "success")
                 self.status("강제 시작!", GREEN)
@@ -2535,9 +2309,10 @@ class WatchWorker(QObject):
 
         # ── 카운트다운 채팅 (WriteProcessMemory, WC3 색상코드 포함) ──
         # |cFFFF0000 = 리얼레드(n초), |cFFFFD700 = 골드(나머지), |r = 리셋
-        _chat_hwnd = find_war3_hwnd()
+        # 채팅 디스패처 스레드가 전송 → 카운트다운 1초 간격이 전송 시간에 밀리지 않음
+        chat = chat_dispatcher()
         _initial_msg = "|cFFFF000010초|r|cFFFFD700 후 게임이 시작됩니다|r"
-        ok, _msg = send_chat_memory(_chat_hwnd, _initial_msg) if _chat_hwnd else (False, "hwnd 없음")
+        ok, _msg = chat.send(_initial_msg)
         if not ok:
             self.log(f"[채팅] {_msg}", "warn")
 
@@ -2551,10 +2326,7 @@ class WatchWorker(QObject):
             self.log(f"[!as] {sec}초 후 게임 시작...")
             self.status(f"!as 카운트다운: {sec}초", YELLOW)
             if sec < 10:  # 10초는 이미 위에서 전송
-                _chat_hwnd = find_war3_hwnd()
-                if _chat_hwnd:
-                    _cnt_msg = f"|cFFFF0000{sec}초|r|cFFFFD700 남았습니다|r"
-                    send_chat_memory(_chat_hwnd, _cnt_msg)
+                chat.submit(f"|cFFFF0000{sec}초|r|cFFFFD700 남았습니다|r")
             if not self._sleep(1.0): return
 
         if not self._running: return
@@ -2570,6 +2342,7 @@ class WatchWorker(QObject):
         else:
             self.log("[경고] War3 창을 찾지 못했습니다.", "warn")
 
+    @traced()
     def _host_loop(self):
         """방장 전용: 7번 클릭 → 방 만들기 진입 → 설정 → Ctrl+V+Tab+C."""
         self.log("=== 방장 매크로 시작 ===", "info")
@@ -2582,10 +2355,7 @@ class WatchWorker(QObject):
             ok7, coords7 = self._wait_for_image(IMG.ROOM_LIST, timeout=15, click=True)
             if not ok7:
                 self.log("[경고] 7번 감지 실패 → Tab+G 후 재시도", "warn")
-                _press_vk(_VK_TAB); time.sleep(0.02)
-                _press_vk(_VK_TAB, keyup=True); time.sleep(0.3)
-                _press_vk(_VK_G); time.sleep(0.02)
-                _press_vk(_VK_G, keyup=True); time.sleep(0.3)
+                self._send_seq(_SEQ_TAB_G); self._sleep(0.3)
                 continue
 
             # ── 9번 → 방만들기 → 8번 감지 (6번 오류시 9번부터 재시도) ──
@@ -2624,26 +2394,20 @@ class WatchWorker(QObject):
                 if hwnd:
                     _user32.SetForegroundWindow(hwnd)
                     if not self._sleep(0.1): return
-                _press_vk(_VK_CONTROL)
-                _press_vk(_VK_V); time.sleep(0.02)
-                _press_vk(_VK_V, keyup=True)
-                _press_vk(_VK_CONTROL, keyup=True)
-                time.sleep(0.3)
-                _press_vk(_VK_TAB); time.sleep(0.02)
-                _press_vk(_VK_TAB, keyup=True); time.sleep(0.3)
-                _press_vk(_VK_C); time.sleep(0.02)
-                _press_vk(_VK_C, keyup=True); time.sleep(0.3)
-                _press_vk(_VK_RETURN); time.sleep(0.02)
-                _press_vk(_VK_RETURN, keyup=True)
+                self._send_seq(_SEQ_CTRL_V)
+                self._sleep(0.3)
+                self._send_seq(_SEQ_TAB_C)
+                self._sleep(0.3)
+                self._send_seq(_SEQ_ENTER)
                 self.log("방 만들기 완료! (Ctrl+V + Tab + C + Enter)", "success")
                 self.status("방 진입 대기 중...", YELLOW)
 
                 # ── 8번/6번 동시 감지 루프 (10초 타임아웃 → 9번부터 재시도) ──
-                deadline8 = time.time() + 10
+                deadline8 = self._clock.now() + 10
                 first8 = True
-                while self._running and time.time() < deadline8:
+                while self._running and self._clock.now() < deadline8:
                     ok8_now, val8, _, _ = _image_match(IMG.ROOM_ENTER)
-                    remaining8 = max(0.0, deadline8 - time.time())
+                    remaining8 = max(0.0, deadline8 - self._clock.now())
                     if val8 >= 0:
                         bar8 = "█" * int(val8 * 10) + "░" * (10 - int(val8 * 10))
                         if ok8_now:
@@ -2714,10 +2478,7 @@ class WatchWorker(QObject):
             if result == "ejected":
                 # 5번 → Tab+G → 7번 클릭부터 (outer while 루프)
                 self.log("로딩 중 강퇴/이탈 → 방 다시 만들기", "warn")
-                _press_vk(_VK_TAB); time.sleep(0.02)
-                _press_vk(_VK_TAB, keyup=True); time.sleep(0.3)
-                _press_vk(_VK_G); time.sleep(0.02)
-                _press_vk(_VK_G, keyup=True); time.sleep(0.3)
+                self._send_seq(_SEQ_TAB_G); self._sleep(0.3)
                 continue  # outer while → 7번 클릭부터
             return  # "timeout": War3 재실행됨 → 워커 종료
 
@@ -0,0 +1,284 @@
+"""
+macro/worker_process.py — WatchWorker 를 자식 프로세스에서 실행 (시그널 = 파이프, 프레임 = 공유 메모리)
+"""
+import multiprocessing as mp
+import struct
+import threading
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+from PySide6.QtCore import Signal
+
+from src.core.events import FinishedEvent
+from src.macro.qt_worker import WorkerSignals
+
+_HB_INTERVAL = 1.0      # 하트비트 주기 (초)
+_STOP_GRACE  = 8.0      # stop 후 이 시간 안에 끝나지 않으면 강제 종료
+
+
+# ══════════════════════════════════════════════════
+#  공유 메모리 프레임 버퍼
+# ══════════════════════════════════════════════════
+class FrameBuffer:
+    """최신 캡처 프레임 1장을 부모와 공유하는 더블 버퍼 (자식 write / 부모 zero-copy read).
+
+    헤더: seq(Q) + 현재 슬롯(I) + 슬롯별 (h, w, c)(III×2). 쓰기는 비활성 슬롯에 한 뒤
+    헤더를 마지막에 갱신 → read() 뷰는 다음 다음 publish 전까지 유효 (오래 쓸 거면 copy=True).
+    """
+
+    _HDR  = struct.Struct("<QI")
+    _META = struct.Struct("<III")
+    _HDR_SIZE = 64
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self._shm   = shm
+        self._owner = owner
+        self._slot_bytes = (shm.size - self._HDR_SIZE) // 2
+        self._last_obj   = None
+        self._last_t     = 0.0
+        self.min_interval = 0.2   # publish 최소 간격 (초) — 프레임 복사 비용 제한
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @classmethod
+    def create(cls, max_w: int = 2560, max_h: int = 1440) -> "FrameBuffer":
+        size = cls._HDR_SIZE + 2 * max_w * max_h * 3
+        shm  = shared_memory.SharedMemory(create=True, size=size)
+        shm.buf[:cls._HDR_SIZE] = bytes(cls._HDR_SIZE)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "FrameBuffer":
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    def publish(self, frame: "np.ndarray"):
+        """프레임 게시 (자식). 같은 프레임 객체·min_interval 이내 호출은 무시."""
+        if frame is self._last_obj:
+            return
+        t = time.monotonic()
+        if t - self._last_t < self.min_interval:
+            return
+        if frame.nbytes > self._slot_bytes:
+            frame = frame[::2, ::2]
+            if frame.nbytes > self._slot_bytes:
+                return
+        buf = self._shm.buf
+        seq, cur = self._HDR.unpack_from(buf, 0)
+        slot = 1 - cur if seq else 0
+        h, w = frame.shape[:2]
+        c    = 1 if frame.ndim == 2 else frame.shape[2]
+        off  = self._HDR_SIZE + slot * self._slot_bytes
+        dst  = np.ndarray(frame.shape, dtype=np.uint8, buffer=buf, offset=off)
+        dst[...] = frame
+        del dst
+        self._META.pack_into(buf, self._HDR.size + slot * self._META.size, h, w, c)
+        self._HDR.pack_into(buf, 0, seq + 1, slot)
+        self._last_obj, self._last_t = frame, t
+
+    def read(self, copy: bool = False) -> "tuple[int, np.ndarray] | None":
+        """(seq, 프레임) — 기본은 공유 메모리 뷰 (복사 없음). 게시 전이면 None."""
+        buf = self._shm.buf
+        seq, slot = self._HDR.unpack_from(buf, 0)
+        if not seq:
+            return None
+        h, w, c = self._META.unpack_from(buf, self._HDR.size + slot * self._META.size)
+        shape = (h, w) if c == 1 else (h, w, c)
+        view  = np.ndarray(shape, dtype=np.uint8, buffer=buf,
+                           offset=self._HDR_SIZE + slot * self._slot_bytes)
+        return seq, (view.copy() if copy else view)
+
+    def close(self):
+        try:
+            self._shm.close()
+        except BufferError:
+            return      # 아직 살아있는 뷰가 있음 → 프로세스 종료 시 해제
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+# ══════════════════════════════════════════════════
+#  자식 프로세스
+# ══════════════════════════════════════════════════
+def _child_main(conn, frame_name: str, ingame: bool, inst_index: "int | None", inst_pid: "int | None"):
+    """자식 프로세스 진입점. WatchWorker 를 메인 스레드에서 실행하고 이벤트를 파이프로 전달."""
+    from src.macro.worker import WatchWorker
+    from src.core.image_match import set_frame_sink
+    from src.utils.process import War3Instance
+
+    send_lock = threading.Lock()
+
+    def _send(msg):
+        with send_lock:
+            try:
+                conn.send(msg)
+            except (OSError, EOFError, BrokenPipeError):
+                pass
+
+    instance = War3Instance(inst_index, inst_pid) if inst_index is not None else None
+    worker   = WatchWorker(ingame=ingame, instance=instance)
+    worker.events.subscribe_all(_send)   # 이벤트는 NamedTuple → 그대로 pickle
+
+    frames = FrameBuffer.attach(frame_name)
+    set_frame_sink(frames.publish)
+
+    def _commands():
+        while True:
+            try:
+                cmd = conn.recv()
+            except (EOFError, OSError):
+                worker.stop()       # 부모 종료 → 워커도 정리
+                return
+            if cmd == "stop":
+                worker.stop()
+
+    def _heartbeat():
+        while True:
+            _send(("hb", (time.time(), instance.pid if instance is not None else None)))
+            time.sleep(_HB_INTERVAL)
+
+    threading.Thread(target=_commands, name="worker-cmd", daemon=True).start()
+    threading.Thread(target=_heartbeat, name="worker-hb", daemon=True).start()
+    worker.start()
+    set_frame_sink(None)
+    frames.close()
+
+
+# ══════════════════════════════════════════════════
+#  부모 측 프록시
+# ══════════════════════════════════════════════════
+class WorkerProcess(WorkerSignals):
+    """자식 프로세스 WatchWorker 의 부모 측 프록시. QtWorker 와 같은 시그널을 낸다.
+
+    - start() 는 즉시 반환 (QThread 불필요). 시그널은 수신 스레드에서 emit → UI 슬롯은 큐 연결
+    - 자식이 finished 없이 끝나면 crashed(exitcode) → UI 가 restart() 로 재기동
+    - latest_frame(): 워커가 마지막으로 매칭한 프레임 (공유 메모리 뷰)
+    """
+
+    crashed = Signal(int)
+
+    def __init__(self, ingame: bool = False, instance=None):
+        super().__init__()
+        self._ingame   = ingame
+        self._instance = instance
+        self._ctx      = mp.get_context("spawn")
+        self._frames   = FrameBuffer.create()
+        self._proc: "mp.process.BaseProcess | None" = None
+        self._conn     = None
+        self._alive    = False
+        self._stopping = False
+        self._last_hb  = 0.0
+        self.started_at = 0.0
+        self.restarts  = 0
+
+    @property
+    def _running(self) -> bool:
+        return self._alive and not self._stopping
+
+    @property
+    def pid(self) -> "int | None":
+        return self._proc.pid if self._proc is not None else None
+
+    # ── 수명 ──────────────────────────────────────
+    def start(self):
+        if self._alive:
+            return
+        parent, child = self._ctx.Pipe()
+        inst = self._instance
+        self._proc = self._ctx.Process(
+            target=_child_main, name="pynox-worker", daemon=True,
+            args=(child, self._frames.name, self._ingame,
+                  inst.index if inst is not None else None,
+                  inst.pid if inst is not None else None),
+        )
+        self._stopping = False
+        self._proc.start()
+        child.close()
+        self._conn     = parent
+        self._alive    = True
+        self._last_hb  = time.monotonic()
+        self.started_at = time.time()
+        threading.Thread(target=self._read_loop, args=(parent, self._proc),
+                         name="worker-proxy", daemon=True).start()
+
+    def stop(self):
+        """중지 요청. _STOP_GRACE 초 안에 끝나지 않으면 강제 종료."""
+        if not self._alive or self._stopping:
+            return
+        self._stopping = True
+        try:
+            self._conn.send("stop")
+        except (OSError, EOFError, BrokenPipeError):
+            pass
+        proc = self._proc
+        t = threading.Timer(_STOP_GRACE, lambda: proc.is_alive() and proc.kill())
+        t.daemon = True
+        t.start()
+
+    def restart(self, ingame: "bool | None" = None):
+        """크래시/정지된 워커를 새 자식 프로세스로 재기동 (PyNOX 재시작 불필요)."""
+        if self._alive:
+            return
+        if ingame is not None:
+            self._ingame = ingame
+        self.restarts += 1
+        self.start()
+
+    def kill(self):
+        """응답 없는 자식 강제 종료 → crashed 로 이어진다."""
+        if self._proc is not None and self._proc.is_alive():
+            self._proc.kill()
+
+    def close(self, timeout: float = 2.0):
+        self.stop()
+        if self._proc is not None:
+            self._proc.join(timeout)
+            if self._proc.is_alive():
+                self._proc.kill()
+        self._frames.close()
+
+    def _read_loop(self, conn, proc):
+        clean = False
+        while True:
+            try:
+                msg = conn.recv()
+            except (EOFError, OSError):
+                break
+            if type(msg) is tuple and msg[0] == "hb":
+                self._last_hb = time.monotonic()
+                if self._instance is not None:
+                    self._instance.pid = msg[1][1]
+                continue
+            if isinstance(msg, FinishedEvent):
+                clean = True
+                continue
+            self._dispatch(msg)
+        proc.join(5.0)
+        try:
+            conn.close()
+        except OSError:
+            pass
+        self._alive = False
+        if clean or self._stopping:
+            self.finished.emit()
+        else:
+            self.crashed.emit(proc.exitcode if proc.exitcode is not None else -1)
+
+    # ── 상태 ──────────────────────────────────────
+    def health(self) -> dict:
+        return {
+            "pid":      self.pid,
+            "alive":    self._alive,
+            "hb_age":   time.monotonic() - self._last_hb if self._alive else None,
+            "uptime":   time.time() - self.started_at if self._alive else 0.0,
+            "restarts": self.restarts,
+            "exitcode": self._proc.exitcode if self._proc is not None and not self._alive else None,
+        }
+
+    def latest_frame(self, copy: bool = False) -> "tuple[int, np.ndarray] | None":
+        return self._frames.read(copy=copy)
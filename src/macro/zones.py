@@ -0,0 +1,163 @@
+"""
+macro/zones.py — 포탈·구역·보스 좌표 데이터 (미니맵 클라이언트 좌표, import 시 1회 로드)
+
+보스 구역:
+    key        설정 키 (활성 여부)
+    pos~pos3   필드 → 보스까지 순서대로 우클릭할 미니맵 좌표 (서브맵 입구 포함)
+    boss_exit  보스맵 → 필드맵 복귀 좌표 (별도 서브맵인 경우, 안쪽 출구부터). None = 같은 맵
+    shortcuts  다른 보스로 바로 가는 수동 경로 (출구를 거치지 않음)
+필드 구역:
+    pos, pos2  이동 좌표 / exit_pos 서브맵 구역의 출구
+"""
+from typing import NamedTuple
+
+DEFAULT_PORTAL = "Q 포탈 | 라하린 숲"
+
+
+# ══════════════════════════════════════════════════
+#  보스 구역
+# ══════════════════════════════════════════════════
+BOSS_ZONES_Q = [
+    {"key": "nh_zone_boss",       "name": "도적단장 - 칼레인",    "pos": (70,  884), "pos2": (237, 834), "pos3": None,       "boss_exit": {"pos": (237, 839), "pos2": None}},
+    {"key": "nh_q_boss_kingcrab", "name": "백년 묵은 킹크랩",     "pos": (76,  881), "pos2": (212, 869), "pos3": None,       "boss_exit": {"pos": (212, 874), "pos2": None}},
+    {"key": "nh_q_boss_giant",    "name": "늪의 거인",             "pos": (76,  881), "pos2": (211, 864), "pos3": (235, 863), "boss_exit": {"pos": (234, 872), "pos2": (212, 874)}},
+    {"key": "nh_q_boss_pap",      "name": "잊혀진 수호자 - 파프", "pos": (69,  873), "pos2": None,       "pos3": None,       "boss_exit": None},
+]
+
+BOSS_ZONES_E = [
+    {"key": "nh_e_boss_maureus",  "name": "마우레우스",        "pos": (28, 942), "pos2": (49, 986),  "pos3": None,       "boss_exit": {"pos": (49, 994),  "pos2": None}, "shortcuts": {"nh_e_boss_tarod":   {"pos": (49, 980), "pos2": (49, 972)}}},
+    {"key": "nh_e_boss_tarod",    "name": "타로드",            "pos": (28, 942), "pos2": (49, 980),  "pos3": (49, 972),  "boss_exit": {"pos": (49, 994),  "pos2": None}, "shortcuts": {"nh_e_boss_maureus": {"pos": (49, 979), "pos2": (49, 980)}}},
+    {"key": "nh_e_boss_colossus", "name": "바위거인 콜로서스", "pos": (49, 934), "pos2": (233, 883), "pos3": None,       "boss_exit": {"pos": (233, 887), "pos2": None}},
+    {"key": "nh_e_boss_tulak",    "name": "사도: 툴'락",       "pos": (53, 938), "pos2": (65, 934),  "pos3": None,       "boss_exit": {"pos": (52, 938),  "pos2": None}},
+]
+
+BOSS_ZONES_R = [
+    {"key": "nh_r_boss_hedan",    "name": "보급장교 헤단",   "pos": ( 94, 835), "pos2": (213, 883), "pos3": None, "boss_exit": {"pos": (212, 888), "pos2": None}},
+    {"key": "nh_r_boss_thanatos", "name": "사신 - 타나토스", "pos": (120, 857), "pos2": (279, 850), "pos3": None, "boss_exit": {"pos": (279, 857), "pos2": None}},
+]
+
+BOSS_ZONES_A = [
+    {"key": "nh_a_boss_bx485", "name": "BX-485",          "pos": (133, 878), "pos2": None, "pos3": None, "boss_exit": None},
+    {"key": "nh_a_boss_ivan",  "name": "엔지니어 - 이반", "pos": (133, 866), "pos2": None, "pos3": None, "boss_exit": None},
+]
+
+BOSS_ZONES_S = [
+    {"key": "nh_s_boss_callis", "name": "집행자 캘리스", "pos": (120, 909), "pos2": None,       "pos3": None, "boss_exit": None},
+    {"key": "nh_s_boss_kalipa", "name": "마룡: 칼리파",  "pos": (120, 917), "pos2": (256, 848), "pos3": None, "boss_exit": {"pos": (256, 856), "pos2": None}},
+]
+
+BOSS_ZONES_D = [
+    {"key": "nh_d_boss_klak",   "name": "클락",   "pos": (127, 941), "pos2": None,       "pos3": None, "boss_exit": None},
+    {"key": "nh_d_boss_mirdon", "name": "미르돈", "pos": (127, 954), "pos2": None,       "pos3": None, "boss_exit": None},
+    {"key": "nh_d_boss_rex",    "name": "렉스",   "pos": (142, 942), "pos2": (253, 864), "pos3": None, "boss_exit": {"pos": (263, 871), "pos2": None}},
+]
+
+BOSS_ZONES_F = [
+    {"key": "nh_f_boss_doombaou", "name": "둠바우", "pos": (186, 852), "pos2": None, "pos3": None, "boss_exit": None},
+]
+
+BOSS_ZONES_Z = [
+    {"key": "nh_z_boss_flame", "name": "플레임", "pos": (160, 867), "pos2": None, "pos3": None, "boss_exit": None},
+]
+
+BOSS_ZONE_W = {"key": "nh_w_zone_boss", "name": "매직웨건", "pos": (29, 912), "pos2": (234, 849), "boss_exit": {"pos": (234, 855), "pos2": None}}
+
+
+# ══════════════════════════════════════════════════
+#  필드 사냥 구역
+# ══════════════════════════════════════════════════
+FIELD_ZONES_Q = [
+    {"name": "오래된 숲의 정령 (아래)", "pos": (34,  887), "pos2": None},
+    {"name": "오래된 숲의 정령 (위)",   "pos": (36,  876), "pos2": None},
+    {"name": "동굴 왕 두꺼비",          "pos": (35,  867), "pos2": None},
+    {"name": "토끼 굴",                 "pos": (28,  865), "pos2": (211, 834), "exit_pos": (208, 828)},
+    {"name": "그을음 도적단 부단장",    "pos": (67,  887), "pos2": None},
+]
+
+FIELD_ZONES_W = [
+    {"name": "경비대장 로웰",           "pos": (62,  905), "pos2": None},
+    {"name": "무쇠발톱",                "pos": (58,  918), "pos2": None},
+    {"name": "TX-005",                  "pos": (48,  921), "pos2": None},
+    {"name": "드워프, 중갑차, 정예병",  "pos": (41,  914), "pos2": None},
+]
+
+FIELD_ZONES_E = [
+    {"name": "바레스",                 "pos": (38, 937), "pos2": None},
+    {"name": "오래된 고대유적 수호자", "pos": (46, 936), "pos2": None},
+    {"name": "거울 여왕의 파편",       "pos": (32, 944), "pos2": None},
+]
+
+FIELD_ZONES_R = [
+    {"name": "(LT)제국기사의 망령", "pos": ( 96, 841), "pos2": None},
+    {"name": "(RT)제국기사의 망령", "pos": (112, 834), "pos2": None},
+    {"name": "옛 수비대장 펠릭스",  "pos": (102, 846), "pos2": None},
+    {"name": "옛 집행관 라나",      "pos": (126, 832), "pos2": None},
+]
+
+FIELD_ZONES_A = [
+    {"name": "(7시) 고블린",              "pos": (128, 886), "pos2": None},
+    {"name": "(5시) 고블린",              "pos": (137, 886), "pos2": None},
+    {"name": "(10시) 고블린",             "pos": (126, 871), "pos2": None},
+    {"name": "(2시) 고블린",              "pos": (139, 870), "pos2": None},
+    {"name": "깊은 동굴 - 거대한 숲 거인", "pos": (144, 878), "pos2": (276, 885), "exit_pos": (286, 885)},
+]
+
+FIELD_ZONES_S = [
+    {"name": "(LT) 바람의 정령",      "pos": (101, 908), "pos2": None},
+    {"name": "(RT) 바람의 정령",      "pos": (111, 900), "pos2": None},
+    {"name": "중급 바람의 정령 윈디", "pos": ( 99, 912), "pos2": None},
+    {"name": "검은가죽 드루이드",     "pos": (115, 918), "pos2": None},
+    {"name": "동굴 깊은 곳",          "pos": (123, 909), "pos2": (277, 898), "exit_pos": (274, 894)},
+    {"name": "상급 바람의 정령 실프", "pos": (123, 909), "pos2": (280, 902), "exit_pos": (274, 894)},
+]
+
+FIELD_ZONES_D = [
+    {"name": "(LT) 마정석 골렘", "pos": (117, 951), "pos2": None},
+    {"name": "(RT) 마정석 골렘", "pos": (131, 948), "pos2": None},
+]
+
+FIELD_ZONES_F = [
+    {"name": "(위) 강철집게",   "pos": (183, 837), "pos2": None},
+    {"name": "(아래) 강철집게", "pos": (167, 851), "pos2": None},
+]
+
+FIELD_ZONES_Z = [
+    {"name": "(입구) 용암굴", "pos": (178, 883), "pos2": None},
+    {"name": "(위) 용암굴",   "pos": (178, 869), "pos2": None},
+    {"name": "(LT) 용암굴",   "pos": (164, 870), "pos2": None},
+    {"name": "(아래) 용암굴", "pos": (160, 881), "pos2": None},
+]
+
+FIELD_ZONES_X = [
+    {"name": "(LT) 정령계", "pos": (163, 925), "pos2": None},
+    {"name": "(RT) 정령계", "pos": (183, 921), "pos2": None},
+]
+
+
+# ══════════════════════════════════════════════════
+#  포탈 → 데이터
+# ══════════════════════════════════════════════════
+class PortalInfo(NamedTuple):
+    bosses:       list   # 보스 구역 (UI 순서, 첫 항목 = 활성 보스가 없을 때 기본 구역)
+    fields:       list   # 필드 사냥 구역
+    zone_idx_key: str    # 선택된 필드 구역 인덱스 설정 키
+    prefix:       str    # 보스 설정 키 접두사 (f"{prefix}_boss_timer", _boss_order …)
+
+
+PORTALS: "dict[str, PortalInfo]" = {
+    "Q 포탈 | 라하린 숲":     PortalInfo(BOSS_ZONES_Q,  FIELD_ZONES_Q, "nh_zone_idx",   "nh"),
+    "W 포탈 | 아스탈 요새":   PortalInfo([BOSS_ZONE_W], FIELD_ZONES_W, "nh_w_zone_idx", "nh_w"),
+    "E 포탈 | 어둠얼음성채":  PortalInfo(BOSS_ZONES_E,  FIELD_ZONES_E, "nh_e_zone_idx", "nh_e"),
+    "R 포탈 | 버려진 고성":   PortalInfo(BOSS_ZONES_R,  FIELD_ZONES_R, "nh_r_zone_idx", "nh_r"),
+    "A 포탈 | 바위협곡":      PortalInfo(BOSS_ZONES_A,  FIELD_ZONES_A, "nh_a_zone_idx", "nh_a"),
+    "S 포탈 | 바람의 협곡":   PortalInfo(BOSS_ZONES_S,  FIELD_ZONES_S, "nh_s_zone_idx", "nh_s"),
+    "D 포탈 | 시계태엽 공장": PortalInfo(BOSS_ZONES_D,  FIELD_ZONES_D, "nh_d_zone_idx", "nh_d"),
+    "F 포탈 | 속삭임의 숲":   PortalInfo(BOSS_ZONES_F,  FIELD_ZONES_F, "nh_f_zone_idx", "nh_f"),
+    "Z 포탈 | 이그니스영역":  PortalInfo(BOSS_ZONES_Z,  FIELD_ZONES_Z, "nh_z_zone_idx", "nh_z"),
+    "X 포탈 | 정령계":        PortalInfo([],            FIELD_ZONES_X, "nh_x_zone_idx", "nh_x"),
+}
+
+
+def portal_info(portal_key: str) -> PortalInfo:
+    """포탈 키 → 데이터. 알 수 없는 키는 Q 포탈 (기존 동작)."""
+    return PORTALS.get(portal_key) or PORTALS[DEFAULT_PORTAL]
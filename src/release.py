@@ -11,7 +11,7 @@ VERSION_PY  = os.path.join(_ROOT, "src", "version.py")
 OUTPUT_ZIP  = os.path.join(_ROOT, "release.zip")
 PACK_DIRS    = ["src"]
 PACK_FILES   = []
-IGNORE_DIRS  = {"__pycache__", "updater"}
+IGNORE_DIRS  = {"__pycache__", "updater", "sim"}   # sim: 개발용 시뮬레이터
 IGNORE_FILES = {"build.py", "release.py"}   # 개발자 전용, 배포 불필요
 IGNORE_EXTS  = {".pyc"}
 
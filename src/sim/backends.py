@@ -0,0 +1,228 @@
+"""
+sim/backends.py — 캡처·입력·프로세스 백엔드를 SimScreen 으로 교체하는 패처
+"""
+import sys
+import time
+import types
+
+from src.sim.screen import SimScreen
+
+_MOUSEEVENTF_MOVE     = 0x0001
+_MOUSEEVENTF_LEFTUP   = 0x0004
+_MOUSEEVENTF_RIGHTUP  = 0x0010
+_MOUSEEVENTF_ABSOLUTE = 0x8000
+_KEYEVENTF_KEYUP     = 0x0002
+_KEYEVENTF_UNICODE   = 0x0004
+_VK_RETURN           = 0x0D
+
+
+class FakeUser32:
+    """src.core.input._user32 대용. SendInput 구조체를 해석해 SimScreen 으로 전달."""
+
+    def __init__(self, screen: SimScreen):
+        self._screen = screen
+        self.cursor  = (0, 0)
+        self._chat_buf: "str | None" = None
+        self._chat_state: "str | None" = None
+        self.inputs  = 0   # 전달된 INPUT 개수 (입력 처리량 측정용)
+        self.clicks  = 0
+
+    # ── 커서 / 창 ─────────────────────────────────
+    def SetCursorPos(self, x, y):
+        self.cursor = (int(x), int(y))
+        return 1
+
+    def GetCursorPos(self, ppt):
+        pt = getattr(ppt, "_obj", ppt)
+        pt.x, pt.y = self.cursor
+        return 1
+
+    def ClientToScreen(self, hwnd, ppt):   # 클라이언트 = 스크린 좌표
+        return 1
+
+    def ScreenToClient(self, hwnd, ppt):
+        return 1
+
+    def GetClientRect(self, hwnd, prc):
+        rc = getattr(prc, "_obj", prc)
+        rc.left = rc.top = 0
+        rc.right, rc.bottom = self._screen.size
+        return 1
+
+    def GetSystemMetrics(self, idx):
+        if idx in (76, 77):                     # 가상 데스크톱 원점 = (0, 0)
+            return 0
+        return self._screen.size[1] if idx in (1, 79) else self._screen.size[0]
+
+    def GetForegroundWindow(self):
+        return self._screen.hwnd or 0
+
+    def SetForegroundWindow(self, hwnd):
+        return 1
+
+    def IsWindow(self, hwnd):
+        return int(hwnd == self._screen.hwnd)
+
+    def MapVirtualKeyW(self, vk, _map_type):
+        return vk
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return lambda *_a, **_k: 0
+
+    # ── SendInput ─────────────────────────────────
+    def SendInput(self, n, p_inputs, _cb):
+        obj   = getattr(p_inputs, "_obj", p_inputs)
+        items = list(obj) if hasattr(obj, "_length_") else [obj]
+        for inp in items[:n]:
+            self.inputs += 1
+            if inp.type == 0:
+                flags = inp.mi.dwFlags
+                if flags & _MOUSEEVENTF_MOVE and flags & _MOUSEEVENTF_ABSOLUTE:
+                    w, h = self._screen.size
+                    self.cursor = (inp.mi.dx * w // 65536, inp.mi.dy * h // 65536)
+                if flags & _MOUSEEVENTF_LEFTUP:
+                    self.clicks += 1
+                    self._screen.click(*self.cursor, button="left")
+                elif flags & _MOUSEEVENTF_RIGHTUP:
+                    self.clicks += 1
+                    self._screen.click(*self.cursor, button="right")
+            elif inp.type == 1:
+                self._key(inp.ki.wVk, inp.ki.wScan, inp.ki.dwFlags)
+        return n
+
+    def _key(self, vk: int, scan: int, flags: int):
+        if flags & _KEYEVENTF_KEYUP:
+            return
+        state = self._screen.state
+        if self._chat_buf is not None and state != self._chat_state:
+            self._chat_buf = None
+        if flags & _KEYEVENTF_UNICODE:
+            if self._chat_buf is not None:
+                self._chat_buf += chr(scan)
+            return
+        if vk == _VK_RETURN:
+            if self._chat_buf is None:
+                self._chat_buf, self._chat_state = "", state
+            else:
+                text, self._chat_buf = self._chat_buf, None
+                self._screen.chat(text)
+        self._screen.key(vk)
+
+
+class _FakeProcess:
+    def __init__(self, screen: SimScreen):
+        self._screen = screen
+        self.pid     = screen.PID
+        self.info    = {"name": "War3.exe", "pid": screen.PID}
+
+    def name(self) -> str:
+        return "War3.exe"
+
+    def kill(self):
+        self._screen.kill()
+
+    terminate = kill
+
+
+def _fake_psutil(screen: SimScreen, real) -> types.SimpleNamespace:
+    """worker 가 쓰는 psutil 일부 (process_iter) 만 SimScreen 기준으로 제공."""
+    def process_iter(attrs=None):
+        return iter([_FakeProcess(screen)] if screen.alive else [])
+    ns = types.SimpleNamespace(**{k: getattr(real, k) for k in dir(real) if not k.startswith("__")}) \
+        if real is not None else types.SimpleNamespace()
+    ns.process_iter = process_iter
+    return ns
+
+
+class SimBackends:
+    """SimScreen 을 워커에 연결하는 패치 묶음. with 블록 또는 install()/uninstall().
+
+    원본 함수가 바인딩된 모든 src.* 모듈 속성을 찾아 교체한다 (from-import 사본 포함).
+    """
+
+    def __init__(self, screen: SimScreen):
+        self.screen  = screen
+        self.user32  = FakeUser32(screen)
+        self.recorder = None   # RecordingBackend (install 후) — 입력 이벤트 타임스탬프
+        self._saved: "list[tuple[object, str, object]]" = []
+
+    def _set(self, owner, name: str, value):
+        self._saved.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, value)
+
+    def _replace_everywhere(self, original, value):
+        for mod_name, mod in list(sys.modules.items()):
+            if not mod_name.startswith("src.") or mod is None:
+                continue
+            for attr, cur in list(vars(mod).items()):
+                if cur is original:
+                    self._set(mod, attr, value)
+
+    def install(self) -> "SimBackends":
+        from src.core import capture, input_backend
+        from src.core.input_backend import RecordingBackend
+        from src.utils import process, memory
+        scr = self.screen
+
+        # ── 캡처 ──
+        self._replace_everywhere(capture._capture_war3_gray,            lambda: scr.frame(gray=True))
+        self._replace_everywhere(capture._capture_war3_gray_background, lambda: scr.frame(gray=True))
+        self._replace_everywhere(capture._capture_war3_bgr,             lambda: scr.frame())
+        self._replace_everywhere(capture._capture_war3_bgr_background,  lambda: scr.frame())
+        self._replace_everywhere(capture._get_pixel_at_client,
+                                 lambda cx, cy: (scr.pixels([(cx, cy)]) or [None])[0])
+        self._set(capture.PixelProbe, "sample", lambda probe, hwnd=None: scr.pixels(probe.points))
+        self._set(capture.PixelProbe, "close",  lambda probe: None)
+
+        # ── 창 / 프로세스 ──
+        self._replace_everywhere(process.find_war3_hwnd, lambda: scr.hwnd)
+        self._replace_everywhere(process.kill_war3, lambda: (scr.kill(), True)[1])
+        try:
+            import psutil as _real_psutil
+        except ImportError:
+            _real_psutil = None
+        fake_ps = _fake_psutil(scr, _real_psutil)
+        for mod_name, mod in list(sys.modules.items()):
+            if mod_name.startswith("src.") and getattr(mod, "psutil", None) is _real_psutil \
+                    and _real_psutil is not None:
+                self._set(mod, "psutil", fake_ps)
+
+        # ── 입력 (기록 백엔드 → FakeUser32 → SimScreen) ──
+        self.recorder = RecordingBackend(self.user32)
+        self._set(input_backend, "_backend", self.recorder)
+        try:
+            import ctypes
+            self._set(ctypes.windll, "user32", self.user32)
+        except AttributeError:
+            pass
+
+        # ── 메모리 패치 (게임 프로세스 없음 → 성공으로 간주) ──
+        for fn_name in ("write_game_delay", "write_start_speed_zero"):
+            self._replace_everywhere(getattr(memory, fn_name), lambda *_a, **_k: (True, "[sim] 메모리 패치 생략"))
+        for fn_name in ("patch_war3_preferences", "patch_war3_resolution_registry"):
+            self._replace_everywhere(getattr(memory, fn_name), lambda *_a, **_k: (True, "[sim] 설정 패치 생략"))
+        return self
+
+    def uninstall(self):
+        while self._saved:
+            owner, name, value = self._saved.pop()
+            setattr(owner, name, value)
+
+    def __enter__(self) -> "SimBackends":
+        return self.install()
+
+    def __exit__(self, *exc):
+        self.uninstall()
+        return False
+
+
+def wait_state(screen: SimScreen, name: str, timeout: float, step: float = 0.05) -> bool:
+    """screen 이 name 상태가 될 때까지 대기 (벤치/시나리오용)."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if screen.state == name:
+            return True
+        time.sleep(step)
+    return False
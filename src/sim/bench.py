@@ -0,0 +1,170 @@
+"""
+sim/bench.py — SimScreen 위에서 WatchWorker._run 전체 루프를 헤드리스로 돌리는 벤치마크
+실행: python -m src.sim.bench --cycles 3 --event PLAYER_LEFT
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from src.sim.platform import install_platform_shims
+
+# 벤치 기본 설정: 승객 흐름 + 인게임 부가 루틴 OFF (재접속 파이프라인만 측정)
+SIM_CONFIG: dict = {
+    "role":                    "guest",
+    "room_name":               "sim",
+    "character":               "검성",
+    "auto_hunt":               False,
+    "control_group_enabled":   False,
+    "attendance_check":        False,
+    "normal_hunt_enabled":     False,
+    "boss_raid_enabled":       False,
+    "auto_save_enabled":       False,
+    "ingame_restart_on_event": True,
+}
+
+
+def run_bench(cycles: int = 3, event: str = "PLAYER_LEFT", hold: float = 3.0,
+              size: "tuple[int, int]" = (1920, 1080), time_scale: float = 1.0,
+              cycle_timeout: float = 300.0, config: "dict | None" = None,
+              verbose: bool = False, virtual: bool = False) -> dict:
+    """사이클 N회 실행 후 지표 반환.
+
+    사이클 = 워커 트레이서의 1사이클 (War3 시작 → 인게임 루틴 완료).
+    사이클 완료 후 hold 초 대기 → event 주입 → 워커가 War3 종료·재접속 → 다음 사이클.
+    virtual=True 이면 워커·시뮬레이터가 VirtualClock 을 공유 → 대기 시간 없이 로직만 측정
+    (이 경우 사이클·복구 시간은 가상 초, wall_s 는 실제 초).
+    """
+    install_platform_shims()
+    from src.utils import config as _config
+    from src.utils.crypto import encrypt_password
+    from src.utils.trace import Tracer
+    from src.macro.worker import WatchWorker
+    from src.sim.screen import SimScreen, guest_graph
+    from src.sim.backends import SimBackends
+    from src.core.clock import MONOTONIC, VirtualClock
+
+    clock = VirtualClock() if virtual else MONOTONIC
+
+    tmp = tempfile.mkdtemp(prefix="pynox_sim_")
+    cfg = dict(SIM_CONFIG, bnet_password=encrypt_password("sim"))
+    cfg.update(config or {})
+    saved_cfg_file = _config.CONFIG_FILE
+    _config.CONFIG_FILE = os.path.join(tmp, "wc3_config.json")
+    _config._cfg_cache  = None
+    _config.save_config(cfg)
+
+    screen = SimScreen(graph=guest_graph(cfg.get("character")), size=size, time_scale=time_scale,
+                       clock=clock.now)
+    done: "list[tuple[object, float, float]]" = []   # (TraceCycle, t_end, cpu_end)
+    done_cv = threading.Condition()
+
+    def _on_cycle(cyc):
+        with done_cv:
+            done.append((cyc, clock.now(), time.process_time()))
+            done_cv.notify_all()
+
+    injected: "list[float]" = []
+    try:
+        with SimBackends(screen) as backends:
+            worker = WatchWorker(clock=clock)
+            worker._tracer = Tracer(export_dir=os.path.join(tmp, "traces"), clock=clock.now)
+            worker.trace_signal.connect(_on_cycle)
+            if verbose:
+                worker.log_signal.connect(lambda msg, _lvl: print(msg, flush=True))
+            t0, cpu0 = time.monotonic(), time.process_time()
+            th = threading.Thread(target=worker.start, name="sim-worker", daemon=True)
+            th.start()
+            for i in range(cycles):
+                with done_cv:
+                    if not done_cv.wait_for(lambda: len(done) > i, timeout=cycle_timeout):
+                        break
+                if i < cycles - 1:
+                    clock.sleep(hold)
+                    injected.append(clock.now())
+                    screen.inject(event)
+            worker.stop()
+            th.join(timeout=10.0)
+            wall = time.monotonic() - t0
+            inputs, clicks = backends.user32.inputs, backends.user32.clicks
+    finally:
+        _config.CONFIG_FILE = saved_cfg_file
+        _config._cfg_cache  = None
+
+    # ── 지표 ──
+    durs, cpus, recov = [], [], []
+    prev_cpu = cpu0
+    steps: "dict[str, list[float]]" = {}
+    for idx, (cyc, t_end, cpu_end) in enumerate(done):
+        durs.append(cyc.total)
+        cpus.append(cpu_end - prev_cpu)
+        prev_cpu = cpu_end
+        if idx >= 1 and idx - 1 < len(injected):
+            recov.append(t_end - injected[idx - 1])
+        for depth, name, dur in cyc.breakdown():
+            if depth == 1:
+                steps.setdefault(name, []).append(dur)
+
+    return {
+        "cycles":          len(done),
+        "wall_s":          round(wall, 2),
+        "cycles_per_min":  round(len(done) / wall * 60.0, 2) if wall > 0 else 0.0,
+        "cycle_avg_s":     round(statistics.mean(durs), 2) if durs else None,
+        "cpu_per_cycle_s": round(statistics.mean(cpus), 3) if cpus else None,
+        "recovery_s":      [round(r, 2) for r in recov],
+        "recovery_avg_s":  round(statistics.mean(recov), 2) if recov else None,
+        "steps_avg_s":     {k: round(statistics.mean(v), 2) for k, v in steps.items()},
+        "captures":        screen.captures,
+        "inputs":          inputs,
+        "clicks":          clicks,
+        "trace_dir":       os.path.join(tmp, "traces"),
+    }
+
+
+def _print_report(r: dict):
+    print("=" * 50)
+    print("  PyNOX 시뮬레이터 벤치마크")
+    print("=" * 50)
+    print(f"  사이클          : {r['cycles']}  ({r['wall_s']}s, {r['cycles_per_min']}/분)")
+    print(f"  사이클 평균     : {r['cycle_avg_s']}s")
+    print(f"  CPU / 사이클    : {r['cpu_per_cycle_s']}s")
+    print(f"  복구 시간       : {r['recovery_s']}  (평균 {r['recovery_avg_s']}s)")
+    print(f"  캡처 / 입력     : {r['captures']} / {r['inputs']} (클릭 {r['clicks']})")
+    print("  단계별 평균:")
+    for name, sec in sorted(r["steps_avg_s"].items(), key=lambda kv: -kv[1]):
+        print(f"    {name:<28} {sec:>8.2f}s")
+    print(f"  trace: {r['trace_dir']}")
+
+
+def main(argv: "list[str] | None" = None) -> int:
+    ap = argparse.ArgumentParser(description="PyNOX 헤드리스 워커 벤치마크 (SimScreen)")
+    ap.add_argument("--cycles", type=int, default=3)
+    ap.add_argument("--event", default="PLAYER_LEFT", choices=["PLAYER_LEFT", "MISSION_END"])
+    ap.add_argument("--hold", type=float, default=3.0, help="사이클 완료 후 이벤트 주입까지 대기(초)")
+    ap.add_argument("--size", default="1920x1080", help="가짜 클라이언트 해상도 (예: 960x540)")
+    ap.add_argument("--scale", type=float, default=1.0, help="시뮬레이터 상태 전이 시간 배율")
+    ap.add_argument("--virtual", action="store_true", help="가상 시계로 실행 (대기 시간 생략)")
+    ap.add_argument("--json", action="store_true", help="결과를 JSON 으로 출력")
+    ap.add_argument("-v", "--verbose", action="store_true", help="워커 로그 출력")
+    a = ap.parse_args(argv)
+    try:
+        w, h = (int(v) for v in a.size.lower().split("x"))
+    except ValueError:
+        ap.error(f"--size 형식 오류: {a.size!r} (예: 960x540)")
+    if w <= 0 or h <= 0:
+        ap.error(f"--size 는 양수여야 합니다: {a.size!r}")
+    r = run_bench(cycles=a.cycles, event=a.event, hold=a.hold, size=(w, h),
+                  time_scale=a.scale, verbose=a.verbose, virtual=a.virtual)
+    if a.json:
+        print(json.dumps(r, ensure_ascii=False, indent=2))
+    else:
+        _print_report(r)
+    return 0 if r["cycles"] == a.cycles else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
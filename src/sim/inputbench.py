@@ -0,0 +1,118 @@
+"""
+sim/inputbench.py — 입력 경로 처리량·타이밍 지터 벤치 (RecordingBackend 위에서 실행, 실제 입력 없음)
+실행: python -m src.sim.inputbench --repeat 200
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from src.sim.platform import install_platform_shims
+
+
+def _pct(values: "list[float]", p: float) -> float:
+    v = sorted(values)
+    return v[min(len(v) - 1, int(len(v) * p))] if v else 0.0
+
+
+def _paths() -> dict:
+    """이름 → CompiledSeq. 워커·채팅·한글 타이핑이 실제로 쓰는 모양."""
+    from src.core.input import _VK_CONTROL, _VK_V, _VK_TAB, _VK_G, _VK_RETURN, _VK_SHIFT, _VK_LEFT
+    from src.core.keyseq import KeySeq
+    from src.core.hangul import HangulTiming, _compiled
+    fast = HangulTiming(ime_settle=0.03, key_hold=0.002, shift_hold=0.002, jamo_gap=0.004, char_gap=0.002, tail=0.0)
+    return {
+        "ctrl_v":        KeySeq().chord(_VK_CONTROL, _VK_V).compile(),
+        "control_group": KeySeq().down(_VK_CONTROL).tap(ord("1")).gap(0.02).tap(ord("9")).up(_VK_CONTROL).compile(),
+        "select_30":     KeySeq().down(_VK_SHIFT).tap(_VK_LEFT, times=30).up(_VK_SHIFT).compile(),
+        "chat_unicode":  KeySeq().tap(_VK_RETURN).text("-save 라하린 숲 보스").tap(_VK_RETURN).compile(),
+        "tab_g_5ms":     KeySeq().tap(_VK_TAB).gap(0.005).tap(_VK_G).compile(),
+        "hangul_fast":   _compiled("라하린 숲 사냥 1", fast),
+    }
+
+
+def _legacy_chat(text: str):
+    """비교용: 키 이벤트마다 _press_vk / _send_key 1회 (기존 방식, 간격 없음)."""
+    from src.core.input import _press_vk, _send_key, _VK_RETURN, _KEYEVENTF_UNICODE, _KEYEVENTF_KEYUP
+    _press_vk(_VK_RETURN); _press_vk(_VK_RETURN, keyup=True)
+    for ch in text:
+        _send_key(0, ord(ch), _KEYEVENTF_UNICODE)
+        _send_key(0, ord(ch), _KEYEVENTF_UNICODE | _KEYEVENTF_KEYUP)
+    _press_vk(_VK_RETURN); _press_vk(_VK_RETURN, keyup=True)
+
+
+def run_bench(repeat: int = 200) -> dict:
+    install_platform_shims()
+    from src.core.input_backend import RecordingBackend, use_backend
+
+    results: dict = {}
+    with use_backend(RecordingBackend()) as rec:
+        for name, seq in _paths().items():
+            rec.clear()
+            send_us: "list[float]" = []
+            jitter:  "list[float]" = []
+            plan = seq.schedule()
+            for _ in range(repeat):
+                mark = len(rec.events)
+                t0 = time.perf_counter()
+                seq.send()
+                send_us.append((time.perf_counter() - t0) * 1e6)
+                # 배치별 실제 전송 시각 (같은 SendInput 의 이벤트는 같은 t) vs 예정 시각
+                times = []
+                for e in rec.events[mark:]:
+                    if not times or e.t != times[-1]:
+                        times.append(e.t)
+                if len(times) == len(plan) > 1:
+                    jitter += [((t - times[0]) - p) * 1e6 for t, p in zip(times[1:], plan[1:])]
+            busy = sum(send_us) / 1e6 - seq.duration * repeat   # 간격 제외한 전송 비용
+            results[name] = {
+                "events":       seq.events,
+                "batches":      seq.batches,
+                "send_avg_us":  statistics.mean(send_us),
+                "events_per_s": seq.events * repeat / busy if busy > 0 else float("inf"),
+                "jitter_avg_us": statistics.mean(jitter) if jitter else None,
+                "jitter_p95_us": _pct(jitter, 0.95) if jitter else None,
+                "jitter_max_us": max(jitter) if jitter else None,
+            }
+
+        text = "-save 라하린 숲 보스"
+        rec.clear()
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            _legacy_chat(text)
+        dt = time.perf_counter() - t0
+        n = (len(text) + 2) * 2
+        results["legacy_chat"] = {"events": n, "batches": n, "send_avg_us": dt / repeat * 1e6,
+                                  "events_per_s": n * repeat / dt if dt > 0 else float("inf"),
+                                  "jitter_avg_us": None, "jitter_p95_us": None, "jitter_max_us": None}
+    return results
+
+
+def _print_report(r: dict):
+    print("=" * 86)
+    print(f"  {'경로':<15}{'이벤트':>6}{'배치':>6}{'전송 평균':>12}{'이벤트/s':>14}"
+          f"{'지터 평균':>11}{'p95':>9}{'최대':>9}")
+    print("=" * 86)
+    for name, x in r.items():
+        j = (f"{x['jitter_avg_us']:>9.0f}µs{x['jitter_p95_us']:>7.0f}µs{x['jitter_max_us']:>7.0f}µs"
+             if x["jitter_avg_us"] is not None else f"{'-':>11}{'-':>9}{'-':>9}")
+        print(f"  {name:<15}{x['events']:>6}{x['batches']:>6}{x['send_avg_us']:>10.0f}µs"
+              f"{x['events_per_s']:>14,.0f}{j}")
+
+
+def main(argv: "list[str] | None" = None) -> int:
+    ap = argparse.ArgumentParser(description="PyNOX 입력 경로 처리량·지터 벤치 (RecordingBackend)")
+    ap.add_argument("--repeat", type=int, default=200)
+    ap.add_argument("--json", action="store_true", help="결과를 JSON 으로 출력")
+    a = ap.parse_args(argv)
+    r = run_bench(a.repeat)
+    if a.json:
+        print(json.dumps(r, ensure_ascii=False, indent=2))
+    else:
+        _print_report(r)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+sim/platform.py — 비 Windows 환경에서 워커 모듈을 import 하기 위한 플랫폼 심
+"""
+import ctypes
+import importlib
+import sys
+import types
+
+# import 시점에 필요한 Windows 전용 모듈 (호출은 SimBackends 가 가로챔)
+_WIN_MODULES = (
+    "win32api", "win32con", "win32gui", "win32ui", "win32clipboard",
+    "winreg", "pymem", "pymem.process", "pymem.exception",
+)
+
+
+def _noop(*_a, **_k):
+    return 0
+
+
+class _AnyLib:
+    """ctypes.windll.<dll> 대용. 모든 함수가 0 을 반환 (argtypes/restype 설정 허용)."""
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        fn = lambda *_a, **_k: 0  # noqa: E731
+        setattr(self, name, fn)
+        return fn
+
+
+class _AnyDLL:
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        lib = _AnyLib()
+        setattr(self, name, lib)
+        return lib
+
+
+class _PlaceholderModule(types.ModuleType):
+    """속성 접근 시 no-op 함수를 돌려주는 빈 모듈."""
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _noop
+
+
+def install_platform_shims() -> "list[str]":
+    """Windows 가 아니면 ctypes.windll / WINFUNCTYPE 과 Win32 전용 모듈 자리를 채운다.
+    실제로 채운 모듈 이름 목록 반환 (Windows 에서는 빈 목록)."""
+    if sys.platform == "win32":
+        return []
+    if not hasattr(ctypes, "windll"):
+        ctypes.windll = _AnyDLL()
+        ctypes.WinDLL = lambda *_a, **_k: _AnyLib()
+    if not hasattr(ctypes, "WINFUNCTYPE"):
+        ctypes.WINFUNCTYPE = ctypes.CFUNCTYPE
+    shimmed = []
+    for name in _WIN_MODULES:
+        if name in sys.modules:
+            continue
+        try:
+            importlib.import_module(name)
+            continue
+        except ImportError:
+            pass
+        mod = _PlaceholderModule(name)
+        sys.modules[name] = mod
+        parent, _, child = name.rpartition(".")
+        if parent and parent in sys.modules:
+            setattr(sys.modules[parent], child, mod)
+        shimmed.append(name)
+    return shimmed
@@ -0,0 +1,294 @@
+"""
+sim/screen.py — 녹화 템플릿을 합성해 프레임을 만드는 WC3 화면 상태 그래프
+"""
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+
+import cv2
+import numpy as np
+
+from src.constants import IMG
+from src.core.image_match import _IMAGE_DIR, _REF_W, _REF_H, _CHAR_IMAGES
+from src.core.input import _VK_C, _VK_G, _VK_RETURN
+from src.macro.combat import DEATH_PROBE_POINTS
+
+# 이벤트 이름 → 화면에 겹쳐 그릴 템플릿
+EVENT_OVERLAYS: "dict[str, str]" = {
+    "PLAYER_LEFT": IMG.PLAYER_LEFT,
+    "MISSION_END": IMG.MISSION_END,
+}
+
+
+@dataclass
+class State:
+    """화면 상태 1개.
+
+    show:     화면에 표시할 템플릿 (IMG 파일명)
+    on_click: 템플릿 클릭 → 다음 상태
+    on_key:   VK 입력 → 다음 상태
+    on_chat:  채팅 전송 텍스트 → 다음 상태
+    after:    (초, 다음 상태) — 시간 경과 자동 전이
+    ingame:   인게임 상태 여부 (이벤트·사망 주입 대상)
+    """
+    name: str
+    show: "list[str]" = field(default_factory=list)
+    on_click: "dict[str, str]" = field(default_factory=dict)
+    on_key: "dict[int, str]" = field(default_factory=dict)
+    on_chat: "dict[str, str]" = field(default_factory=dict)
+    after: "tuple[float, str] | None" = None
+    ingame: bool = False
+
+
+def guest_graph(character: "str | None" = None) -> "dict[str, State]":
+    """승객(guest) 흐름 기본 그래프: main → login → lobby → room → loading → ingame."""
+    char_img = _CHAR_IMAGES.get(character or "", next(iter(_CHAR_IMAGES.values())))
+    states = [
+        State("main",        [IMG.MAIN_SCREEN], on_click={IMG.MAIN_SCREEN: "login_enter"}),
+        State("login_enter", [IMG.LOGIN_ENTER], after=(0.5, "login")),
+        State("login",       [IMG.LOGIN_SCREEN], on_key={_VK_RETURN: "lobby"}, after=(5.0, "lobby")),
+        State("lobby",       [IMG.LOBBY], on_key={_VK_C: "channel"}),
+        State("channel",     [IMG.CUSTOM_CHANNEL], on_key={_VK_G: "room_list"}),
+        State("room_list",   [IMG.ROOM_LIST], on_key={_VK_RETURN: "room"}),
+        State("room",        [IMG.ROOM_ENTER], after=(2.0, "loading")),
+        State("loading",     [], after=(3.0, "char_select")),
+        State("char_select", [IMG.LOADING_DONE, IMG.LOADING_CURSOR, char_img],
+              on_click={char_img: "char_picked"}),
+        State("char_picked", [IMG.CHAR_SELECT, IMG.INGAME_CHECK], after=(1.0, "ingame")),
+        State("ingame",      [IMG.INGAME_CHECK], ingame=True),
+    ]
+    return {s.name: s for s in states}
+
+
+class SimScreen:
+    """상태 그래프 기반 가짜 WC3 클라이언트.
+
+    - 프레임: 노이즈 배경 위에 현재 상태의 템플릿을 해상도 비율대로 합성 (상태별 캐시)
+    - 입력: click()/key()/chat() 으로 상태 전이
+    - 이벤트: inject("PLAYER_LEFT" | "MISSION_END" | "death")
+    - 프로세스: kill() 시 창/프로세스 소멸 → relaunch_delay 후 시작 상태로 재실행
+    """
+
+    HWND = 0x5157  # 가짜 창 핸들
+    PID  = 4242
+
+    def __init__(self, graph: "dict[str, State] | None" = None, start: str = "main",
+                 size: "tuple[int, int]" = (_REF_W, _REF_H), time_scale: float = 1.0,
+                 relaunch_delay: float = 2.0, death_sec: float = 5.0,
+                 image_dir: str = _IMAGE_DIR, seed: int = 0, clock=time.monotonic):
+        self.graph       = graph or guest_graph()
+        self.start       = start
+        self.size        = size
+        self.time_scale  = time_scale
+        self.relaunch_delay = relaunch_delay
+        self.death_sec   = death_sec
+        self._dir        = image_dir
+        self._clock      = clock
+        self._lock       = threading.RLock()
+        w, h = size
+        self._bg = np.random.default_rng(seed).integers(0, 64, (h, w, 3), dtype=np.uint8)
+        self._tmpl_cache: "dict[str, np.ndarray | None]" = {}
+        self._frame_cache: "dict[tuple, tuple[np.ndarray, np.ndarray]]" = {}
+        self._layouts: "dict[tuple, dict[str, tuple[int, int, int, int]]]" = {}
+        self._state      = start
+        self._entered    = clock()
+        self._alive      = True
+        self._relaunch_at: "float | None" = None
+        self._overlays: "set[str]" = set()
+        self._dead_until: "float | None" = None
+        self.history: "list[tuple[float, str, str, str]]" = []  # (t, from, to, cause)
+        self.chats: "list[tuple[float, str]]" = []
+        self.captures = 0
+
+    # ── 상태 ──────────────────────────────────────
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._tick()
+            return self._state
+
+    @property
+    def hwnd(self) -> "int | None":
+        with self._lock:
+            self._tick()
+            return self.HWND if self._alive else None
+
+    @property
+    def alive(self) -> bool:
+        return self.hwnd is not None
+
+    def _goto(self, nxt: str, cause: str):
+        if nxt not in self.graph:
+            raise KeyError(f"정의되지 않은 상태: {nxt}")
+        self.history.append((self._clock(), self._state, nxt, cause))
+        self._state   = nxt
+        self._entered = self._clock()
+        self._overlays.clear()
+
+    def _tick(self):
+        now_t = self._clock()
+        if not self._alive:
+            if self._relaunch_at is not None and now_t >= self._relaunch_at:
+                self._alive, self._relaunch_at = True, None
+                self._goto(self.start, "relaunch")
+            return
+        if self._dead_until is not None and now_t >= self._dead_until:
+            self._dead_until = None
+        # 연쇄 after 전이 처리
+        for _ in range(len(self.graph)):
+            st = self.graph[self._state]
+            if not st.after:
+                break
+            sec, nxt = st.after
+            if now_t - self._entered < sec * self.time_scale:
+                break
+            self._goto(nxt, "after")
+
+    # ── 입력 ──────────────────────────────────────
+    def click(self, x: int, y: int, button: str = "left"):
+        with self._lock:
+            self._tick()
+            if not self._alive:
+                return
+            st = self.graph[self._state]
+            for fname, (tx, ty, tw, th) in self._layout(st).items():
+                if tx <= x < tx + tw and ty <= y < ty + th and fname in st.on_click:
+                    self._goto(st.on_click[fname], f"{button}click:{fname}")
+                    return
+
+    def key(self, vk: int):
+        with self._lock:
+            self._tick()
+            if not self._alive:
+                return
+            nxt = self.graph[self._state].on_key.get(vk)
+            if nxt:
+                self._goto(nxt, f"key:{vk:#04x}")
+
+    def chat(self, text: str):
+        with self._lock:
+            self._tick()
+            self.chats.append((self._clock(), text))
+            if not self._alive:
+                return
+            nxt = self.graph[self._state].on_chat.get(text)
+            if nxt:
+                self._goto(nxt, f"chat:{text}")
+
+    # ── 이벤트 주입 ───────────────────────────────
+    def inject(self, event: str):
+        with self._lock:
+            self._tick()
+            if event == "death":
+                self._dead_until = self._clock() + self.death_sec * self.time_scale
+            elif event in EVENT_OVERLAYS:
+                self._overlays.add(EVENT_OVERLAYS[event])
+            else:
+                raise ValueError(f"알 수 없는 이벤트: {event}")
+
+    def kill(self):
+        with self._lock:
+            if not self._alive:
+                return
+            self.history.append((self._clock(), self._state, "", "kill"))
+            self._alive = False
+            self._overlays.clear()
+            self._dead_until = None
+            self._relaunch_at = self._clock() + self.relaunch_delay * self.time_scale
+
+    # ── 프레임 ────────────────────────────────────
+    def _template(self, fname: str) -> "np.ndarray | None":
+        if fname not in self._tmpl_cache:
+            path = os.path.join(self._dir, fname)
+            img  = None
+            if os.path.exists(path):
+                img = cv2.imdecode(np.fromfile(path, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+            if img is not None:
+                if img.ndim == 2:
+                    img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+                w, h = self.size
+                nw = max(1, int(img.shape[1] * w / _REF_W))
+                nh = max(1, int(img.shape[0] * h / _REF_H))
+                if (nw, nh) != (img.shape[1], img.shape[0]):
+                    # image_match._load_template 과 같은 방식: 색상은 INTER_AREA, 알파(마스크)는 INTER_NEAREST
+                    # (알파까지 INTER_AREA 로 줄이면 가장자리가 반투명 합성돼 마스크 매칭 점수가 무너짐)
+                    bgr = cv2.resize(img[:, :, :3], (nw, nh), interpolation=cv2.INTER_AREA)
+                    if img.shape[2] == 4:
+                        alpha = cv2.resize(img[:, :, 3], (nw, nh), interpolation=cv2.INTER_NEAREST)
+                        img = np.dstack([bgr, alpha])
+                    else:
+                        img = bgr
+            self._tmpl_cache[fname] = img
+        return self._tmpl_cache[fname]
+
+    def _layout(self, st: State) -> "dict[str, tuple[int, int, int, int]]":
+        """템플릿 배치 (좌→우, 줄바꿈). 사망 프로브 영역(좌상단)은 비워 둔다."""
+        names = tuple(st.show) + tuple(sorted(self._overlays))
+        if names in self._layouts:
+            return self._layouts[names]
+        w, h = self.size
+        pad  = max(8, w // 120)
+        x, y, row_h = pad, max(120 * h // _REF_H, pad), 0
+        out = {}
+        for fname in names:
+            img = self._template(fname)
+            if img is None:
+                continue
+            th, tw = img.shape[:2]
+            if x + tw + pad > w:
+                x, y, row_h = pad, y + row_h + pad, 0
+            if y + th > h:
+                break
+            out[fname] = (x, y, tw, th)
+            x += tw + pad
+            row_h = max(row_h, th)
+        self._layouts[names] = out
+        return out
+
+    def _render(self) -> "tuple[np.ndarray, np.ndarray]":
+        st   = self.graph[self._state]
+        dead = self._dead_until is not None and st.ingame
+        key  = (self._state, tuple(sorted(self._overlays)), dead)
+        cached = self._frame_cache.get(key)
+        if cached is not None:
+            return cached
+        frame = self._bg.copy()
+        for fname, (x, y, tw, th) in self._layout(st).items():
+            img = self._template(fname)
+            roi = frame[y:y + th, x:x + tw]
+            if img.shape[2] == 4:
+                # 매처의 마스크(alpha > 0) 와 같은 영역만 그대로 복사
+                a = img[:, :, 3] > 0
+                roi[a] = img[:, :, :3][a]
+            else:
+                roi[:] = img
+        if dead:
+            for px, py in DEATH_PROBE_POINTS:
+                frame[max(0, py - 2):py + 3, max(0, px - 2):px + 3] = 0
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        self._frame_cache[key] = (frame, gray)
+        return frame, gray
+
+    def frame(self, gray: bool = False) -> "np.ndarray | None":
+        """현재 프레임 (창 없음이면 None). 호출자가 수정하지 않는 읽기 전용 배열."""
+        with self._lock:
+            self._tick()
+            if not self._alive:
+                return None
+            self.captures += 1
+            bgr, g = self._render()
+            return g if gray else bgr
+
+    def pixels(self, points: "list[tuple[int, int]]") -> "list[tuple[int, int, int]] | None":
+        frame = self.frame()
+        if frame is None:
+            return None
+        h, w = frame.shape[:2]
+        out = []
+        for x, y in points:
+            if not (0 <= x < w and 0 <= y < h):
+                return None
+            b, g, r = frame[y, x]
+            out.append((int(r), int(g), int(b)))
+        return out
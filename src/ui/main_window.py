@@ -23,7 +23,8 @@ from PySide6.QtWidgets import (
     QLineEdit, QListWidget, QListWidgetItem, QMainWindow, QMenu,
     QPushButton, QRadioButton, QRubberBand, QScrollArea, QSizePolicy, QSpinBox,
     QStyle, QStyledItemDelegate, QStyleOptionButton, QStyleOptionViewItem, QStylePainter,
-    QMessageBox, QTabWidget, QTextEdit, QVBoxLayout, QWidget, QWidgetAction,
+    QMessageBox, QTabWidget, QTableWidget, QTableWidgetItem, QHeaderView,
+    QTextEdit, QVBoxLayout, QWidget, QWidgetAction,
 )
 
 from src.ui.theme import (
@@ -36,7 +37,10 @@ from src.ui.portal_widget import PORTAL_CONFIGS, PortalZoneWidget, PortalBossPan
 from src.ui.widgets import ConfigSpinBox, ConfigCheckBox
 from src.utils.config import load_config, save_config, update_config, update_config_multi
 from src.utils.updater import get_local_version
-from src.utils.process import find_war3_hwnd
+from src.utils.process import (
+    find_war3_hwnd, find_war3_instances, bind_instance, claim_war3, release_war3,
+    war3_pids, War3Instance,
+)
 from src.utils.smartkey import _smart_hook
 from src.utils.ocr import _kor_available, ocr_text as _ocr_text
 from src.utils.memory import write_game_delay, patch_war3_preferences, patch_war3_resolution_registry
@@ -44,6 +48,8 @@ from src.core.image_match import _image_match, image_exists, _CHAR_IMAGES, _reso
 from src.core.input import _user32, _press_vk, click_image_center, _scale_coords
 from src.core.capture import _get_pixel_at_client, _capture_war3_bgr, _get_cursor_client, _get_pixel_at_cursor
 from src.macro.worker import WatchWorker
+from src.macro.qt_worker import QtWorker
+from src.macro.worker_process import WorkerProcess
 
 from datetime import datetime
 def now():
@@ -181,6 +187,18 @@ class HotkeySignalEmitter(QObject):
     stop_pressed  = Signal()
 
 
+class _ClientRelay(QObject):
+    """다중 클라이언트 워커 로그 → 메인 창 ([#n] 태그). 메인 스레드 소속 → 큐 연결로 전달."""
+
+    def __init__(self, win: "MainWindow", index: int):
+        super().__init__(win)
+        self._win = win
+        self._tag = f"[#{index + 1}] "
+
+    def log(self, msg: str, level: str):
+        self._win._append_log(self._tag + msg, level)
+
+
 # ══════════════════════════════════════════════════
 #  네비게이션 리스트 (화살표·Enter·첫글자 점프)
 # ══════════════════════════════════════════════════
@@ -1123,9 +1141,15 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(670, 892)
         self.resize(670, 961)
         self._thread: QThread | None = None
-        self._worker: WatchWorker | None = None
+        self._worker: "QtWorker | WorkerProcess | None" = None
         self._war3_gone_ticks = 0
         self._pending_recovery = False
+        # 다중 클라이언트: #2 이후 인스턴스 워커 {index: (QThread | None, 워커)}
+        self._peers: "dict[int, tuple[QThread | None, QtWorker | WorkerProcess]]" = {}
+        self._peer_gone: "dict[int, int]" = {}
+        self._peer_recover: "set[int]" = set()
+        self._client_cpu: "dict[int, dict]" = {}
+        self._relays: "dict[int, _ClientRelay]" = {}
 
         self._build_ui()
         self._apply_theme()
@@ -1135,6 +1159,11 @@ class MainWindow(QMainWindow):
         self._war3_monitor.setInterval(250)
         self._war3_monitor.timeout.connect(self._check_war3_alive)
         self._war3_monitor.start()
+        # ── 워커 프로세스 상태 표시 (1초 간격) ──
+        self._health_timer = QTimer(self)
+        self._health_timer.setInterval(1000)
+        self._health_timer.timeout.connect(self._update_worker_health)
+        self._health_timer.start()
         # ── 녹스 맵 자동 다운로드 타이머 (5분 간격) ──
         self._nox_checking = False
         self._nox_signals  = _NoxSignals(self)
@@ -1397,6 +1426,36 @@ class MainWindow(QMainWindow):
         r0b.addStretch()
         tab1_layout.addLayout(r0b)
 
+        # 클라이언트 수 (2 이상 → War3 인스턴스마다 워커 1개)
+        r0c = QHBoxLayout()
+        lbl0c = QLabel("클라이언트"); lbl0c.setFixedWidth(LWIDTH)
+        r0c.addWidget(lbl0c)
+        self.spn_clients = ConfigSpinBox("client_count", 1, 8, 1, suffix="개", width=66)
+        r0c.addWidget(self.spn_clients)
+        self.lbl_client_cpu = QLabel("- 2개 이상이면 War3 창마다 매크로를 따로 실행")
+        self.lbl_client_cpu.setStyleSheet(f"color:{TEXT_DIM};")
+        r0c.addWidget(self.lbl_client_cpu)
+        r0c.addStretch()
+        tab1_layout.addLayout(r0c)
+
+        # 워커 프로세스 상태 (자식 프로세스 모드)
+        r0d = QHBoxLayout()
+        lbl0d = QLabel("워커"); lbl0d.setFixedWidth(LWIDTH)
+        r0d.addWidget(lbl0d)
+        self.lbl_worker_frame = QLabel()
+        self.lbl_worker_frame.setFixedSize(96, 54)
+        self.lbl_worker_frame.setStyleSheet(f"background:{DARK_BG}; border:1px solid {DARK_BORDER};")
+        r0d.addWidget(self.lbl_worker_frame)
+        self.lbl_worker_health = QLabel("대기")
+        self.lbl_worker_health.setStyleSheet(f"color:{TEXT_DIM};")
+        r0d.addWidget(self.lbl_worker_health)
+        r0d.addStretch()
+        self.btn_worker_restart = QPushButton("워커 재시작")
+        self.btn_worker_restart.setEnabled(False)
+        self.btn_worker_restart.clicked.connect(self._restart_workers)
+        r0d.addWidget(self.btn_worker_restart)
+        tab1_layout.addLayout(r0d)
+
         # 포지션 (방장 / 승객 / 프리매치)
         r1 = QHBoxLayout()
         lbl1 = QLabel("포지션"); lbl1.setFixedWidth(LWIDTH)
@@ -2818,8 +2877,42 @@ class MainWindow(QMainWindow):
 
     def _build_tab567(self):
         _cfg = load_config()
-        # ── Tab 5: 빈 탭 ────────────────────────────
-        self.tabs.addTab(QWidget(), "탭 5")
+        # ── Tab 5: 재접속 분석 (사이클별 단계 소요 시간) ──
+        tab5 = QWidget()
+        tab5_layout = QVBoxLayout(tab5)
+        tab5_layout.setContentsMargins(16, 16, 16, 16)
+        tab5_layout.setSpacing(10)
+
+        lbl_trace_title = QLabel("재접속 분석 (War3 재시작 → 사냥터 복귀)")
+        lbl_trace_title.setStyleSheet("font-size:15px; font-weight:bold;")
+        tab5_layout.addWidget(lbl_trace_title)
+
+        r_trace = QHBoxLayout()
+        r_trace.addWidget(QLabel("사이클:"))
+        self.cmb_trace_cycle = QComboBox()
+        self.cmb_trace_cycle.setMinimumWidth(320)
+        self.cmb_trace_cycle.currentIndexChanged.connect(self._show_trace_cycle)
+        r_trace.addWidget(self.cmb_trace_cycle)
+        r_trace.addStretch()
+        self.lbl_trace_path = QLabel("")
+        self.lbl_trace_path.setStyleSheet(f"color:{TEXT_DIM};")
+        self.lbl_trace_path.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        r_trace.addWidget(self.lbl_trace_path)
+        tab5_layout.addLayout(r_trace)
+
+        self.tbl_trace = QTableWidget(0, 3)
+        self.tbl_trace.setHorizontalHeaderLabels(["단계", "소요 (초)", "비율"])
+        self.tbl_trace.verticalHeader().setVisible(False)
+        self.tbl_trace.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.tbl_trace.setSelectionBehavior(QTableWidget.SelectRows)
+        _hdr = self.tbl_trace.horizontalHeader()
+        _hdr.setSectionResizeMode(0, QHeaderView.Stretch)
+        _hdr.setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        _hdr.setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        tab5_layout.addWidget(self.tbl_trace)
+
+        self._trace_cycles: list = []  # 최신순 TraceCycle
+        self.tabs.addTab(tab5, "재접속 분석")
 
         # ── Tab 6: 녹스 맵 자동 다운로드 ─────────────
         tab6 = QWidget()
@@ -3580,12 +3673,12 @@ class MainWindow(QMainWindow):
     def _check_war3_alive(self):
         """0.25초마다 War3.exe 프로세스 존재 체크.
         매크로 실행 중 3초 연속 미감지 시 JNLoader부터 재시작 (UI 버튼 유지)."""
+        self._check_peers_alive()
         if not (self._worker and self._worker._running):
             self._war3_gone_ticks = 0
             return
         try:
-            alive = any(p.info['name'].lower() == 'war3.exe'
-                        for p in psutil.process_iter(['name']))
+            alive = self._instance_alive(self._worker)
         except Exception:
             alive = True
         if alive:
@@ -3606,9 +3699,36 @@ class MainWindow(QMainWindow):
                 if self._thread:
                     self._thread.quit()
 
+    @staticmethod
+    def _instance_alive(worker: "QtWorker | WorkerProcess") -> bool:
+        """워커 담당 War3 생존 여부. 단일 클라이언트면 War3.exe 아무거나,
+        다중이면 배정된 pid (배정 전 = 워커가 재실행 중 → 살아있는 것으로 간주)."""
+        inst = worker._instance
+        if inst is None:
+            return any(p.info['name'].lower() == 'war3.exe'
+                       for p in psutil.process_iter(['name']))
+        return inst.pid is None or inst.pid in war3_pids()
+
+    def _check_peers_alive(self):
+        """#2 이후 클라이언트 War3 소멸 감시 (3초) → 해당 워커만 중지 후 재실행."""
+        for idx, (_, worker) in list(self._peers.items()):
+            try:
+                alive = not worker._running or self._instance_alive(worker)
+            except Exception:
+                alive = True
+            if alive:
+                self._peer_gone[idx] = 0
+                continue
+            self._peer_gone[idx] = self._peer_gone.get(idx, 0) + 1
+            if self._peer_gone[idx] >= 12:
+                self._peer_gone[idx] = 0
+                self._append_log(f"[{now()}] [#{idx + 1}] War3 프로세스 소멸 → JNLoader 재실행", "error")
+                self._peer_recover.add(idx)
+                worker.stop()
+
     def _start(self):
         # 이미 실행 중이면 무시
-        if self._thread and self._thread.isRunning():
+        if (self._thread and self._thread.isRunning()) or (self._worker and self._worker._running):
             return
 
         # ── 필수 설정 체크 ────────────────────────────
@@ -3636,6 +3756,11 @@ class MainWindow(QMainWindow):
         self._update_status("실행 중...", YELLOW)
         self._append_log(f"[{now()}] 매크로 시작", "info")
 
+        count = cfg.get("client_count", 1)
+        if count > 1:
+            self._start_multi(count)
+            return
+
         # ── War3 프로세스 상태 체크 ──────────────────
         try:
             war3_alive = any(p.info['name'].lower() == 'war3.exe'
@@ -3674,19 +3799,234 @@ class MainWindow(QMainWindow):
             return
         self._start_worker()
 
-    def _start_worker(self, ingame: bool = False):
-        """QThread + WatchWorker 생성 및 시작."""
-        self._thread = QThread()
-        self._worker = WatchWorker(ingame=ingame)
-        self._worker.moveToThread(self._thread)
-        self._thread.started.connect(self._worker.start)
-        self._worker.log_signal.connect(self._append_log)
-        self._worker.update_signal.connect(self._update_last_log)
-        self._worker.status_signal.connect(self._update_status)
-        self._worker.overlay_signal.connect(self._on_overlay_match)
-        self._worker.finished.connect(self._on_worker_finished)
-        self._thread.finished.connect(self._thread.deleteLater)
-        self._thread.start()
+    def _start_multi(self, count: int):
+        """다중 클라이언트 시작. 인게임 중인 War3 는 그대로 이어받고,
+        나머지는 종료 후 부족한 수만큼 JNLoader 실행 → 워커가 새 War3 를 하나씩 배정받는다."""
+        ingame: "list[War3Instance]" = []
+        for inst in find_war3_instances():
+            with bind_instance(inst):
+                is_ingame = len(ingame) < count and image_exists("14.인게임체크.png", background=True)
+            if is_ingame:
+                inst.index = len(ingame)
+                claim_war3(inst)
+                ingame.append(inst)
+            else:
+                try:
+                    psutil.Process(inst.pid).kill()
+                except Exception:
+                    pass
+        self._append_log(
+            f"[{now()}] 다중 클라이언트 {count}개 (인게임 이어받기 {len(ingame)}개)", "info")
+
+        for inst in ingame:
+            self._start_worker(ingame=True, instance=inst)
+        for n, idx in enumerate(range(len(ingame), count)):
+            # JNLoader 는 순차 실행 (동시 실행 시 로더 충돌) → 5초 간격
+            QTimer.singleShot(1500 + n * 5000, lambda i=idx: self._launch_client(i))
+
+    def _launch_client(self, index: int):
+        """클라이언트 #index 용 JNLoader 실행 + 워커 시작 (매크로 중지 상태면 무시)."""
+        if not self.btn_stop.isEnabled():
+            return
+        if not self._launch_jnloader():
+            self._append_log(f"[{now()}] [#{index + 1}] JNLoader 실행 실패", "error")
+            return
+        self._start_worker(instance=War3Instance(index))
+
+    def _start_worker(self, ingame: bool = False, instance: "War3Instance | None" = None):
+        """워커 생성 및 시작. instance.index ≥ 1 이면 보조 클라이언트 워커.
+        worker_process=True(기본) → 자식 프로세스 (GIL 분리), False → QThread."""
+        if load_config().get("worker_process", True):
+            thread = None
+            worker = WorkerProcess(ingame=ingame, instance=instance)
+            worker.crashed.connect(self._on_worker_crashed)
+        else:
+            thread = QThread()
+            worker = QtWorker(WatchWorker(ingame=ingame, instance=instance))
+            worker.moveToThread(thread)
+            thread.started.connect(worker.run)
+            thread.finished.connect(thread.deleteLater)
+        worker.trace_signal.connect(self._on_trace_cycle)
+        worker.cpu_signal.connect(self._on_client_cpu)
+        if instance is None:
+            worker.log_signal.connect(self._append_log)
+            worker.update_signal.connect(self._update_last_log)
+        else:
+            if instance.index not in self._relays:
+                self._relays[instance.index] = _ClientRelay(self, instance.index)
+            worker.log_signal.connect(self._relays[instance.index].log)
+        if instance is None or instance.index == 0:
+            self._thread, self._worker = thread, worker
+            worker.status_signal.connect(self._update_status)
+            worker.overlay_signal.connect(self._on_overlay_match)
+            worker.finished.connect(self._on_worker_finished)
+        else:
+            self._peers[instance.index] = (thread, worker)
+            worker.finished.connect(self._on_peer_finished)
+        if thread is not None:
+            thread.start()
+        else:
+            worker.start()
+
+    def _on_peer_finished(self):
+        self._peer_done(self.sender())
+
+    def _peer_done(self, worker):
+        idx = next((i for i, (_, w) in self._peers.items() if w is worker), None)
+        if idx is None:
+            return
+        thread, _ = self._peers.pop(idx)
+        if thread is not None:
+            thread.quit()
+            thread.wait(500)
+        if isinstance(worker, WorkerProcess):
+            worker.close()
+        self._client_cpu.pop(idx, None)
+        release_war3(worker._instance)
+        if idx in self._peer_recover and self.btn_stop.isEnabled():
+            self._peer_recover.discard(idx)
+            self._append_log(f"[{now()}] [#{idx + 1}] JNLoader 재실행 중...", "warn")
+            QTimer.singleShot(1500, lambda i=idx: self._launch_client(i))
+        elif self.btn_stop.isEnabled():
+            self._append_log(f"[{now()}] [#{idx + 1}] 클라이언트 매크로 종료", "warn")
+
+    def _stop_peers(self, wait_ms: int = 0):
+        self._peer_recover.clear()
+        for thread, worker in list(self._peers.values()):
+            if isinstance(worker, WorkerProcess):
+                if wait_ms:
+                    worker.close(wait_ms / 1000.0)
+                elif not worker._alive:
+                    self._peer_done(worker)     # 크래시 후 멈춰 있던 워커
+                else:
+                    worker.stop()
+                continue
+            worker.stop()
+            thread.quit()
+            if wait_ms:
+                thread.wait(wait_ms)
+
+    # ── 워커 프로세스 상태 / 재시작 ─────────────────────
+    def _all_workers(self) -> "list":
+        workers = [self._worker] if self._worker is not None else []
+        return workers + [w for _, w in self._peers.values()]
+
+    def _on_worker_crashed(self, code: int):
+        """자식 프로세스가 finished 없이 종료 → 매크로 실행 중이면 자동 재기동."""
+        worker = self.sender()
+        idx = worker._instance.index if worker._instance is not None else 0
+        self._append_log(f"[{now()}] [#{idx + 1}] 워커 프로세스 비정상 종료 (code {code})", "error")
+        if not self.btn_stop.isEnabled():
+            self._finish_worker(worker)
+        elif load_config().get("worker_auto_restart", True):
+            self._respawn_worker(worker)
+        else:
+            self._update_status("워커 중단됨 → [워커 재시작]", RED)
+
+    def _respawn_worker(self, worker: WorkerProcess):
+        with bind_instance(worker._instance):
+            ingame = image_exists("14.인게임체크.png", background=True)
+        self._append_log(f"[{now()}] 워커 재시작 ({'인게임' if ingame else '처음부터'})", "warn")
+        worker.restart(ingame=ingame)
+
+    def _finish_worker(self, worker):
+        if worker is self._worker:
+            self._on_worker_finished()
+        else:
+            self._peer_done(worker)
+
+    def _restart_workers(self):
+        """[워커 재시작] 중단된 워커는 재기동, 응답 없는(하트비트 10초 초과) 워커는 강제 종료 → 재기동."""
+        for w in self._all_workers():
+            if not isinstance(w, WorkerProcess):
+                continue
+            h = w.health()
+            if not h["alive"]:
+                self._respawn_worker(w)
+            elif h["hb_age"] is not None and h["hb_age"] > 10.0:
+                self._append_log(f"[{now()}] 워커 응답 없음 (PID {h['pid']}) → 강제 종료", "warn")
+                w.kill()
+
+    def _update_worker_health(self):
+        procs = [w for w in self._all_workers() if isinstance(w, WorkerProcess)]
+        self.btn_worker_restart.setEnabled(bool(procs))
+        if not procs:
+            self.lbl_worker_health.setText("스레드 모드" if self._worker is not None else "대기")
+            return
+        parts = []
+        for w in procs:
+            h   = w.health()
+            tag = f"#{w._instance.index + 1} " if w._instance is not None else ""
+            if h["alive"]:
+                stale = h["hb_age"] is not None and h["hb_age"] > 3.0
+                parts.append(f"{tag}PID {h['pid']} {'⚠ 응답없음' if stale else '정상'}"
+                             f" {h['hb_age']:.1f}s · 재시작 {h['restarts']}")
+            else:
+                parts.append(f"{tag}중단됨 (code {h['exitcode']})")
+        self.lbl_worker_health.setText("  |  ".join(parts))
+
+        # 최신 워커 프레임 썸네일 (공유 메모리 뷰 → 축소본만 복사)
+        got = procs[0].latest_frame()
+        if got is None:
+            return
+        _, view = got
+        fmt = QImage.Format_Grayscale8 if view.ndim == 2 else QImage.Format_BGR888
+        img = QImage(view.data, view.shape[1], view.shape[0], view.strides[0], fmt)
+        thumb = img.scaled(self.lbl_worker_frame.size(), Qt.KeepAspectRatio, Qt.FastTransformation)
+        del img, view
+        self.lbl_worker_frame.setPixmap(QPixmap.fromImage(thumb))
+
+    def _on_client_cpu(self, d: dict):
+        """클라이언트별 CPU 비용 표시 + 이 PC 의 예상 수용 클라이언트 수."""
+        self._client_cpu[d["index"]] = d
+        parts, costs = [], []
+        for i in sorted(self._client_cpu):
+            c = self._client_cpu[i]
+            war3 = c["war3_pct"]
+            parts.append(f"#{i + 1} {c['worker_pct']:.1f}%"
+                         + (f"+{war3:.0f}%" if war3 is not None else ""))
+            costs.append(c["worker_pct"] + (war3 or 0.0))
+        text = "CPU(매크로+War3, 코어 기준) " + " · ".join(parts)
+        per = sum(costs) / len(costs) if costs else 0.0
+        if per > 0:
+            cap = int((os.cpu_count() or 1) * 100.0 * 0.8 / per)
+            text += f"  → 예상 수용 {cap}개"
+        self.lbl_client_cpu.setText(text)
+
+    # ── 재접속 분석 ─────────────────────────────────
+    def _on_trace_cycle(self, cyc):
+        self._trace_cycles.insert(0, cyc)
+        del self._trace_cycles[20:]
+        self.cmb_trace_cycle.blockSignals(True)
+        self.cmb_trace_cycle.clear()
+        for c in self._trace_cycles:
+            mark = "" if c.ok else " (미완료)"
+            self.cmb_trace_cycle.addItem(
+                f"{c.started_at.strftime('%H:%M:%S')}  {c.name}  {c.total:.1f}s{mark}")
+        self.cmb_trace_cycle.blockSignals(False)
+        self.cmb_trace_cycle.setCurrentIndex(0)
+        self._show_trace_cycle(0)
+
+    def _show_trace_cycle(self, idx: int):
+        if not (0 <= idx < len(self._trace_cycles)):
+            self.tbl_trace.setRowCount(0)
+            return
+        cyc   = self._trace_cycles[idx]
+        total = cyc.total or 1e-9
+        rows  = cyc.breakdown()
+        self.tbl_trace.setRowCount(len(rows))
+        for r, (depth, name, dur) in enumerate(rows):
+            it_name = QTableWidgetItem("    " * depth + name)
+            it_dur  = QTableWidgetItem(f"{dur:.2f}")
+            it_pct  = QTableWidgetItem(f"{dur / total * 100:.0f}%")
+            it_dur.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            it_pct.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            if depth == 1 and dur / total >= 0.3:
+                it_name.setForeground(QColor(YELLOW))
+            self.tbl_trace.setItem(r, 0, it_name)
+            self.tbl_trace.setItem(r, 1, it_dur)
+            self.tbl_trace.setItem(r, 2, it_pct)
+        self.lbl_trace_path.setText(cyc.path or "")
 
     def _on_overlay_match(self, cx: int, cy: int, tw: int, th: int):
         if self.btn_overlay_toggle.isChecked():
@@ -3731,8 +4071,14 @@ class MainWindow(QMainWindow):
 
     def _on_worker_finished(self):
         thread = self._thread
+        inst   = self._worker._instance if self._worker else None
+        if isinstance(self._worker, WorkerProcess):
+            self._worker.close()
         self._thread = None
         self._worker = None
+        if inst is not None:
+            release_war3(inst)
+            self._client_cpu.pop(inst.index, None)
         if thread:
             thread.quit()
             thread.wait(500)   # 스레드가 완전히 종료될 때까지 대기 (최대 0.5초)
@@ -3744,13 +4090,15 @@ class MainWindow(QMainWindow):
             self._pending_recovery = False
             self._append_log(f"[{now()}] JNLoader 재실행 중...", "warn")
             if self._launch_jnloader():
-                self._start_worker()
+                self._start_worker(instance=War3Instance(inst.index) if inst is not None else None)
             else:
                 self._append_log(f"[{now()}] JNLoader 실행 실패 → 매크로 중지", "error")
+                self._stop_peers()
                 self.btn_start.setEnabled(True)
                 self.btn_stop.setEnabled(False)
                 self._update_status("중지됨", TEXT_DIM)
         else:
+            self._stop_peers()   # #1 종료 = 매크로 종료 (다중 클라이언트 포함)
             self.btn_start.setEnabled(True)
             self.btn_stop.setEnabled(False)
             self._update_status("중지됨", TEXT_DIM)
@@ -4066,6 +4414,9 @@ class MainWindow(QMainWindow):
     def _stop(self):
         self._war3_gone_ticks = 0
         self._pending_recovery = False
+        self._stop_peers()
+        if isinstance(self._worker, WorkerProcess) and not self._worker._alive:
+            self._on_worker_finished()      # 크래시 후 멈춰 있던 워커 → 바로 정리
         if self._worker:
             self._worker.stop()
         if self._thread:
@@ -4225,7 +4576,10 @@ class MainWindow(QMainWindow):
         self._war3_monitor.stop()
         self._stop_hotkey_listener()
         self._stop_admin_save_listener()
-        if self._worker:
+        self._stop_peers(wait_ms=2000)
+        if isinstance(self._worker, WorkerProcess):
+            self._worker.close(2.0)
+        elif self._worker:
             self._worker.stop()
         if self._thread:
             self._thread.quit()
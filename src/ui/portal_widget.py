@@ -94,6 +94,7 @@ class PortalBossPanel(QWidget):
         self._lbl_timer_sec:      "QLabel | None"    = None
         self._lbl_timer_desc:     "QLabel | None"    = None
         self._lbl_priority_desc:  "QLabel | None"    = None
+        self._led_hp_region:      "QLineEdit | None" = None
         self._build_ui()
 
     # ── 설정 키 헬퍼 ──────────────────────────────────
@@ -212,6 +213,30 @@ class PortalBossPanel(QWidget):
         _lbl_no_return_desc.setStyleSheet(f"color:{TEXT_DIM}; font-size:11px;")
         lay.addWidget(_lbl_no_return_desc)
 
+        # ── 보스 HP 바 영역 (전역 설정: 화면 배치는 포탈과 무관) ──
+        hp_row = QHBoxLayout()
+        hp_row.setSpacing(6)
+
+        _lbl_hp = QLabel("보스 HP 바 영역:")
+        _lbl_hp.setStyleSheet(f"color:{YELLOW}; font-weight:bold;")
+        hp_row.addWidget(_lbl_hp)
+
+        self._led_hp_region = QLineEdit(self._fmt_region(cfg.get("boss_hp_region")))
+        self._led_hp_region.setFixedWidth(150)
+        self._led_hp_region.setPlaceholderText("x0,y0,x1,y1")
+        self._led_hp_region.setStyleSheet(
+            f"background:{DARK_PANEL}; border:1px solid {DARK_BORDER};"
+            f"border-radius:4px; padding:2px 6px; color:{TEXT};"
+        )
+        self._led_hp_region.editingFinished.connect(self._on_hp_region_edited)
+        hp_row.addWidget(self._led_hp_region)
+        hp_row.addStretch()
+        lay.addLayout(hp_row)
+
+        _lbl_hp_desc = QLabel("  └─ 1920×1080 기준 선택 유닛 HP 바 좌표. 설정시 HP 0% 즉시 종료·정체시 전투 포기 (비우면 끔)")
+        _lbl_hp_desc.setStyleSheet(f"color:{TEXT_DIM}; font-size:11px;")
+        lay.addWidget(_lbl_hp_desc)
+
         # ── 시그널 연결 ──
         for cfg_key, chk in self._boss_chks:
             chk.stateChanged.connect(
@@ -274,6 +299,10 @@ class PortalBossPanel(QWidget):
         if not self._boss_chks:
             return
 
+        # HP 바 영역은 포탈 공용 키 — 다른 패널에서 바꾼 값 반영
+        if self._led_hp_region and not self._led_hp_region.hasFocus():
+            self._led_hp_region.setText(self._fmt_region(load_config().get("boss_hp_region")))
+
         any_boss       = any(chk.isChecked() for _, chk in self._boss_chks)
         timer_on       = self._chk_boss_timer.isChecked() if self._chk_boss_timer else False
         timer_field_on = any_boss and timer_on
@@ -344,6 +373,27 @@ class PortalBossPanel(QWidget):
         save_config({**load_config(), self._k("boss_timer_sec"): val})
         self.boss_state_changed.emit()
 
+    @staticmethod
+    def _fmt_region(region) -> str:
+        return ",".join(str(v) for v in region) if region else ""
+
+    @staticmethod
+    def _parse_region(txt: str) -> "list[int] | None":
+        """"x0,y0,x1,y1" → [x0, y0, x1, y1]. 빈 값·형식 오류·뒤집힌 좌표는 None (HP 추적 끔)."""
+        try:
+            vals = [int(v) for v in txt.replace(" ", "").split(",")]
+        except ValueError:
+            return None
+        if len(vals) != 4 or vals[0] >= vals[2] or vals[1] >= vals[3] or min(vals) < 0:
+            return None
+        return vals
+
+    def _on_hp_region_edited(self):
+        region = self._parse_region(self._led_hp_region.text())
+        self._led_hp_region.setText(self._fmt_region(region))
+        save_config({**load_config(), "boss_hp_region": region})
+        self.boss_state_changed.emit()
+
 
 # ── 포탈 설정 데이터 ──────────────────────────────────────
 PORTAL_CONFIGS: "list[PortalConfig]" = [
@@ -1,51 +1,108 @@
 """
-utils/chat.py — 인게임 채팅 전송 유틸 (standalone)
+utils/chat.py — 통합 채팅 전송 API (전송 경로별 지연 측정·순위·자동 폴백) + 채팅 디스패처 (전용 스레드 + 큐)
 """
+import collections
 import ctypes
 import ctypes.wintypes
+import threading
 import time
 from typing import Callable, Optional
 
 from src.core.input import (
     _user32, _KBD_INPUT,
-    _KEYEVENTF_KEYUP,
-    _VK_RETURN, _VK_CONTROL, _VK_V,
-    _press_vk, type_string, press_enter,
+    _KEYEVENTF_KEYUP, _KEYEVENTF_UNICODE,
+    _VK_RETURN, _VK_CONTROL, _VK_ESCAPE, _VK_V,
+    _press_vk, type_string,
 )
-from src.utils.process import find_war3_hwnd
+from src.utils.process import War3Instance, bind_instance, current_instance, find_war3_hwnd
 
 
-def send_ingame_chat(text: str, log: "Optional[Callable]" = None):
-    """Enter → 텍스트 입력 → Enter 로 인게임 채팅 전송."""
-    hwnd = find_war3_hwnd()
-    if hwnd:
-        _user32.SetForegroundWindow(hwnd)
-        time.sleep(0.1)
-    if log:
-        log(f"채팅 입력: {text}", "info")
-    _press_vk(_VK_RETURN); time.sleep(0.1)
-    _press_vk(_VK_RETURN, keyup=True); time.sleep(0.2)
-    type_string(text)
-    time.sleep(0.1)
-    _press_vk(_VK_RETURN); time.sleep(0.02)
-    _press_vk(_VK_RETURN, keyup=True)
-    if log:
-        log(f"채팅 전송 완료: {text}", "success")
+# ══════════════════════════════════════════════════
+#  전송 경로 (hwnd, text, hide) → 입력 여부
+#  False 는 "아무것도 입력하지 않음" 일 때만 (창 전환 실패 등) → 라우터가 다음 경로로 폴백
+# ══════════════════════════════════════════════════
+def _focus(hwnd: int, timeout: float = 1.0) -> bool:
+    """War3 창을 전면으로 (입력 기반 경로의 전제 조건)."""
+    _user32.SetForegroundWindow(hwnd)
+    deadline = time.perf_counter() + timeout
+    while _user32.GetForegroundWindow() != hwnd:
+        if time.perf_counter() >= deadline:
+            return False
+        time.sleep(0.02)
+    return True
 
 
-def send_chat_fast(text: str, log: "Optional[Callable]" = None):
-    """클립보드 붙여넣기 방식으로 빠르게 채팅 커맨드 전송."""
-    import win32clipboard
-    hwnd = find_war3_hwnd()
-    if not hwnd:
-        if log:
-            log("[채팅] WC3 창 없음", "warn")
-        return
-    win32clipboard.OpenClipboard()
-    win32clipboard.EmptyClipboard()
-    win32clipboard.SetClipboardText(text, win32clipboard.CF_UNICODETEXT)
-    win32clipboard.CloseClipboard()
-    _user32.SetForegroundWindow(hwnd)
+def set_clipboard(text: str) -> bool:
+    """클립보드에 유니코드 텍스트 기록. 다른 프로세스가 점유 중이면 짧게 재시도 후 False."""
+    try:
+        import win32clipboard
+    except ImportError:
+        return False
+    for _ in range(5):
+        try:
+            win32clipboard.OpenClipboard()
+        except Exception:
+            time.sleep(0.01)
+            continue
+        try:
+            win32clipboard.EmptyClipboard()
+            win32clipboard.SetClipboardText(text, win32clipboard.CF_UNICODETEXT)
+            return True
+        except Exception:
+            return False
+        finally:
+            win32clipboard.CloseClipboard()
+    return False
+
+
+def _send_batch(events: "list[tuple[int, int, int]]"):
+    """(vk, scan, flags) 목록을 SendInput 1회로 전송."""
+    arr = (_KBD_INPUT * len(events))()
+    for i, (vk, scan, flags) in enumerate(events):
+        ctypes.memset(ctypes.byref(arr[i]), 0, ctypes.sizeof(_KBD_INPUT))
+        arr[i].type       = 1  # INPUT_KEYBOARD
+        arr[i].ki.wVk     = vk
+        arr[i].ki.wScan   = scan if scan or not vk else _user32.MapVirtualKeyW(vk, 0)
+        arr[i].ki.dwFlags = flags
+    _user32.SendInput(len(events), arr, ctypes.sizeof(_KBD_INPUT))
+
+
+def _tx_memory(hwnd: int, text: str, hide: bool) -> bool:
+    """WriteProcessMemory 로 EditBox 기록 후 Enter (창 비활성이어도 동작, hide 지원)."""
+    from src.utils.memory import send_chat_memory
+    return send_chat_memory(hwnd, text, hide=hide)[0]
+
+
+def _tx_unicode(hwnd: int, text: str, hide: bool) -> bool:
+    """Enter↓↑ + 문자별 KEYEVENTF_UNICODE↓↑ + Enter↓↑ 단일 SendInput 배치 (한글 포함)."""
+    if not _focus(hwnd):
+        return False
+    events = [(_VK_RETURN, 0, 0), (_VK_RETURN, 0, _KEYEVENTF_KEYUP)]
+    for ch in text:
+        events.append((0, ord(ch), _KEYEVENTF_UNICODE))
+        events.append((0, ord(ch), _KEYEVENTF_UNICODE | _KEYEVENTF_KEYUP))
+    events += [(_VK_RETURN, 0, 0), (_VK_RETURN, 0, _KEYEVENTF_KEYUP)]
+    _send_batch(events)
+    return True
+
+
+def _tx_paste(hwnd: int, text: str, hide: bool) -> bool:
+    """클립보드 + Enter → Ctrl+V → Enter 단일 SendInput 배치."""
+    if not set_clipboard(text) or not _focus(hwnd):
+        return False
+    _send_batch([
+        (_VK_RETURN,  0, 0), (_VK_RETURN,  0, _KEYEVENTF_KEYUP),
+        (_VK_CONTROL, 0, 0), (_VK_V,       0, 0),
+        (_VK_V,       0, _KEYEVENTF_KEYUP), (_VK_CONTROL, 0, _KEYEVENTF_KEYUP),
+        (_VK_RETURN,  0, 0), (_VK_RETURN,  0, _KEYEVENTF_KEYUP),
+    ])
+    return True
+
+
+def _tx_paste_keys(hwnd: int, text: str, hide: bool) -> bool:
+    """클립보드 + 키 단위 입력 (사이 대기 포함 — 배치 입력을 놓치는 환경용)."""
+    if not set_clipboard(text) or not _focus(hwnd):
+        return False
     time.sleep(0.05)
     _press_vk(_VK_RETURN);              time.sleep(0.02)
     _press_vk(_VK_RETURN, keyup=True);  time.sleep(0.05)
@@ -55,40 +112,373 @@ def send_chat_fast(text: str, log: "Optional[Callable]" = None):
     _press_vk(_VK_CONTROL, keyup=True); time.sleep(0.05)
     _press_vk(_VK_RETURN);              time.sleep(0.02)
     _press_vk(_VK_RETURN, keyup=True)
+    return True
+
+
+def _tx_typing(hwnd: int, text: str, hide: bool) -> bool:
+    """Enter → 자모 타이핑 → Enter (가장 느리지만 클립보드·유니코드 입력 불가 환경에서도 동작)."""
+    if not _focus(hwnd):
+        return False
+    time.sleep(0.1)
+    _press_vk(_VK_RETURN); time.sleep(0.1)
+    _press_vk(_VK_RETURN, keyup=True); time.sleep(0.2)
+    type_string(text)
+    time.sleep(0.1)
+    _press_vk(_VK_RETURN); time.sleep(0.02)
+    _press_vk(_VK_RETURN, keyup=True)
+    return True
+
+
+# hide=True 로 보낼 수 있는 경로 (창 전환·채팅창 노출 없음). 나머지는 _focus() 로 War3 를 전면에 띄운다
+HIDDEN_TRANSPORTS: "frozenset[str]" = frozenset({"memory"})
+
+# 이름 → (전송 함수, 측정 전 기본 지연 ms). 기본 순서 = 나열 순서
+TRANSPORTS: "dict[str, tuple[Callable, float]]" = {
+    "memory":  (_tx_memory,      60.0),
+    "unicode": (_tx_unicode,     80.0),
+    "paste":   (_tx_paste,      120.0),
+    "keys":    (_tx_paste_keys, 250.0),
+    "typing":  (_tx_typing,     700.0),
+}
+
+
+# ══════════════════════════════════════════════════
+#  통합 API (순위 + 폴백 + 검증)
+# ══════════════════════════════════════════════════
+class _PathStats:
+    __slots__ = ("ok", "fail", "latency")
+
+    def __init__(self, history: int):
+        self.ok   = 0
+        self.fail = 0
+        self.latency: "collections.deque[float]" = collections.deque(maxlen=history)
+
+    def rate(self) -> float:
+        return (self.ok + 1) / (self.ok + self.fail + 2)   # 라플라스 보정 (미측정 = 0.5)
+
+    def pct(self, p: float) -> "float | None":
+        if not self.latency:
+            return None
+        lat = sorted(self.latency)
+        return lat[min(len(lat) - 1, int(len(lat) * p))] * 1000
+
+
+class ChatRouter:
+    """여러 채팅 전송 경로 중 측정된 성공률·지연이 가장 좋은 경로부터 시도, 실패 시 다음 경로.
+
+    검증: 메모리 채팅창 플래그가 verify_timeout 안에 닫혀야 성공 (열린 채 남으면 실패 → ESC 로 정리).
+    메모리를 읽을 수 없으면 verify(text) 콜백 (화면 확인 등), 그것도 없으면 경로 결과를 신뢰.
+    폴백은 경로가 아무것도 입력하지 못했을 때만 — 입력 후 검증 실패·예외는 명령이 이미 전송됐을 수
+    있으므로 다른 경로로 재전송하지 않고 실패 반환. hide=True 는 HIDDEN_TRANSPORTS 경로만 사용.
+    """
+
+    def __init__(self, transports: "dict[str, tuple[Callable, float]] | None" = None,
+                 verify_timeout: float = 0.3, history: int = 100):
+        self._transports = dict(transports or TRANSPORTS)
+        self._stats = {name: _PathStats(history) for name in self._transports}
+        self._lock  = threading.Lock()
+        self.verify_timeout = verify_timeout
+
+    def ranking(self, names: "list[str] | None" = None) -> "list[str]":
+        """시도 순서: 성공률(0.1 단위) 높은 순 → p50 지연 짧은 순 (미측정은 기본 지연)."""
+        names = [n for n in (names or self._transports) if n in self._transports]
+        with self._lock:
+            def _key(n):
+                st = self._stats[n]
+                return (-round(st.rate(), 1), st.pct(0.5) or self._transports[n][1])
+            return sorted(names, key=_key)
+
+    def send(self, text: str, hide: bool = False, hwnd: "int | None" = None,
+             verify: "Callable[[str], bool | None] | None" = None,
+             transports: "list[str] | None" = None) -> "tuple[bool, str]":
+        hwnd = hwnd or find_war3_hwnd()
+        if not hwnd:
+            return False, "[채팅] WC3 창 없음"
+        names = self.ranking(transports)
+        if hide:
+            # 입력 기반 경로는 SetForegroundWindow 로 War3 를 전면에 띄우므로 숨김 전송 불가
+            names = [n for n in names if n in HIDDEN_TRANSPORTS]
+            if not names:
+                return False, f"[채팅] 숨김 전송 가능한 경로 없음: {text}"
+        tried = []
+        for name in names:
+            fn = self._transports[name][0]
+            t0 = time.perf_counter()
+            try:
+                sent: "bool | None" = bool(fn(hwnd, text, hide))
+            except Exception:
+                sent = None   # 어디까지 입력됐는지 모름
+            ok = bool(sent) and self._verify(hwnd, text, verify) is not False
+            dt = time.perf_counter() - t0
+            with self._lock:
+                st = self._stats[name]
+                if ok:
+                    st.ok += 1
+                    st.latency.append(dt)
+                else:
+                    st.fail += 1
+            if ok:
+                return True, f"[채팅] 전송 ({name}, {dt * 1000:.0f}ms): {text}"
+            tried.append(name)
+            if sent is not False:
+                return False, f"[채팅] 전송 확인 실패 ({' → '.join(tried)}, 중복 방지로 재전송 안 함): {text}"
+        return False, f"[채팅] 전송 실패 ({' → '.join(tried)}): {text}"
+
+    def _verify(self, hwnd: int, text: str, verify) -> "bool | None":
+        closed = _chat_closed(hwnd, self.verify_timeout)
+        if closed is False:
+            _user32.PostMessageW(hwnd, 0x100, _VK_ESCAPE, 0)   # 열린 채팅창 정리
+            _user32.PostMessageW(hwnd, 0x101, _VK_ESCAPE, 0)
+            return False
+        if closed is None and verify is not None:
+            return verify(text)
+        return closed
+
+    def stats(self) -> "dict[str, dict]":
+        with self._lock:
+            return {n: {"ok": st.ok, "fail": st.fail,
+                        "p50_ms": st.pct(0.50), "p95_ms": st.pct(0.95)}
+                    for n, st in self._stats.items()}
+
+
+def _chat_closed(hwnd: int, timeout: float) -> "bool | None":
+    """채팅창 플래그가 timeout 안에 닫히면 True, 열린 채면 False, 메모리 읽기 불가면 None."""
+    pm = None
+    try:
+        from src.utils.memory import acquire_session, release_session
+        pm = acquire_session(hwnd)
+        base = pm.game_base
+        if not base:
+            return None
+        deadline = time.perf_counter() + timeout
+        while pm.read_int(base + 0xD04FEC):
+            if time.perf_counter() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+    except Exception:
+        return None
+    finally:
+        if pm is not None:
+            release_session(pm)
+
+
+_router = ChatRouter()
+
+
+def send_chat(text: str, hide: bool = False, hwnd: "int | None" = None,
+              verify: "Callable[[str], bool | None] | None" = None,
+              transports: "list[str] | None" = None) -> "tuple[bool, str]":
+    """채팅 전송 (가장 빠른 경로부터 자동 폴백). (ok, 메시지) 반환."""
+    return _router.send(text, hide=hide, hwnd=hwnd, verify=verify, transports=transports)
+
+
+def transport_stats() -> "dict[str, dict]":
+    """경로별 성공/실패 횟수와 p50/p95 지연 (ms, 미측정 None)."""
+    return _router.stats()
+
+
+def transport_ranking() -> "list[str]":
+    return _router.ranking()
+
+
+# ── 기존 개별 전송 함수 (경로 고정) ──────────────────────
+def send_ingame_chat(text: str, log: "Optional[Callable]" = None):
+    """Enter → 텍스트 입력 → Enter 로 인게임 채팅 전송."""
+    if log:
+        log(f"채팅 입력: {text}", "info")
+    ok, msg = send_chat(text, transports=["typing"])
     if log:
-        log(f"[채팅] 전송: {text}", "success")
+        log(msg, "success" if ok else "warn")
+
+
+def send_chat_fast(text: str, log: "Optional[Callable]" = None):
+    """클립보드 붙여넣기 방식으로 빠르게 채팅 커맨드 전송."""
+    ok, msg = send_chat(text, transports=["keys"])
+    if log:
+        log(msg, "success" if ok else "warn")
 
 
 def send_chat_instant(text: str, log: "Optional[Callable]" = None):
     """배치 SendInput으로 딜레이 없이 채팅 커맨드 전송."""
-    import win32clipboard
-    hwnd = find_war3_hwnd()
-    if not hwnd:
-        if log:
-            log("[채팅] WC3 창 없음", "warn")
-        return
-    win32clipboard.OpenClipboard()
-    win32clipboard.EmptyClipboard()
-    win32clipboard.SetClipboardText(text, win32clipboard.CF_UNICODETEXT)
-    win32clipboard.CloseClipboard()
-    _user32.SetForegroundWindow(hwnd)
-    events = [
-        (_VK_RETURN,  0),
-        (_VK_RETURN,  _KEYEVENTF_KEYUP),
-        (_VK_CONTROL, 0),
-        (_VK_V,       0),
-        (_VK_V,       _KEYEVENTF_KEYUP),
-        (_VK_CONTROL, _KEYEVENTF_KEYUP),
-        (_VK_RETURN,  0),
-        (_VK_RETURN,  _KEYEVENTF_KEYUP),
-    ]
-    arr = (_KBD_INPUT * len(events))()
-    for i, (vk, flags) in enumerate(events):
-        ctypes.memset(ctypes.byref(arr[i]), 0, ctypes.sizeof(_KBD_INPUT))
-        arr[i].type       = 1
-        arr[i].ki.wVk     = vk
-        arr[i].ki.wScan   = _user32.MapVirtualKeyW(vk, 0)
-        arr[i].ki.dwFlags = flags
-    _user32.SendInput(len(events), arr, ctypes.sizeof(_KBD_INPUT))
+    ok, msg = send_chat(text, transports=["paste"])
     if log:
-        log(f"[채팅] 즉시 전송: {text}", "success")
+        log(msg, "success" if ok else "warn")
+
+
+# ══════════════════════════════════════════════════
+#  채팅 디스패처 (동일 명령 병합, 메시지별 지연 기록)
+# ══════════════════════════════════════════════════
+class ChatTicket:
+    """전송 요청 1건. wait() 로 결과 (ok, 메시지) 대기, 또는 add_done_callback() 으로 완료 통지."""
+
+    __slots__ = ("text", "hide", "hwnd", "queued_at", "latency", "result", "_done", "_cb_lock", "_callbacks")
+
+    def __init__(self, text: str, hide: bool, hwnd: "int | None"):
+        self.text      = text
+        self.hide      = hide
+        self.hwnd      = hwnd
+        self.queued_at = time.perf_counter()
+        self.latency: "float | None" = None       # 큐 적재 → 전송 완료 (초)
+        self.result: "tuple[bool, str] | None" = None
+        self._done     = threading.Event()
+        self._cb_lock  = threading.Lock()
+        self._callbacks: "list[Callable[[ChatTicket], None]]" = []
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def add_done_callback(self, fn: "Callable[[ChatTicket], None]"):
+        """완료 시 fn(ticket) 호출 (디스패처 스레드에서). 이미 완료됐으면 즉시 호출.
+        블로킹 없이 결과를 받아야 하는 스케줄러 콜백용 — fn 은 짧게 유지."""
+        with self._cb_lock:
+            if not self._done.is_set():
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def _finish(self, result: "tuple[bool, str]"):
+        self.result = result
+        with self._cb_lock:
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            try:
+                fn(self)
+            except Exception:
+                pass
+
+    def wait(self, timeout: "float | None" = None) -> "tuple[bool, str]":
+        if not self._done.wait(timeout):
+            return False, f"[채팅] 전송 대기 시간 초과: {self.text}"
+        return self.result
+
+
+class ChatDispatcher:
+    """채팅 전송 전용 스레드 1개 (War3 인스턴스당).
+
+    - submit(): 큐에 넣고 즉시 반환. 대기 중이거나 전송 중인 같은 (텍스트, hide, hwnd) 요청이 있으면
+      그 티켓을 돌려준다 (예: -save 연타 → 1회 전송, send() 시간 초과 후 재시도 → 진행 중 전송 결과 공유)
+    - send(): submit + 완료 대기
+    - close(): 대기 중 요청은 실패 처리, 전송 중인 요청이 끝나면 스레드 종료
+    - 전송은 send_chat() (경로 순위·폴백), send_fn(text, hide=, hwnd=) 로 교체 가능
+    """
+
+    def __init__(self, instance: "War3Instance | None" = None, send_fn=None, history: int = 200):
+        self._instance = instance
+        self._send_fn  = send_fn or send_chat
+        self._pending: "collections.deque[ChatTicket]" = collections.deque()
+        self._inflight: "ChatTicket | None" = None   # 전송 중인 요청
+        self._cond     = threading.Condition()
+        self._latency: "collections.deque[float]" = collections.deque(maxlen=history)
+        self.sent      = 0
+        self.failed    = 0
+        self.coalesced = 0
+        self._closed   = False
+        self._thread   = threading.Thread(target=self._loop, name="chat-dispatch", daemon=True)
+        self._thread.start()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def submit(self, text: str, hide: bool = False, hwnd: "int | None" = None) -> ChatTicket:
+        with self._cond:
+            if self._closed:
+                ticket = ChatTicket(text, hide, hwnd)
+                ticket._finish((False, f"[채팅] 디스패처 종료됨: {text}"))
+                return ticket
+            cur = self._inflight
+            for t in ([cur] if cur is not None else []) + list(self._pending):
+                if t.text == text and t.hide == hide and t.hwnd == hwnd:
+                    self.coalesced += 1
+                    return t
+            ticket = ChatTicket(text, hide, hwnd)
+            self._pending.append(ticket)
+            self._cond.notify()
+            return ticket
+
+    def send(self, text: str, hide: bool = False, hwnd: "int | None" = None,
+             timeout: float = 3.0) -> "tuple[bool, str]":
+        return self.submit(text, hide, hwnd).wait(timeout)
+
+    def stats(self) -> dict:
+        lat = sorted(self._latency)
+
+        def _pct(p: float) -> float:
+            return lat[min(len(lat) - 1, int(len(lat) * p))] * 1000 if lat else 0.0
+        return {"sent": self.sent, "failed": self.failed, "coalesced": self.coalesced,
+                "pending": len(self._pending),
+                "p50_ms": _pct(0.50), "p95_ms": _pct(0.95), "max_ms": lat[-1] * 1000 if lat else 0.0}
+
+    def close(self, timeout: "float | None" = 5.0):
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            dropped = list(self._pending)
+            self._pending.clear()
+            self._cond.notify_all()
+        for t in dropped:
+            t._finish((False, f"[채팅] 디스패처 종료로 전송 취소: {t.text}"))
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def _loop(self):
+        with bind_instance(self._instance):
+            while True:
+                with self._cond:
+                    while not self._pending and not self._closed:
+                        self._cond.wait()
+                    if self._closed:
+                        return
+                    ticket = self._pending.popleft()
+                    self._inflight = ticket            # 전송 끝날 때까지 같은 요청은 이 티켓에 병합
+                try:
+                    result = self._send_fn(ticket.text, hide=ticket.hide, hwnd=ticket.hwnd)
+                except Exception as e:
+                    result = (False, f"[채팅] 전송 실패: {e}")
+                ticket.latency = time.perf_counter() - ticket.queued_at
+                if result[0]:
+                    self.sent += 1
+                    self._latency.append(ticket.latency)
+                else:
+                    self.failed += 1
+                with self._cond:
+                    self._inflight = None
+                ticket._finish(result)
+
+
+# ── 인스턴스별 디스패처 ─────────────────────────────
+_dispatchers: "dict[int | None, ChatDispatcher]" = {}
+_disp_lock = threading.Lock()
+
+
+def chat_dispatcher(instance: "War3Instance | None" = None) -> ChatDispatcher:
+    """인스턴스(없으면 현재 바인딩) 의 디스패처. 첫 호출 시 시작, close_dispatcher() 까지 유지.
+    같은 번호라도 인스턴스 객체가 바뀌면 (War3 재시작 후 새 War3Instance) 새 디스패처로 교체 —
+    스레드가 해제된 옛 인스턴스(pid=None)에 묶여 있으면 창을 찾지 못한다."""
+    inst = instance if instance is not None else current_instance()
+    key = inst.index if inst is not None else None
+    stale = None
+    with _disp_lock:
+        d = _dispatchers.get(key)
+        if d is None or d.closed or d._instance is not inst:
+            stale = d
+            d = _dispatchers[key] = ChatDispatcher(inst)
+    if stale is not None:
+        stale.close(timeout=0)   # 전송 중인 요청은 끝까지 보내고 스스로 종료
+    return d
+
+
+def close_dispatcher(instance: "War3Instance | None" = None):
+    """인스턴스의 디스패처 종료 (워커 종료 시). 다른 인스턴스 객체가 이미 교체했으면 그대로 둔다."""
+    inst = instance if instance is not None else current_instance()
+    key = inst.index if inst is not None else None
+    with _disp_lock:
+        d = _dispatchers.get(key)
+        if d is None or d._instance is not inst:
+            return
+        del _dispatchers[key]
+    d.close()
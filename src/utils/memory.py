@@ -2,63 +2,358 @@
 utils/memory.py — PyMem 게임 메모리 패치 유틸
 """
 import ctypes
+import json
 import os
 import stat
 import struct as _struct
+import threading
 import time as _time
 import winreg
 
 import pymem
+import pymem.exception
 import pymem.process
 
+from src.utils.config import _exe_dir
+from src.utils.memreader import MemoryReader, ProcessBackend, walk_chain, hop_chain, is_node
+from src.utils.process import current_instance, hwnd_pid, war3_pids
+
 
 _DELAY_PATTERN = bytes([0xC0, 0xD6, 0xDB, 0x68, 0xC0])
 
 # ── 채팅 EditBox 패턴 (OpenCirnix Message.cs 기준) ─────────────────────────────
 _CHAT_PATTERN = bytes([0x94, 0x28, 0x49, 0x65, 0x94])
 _HIDE_PATTERN = bytes([0xB0, 0x32, 0x5B, 0x2C, 0xB0])
-_chat_edit_box_cache: "int | None" = None   # storm_base + 0x58280 체인 (안정적, 캐시)
-_storm_base_cache: "int | None" = None
-_game_base_cache:  "int | None" = None
+_OSTCP_PATTERN = bytes([0x4C, 0x7F, 0x65, 0x07, 0x4C])   # 방 정보 (+0x340 = 인원 수)
 
+# 알려진 storm.dll 포인터 체인: 이름 → (오프셋, 시그니처)
+CHAINS = {
+    "chat":    (0x58280, _CHAT_PATTERN),
+    "hide":    (0x582F0, _HIDE_PATTERN),
+    "delay":   (0x58330, _DELAY_PATTERN),
+    "players": (0x58160, _OSTCP_PATTERN),
+}
 
-def _bring(pm, addr: int, size: int) -> "bytes | None":
-    """OpenCirnix Bring() 재현: VirtualProtectEx(0x40) → ReadProcessMemory → 복원.
-    실행 전용(PAGE_EXECUTE) 등 보호된 메모리 노드도 읽을 수 있도록 보호 변경."""
-    kernel32 = ctypes.windll.kernel32
-    old = ctypes.c_ulong(0)
-    kernel32.VirtualProtectEx(pm.process_handle, ctypes.c_void_p(addr),
-                               size, 0x40, ctypes.byref(old))
-    try:
-        buf = pm.read_bytes(addr, size)
-    except Exception:
-        buf = None
-    kernel32.VirtualProtectEx(pm.process_handle, ctypes.c_void_p(addr),
-                               size, old, ctypes.byref(ctypes.c_ulong(0)))
-    return buf
+# ── 포인터 체인 깊이 캐시 (storm.dll 빌드별, 파일 저장) ───────────────────────
+CHAIN_CACHE_FILE = os.path.join(_exe_dir(), "pointer_chains.json")
+_chain_lock   = threading.Lock()
+_chain_depths: "dict[str, dict[str, int]] | None" = None   # {빌드: {"오프셋:시그니처": 깊이}}
+
+
+def _chain_key(offset: int, signature: bytes) -> str:
+    return f"{offset:X}:{signature.hex()}"
 
 
-def _follow_pointer(pm, offset: int, signature: bytes) -> "int | None":
-    """OpenCirnix FollowPointer() 재현: offset에서 4바이트 역참조 후 시그니처 체인 탐색."""
-    buf = _bring(pm, offset, 4)
-    if not buf:
+def _chain_depth(build: "str | None", offset: int, signature: bytes) -> "int | None":
+    global _chain_depths
+    if build is None:
         return None
-    ptr = int.from_bytes(buf, "little")
-    for _ in range(2000):
-        if ptr == 0:
-            return None
-        data = _bring(pm, ptr, 4 + len(signature))
-        if not data:
+    with _chain_lock:
+        if _chain_depths is None:
+            try:
+                with open(CHAIN_CACHE_FILE, "r", encoding="utf-8") as f:
+                    _chain_depths = json.load(f)
+            except (OSError, ValueError):
+                _chain_depths = {}
+        return _chain_depths.get(build, {}).get(_chain_key(offset, signature))
+
+
+def _save_chain_depth(build: "str | None", offset: int, signature: bytes, depth: int):
+    if build is None or _chain_depth(build, offset, signature) == depth:
+        return
+    with _chain_lock:
+        _chain_depths.setdefault(build, {})[_chain_key(offset, signature)] = depth
+        tmp = CHAIN_CACHE_FILE + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(_chain_depths, f, indent=2)
+            os.replace(tmp, CHAIN_CACHE_FILE)
+        except OSError:
+            pass
+
+
+# ══════════════════════════════════════════════════
+#  War3 메모리 세션 (pid 당 1개 공유 attach)
+# ══════════════════════════════════════════════════
+class War3Session:
+    """War3 프로세스 1개에 대한 공유 attach. 핸들·모듈 베이스·EditBox 노드를 캐시.
+
+    - 읽기는 여러 스레드에서 동시에 호출해도 된다 (ReadProcessMemory 는 핸들 공유 안전)
+    - 소비자는 acquire_session() / release_session() 으로 임대(lease) → 핸들은 마지막 보유자가 닫는다
+    - 읽기 실패 시 호출 측이 drop_session() → 캐시만 stale 처리 (재attach 는 pid 변경·프로세스 종료 시에만)
+    - pymem.Pymem 과 같은 read_*/write_bytes/process_handle 모양 → 기존 헬퍼에 그대로 전달
+    """
+
+    def __init__(self, pid: int):
+        self.pm = pymem.Pymem()
+        self.pm.open_process_from_id(pid)
+        self.pid            = pid
+        self.process_handle = self.pm.process_handle
+        self.reader         = MemoryReader(ProcessBackend(self.process_handle))
+        self._modules: "dict[str, int]" = {}
+        self._nodes: "dict[tuple[int, bytes], int]" = {}   # (storm 오프셋, 시그니처) → 노드 주소
+        self._build: "str | None" = None
+        self.chain_hits     = 0   # 캐시 노드 검증 통과
+        self.chain_walks    = 0   # 전체 체인 탐색
+        self.attached_at    = _time.monotonic()
+        self.reads          = 0
+        self._read_total    = 0.0
+        self._read_max      = 0.0
+        self._leases        = 0       # 보유 중인 임대 수 (_sessions_lock 보호)
+        self._retired       = False   # 레지스트리에서 빠짐 → 임대가 0 이 되면 닫음
+        self._closed        = False
+
+    # ── 모듈 베이스 ──────────────────────────────
+    def module_base(self, name: str) -> "int | None":
+        """모듈 베이스 (찾은 값만 캐시 → 로드 전 attach 면 다음 호출에서 재탐색)."""
+        base = self._modules.get(name)
+        if base is None:
+            for mod in pymem.process.enum_process_module(self.process_handle):
+                self._modules.setdefault(os.path.basename(mod.name).lower(), int(mod.lpBaseOfDll))
+            base = self._modules.get(name)
+        return base
+
+    @property
+    def storm_base(self) -> "int | None":
+        return self.module_base("storm.dll")
+
+    @property
+    def game_base(self) -> "int | None":
+        return self.module_base("game.dll")
+
+    def build_id(self) -> "str | None":
+        """storm.dll 빌드 식별자 (PE TimeDateStamp + SizeOfImage). 패치되면 바뀐다."""
+        if self._build is None and self.storm_base is not None:
+            try:
+                e_lfanew = _struct.unpack_from("<I", self.read_bytes(self.storm_base + 0x3C, 4))[0]
+                nt = self.read_bytes(self.storm_base + e_lfanew, 0x54)
+                stamp, size = _struct.unpack_from("<I", nt, 8)[0], _struct.unpack_from("<I", nt, 0x50)[0]
+                self._build = f"{stamp:08X}-{size:X}"
+            except Exception:
+                return None
+        return self._build
+
+    # ── 포인터 체인 ──────────────────────────────
+    def resolve_chain(self, offset: int, signature: bytes) -> "int | None":
+        """storm_base+offset 연결 리스트에서 signature 노드 주소.
+
+        1) 캐시된 노드에 signature 가 그대로 있으면 즉시 반환 (읽기 1회)
+        2) 저장된 빌드별 깊이가 있으면 그 깊이까지 따라간 뒤 검증
+        3) 둘 다 실패하면 전체 탐색 → 깊이 저장
+        탐색은 페이지 선읽기(reader.paged) — 보호 변경은 읽을 수 없는 페이지에만.
+        """
+        read = self.reader.read
+        key  = (offset, signature)
+        node = self._nodes.get(key)
+        if node is not None and is_node(read, node, signature):
+            self.chain_hits += 1
+            return node
+        storm = self.storm_base
+        if storm is None:
             return None
-        if data[4:4 + len(signature)] == signature:
-            return ptr
-        ptr = int.from_bytes(data[:4], "little")
-    return None
+        build = self.build_id()
+        depth = _chain_depth(build, offset, signature)
+        node  = None
+        if depth is not None:
+            node = hop_chain(self.reader.paged(), storm + offset, depth)
+            if node is not None and not is_node(read, node, signature):
+                node = None
+        if node is None:
+            self.chain_walks += 1
+            node, depth = walk_chain(self.reader.paged(), storm + offset, signature)
+            if node is not None:
+                _save_chain_depth(build, offset, signature, depth)
+        if node is None:
+            self._nodes.pop(key, None)
+        else:
+            self._nodes[key] = node
+        return node
+
+    # ── 읽기/쓰기 ────────────────────────────────
+    def _timed(self, fn, *args):
+        t0 = _time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            dt = _time.perf_counter() - t0
+            self.reads       += 1          # 통계는 근사치 (잠금 없음)
+            self._read_total += dt
+            if dt > self._read_max:
+                self._read_max = dt
+
+    def read_bytes(self, addr: int, size: int) -> bytes:
+        return self._timed(self.pm.read_bytes, addr, size)
+
+    def read_int(self, addr: int) -> int:
+        return self._timed(self.pm.read_int, addr)
+
+    def read_uint(self, addr: int) -> int:
+        return self._timed(self.pm.read_uint, addr)
+
+    def read_ints(self, addrs: "list[int]") -> "list[int | None]":
+        """여러 int32 를 묶음 읽기 (인접 주소는 ReadProcessMemory 1회로 병합)."""
+        out = self.reader.read_many([(a, 4) for a in addrs])
+        return [int.from_bytes(b, "little", signed=True) if b else None for b in out]
+
+    def dump_chains(self, path: str, names: "list[str] | None" = None) -> dict:
+        """알려진 포인터 체인이 지나는 메모리 페이지를 덤프 파일로 저장 (리눅스 벤치·테스트용).
+        meta 에 체인 head·시그니처·찾은 노드를 기록. meta 반환."""
+        rec = MemoryReader(self.reader.backend, record=True)
+        storm = self.storm_base
+        chains = []
+        for name in names or list(CHAINS):
+            offset, sig = CHAINS[name]
+            node, depth = walk_chain(rec.paged(), storm + offset, sig)
+            chains.append({"name": name, "head": storm + offset, "signature": sig.hex(),
+                           "node": node, "depth": depth})
+        meta = {"pid": self.pid, "storm_base": storm, "build": self.build_id(),
+                "captured": _time.strftime("%Y-%m-%d %H:%M:%S"), "chains": chains}
+        rec.save(path, meta)
+        return meta
+
+    def write_bytes(self, addr: int, data: bytes, size: int):
+        self.pm.write_bytes(addr, data, size)
+
+    # ── 수명 ──────────────────────────────────────
+    def alive(self) -> bool:
+        if self._closed:
+            return False
+        code = ctypes.c_ulong(0)
+        ok = ctypes.windll.kernel32.GetExitCodeProcess(self.process_handle, ctypes.byref(code))
+        return bool(ok) and code.value == 259   # STILL_ACTIVE
+
+    def invalidate(self):
+        """캐시(모듈 베이스·체인 노드·빌드) 를 stale 처리. 핸들은 그대로 → 다음 읽기에서 재탐색."""
+        self._modules.clear()
+        self._nodes.clear()
+        self._build = None
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.pm.close_process()
+        except Exception:
+            pass
+
+    def stats(self) -> dict:
+        return {
+            "pid":         self.pid,
+            "reads":       self.reads,
+            "read_avg_us": self._read_total / self.reads * 1e6 if self.reads else 0.0,
+            "read_max_us": self._read_max * 1e6,
+            "chain_hits":  self.chain_hits,
+            "chain_walks": self.chain_walks,
+            **{f"reader_{k}": v for k, v in self.reader.stats().items()},
+            "age_s":       _time.monotonic() - self.attached_at,
+        }
+
+
+_sessions: "dict[int, War3Session]" = {}
+_sessions_lock = threading.Lock()
+_default_pid: "int | None" = None   # 인스턴스 바인딩 없는 호출 (단일 클라이언트) 이 쓰는 pid
+_attaches = 0                       # 누적 attach 횟수 (재접속·War3 재시작 포함)
+
+
+def war3_session(hwnd: "int | None" = None) -> War3Session:
+    """War3 메모리 세션. hwnd → 그 창의 프로세스, 아니면 현재 바인딩된 인스턴스의 pid,
+    둘 다 없으면 (단일 클라이언트) 첫 War3.exe. 같은 pid 면 기존 세션을 재사용하고
+    pid 가 바뀌었거나 프로세스가 종료된 경우에만 다시 attach 한다.
+    임대 없이 반환 → 짧은 단발 조회용. 읽기·쓰기 도중 핸들이 닫히면 안 되면 acquire_session()."""
+    return _session(hwnd, lease=False)
+
+
+def acquire_session(hwnd: "int | None" = None) -> War3Session:
+    """war3_session() + 임대 1개. release_session() 과 짝 (try/finally)."""
+    return _session(hwnd, lease=True)
+
+
+def release_session(s: "War3Session | None"):
+    """임대 반납. 이미 폐기된 세션이면 마지막 보유자가 핸들을 닫는다."""
+    if s is None:
+        return
+    with _sessions_lock:
+        s._leases -= 1
+        if s._retired and s._leases <= 0:
+            s.close()
+
+
+def _session(hwnd: "int | None", lease: bool) -> War3Session:
+    pid = hwnd_pid(hwnd) if hwnd else None
+    if not pid:
+        inst = current_instance()
+        if inst is not None:
+            if inst.pid is None:
+                raise pymem.exception.ProcessNotFound("War3 인스턴스 미배정")
+            pid = inst.pid
+    with _sessions_lock:
+        s = _lookup_locked(hwnd, pid)
+        if lease:
+            s._leases += 1
+        return s
+
+
+def _lookup_locked(hwnd: "int | None", pid: "int | None") -> War3Session:
+    global _default_pid, _attaches
+    s = _sessions.get(pid or _default_pid)
+    if s is not None:
+        if s.alive():
+            return s
+        _retire_locked(s)
+    if not pid:
+        pids = war3_pids()
+        if not pids:
+            raise pymem.exception.ProcessNotFound("War3.exe")
+        pid = pids[0]
+        s = _sessions.get(pid)
+        if s is not None and s.alive():
+            _default_pid = pid
+            return s
+    s = War3Session(pid)
+    _attaches += 1
+    _sessions[pid] = s
+    if hwnd is None and current_instance() is None:
+        _default_pid = pid
+    return s
+
+
+def _retire_locked(s: War3Session):
+    """레지스트리에서 제거. 임대 중이면 닫기는 마지막 release_session() 으로 미룬다."""
+    if _sessions.get(s.pid) is s:
+        del _sessions[s.pid]
+    s._retired = True
+    if s._leases <= 0:
+        s.close()
+
+
+def drop_session(s: "War3Session | None"):
+    """읽기 실패·캐시 오염 시 호출. 프로세스가 살아 있으면 캐시만 stale 처리하고
+    공유 핸들은 유지 (다른 소비자 보호), 종료됐으면 폐기 → 다음 war3_session() 에서 재attach."""
+    if s is None:
+        return
+    with _sessions_lock:
+        if s.alive():
+            s.invalidate()
+        else:
+            _retire_locked(s)
+
+
+def session_stats() -> dict:
+    """attach 횟수 + 세션별 읽기 횟수·지연."""
+    with _sessions_lock:
+        return {"attaches": _attaches, "sessions": [s.stats() for s in _sessions.values()]}
+
 
+def _bring(pm: War3Session, addr: int, size: int) -> "bytes | None":
+    """OpenCirnix Bring() 재현. 보호된(PAGE_EXECUTE 등) 페이지만 VirtualProtectEx(0x40) →
+    ReadProcessMemory → 복원, 이미 읽을 수 있는 페이지는 바로 읽는다 (ProcessBackend)."""
+    return pm.reader.read(addr, size)
 
-def _find_hide_offset(pm, storm_base: int) -> "int | None":
-    """OpenCirnix GetTargetReceiveStatus() — 매 호출마다 체인 재탐색 (주소 동적 변경)."""
-    node = _follow_pointer(pm, storm_base + 0x582F0, _HIDE_PATTERN)
+
+def _find_hide_offset(pm: War3Session) -> "int | None":
+    """OpenCirnix GetTargetReceiveStatus() — 주소가 동적으로 바뀌므로 매 호출 검증 (불일치 시 재탐색)."""
+    node = pm.resolve_chain(*CHAINS["hide"])
     if node is None:
         return None
     target = node + 0x2A8
@@ -68,77 +363,94 @@ def _find_hide_offset(pm, storm_base: int) -> "int | None":
     return target
 
 
+_CHAT_OPEN_TIMEOUT  = 0.2    # Enter 후 채팅창 열림 플래그 대기 한도 (초)
+_CHAT_CLOSE_TIMEOUT = 0.1    # 전송 Enter 후 닫힘 플래그 대기 한도 (초)
+_CHAT_SETTLE        = 0.01   # 열림 감지 후 히스토리 초기화가 끝나도록 두는 여유 (초)
+
+
+def _wait_chat_flag(is_open, want: bool, timeout: float) -> bool:
+    """채팅창 열림 플래그가 want 가 될 때까지 2ms 간격 폴링. 도달하면 True."""
+    deadline = _time.perf_counter() + timeout
+    while True:
+        if is_open() == want:
+            return True
+        if _time.perf_counter() >= deadline:
+            return False
+        _time.sleep(0.002)
+
+
 def send_chat_memory(hwnd: int, text: str, hide: bool = False) -> "tuple[bool, str]":
     """WC3 채팅 EditBox에 WriteProcessMemory로 직접 UTF-8 텍스트 쓰기 후 Enter 전송.
     hide=True 시 OpenCirnix MessageHide() 방식으로 채팅창 UI를 숨기고 전송."""
-    global _chat_edit_box_cache, _storm_base_cache, _game_base_cache
     user32 = ctypes.windll.user32
     pm = None
+    posted = False   # 전송 Enter 를 보냈는지 (이후 예외는 전송된 것으로 취급 → 재전송 방지)
     try:
-        pm = pymem.Pymem("War3.exe")
-
-        # 모듈 베이스 캐시 (storm + game 동시)
-        if _storm_base_cache is None or _game_base_cache is None:
-            for mod in pymem.process.enum_process_module(pm.process_handle):
-                name = os.path.basename(mod.name).lower()
-                if name == "storm.dll":
-                    _storm_base_cache = int(mod.lpBaseOfDll)
-                elif name == "game.dll":
-                    _game_base_cache = int(mod.lpBaseOfDll)
-        if _storm_base_cache is None:
+        pm = acquire_session(hwnd)
+        game_base = pm.game_base
+        if pm.storm_base is None:
             return False, "[채팅] storm.dll 미발견"
 
-        # EditBox 캐시 탐색 (_follow_pointer 사용)
-        if _chat_edit_box_cache is None:
-            node = _follow_pointer(pm, _storm_base_cache + 0x58280, _CHAT_PATTERN)
-            if node is None:
-                return False, "[채팅] EditBox 패턴 미발견"
-            _chat_edit_box_cache = node
+        # EditBox 노드 (세션 캐시 → 시그니처 검증, 불일치 시 재탐색)
+        edit_box = pm.resolve_chain(*CHAINS["chat"])
+        if edit_box is None:
+            return False, "[채팅] EditBox 패턴 미발견"
 
         # OpenCirnix ApplyChat(TryHide) 흐름 재현:
-        # 채팅창 열기 → hide 선적용(flash 최소화) → 50ms 대기 → 텍스트 기록 → MessageHide() → 전송
+        # 채팅창 열기 → hide 선적용(flash 최소화) → 열림 대기 → 텍스트 기록 → MessageHide() → 전송
         def _is_chat_open():
-            if _game_base_cache is None:
+            if game_base is None:
                 return False
             try:
-                return bool(pm.read_int(_game_base_cache + 0xD04FEC))
+                return bool(pm.read_int(game_base + 0xD04FEC))
             except Exception:
                 return False
 
-        if not _is_chat_open():
+        # 첫 확인은 메모리 상태 퍼블리셔 스냅샷 재사용 (0.1초 이내 값일 때만)
+        from src.utils.memstate import running_publisher
+        pub = running_publisher()
+        st  = pub.fresh(0.1) if pub is not None and pub.snapshot().pid == pm.pid else None
+        if not (st.chat_open if st is not None else _is_chat_open()):
             user32.PostMessageW(hwnd, 0x100, 13, 0)
             user32.PostMessageW(hwnd, 0x101, 13, 0)
             if hide:
                 # 채팅창 렌더링 전에 선제적으로 hide 적용 → 화면 노출 최소화
-                _pre = _find_hide_offset(pm, _storm_base_cache)
+                _pre = _find_hide_offset(pm)
                 if _pre is not None:
                     pm.write_bytes(_pre, bytes([0x7F, 0, 0, 0]), 4)
             # WC3가 채팅창을 열고 히스토리로 EditBox를 초기화할 때까지 대기
             # hide 여부와 무관하게 반드시 필요 — 없으면 히스토리에 덮어씌워짐
-            _time.sleep(0.05)
+            # (고정 50ms 대신 열림 플래그 폴링 + 짧은 여유, game.dll 미확인 시 기존 50ms)
+            if game_base is None:
+                _time.sleep(0.05)
+            else:
+                _wait_chat_flag(_is_chat_open, True, _CHAT_OPEN_TIMEOUT)
+                _time.sleep(_CHAT_SETTLE)
 
         # 텍스트를 버퍼에 직접 기록
-        # ★ 반드시 채팅창 open + 50ms 대기 이후에 써야 함:
+        # ★ 반드시 채팅창 open 이후에 써야 함:
         #   WC3는 채팅창을 열 때 마지막 커맨드 히스토리로 EditBox를 덮어쓰는데,
         #   open 전에 쓰면 그 히스토리에 덮어쓰여 엉뚱한 텍스트가 전송된다.
-        msg_offset = _chat_edit_box_cache + 0x88
+        msg_offset = edit_box + 0x88
         encoded = text.encode("utf-8") + b"\x00"
         pm.write_bytes(msg_offset, encoded, len(encoded))
 
         if hide:
             # 주소가 동적으로 변경되므로 전송 직전에 재탐색 후 재적용
-            hide_offset = _find_hide_offset(pm, _storm_base_cache)
+            hide_offset = _find_hide_offset(pm)
             if hide_offset is not None:
                 pm.write_bytes(hide_offset, bytes([0x7F, 0, 0, 0]), 4)
 
         user32.PostMessageW(hwnd, 0x100, 13, 0)
         user32.PostMessageW(hwnd, 0x101, 13, 0)
-        _time.sleep(0.05)
+        posted = True
 
         # 전송 후에도 채팅창이 열려있으면 강제 닫기 (hide 재적용 후 Enter)
-        if _is_chat_open():
+        if game_base is None:
+            _time.sleep(0.05)
+        if not _wait_chat_flag(_is_chat_open, False, _CHAT_CLOSE_TIMEOUT):
             if hide:
-                hide_offset2 = _find_hide_offset(pm, _storm_base_cache)
+                hide_offset2 = _find_hide_offset(pm)
                 if hide_offset2 is not None:
                     pm.write_bytes(hide_offset2, bytes([0x7F, 0, 0, 0]), 4)
             user32.PostMessageW(hwnd, 0x100, 13, 0)
@@ -146,16 +458,12 @@ def send_chat_memory(hwnd: int, text: str, hide: bool = False) -> "tuple[bool, s
 
         return True, f"채팅 전송: {text}"
     except Exception as e:
-        _chat_edit_box_cache = None
-        _storm_base_cache = None
-        _game_base_cache = None
+        drop_session(pm)
+        if posted:
+            return True, f"채팅 전송 (닫기 확인 실패: {e}): {text}"
         return False, f"[채팅] 전송 실패: {e}"
     finally:
-        if pm is not None:
-            try:
-                pm.close_process()
-            except Exception:
-                pass
+        release_session(pm)
 
 _WAR3_PREF_PATH = os.path.join(
     os.path.expandvars("%USERPROFILE%"),
@@ -182,33 +490,15 @@ def write_game_delay(delay: int) -> "tuple[bool, str]":
         return False, f"[경고] 딜레이 범위 오류: {delay} (0~550)"
     pm = None
     try:
-        pm = pymem.Pymem("War3.exe")
-        storm_base = None
-        for mod in pymem.process.enum_process_module(pm.process_handle):
-            if os.path.basename(mod.name).lower() == "storm.dll":
-                storm_base = int(mod.lpBaseOfDll)
-                break
+        pm = acquire_session()
+        storm_base = pm.storm_base
         if storm_base is None:
             return False, "[경고] storm.dll 을 찾을 수 없습니다."
 
-        ptr = pm.read_uint(storm_base + 0x58330)
-        if ptr == 0:
+        if pm.read_uint(storm_base + CHAINS["delay"][0]) == 0:
             return False, "[경고] 딜레이 포인터 체인 시작점이 0"
 
-        offset = None
-        for _ in range(2000):
-            try:
-                data = pm.read_bytes(ptr, 4 + len(_DELAY_PATTERN))
-            except Exception:
-                break
-            if data[4:4 + len(_DELAY_PATTERN)] == _DELAY_PATTERN:
-                offset = ptr
-                break
-            next_ptr = int.from_bytes(data[:4], "little")
-            if next_ptr == 0:
-                break
-            ptr = next_ptr
-
+        offset = pm.resolve_chain(*CHAINS["delay"])
         if offset is None:
             return False, "[경고] 딜레이 패턴을 찾지 못했습니다."
 
@@ -220,38 +510,28 @@ def write_game_delay(delay: int) -> "tuple[bool, str]":
 
         return True, f"딜레이 직접 적용 완료: {delay}ms"
     except Exception as e:
+        drop_session(pm)
         return False, f"[오류] 딜레이 설정 실패: {e}"
     finally:
-        if pm is not None:
-            try:
-                pm.close_process()
-            except Exception:
-                pass
+        release_session(pm)
 
 
 def write_start_speed_zero() -> "tuple[bool, str]":
     """StartDelay 를 0.01f 로 설정 (항상 0). (ok, 메시지) 반환."""
     pm = None
     try:
-        pm = pymem.Pymem("War3.exe")
-        game_base = None
-        for mod in pymem.process.enum_process_module(pm.process_handle):
-            if os.path.basename(mod.name).lower() == "game.dll":
-                game_base = int(mod.lpBaseOfDll)
-                break
+        pm = acquire_session()
+        game_base = pm.game_base
         if game_base is None:
             return False, "[경고] game.dll 을 찾을 수 없습니다."
 
         _mem_patch(pm, game_base + 0x324146, _struct.pack("<f", 0.01))
         return True, "시작속도 0 설정 완료 (!ss 0)"
     except Exception as e:
+        drop_session(pm)
         return False, f"[오류] 시작속도 설정 실패: {e}"
     finally:
-        if pm is not None:
-            try:
-                pm.close_process()
-            except Exception:
-                pass
+        release_session(pm)
 
 
 def _set_pref_writable():
@@ -0,0 +1,324 @@
+"""
+utils/memreader.py — 묶음 메모리 읽기 (범위 병합·페이지 선읽기·보호 변경 최소화) + 덤프 파일 백엔드
+
+    python -m src.utils.memreader info  DUMP
+    python -m src.utils.memreader bench DUMP [--repeat N]
+"""
+import argparse
+import ctypes
+import json
+import struct
+import sys
+import time
+
+PAGE = 0x1000
+
+_READABLE = 0x02 | 0x04 | 0x08 | 0x20 | 0x40 | 0x80   # READONLY·READWRITE·WRITECOPY·EXECUTE_READ(WRITE/WRITECOPY)
+_NO_READ  = 0x01 | 0x100                              # NOACCESS · GUARD
+
+
+def _readable(protect: int) -> bool:
+    return bool(protect & _READABLE) and not (protect & _NO_READ)
+
+
+# ══════════════════════════════════════════════════
+#  백엔드
+# ══════════════════════════════════════════════════
+class _MBI(ctypes.Structure):
+    _fields_ = [
+        ("BaseAddress",       ctypes.c_void_p),
+        ("AllocationBase",    ctypes.c_void_p),
+        ("AllocationProtect", ctypes.c_ulong),
+        ("RegionSize",        ctypes.c_size_t),
+        ("State",             ctypes.c_ulong),
+        ("Protect",           ctypes.c_ulong),
+        ("Type",              ctypes.c_ulong),
+    ]
+
+
+class ProcessBackend:
+    """실제 프로세스 (ReadProcessMemory). 페이지 보호는 VirtualQueryEx 로 조회·캐시하고
+    읽을 수 없는 페이지에만 VirtualProtectEx → 읽기 → 복원 (OpenCirnix Bring)."""
+
+    def __init__(self, handle: int):
+        self._k32    = ctypes.WinDLL("kernel32", use_last_error=True)
+        self._handle = handle
+        self._regions: "list[tuple[int, int, int]]" = []   # (base, end, protect)
+        self.protect_changes = 0
+
+    def _protect_of(self, addr: int) -> "int | None":
+        for base, end, prot in self._regions:
+            if base <= addr < end:
+                return prot
+        mbi = _MBI()
+        if not self._k32.VirtualQueryEx(self._handle, ctypes.c_void_p(addr),
+                                        ctypes.byref(mbi), ctypes.sizeof(mbi)):
+            return None
+        base = mbi.BaseAddress or 0
+        self._regions.append((base, base + mbi.RegionSize, mbi.Protect))
+        if len(self._regions) > 256:
+            del self._regions[:128]
+        return mbi.Protect
+
+    def _rpm(self, addr: int, size: int) -> "bytes | None":
+        buf = ctypes.create_string_buffer(size)
+        got = ctypes.c_size_t(0)
+        ok = self._k32.ReadProcessMemory(self._handle, ctypes.c_void_p(addr), buf, size, ctypes.byref(got))
+        return buf.raw[:got.value] if ok and got.value == size else None
+
+    def read(self, addr: int, size: int) -> "bytes | None":
+        prot = self._protect_of(addr)
+        if prot is not None and _readable(prot) and _readable(self._protect_of(addr + size - 1) or 0):
+            data = self._rpm(addr, size)
+            if data is not None:
+                return data
+            self._regions.clear()    # 보호가 바뀌었을 수 있음 → 다음 조회에서 갱신
+        # 보호 페이지: 잠시 PAGE_EXECUTE_READWRITE 로 바꿔 읽고 복원
+        old = ctypes.c_ulong(0)
+        if not self._k32.VirtualProtectEx(self._handle, ctypes.c_void_p(addr), size, 0x40, ctypes.byref(old)):
+            return None
+        self.protect_changes += 1
+        try:
+            return self._rpm(addr, size)
+        finally:
+            self._k32.VirtualProtectEx(self._handle, ctypes.c_void_p(addr), size, old,
+                                       ctypes.byref(ctypes.c_ulong(0)))
+
+    def regions(self, addr: int, size: int) -> "list[tuple[int, int, int]]":
+        """[addr, addr+size) 와 겹치는 보호 구간 (덤프 기록용)."""
+        self._protect_of(addr)
+        return [r for r in self._regions if r[0] < addr + size and addr < r[1]]
+
+
+class DumpBackend:
+    """캡처한 메모리 스냅샷 (save_dump 형식). 리눅스에서도 체인 탐색 벤치·검증 가능."""
+
+    def __init__(self, regions: "list[tuple[int, bytes]]", meta: "dict | None" = None):
+        self._regions = sorted(regions)
+        self.meta = meta or {}
+        self.protect_changes = 0
+
+    @classmethod
+    def load(cls, path: str) -> "DumpBackend":
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"덤프 파일 아님: {path}")
+            (mlen,) = struct.unpack("<I", f.read(4))
+            meta = json.loads(f.read(mlen).decode("utf-8"))
+            regions = []
+            while True:
+                hdr = f.read(_REGION.size)
+                if len(hdr) < _REGION.size:
+                    break
+                base, size = _REGION.unpack(hdr)
+                regions.append((base, f.read(size)))
+        return cls(regions, meta)
+
+    def read(self, addr: int, size: int) -> "bytes | None":
+        for base, data in self._regions:
+            if base <= addr and addr + size <= base + len(data):
+                return data[addr - base:addr - base + size]
+        return None
+
+
+_MAGIC  = b"PNXMEM01"
+_REGION = struct.Struct("<QI")
+
+
+def save_dump(path: str, regions: "dict[int, bytes]", meta: "dict | None" = None):
+    """{페이지 주소: 바이트} 를 덤프 파일로 저장. 인접 페이지는 한 구간으로 합친다."""
+    merged: "list[list]" = []
+    for base in sorted(regions):
+        data = regions[base]
+        if merged and merged[-1][0] + len(merged[-1][1]) == base:
+            merged[-1][1] += data
+        else:
+            merged.append([base, bytearray(data)])
+    blob = json.dumps(meta or {}, ensure_ascii=False).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(_MAGIC)
+        f.write(struct.pack("<I", len(blob)))
+        f.write(blob)
+        for base, data in merged:
+            f.write(_REGION.pack(base, len(data)))
+            f.write(bytes(data))
+
+
+# ══════════════════════════════════════════════════
+#  묶음 읽기
+# ══════════════════════════════════════════════════
+class MemoryReader:
+    """백엔드 위의 읽기 계층.
+
+    - read(): 단건 (항상 새로 읽음)
+    - read_many(): 여러 (주소, 크기) 를 정렬·병합해 최소 횟수로 읽기 (상태 폴링용)
+    - paged(): 페이지 단위 선읽기 캐시를 쓰는 read 함수 (연결 리스트 탐색 1회 동안만 유효)
+    - record=True 면 읽은 페이지를 모아 save() 로 덤프 저장 (벤치·테스트용 스냅샷 캡처)
+    """
+
+    def __init__(self, backend, merge_gap: int = 64, record: bool = False):
+        self.backend   = backend
+        self.merge_gap = merge_gap
+        self.calls     = 0      # 백엔드 읽기 호출 수
+        self.bytes     = 0
+        self._record: "dict[int, bytes] | None" = {} if record else None
+
+    def _fetch(self, addr: int, size: int) -> "bytes | None":
+        self.calls += 1
+        data = self.backend.read(addr, size)
+        if data is not None:
+            self.bytes += size
+            if self._record is not None:
+                self._keep(addr, data)
+        return data
+
+    def _keep(self, addr: int, data: bytes):
+        # 덤프는 페이지 단위 → 걸친 페이지를 전부 다시 읽어 보관
+        first, last = addr & ~(PAGE - 1), (addr + len(data) - 1) & ~(PAGE - 1)
+        for page in range(first, last + PAGE, PAGE):
+            if page not in self._record:
+                whole = self.backend.read(page, PAGE)
+                if whole is not None:
+                    self._record[page] = whole
+
+    def read(self, addr: int, size: int) -> "bytes | None":
+        return self._fetch(addr, size)
+
+    def read_many(self, requests: "list[tuple[int, int]]") -> "list[bytes | None]":
+        """(주소, 크기) 목록 → 같은 순서의 결과. merge_gap 이내로 붙은 범위는 한 번에 읽는다.
+        병합 읽기가 실패하면 (보호 경계 등) 해당 묶음만 개별 읽기로 재시도."""
+        order = sorted(range(len(requests)), key=lambda i: requests[i][0])
+        out: "list[bytes | None]" = [None] * len(requests)
+        group: "list[int]" = []
+        g_start = g_end = 0
+
+        def _flush():
+            data = self._fetch(g_start, g_end - g_start) if len(group) > 1 else None
+            for i in group:
+                a, n = requests[i]
+                out[i] = data[a - g_start:a - g_start + n] if data is not None else self._fetch(a, n)
+
+        for i in order:
+            a, n = requests[i]
+            if group and a <= g_end + self.merge_gap:
+                g_end = max(g_end, a + n)
+            else:
+                if group:
+                    _flush()
+                group, g_start, g_end = [], a, a + n
+            group.append(i)
+        if group:
+            _flush()
+        return out
+
+    def paged(self):
+        """페이지 선읽기 read(addr, size) 함수. 노드가 같은 페이지에 몰린 연결 리스트는
+        페이지 1번 읽기로 여러 노드를 처리. 페이지 읽기 실패 시 해당 범위만 직접 읽는다."""
+        pages: "dict[int, bytes | None]" = {}
+
+        def _read(addr: int, size: int) -> "bytes | None":
+            base = addr & ~(PAGE - 1)
+            if addr + size > base + PAGE:
+                return self._fetch(addr, size)      # 페이지 경계 걸침
+            if base not in pages:
+                pages[base] = self._fetch(base, PAGE)
+            page = pages[base]
+            if page is None:
+                return self._fetch(addr, size)
+            return page[addr - base:addr - base + size]
+        return _read
+
+    def save(self, path: str, meta: "dict | None" = None):
+        save_dump(path, self._record or {}, meta)
+
+    def stats(self) -> dict:
+        return {"calls": self.calls, "bytes": self.bytes,
+                "protect_changes": getattr(self.backend, "protect_changes", 0)}
+
+
+# ══════════════════════════════════════════════════
+#  연결 리스트 탐색
+# ══════════════════════════════════════════════════
+def walk_chain(read, head: int, signature: bytes, max_nodes: int = 2000) -> "tuple[int | None, int]":
+    """OpenCirnix FollowPointer() 재현: head 에서 4바이트 역참조 후 시그니처 체인 탐색.
+    (노드 주소, 깊이) 반환 — 깊이 = head 가 가리키는 첫 노드부터 따라간 next 횟수."""
+    buf = read(head, 4)
+    if not buf:
+        return None, 0
+    ptr = int.from_bytes(buf, "little")
+    for depth in range(max_nodes):
+        if ptr == 0:
+            return None, depth
+        data = read(ptr, 4 + len(signature))
+        if not data:
+            return None, depth
+        if data[4:4 + len(signature)] == signature:
+            return ptr, depth
+        ptr = int.from_bytes(data[:4], "little")
+    return None, max_nodes
+
+
+def hop_chain(read, head: int, depth: int) -> "int | None":
+    """시그니처 비교 없이 depth 번 next 를 따라간 노드 주소 (저장된 깊이 재사용)."""
+    buf = read(head, 4)
+    if not buf:
+        return None
+    ptr = int.from_bytes(buf, "little")
+    for _ in range(depth):
+        if ptr == 0:
+            return None
+        buf = read(ptr, 4)
+        if not buf:
+            return None
+        ptr = int.from_bytes(buf, "little")
+    return ptr or None
+
+
+def is_node(read, node: int, signature: bytes) -> bool:
+    return read(node + 4, len(signature)) == signature
+
+
+# ── CLI (덤프 벤치) ─────────────────────────────────
+def _bench(dump: DumpBackend, repeat: int):
+    chains = dump.meta.get("chains", [])
+    if not chains:
+        print("덤프에 체인 정보(meta.chains) 없음")
+        return
+    for ch in chains:
+        head, sig = int(ch["head"]), bytes.fromhex(ch["signature"])
+        rows = []
+        for label, mk in (("노드별 읽기", lambda r: r.read), ("페이지 선읽기", lambda r: r.paged())):
+            t0 = time.perf_counter()
+            for _ in range(repeat):
+                r = MemoryReader(dump)
+                node, depth = walk_chain(mk(r), head, sig)
+            dt = (time.perf_counter() - t0) / repeat
+            rows.append((label, node, depth, r.calls, dt))
+        print(f"[{ch.get('name', hex(head))}] head=0x{head:X} sig={sig.hex()}")
+        for label, node, depth, calls, dt in rows:
+            found = f"0x{node:X}" if node is not None else "없음"
+            print(f"  {label:<8} 노드 {found} 깊이 {depth:>4}  읽기 {calls:>5}회  {dt * 1e6:8.1f}µs")
+
+
+def main(argv: "list[str] | None" = None) -> int:
+    ap = argparse.ArgumentParser(description="PyNOX 메모리 덤프 도구")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p_info = sub.add_parser("info", help="덤프 요약")
+    p_info.add_argument("dump")
+    p_bench = sub.add_parser("bench", help="덤프 위에서 포인터 체인 탐색 벤치")
+    p_bench.add_argument("dump")
+    p_bench.add_argument("--repeat", type=int, default=200)
+    a = ap.parse_args(argv)
+
+    dump = DumpBackend.load(a.dump)
+    if a.cmd == "info":
+        total = sum(len(d) for _, d in dump._regions)
+        print(f"구간 {len(dump._regions)}개, {total / 1024:.1f} KB")
+        print(json.dumps(dump.meta, ensure_ascii=False, indent=2))
+    else:
+        _bench(dump, a.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+utils/memstate.py — War3 메모리 상태 퍼블리셔 (채팅창·인게임·방 인원을 스레드 1개가 폴링해 공유)
+"""
+import threading
+import time
+from typing import Callable, NamedTuple
+
+from src.utils.config import load_config
+from src.utils.process import War3Instance, bind_instance, current_instance
+
+_CHAT_OPEN  = 0xD04FEC   # game.dll — 채팅 입력창 열림 (int)
+_GAME_STATE = 0xD32318   # game.dll — 상태 플래그 2개 (int×2, 4/4 또는 1/1 = 인게임)
+
+
+class MemState(NamedTuple):
+    """폴링 1회 결과. ok=False 면 메모리 읽기 실패 (War3 없음 등) → 나머지 값은 의미 없음."""
+    ok:           bool
+    chat_open:    bool
+    in_game:      "bool | None"
+    player_count: "int | None"   # 로비(방)에 있을 때만
+    pid:          "int | None"
+    t:            float          # time.monotonic()
+
+
+_EMPTY = MemState(False, False, None, None, None, 0.0)
+
+
+class MemStatePublisher:
+    """메모리 상태 폴링 스레드 1개 + 스냅샷 + 변경 알림.
+
+    - snapshot(): 마지막 상태 (잠금 없음, 비용 0)
+    - fresh(max_age): max_age 초 이내 성공한 상태만 (아니면 None → 호출 측이 템플릿 등으로 폴백)
+    - subscribe(fn): chat_open / in_game / player_count / ok 가 바뀔 때 fn(state) (폴링 스레드에서 호출)
+    - 폴링 간격: 로비·대기 중 fast, 인게임(사냥) 중 slow. boost() 로 잠시 fast 유지 (Enter 입력 등)
+    """
+
+    def __init__(self, instance: "War3Instance | None" = None,
+                 fast: "float | None" = None, slow: "float | None" = None):
+        cfg = load_config()
+        self._instance = instance
+        self.fast  = fast if fast is not None else cfg.get("memstate_fast_interval", 0.05)
+        self.slow  = slow if slow is not None else cfg.get("memstate_slow_interval", 0.25)
+        self._state = _EMPTY
+        self._subs: "tuple[Callable, ...]" = ()
+        self._lock  = threading.Lock()
+        self._wake  = threading.Event()
+        self._stop  = threading.Event()
+        self._boost_until = 0.0
+        self._thread: "threading.Thread | None" = None
+        self.polls   = 0
+        self.changes = 0
+        self._poll_total = 0.0
+
+    # ── 조회 ──────────────────────────────────────
+    def snapshot(self) -> MemState:
+        return self._state
+
+    def fresh(self, max_age: float = 0.5) -> "MemState | None":
+        st = self._state
+        if st.ok and time.monotonic() - st.t <= max_age:
+            return st
+        return None
+
+    def subscribe(self, fn: Callable) -> Callable[[], None]:
+        with self._lock:
+            self._subs = self._subs + (fn,)
+
+        def _unsubscribe():
+            with self._lock:
+                self._subs = tuple(f for f in self._subs if f is not fn)
+        return _unsubscribe
+
+    def boost(self, seconds: float = 2.0):
+        """seconds 동안 fast 간격으로 폴링 (곧 상태가 바뀔 것 같을 때)."""
+        self._boost_until = max(self._boost_until, time.monotonic() + seconds)
+        self._wake.set()
+
+    def stats(self) -> dict:
+        return {"polls": self.polls, "changes": self.changes,
+                "poll_avg_us": self._poll_total / self.polls * 1e6 if self.polls else 0.0}
+
+    # ── 수명 ──────────────────────────────────────
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="memstate", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(2.0)
+        self._thread = None
+
+    # ── 내부 ──────────────────────────────────────
+    def _loop(self):
+        with bind_instance(self._instance):
+            while not self._stop.is_set():
+                t0 = time.perf_counter()
+                st = self._poll()
+                self._poll_total += time.perf_counter() - t0
+                self.polls += 1
+                prev, self._state = self._state, st
+                if prev[:4] != st[:4]:
+                    self.changes += 1
+                    for fn in self._subs:
+                        try:
+                            fn(st)
+                        except Exception:
+                            pass
+                hunting = st.ok and st.in_game and time.monotonic() >= self._boost_until
+                self._wake.wait(self.slow if hunting else (self.fast if st.ok else 1.0))
+                self._wake.clear()
+
+    def _poll(self) -> MemState:
+        from src.utils.memory import CHAINS, acquire_session, drop_session, release_session
+        pm = None
+        try:
+            pm = acquire_session()
+            base = pm.game_base
+            if not base:
+                return _EMPTY._replace(pid=pm.pid, t=time.monotonic())
+            chat, a, b = pm.read_ints([base + _CHAT_OPEN, base + _GAME_STATE, base + _GAME_STATE + 4])
+            if chat is None or a is None:
+                return _EMPTY._replace(pid=pm.pid, t=time.monotonic())
+            in_game = (a == 4 and b == 4) or (a == 1 and b == 1)
+            count = None
+            if not in_game:
+                node = pm.resolve_chain(*CHAINS["players"])
+                if node is not None:
+                    (count,) = pm.read_ints([node + 0x340])
+            return MemState(True, bool(chat), in_game, count, pm.pid, time.monotonic())
+        except Exception:
+            drop_session(pm)
+            return _EMPTY._replace(t=time.monotonic())
+        finally:
+            release_session(pm)
+
+
+# ── 인스턴스별 공유 (참조 카운트) ──────────────────────
+_publishers: "dict[int | None, list]" = {}   # 인스턴스 index → [퍼블리셔, 참조 수]
+_pub_lock = threading.Lock()
+
+
+def acquire_publisher(instance: "War3Instance | None" = None) -> MemStatePublisher:
+    """인스턴스(없으면 현재 바인딩) 의 퍼블리셔를 시작/공유. release_publisher() 와 짝."""
+    inst = instance if instance is not None else current_instance()
+    key = inst.index if inst is not None else None
+    with _pub_lock:
+        entry = _publishers.get(key)
+        if entry is None:
+            entry = _publishers[key] = [MemStatePublisher(inst), 0]
+            entry[0].start()
+        entry[1] += 1
+        return entry[0]
+
+
+def running_publisher(instance: "War3Instance | None" = None) -> "MemStatePublisher | None":
+    """이미 실행 중인 퍼블리셔 (없으면 None — 새로 시작하지 않음)."""
+    inst = instance if instance is not None else current_instance()
+    entry = _publishers.get(inst.index if inst is not None else None)
+    return entry[0] if entry is not None else None
+
+
+def release_publisher(pub: "MemStatePublisher | None"):
+    if pub is None:
+        return
+    with _pub_lock:
+        for key, entry in list(_publishers.items()):
+            if entry[0] is pub:
+                entry[1] -= 1
+                if entry[1] <= 0:
+                    del _publishers[key]
+                    pub.stop()
+                return
@@ -1,14 +1,72 @@
 """
 utils/process.py — War3 프로세스/HWND 유틸
 """
+import contextlib
+import contextvars
 import ctypes
 import ctypes.wintypes
+import threading
 import time
+
+import psutil
 import win32gui
 
 
-def find_war3_hwnd() -> "int | None":
-    """Warcraft III 창 핸들 반환. 없으면 None."""
+# ── War3 인스턴스 (다중 클라이언트) ───────────────────────────────────────────
+class War3Instance:
+    """War3 클라이언트 1개 (pid + hwnd). 워커 1개가 인스턴스 1개를 담당.
+
+    pid 가 None 이면 아직 배정 전 → claim_war3() 가 다른 워커가 잡지 않은 War3 를 배정.
+    bind_instance() 로 묶인 스레드에서는 창·프로세스·메모리·캡처·입력이 이 인스턴스 기준.
+    """
+
+    __slots__ = ("index", "pid", "hwnd")
+
+    def __init__(self, index: int = 0, pid: "int | None" = None, hwnd: "int | None" = None):
+        self.index = index
+        self.pid   = pid
+        self.hwnd  = hwnd
+
+    def __repr__(self) -> str:
+        return f"War3Instance(#{self.index + 1}, pid={self.pid}, hwnd={self.hwnd})"
+
+
+# 현재 스레드(컨텍스트)에 묶인 인스턴스. clock.spawn / Scheduler 스레드로 상속된다.
+_current: "contextvars.ContextVar[War3Instance | None]" = contextvars.ContextVar("war3_instance", default=None)
+_claims_lock = threading.Lock()
+_claim_handles: "dict[int, int]" = {}   # pid → named mutex 핸들 (이 프로세스가 배정받은 War3)
+
+
+@contextlib.contextmanager
+def bind_instance(inst: "War3Instance | None"):
+    token = _current.set(inst)
+    try:
+        yield inst
+    finally:
+        _current.reset(token)
+
+
+def current_instance() -> "War3Instance | None":
+    return _current.get()
+
+
+def hwnd_pid(hwnd: int) -> int:
+    pid = ctypes.c_ulong(0)
+    ctypes.windll.user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+    return pid.value
+
+
+def war3_pids() -> "list[int]":
+    """실행 중인 War3.exe pid 목록 (pid 오름차순)."""
+    pids = []
+    for p in psutil.process_iter(['name']):
+        name = p.info.get('name') or ""
+        if name.lower() == 'war3.exe':
+            pids.append(p.pid)
+    return sorted(pids)
+
+
+def _war3_windows() -> "list[int]":
     found = []
 
     def _cb(hwnd, _):
@@ -19,7 +77,117 @@ def find_war3_hwnd() -> "int | None":
             found.append(hwnd)
 
     win32gui.EnumWindows(_cb, None)
-    return found[0] if found else None
+    return found
+
+
+def find_war3_instances() -> "list[War3Instance]":
+    """실행 중인 War3 클라이언트 목록 (창이 아직 없으면 hwnd=None)."""
+    by_pid: "dict[int, int]" = {}
+    for hwnd in _war3_windows():
+        by_pid.setdefault(hwnd_pid(hwnd), hwnd)
+    return [War3Instance(i, pid, by_pid.get(pid)) for i, pid in enumerate(war3_pids())]
+
+
+def _own(pid: int) -> bool:
+    """pid 전용 named mutex 생성 (_claims_lock 보유 상태). 이미 누가 잡았으면 False.
+    mutex 는 프로세스 간 공유 → 워커 자식 프로세스끼리도 같은 War3 를 중복 배정하지 않는다."""
+    if pid in _claim_handles:
+        return False
+    k32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    h = k32.CreateMutexW(None, False, f"Local\\PyNOX.War3.{pid}")
+    if not h:
+        return False
+    if ctypes.get_last_error() == 183:  # ERROR_ALREADY_EXISTS
+        k32.CloseHandle(h)
+        return False
+    _claim_handles[pid] = h
+    return True
+
+
+def _disown(pid: "int | None"):
+    h = _claim_handles.pop(pid, None)
+    if h:
+        ctypes.windll.kernel32.CloseHandle(h)
+
+
+def claim_war3(inst: War3Instance) -> bool:
+    """inst 에 War3 프로세스 배정. 이미 배정된 pid 가 살아있으면 유지,
+    없으면 아무도 잡지 않은 War3 중 pid 가 가장 작은 것을 배정."""
+    live = war3_pids()
+    with _claims_lock:
+        for pid in [p for p in _claim_handles if p not in live]:
+            _disown(pid)
+        if inst.pid in live:
+            _own(inst.pid)   # 부모가 미리 배정한 경우 등 → 실패해도 배정 유지
+            return True
+        inst.pid, inst.hwnd = None, None
+        for pid in live:
+            if _own(pid):
+                inst.pid = pid
+                return True
+    return False
+
+
+def release_war3(inst: "War3Instance | None"):
+    """배정 해제 (War3 종료 후 다음 프로세스를 새로 claim 하도록)."""
+    if inst is None:
+        return
+    with _claims_lock:
+        _disown(inst.pid)
+        inst.pid, inst.hwnd = None, None
+
+
+def iter_war3_processes():
+    """현재 인스턴스의 War3 프로세스 (인스턴스 미바인딩 시 모든 War3.exe)."""
+    inst = _current.get()
+    for p in psutil.process_iter(['name']):
+        name = p.info.get('name') or ""
+        if name.lower() != 'war3.exe':
+            continue
+        if inst is None or p.pid == inst.pid:
+            yield p
+
+
+def find_war3_process() -> "psutil.Process | None":
+    """현재 인스턴스의 War3 프로세스 (pid 미배정이면 claim). 미바인딩 시 첫 War3.exe."""
+    inst = _current.get()
+    if inst is not None and not claim_war3(inst):
+        return None
+    return next(iter_war3_processes(), None)
+
+
+def kill_war3_processes() -> int:
+    """현재 인스턴스의 War3 (미바인딩 시 모든 War3.exe) 강제 종료 → 종료 개수.
+    인스턴스 배정도 해제 → 재실행된 클라이언트를 다시 claim."""
+    killed = 0
+    for p in list(iter_war3_processes()):
+        p.kill()
+        killed += 1
+    release_war3(_current.get())
+    return killed
+
+
+def find_war3_hwnd(pid: "int | None" = None) -> "int | None":
+    """Warcraft III 창 핸들 반환. 없으면 None.
+    pid 미지정 시 현재 바인딩된 인스턴스의 창 (미바인딩이면 첫 번째 War3 창)."""
+    inst = None
+    if pid is None:
+        inst = _current.get()
+        if inst is not None:
+            if inst.pid is None:
+                return None
+            pid = inst.pid
+            h = inst.hwnd
+            if h and win32gui.IsWindow(h) and hwnd_pid(h) == pid:
+                return h
+
+    found = _war3_windows()
+    if pid is not None:
+        found = [h for h in found if hwnd_pid(h) == pid]
+    hwnd = found[0] if found else None
+    if inst is not None:
+        inst.hwnd = hwnd
+    return hwnd
 
 
 def kill_war3() -> bool:
@@ -27,11 +195,10 @@ def kill_war3() -> bool:
     hwnd = find_war3_hwnd()
     if not hwnd:
         return False
-    pid = ctypes.c_ulong(0)
-    ctypes.windll.user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
-    if not pid.value:
+    pid = hwnd_pid(hwnd)
+    if not pid:
         return False
-    handle = ctypes.windll.kernel32.OpenProcess(0x0001, False, pid.value)  # PROCESS_TERMINATE
+    handle = ctypes.windll.kernel32.OpenProcess(0x0001, False, pid)  # PROCESS_TERMINATE
     if not handle:
         return False
     ctypes.windll.kernel32.TerminateProcess(handle, 0)
@@ -48,3 +215,38 @@ def wait_for_hwnd(timeout: float = 60.0, interval: float = 1.0) -> "int | None":
             return hwnd
         time.sleep(interval)
     return None
+
+
+class CpuMeter:
+    """인스턴스 1개의 CPU 비용 (등록된 워커 스레드 합계 + 담당 War3 프로세스).
+    값은 코어 1개 기준 % — 100% 는 코어 1개 포화. 항상 실제 시간 기준으로 측정."""
+
+    def __init__(self):
+        self._tids: "set[int]" = set()
+        self._last: "tuple[float, float] | None" = None   # (wall, cpu)
+        self._war3: "psutil.Process | None" = None
+
+    def add_thread(self, native_id: "int | None" = None):
+        self._tids.add(native_id or threading.get_native_id())
+
+    def sample(self, pid: "int | None") -> "tuple[float, float | None]":
+        """(워커 CPU%, War3 CPU% | None). 첫 호출은 기준점만 기록하고 0 반환."""
+        wall = time.monotonic()
+        cpu  = sum(t.user_time + t.system_time
+                   for t in psutil.Process().threads() if t.id in self._tids)
+        worker_pct = 0.0
+        if self._last is not None and wall > self._last[0]:
+            worker_pct = max(0.0, (cpu - self._last[1]) / (wall - self._last[0]) * 100.0)
+        self._last = (wall, cpu)
+
+        war3_pct = None
+        if pid:
+            try:
+                if self._war3 is None or self._war3.pid != pid:
+                    self._war3 = psutil.Process(pid)
+                    self._war3.cpu_percent(None)
+                else:
+                    war3_pct = self._war3.cpu_percent(None)
+            except psutil.Error:
+                self._war3 = None
+        return worker_pct, war3_pct
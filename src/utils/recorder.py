@@ -0,0 +1,357 @@
+"""
+utils/recorder.py — 세션 녹화기 (프레임·입력·매칭 결과 링버퍼 → 실패 시 압축 아카이브 덤프 / 재생)
+실행: python -m src.utils.recorder info   <archive.pnxrec>
+      python -m src.utils.recorder replay <archive.pnxrec> [--diff-only]
+"""
+import argparse
+import collections
+import glob
+import io
+import json
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+from datetime import datetime
+
+import cv2
+import numpy as np
+
+from src.utils.config import _exe_dir
+
+try:
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None
+
+RECORD_DIR = os.path.join(_exe_dir(), "recordings")
+
+_MAGIC      = b"PNXREC1\0"
+_FOOTER     = struct.Struct("<QIQI")      # meta_off, meta_len, index_off, index_len
+_CODEC_ZLIB = 0
+_CODEC_ZSTD = 1
+_KIND_FRAME  = 0
+_KIND_EVENTS = 1
+_EVENTS_PER_CHUNK = 512
+
+# 아카이브 인덱스 (np.save 직렬화). 프레임 1개 또는 이벤트 청크 1개당 1행
+_INDEX_DTYPE = np.dtype([
+    ("kind", "u1"), ("codec", "u1"), ("key", "u1"),
+    ("seq", "u4"), ("t", "f8"), ("off", "u8"), ("size", "u4"),
+    ("w", "u2"), ("h", "u2"), ("ow", "u2"), ("oh", "u2"), ("c", "u1"),
+])
+
+
+def _compress(data: bytes, codec: int) -> bytes:
+    if codec == _CODEC_ZSTD:
+        return _zstd.ZstdCompressor(level=3).compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(data: bytes, codec: int) -> bytes:
+    if codec == _CODEC_ZSTD:
+        if _zstd is None:
+            raise RuntimeError("zstd 아카이브 → zstandard 패키지가 필요합니다.")
+        return _zstd.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class SessionRecorder:
+    """최근 화면·입력·매칭 결과를 메모리 링버퍼에 보관하는 녹화기.
+
+    - 프레임: 1/scale 축소 그레이, 키프레임 + 직전 프레임 XOR 델타 (zlib level 1)
+      알파 마스크 템플릿(41·42번 등)을 매칭한 프레임은 원본 해상도 컬러(BGR) 로 보관
+      → replay 가 같은 알고리즘(마스크 SQDIFF)·같은 픽셀로 재매칭
+    - 키프레임 그룹 단위로 오래된 것부터 버림 → 프레임 메모리 ≤ max_bytes
+    - 이벤트(입력·매칭·마커): 최근 max_events 개
+    - 매칭 결과는 프레임 seq 를 참조 → replay 로 같은 프레임에 다시 매칭 가능
+    """
+
+    def __init__(self, max_bytes: int = 64 << 20, max_events: int = 20000,
+                 scale: int = 2, keyframe_every: int = 30, min_interval: float = 0.0,
+                 out_dir: "str | None" = RECORD_DIR, keep: int = 10,
+                 clock=time.monotonic):
+        self._max_bytes = max(1 << 20, int(max_bytes))
+        self._scale     = max(1, int(scale))
+        self._key_every = max(1, int(keyframe_every))
+        self._min_iv    = max(0.0, float(min_interval))
+        self._dir       = out_dir
+        self._keep      = max(1, int(keep))
+        self._clock     = clock
+        self._lock      = threading.Lock()
+        self._groups: "collections.deque[list[tuple]]" = collections.deque()  # [(seq, t, key, w, h, ow, oh, payload)]
+        self._events: "collections.deque[dict]" = collections.deque(maxlen=max(100, int(max_events)))
+        self._bytes     = 0
+        self._seq       = 0
+        self._prev: "np.ndarray | None" = None
+        self._since_key = 0
+        self._last_obj  = None     # 마지막으로 기록한 프레임 객체 (동일 프레임 다중 매칭 → 1회 기록)
+        self._last_seq  = -1
+        self._last_color = False
+        self._last_t    = -1e18
+        self.dropped    = 0        # 링버퍼에서 밀려난 프레임 수
+
+    # ── 기록 ──────────────────────────────────────
+    def _next_seq(self) -> int:
+        self._seq += 1
+        return self._seq
+
+    def _add_frame(self, frame: "np.ndarray", color: bool = False) -> int:
+        """프레임 기록 (잠금 보유 상태에서 호출). 기록 안 했으면 -1.
+        color=True 면 컬러 유지 (같은 프레임이 그레이로만 기록돼 있으면 컬러로 다시 기록)."""
+        color = color and frame.ndim == 3
+        if frame is self._last_obj and (self._last_color or not color):
+            return self._last_seq
+        t = self._clock()
+        if frame is not self._last_obj and t - self._last_t < self._min_iv:
+            return -1
+        s     = 1 if color else self._scale   # 마스크 SQDIFF 는 축소·확대 오차에 민감 → 원본 해상도
+        oh, ow = frame.shape[:2]
+        small = frame[::s, ::s] if s > 1 else frame
+        if small.ndim == 3 and not color:
+            small = cv2.cvtColor(np.ascontiguousarray(small), cv2.COLOR_BGR2GRAY)
+        small = np.ascontiguousarray(small, dtype=np.uint8)
+
+        prev = self._prev
+        key  = prev is None or prev.shape != small.shape or self._since_key >= self._key_every \
+            or not self._groups
+        data = small if key else np.bitwise_xor(small, prev)
+        payload = zlib.compress(data.tobytes(), 1)
+
+        seq = self._next_seq()
+        h, w = small.shape[:2]
+        c = small.shape[2] if small.ndim == 3 else 1
+        if key:
+            self._groups.append([])
+            self._since_key = 0
+        self._groups[-1].append((seq, t, int(key), w, h, ow, oh, c, payload))
+        self._since_key += 1
+        self._bytes    += len(payload)
+        self._prev      = small
+        self._last_obj, self._last_seq, self._last_t = frame, seq, t
+        self._last_color = color
+
+        # 마지막(현재) 그룹은 남겨 두어야 델타 복원 가능
+        while self._bytes > self._max_bytes and len(self._groups) > 1:
+            old = self._groups.popleft()
+            self._bytes -= sum(len(f[8]) for f in old)
+            self.dropped += len(old)
+        return seq
+
+    def add_match(self, filename: str, frame: "np.ndarray | None", threshold: float,
+                  edges: bool, result: tuple, color: bool = False):
+        matched, conf, coords, _ = result
+        with self._lock:
+            fseq = self._add_frame(frame, color) if frame is not None else -1
+            self._events.append({
+                "seq": self._next_seq(), "t": self._clock(), "k": "match",
+                "name": filename, "frame": fseq, "thr": threshold, "edges": bool(edges),
+                "mask": bool(color),
+                "ok": bool(matched), "conf": round(float(conf), 5),
+                "xy": list(coords) if coords else None,
+            })
+
+    def add_event(self, kind: str, **fields):
+        with self._lock:
+            ev = {"seq": self._next_seq(), "t": self._clock(), "k": kind}
+            ev.update(fields)
+            self._events.append(ev)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"frames": sum(len(g) for g in self._groups), "bytes": self._bytes,
+                    "events": len(self._events), "dropped": self.dropped}
+
+    # ── 덤프 ──────────────────────────────────────
+    def dump(self, reason: str = "", path: "str | None" = None) -> "str | None":
+        """링버퍼 → 아카이브 파일. 경로 반환 (저장 실패 시 None).
+        보관 개수(keep) 초과분은 오래된 아카이브부터 삭제."""
+        with self._lock:
+            frames = [f for g in self._groups for f in g]
+            events = list(self._events)
+        if not frames and not events:
+            return None
+        if path is None:
+            if not self._dir:
+                return None
+            path = os.path.join(self._dir, f"rec_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pnxrec")
+        codec = _CODEC_ZSTD if _zstd is not None else _CODEC_ZLIB
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            rows = []
+            with open(path, "wb") as f:
+                f.write(_MAGIC)
+                for seq, t, key, w, h, ow, oh, c, payload in frames:
+                    rows.append((_KIND_FRAME, _CODEC_ZLIB, key, seq, t, f.tell(), len(payload), w, h, ow, oh, c))
+                    f.write(payload)
+                for i in range(0, len(events), _EVENTS_PER_CHUNK):
+                    chunk = events[i:i + _EVENTS_PER_CHUNK]
+                    blob  = _compress("\n".join(json.dumps(e, ensure_ascii=False) for e in chunk).encode("utf-8"), codec)
+                    rows.append((_KIND_EVENTS, codec, 0, chunk[0]["seq"], chunk[0]["t"], f.tell(), len(blob), 0, 0, 0, 0, 0))
+                    f.write(blob)
+                meta = json.dumps({"reason": reason, "created": datetime.now().isoformat(),
+                                   "scale": self._scale, "frames": len(frames), "events": len(events),
+                                   "dropped": self.dropped}, ensure_ascii=False).encode("utf-8")
+                meta_off = f.tell()
+                f.write(meta)
+                buf = io.BytesIO()
+                np.save(buf, np.array(rows, dtype=_INDEX_DTYPE), allow_pickle=False)
+                index_off = f.tell()
+                f.write(buf.getvalue())
+                f.write(_FOOTER.pack(meta_off, len(meta), index_off, buf.tell()))
+                f.write(_MAGIC)
+        except Exception:
+            return None
+        if self._dir and os.path.dirname(os.path.abspath(path)) == os.path.abspath(self._dir):
+            self._prune()
+        return path
+
+    def _prune(self):
+        files = sorted(glob.glob(os.path.join(self._dir, "rec_*.pnxrec")))
+        for old in files[:-self._keep]:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+
+
+def from_config(cfg: dict, clock=time.monotonic) -> "SessionRecorder | None":
+    """설정(recorder_*) 으로 녹화기 생성. 비활성화 시 None."""
+    if not cfg.get("recorder_enabled", False):
+        return None
+    return SessionRecorder(
+        max_bytes=int(cfg.get("recorder_max_mb", 64)) << 20,
+        max_events=cfg.get("recorder_max_events", 20000),
+        scale=cfg.get("recorder_scale", 2),
+        keyframe_every=cfg.get("recorder_keyframe", 30),
+        min_interval=cfg.get("recorder_min_interval", 0.0),
+        out_dir=cfg.get("recorder_dir") or RECORD_DIR,
+        keep=cfg.get("recorder_keep", 10),
+        clock=clock,
+    )
+
+
+# ── 전역 훅 (core/input.py, core/image_match.py 에서 호출) ─────────────────
+_active: "SessionRecorder | None" = None
+
+
+def install(rec: "SessionRecorder | None"):
+    global _active
+    _active = rec
+
+
+def active() -> "SessionRecorder | None":
+    return _active
+
+
+def note_event(kind: str, **fields):
+    rec = _active
+    if rec is not None:
+        rec.add_event(kind, **fields)
+
+
+def note_match(filename: str, frame, threshold: float, edges: bool, result: tuple, color: bool = False):
+    rec = _active
+    if rec is not None:
+        rec.add_match(filename, frame, threshold, edges, result, color)
+
+
+# ══════════════════════════════════════════════════
+#  아카이브 읽기 / 재생
+# ══════════════════════════════════════════════════
+class Archive:
+    """녹화 아카이브 리더. frames() 로 복원 프레임, events() 로 이벤트 순회."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._data = f.read()
+        d = self._data
+        if d[:len(_MAGIC)] != _MAGIC or d[-len(_MAGIC):] != _MAGIC:
+            raise ValueError(f"녹화 아카이브가 아닙니다: {path}")
+        foot = len(d) - len(_MAGIC) - _FOOTER.size
+        meta_off, meta_len, index_off, index_len = _FOOTER.unpack_from(d, foot)
+        self.meta  = json.loads(d[meta_off:meta_off + meta_len].decode("utf-8"))
+        self.index = np.load(io.BytesIO(d[index_off:index_off + index_len]), allow_pickle=False)
+
+    def events(self):
+        for row in self.index[self.index["kind"] == _KIND_EVENTS]:
+            blob = self._data[int(row["off"]):int(row["off"]) + int(row["size"])]
+            for line in _decompress(blob, int(row["codec"])).decode("utf-8").splitlines():
+                yield json.loads(line)
+
+    def frames(self, full_size: bool = True):
+        """(seq, t, frame) 순회. full_size=True 면 원래 해상도로 확대 (최근접 보간)."""
+        prev = None
+        has_c = "c" in self.index.dtype.names   # 컬러 필드 이전 아카이브는 전부 그레이
+        for row in self.index[self.index["kind"] == _KIND_FRAME]:
+            blob = self._data[int(row["off"]):int(row["off"]) + int(row["size"])]
+            c    = int(row["c"]) if has_c else 1
+            shape = (int(row["h"]), int(row["w"])) + ((c,) if c > 1 else ())
+            data = np.frombuffer(zlib.decompress(blob), dtype=np.uint8).reshape(shape)
+            if row["key"]:
+                cur = data.copy()
+            elif prev is None or prev.shape != data.shape:
+                continue   # 앞쪽 키프레임이 잘린 델타 → 복원 불가
+            else:
+                cur = np.bitwise_xor(prev, data)
+            prev = cur
+            out = cur
+            if full_size and (cur.shape[1], cur.shape[0]) != (int(row["ow"]), int(row["oh"])):
+                out = cv2.resize(cur, (int(row["ow"]), int(row["oh"])), interpolation=cv2.INTER_NEAREST)
+            yield int(row["seq"]), float(row["t"]), out
+
+
+def replay(path: str) -> "list[dict]":
+    """기록된 매칭을 같은 프레임에 다시 수행 → [{seq, name, ok, conf, replay_ok, replay_conf}].
+    마스크 템플릿을 매칭한 프레임은 원본 컬러로 저장돼 같은 알고리즘(마스크 SQDIFF)으로 재매칭된다.
+    그 밖의 프레임은 축소 그레이라 원본과 신뢰도가 다를 수 있으나, 같은 아카이브는 항상 같은 결과."""
+    from src.core.image_match import _match_frame_raw
+    arc     = Archive(path)
+    matches = collections.defaultdict(list)
+    for ev in arc.events():
+        if ev.get("k") == "match" and ev.get("frame", -1) >= 0:
+            matches[ev["frame"]].append(ev)
+    out = []
+    for seq, _, frame in arc.frames():
+        for ev in matches.pop(seq, ()):
+            ok, conf, _, _ = _match_frame_raw(ev["name"], frame, ev["thr"], edges=ev["edges"])
+            out.append({"seq": ev["seq"], "name": ev["name"], "ok": ev["ok"], "conf": ev["conf"],
+                        "replay_ok": bool(ok), "replay_conf": round(float(conf), 5)})
+    out.sort(key=lambda r: r["seq"])
+    return out
+
+
+def main(argv: "list[str] | None" = None) -> int:
+    ap = argparse.ArgumentParser(description="PyNOX 세션 녹화 아카이브 도구")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p_info = sub.add_parser("info", help="아카이브 요약 + 이벤트 목록")
+    p_info.add_argument("path")
+    p_info.add_argument("--events", action="store_true", help="이벤트 전체 출력")
+    p_rep = sub.add_parser("replay", help="기록된 매칭을 저장 프레임으로 재실행")
+    p_rep.add_argument("path")
+    p_rep.add_argument("--diff-only", action="store_true", help="판정이 달라진 항목만 출력")
+    a = ap.parse_args(argv)
+
+    if a.cmd == "info":
+        arc = Archive(a.path)
+        print(json.dumps(arc.meta, ensure_ascii=False, indent=2))
+        if a.events:
+            for ev in arc.events():
+                print(json.dumps(ev, ensure_ascii=False))
+        return 0
+
+    rows = replay(a.path)
+    diff = [r for r in rows if r["ok"] != r["replay_ok"]]
+    for r in (diff if a.diff_only else rows):
+        mark = "≠" if r["ok"] != r["replay_ok"] else " "
+        print(f"{mark} #{r['seq']:<7} {r['name']:<28} 기록 {r['ok']!s:<5} {r['conf']:.3f}"
+              f"  → 재생 {r['replay_ok']!s:<5} {r['replay_conf']:.3f}")
+    print(f"매칭 {len(rows)}건 / 판정 불일치 {len(diff)}건")
+    return 1 if diff else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
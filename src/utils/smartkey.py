@@ -3,7 +3,6 @@ utils/smartkey.py — WH_KEYBOARD_LL 저수준 키보드 후킹 (스마트키)
 """
 import ctypes
 import ctypes.wintypes
-import os
 import queue
 import threading
 import time
@@ -12,6 +11,7 @@ from src.core.input import (
     _user32, _KBD_INPUT, _MOUSE_INPUT,
     _KEYEVENTF_KEYUP, _MOUSEEVENTF_LEFTDOWN, _MOUSEEVENTF_LEFTUP,
 )
+from src.utils.chat import chat_dispatcher
 from src.utils.process import find_war3_hwnd
 
 
@@ -55,37 +55,40 @@ class SmartKeyHookManager:
         self._in_game      = False
         self._queue: "queue.Queue" = queue.Queue()
         self._chat_cmds: dict = {}
-        self._chat_queue: "queue.Queue" = queue.Queue()
         self._exit_vk      = 0
         self._generation   = 0  # 스레드 세대 카운터 — 중복 기동 방지
-
-    # ── 채팅 & 인게임 상태 폴링 ──────────────────────
-    def _poll_chat(self, gen: int):
-        import pymem
-        import pymem.process
-        pm = None
-        base = 0
-        while self._active and self._generation == gen:
-            try:
-                if pm is None:
-                    pm = pymem.Pymem("war3.exe")
-                    base = 0
-                    for mod in pymem.process.enum_process_module(pm.process_handle):
-                        if os.path.basename(mod.name).lower() == "game.dll":
-                            base = mod.lpBaseOfDll
-                            break
-                if base:
-                    self._chat_open = bool(pm.read_int(base + 0xD04FEC))
-                    a = pm.read_int(base + 0xD32318)
-                    b = pm.read_int(base + 0xD3231C)
-                    self._in_game = (a == 4 and b == 4) or \
-                                    (a == 1 and b == 1)
-            except Exception:
-                pm = None
-                base = 0
-                self._chat_open = False
-                self._in_game   = False
-            time.sleep(0.05)
+        self._memstate     = None  # MemStatePublisher (활성 중에만)
+        self._memstate_unsub = None
+
+    # ── 채팅 & 인게임 상태 (메모리 상태 퍼블리셔 구독) ─────
+    # 퍼블리셔는 프로세스 단위 공유: 워커가 같은 프로세스(QThread)면 워커의 폴링 스레드를 함께 쓰고,
+    # worker_process(기본)면 워커 퍼블리셔는 자식 프로세스에 있으므로 여기서 별도로 메모리를 읽는다.
+    def _attach_memstate(self):
+        from src.utils.memstate import acquire_publisher
+        self._detach_memstate()
+        pub = acquire_publisher()
+
+        def _on_state(st):
+            self._chat_open = st.chat_open
+            self._in_game   = bool(st.ok and st.in_game)
+
+        self._memstate_unsub = pub.subscribe(_on_state)
+        _on_state(pub.snapshot())
+        self._memstate = pub
+
+    def _detach_memstate(self):
+        from src.utils.memstate import release_publisher
+        pub, unsub = self._memstate, self._memstate_unsub
+        self._memstate = self._memstate_unsub = None
+        if unsub is not None:
+            unsub()
+        release_publisher(pub)
+        self._chat_open = False
+        self._in_game   = False
+
+    def _deactivate(self):
+        self._active = False
+        self._detach_memstate()
 
     # ── 키 전송 스레드 (SendInput은 항상 여기서) ──────
     def _sender(self, gen: int):
@@ -129,20 +132,6 @@ class SmartKeyHookManager:
             except Exception:
                 pass
 
-    # ── 채팅 커맨드 전송 스레드 ────────────────────────
-    def _chat_sender(self, gen: int):
-        from src.utils.memory import send_chat_memory
-        while self._active and self._generation == gen:
-            try:
-                text = self._chat_queue.get(timeout=0.1)
-                hwnd = find_war3_hwnd()
-                if hwnd:
-                    send_chat_memory(hwnd, text, hide=True)
-            except queue.Empty:
-                pass
-            except Exception:
-                pass
-
     # ── 후킹 스레드 (메시지 루프) ────────────────────
     def _hook_thread_func(self, gen: int):
         def _callback(nCode, wParam, lParam):
@@ -150,6 +139,9 @@ class SmartKeyHookManager:
                 ks = ctypes.cast(lParam, ctypes.POINTER(_KBDLLHOOKSTRUCT)).contents
                 if not (ks.flags & _LLKHF_INJECTED):
                     vk = ks.vkCode
+                    pub = self._memstate   # stop() 이 다른 스레드에서 해제할 수 있음
+                    if vk == 0x0D and pub is not None:
+                        pub.boost()   # Enter → 채팅창 열림/닫힘을 빠르게 반영
                     if vk in _SMART_VKS:
                         hwnd = find_war3_hwnd()
                         if hwnd and _user32.GetForegroundWindow() == hwnd:
@@ -160,7 +152,8 @@ class SmartKeyHookManager:
                         hwnd = find_war3_hwnd()
                         if hwnd and _user32.GetForegroundWindow() == hwnd:
                             if self._in_game and not self._chat_open:
-                                self._chat_queue.put(self._chat_cmds[vk])
+                                # 채팅 디스패처 큐 (같은 명령 연타는 1회로 병합)
+                                chat_dispatcher().submit(self._chat_cmds[vk], hide=True, hwnd=hwnd)
                                 return 1
                     if self._exit_vk and vk == self._exit_vk:
                         hwnd = find_war3_hwnd()
@@ -203,9 +196,8 @@ class SmartKeyHookManager:
     def _start_threads(self):
         self._generation += 1
         gen = self._generation
-        threading.Thread(target=self._poll_chat,        args=(gen,), daemon=True).start()
+        self._attach_memstate()
         threading.Thread(target=self._sender,           args=(gen,), daemon=True).start()
-        threading.Thread(target=self._chat_sender,      args=(gen,), daemon=True).start()
         threading.Thread(target=self._hook_thread_func, args=(gen,), daemon=True).start()
 
     def start(self, hero_vk: int):
@@ -218,7 +210,7 @@ class SmartKeyHookManager:
     def stop(self):
         self._smart_active = False
         if not self._chat_cmds and not self._exit_vk:
-            self._active = False
+            self._deactivate()
 
     def update_chat_cmds(self, cmds: dict):
         self._chat_cmds = cmds
@@ -226,7 +218,7 @@ class SmartKeyHookManager:
             self._active = True
             self._start_threads()
         elif not cmds and not self._smart_active and not self._exit_vk:
-            self._active = False
+            self._deactivate()
 
     def update_exit_cmd(self, vk: int):
         self._exit_vk = vk
@@ -234,7 +226,7 @@ class SmartKeyHookManager:
             self._active = True
             self._start_threads()
         elif not vk and not self._smart_active and not self._chat_cmds:
-            self._active = False
+            self._deactivate()
 
 
 # 싱글턴 인스턴스
@@ -0,0 +1,140 @@
+"""
+utils/trace.py — 재접속 파이프라인 지연 추적 (중첩 span → 사이클별 Chrome trace JSON)
+"""
+import collections
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+from src.utils.config import _exe_dir
+
+TRACE_DIR = os.path.join(_exe_dir(), "traces")
+
+
+class TraceCycle:
+    """사이클 1회 (War3 재시작 → 사냥터 복귀) 동안 기록된 span 목록."""
+
+    __slots__ = ("name", "started_at", "t0", "events", "ok", "path")
+
+    def __init__(self, name: str, t0: float):
+        self.name       = name
+        self.started_at = datetime.now()
+        self.t0         = t0
+        self.events: "list[tuple[str, float, float, int, int, dict | None]]" = []  # (name, start, dur, depth, tid, args)
+        self.ok         = False
+        self.path: "str | None" = None
+
+    @property
+    def total(self) -> float:
+        root = [e for e in self.events if e[3] == 0]
+        return sum(e[2] for e in root)
+
+    def breakdown(self) -> "list[tuple[int, str, float]]":
+        """(depth, 이름, 소요초) 목록 — 시작 시각 순. UI 표 표시용."""
+        return [(d, n, dur) for n, _, dur, d, _, _ in sorted(self.events, key=lambda e: (e[1], e[3]))]
+
+    def to_chrome(self) -> dict:
+        """Chrome trace (chrome://tracing, Perfetto) 포맷. 'X'(complete) 이벤트, µs 단위."""
+        pid = os.getpid()
+        evs = []
+        for name, start, dur, depth, tid, args in self.events:
+            ev = {"name": name, "ph": "X", "pid": pid, "tid": tid,
+                  "ts": round((start - self.t0) * 1e6, 1), "dur": round(dur * 1e6, 1)}
+            if args:
+                ev["args"] = args
+            evs.append(ev)
+        return {"traceEvents": evs, "displayTimeUnit": "ms",
+                "otherData": {"cycle": self.name, "started_at": self.started_at.isoformat(),
+                              "ok": self.ok}}
+
+
+class Tracer:
+    """경량 span 기록기. span 은 메모리에만 누적하고 사이클 종료 시 1회 내보낸다.
+
+    - begin_cycle(): 새 사이클 시작 (진행 중 사이클은 미완료로 종료)
+    - span(name): 중첩 가능한 컨텍스트 매니저 (스레드별 depth)
+    - end_cycle(ok): 사이클 종료 → Chrome trace JSON 저장 후 TraceCycle 반환
+    """
+
+    def __init__(self, keep: int = 20, export_dir: "str | None" = TRACE_DIR,
+                 clock=time.perf_counter):
+        self._clock  = clock
+        self._dir    = export_dir
+        self._lock   = threading.Lock()
+        self._local  = threading.local()
+        self._cycle: "TraceCycle | None" = None
+        self._root_t = 0.0
+        self.cycles: "collections.deque[TraceCycle]" = collections.deque(maxlen=keep)
+
+    @property
+    def active(self) -> bool:
+        return self._cycle is not None
+
+    # ── 사이클 ────────────────────────────────────
+    def begin_cycle(self, name: str = "cycle") -> TraceCycle:
+        if self._cycle is not None:
+            self.end_cycle(ok=False)
+        t = self._clock()
+        with self._lock:
+            self._cycle  = TraceCycle(name, t)
+            self._root_t = t
+        return self._cycle
+
+    def end_cycle(self, ok: bool = True) -> "TraceCycle | None":
+        with self._lock:
+            cyc, self._cycle = self._cycle, None
+            if cyc is None:
+                return None
+            cyc.events.append((cyc.name, self._root_t, self._clock() - self._root_t,
+                               0, threading.get_ident(), None))
+            cyc.ok = ok
+            self.cycles.append(cyc)
+        if self._dir:
+            try:
+                os.makedirs(self._dir, exist_ok=True)
+                cyc.path = os.path.join(
+                    self._dir, f"cycle_{cyc.started_at.strftime('%Y%m%d_%H%M%S')}.json")
+                with open(cyc.path, "w", encoding="utf-8") as f:
+                    json.dump(cyc.to_chrome(), f, ensure_ascii=False)
+            except Exception:
+                cyc.path = None
+        return cyc
+
+    # ── span ──────────────────────────────────────
+    @contextlib.contextmanager
+    def span(self, name: str, **args):
+        cyc = self._cycle
+        if cyc is None:
+            yield
+            return
+        depth = getattr(self._local, "depth", 0) + 1
+        self._local.depth = depth
+        start = self._clock()
+        try:
+            yield
+        finally:
+            dur = self._clock() - start
+            self._local.depth = depth - 1
+            with self._lock:
+                # append 는 사이클 교체와 경합하지 않도록 잠금 (기록 자체는 튜플 1개)
+                cyc.events.append((name, start, dur, depth, threading.get_ident(), args or None))
+
+
+def traced(name: "str | None" = None):
+    """메서드 데코레이터. self._tracer 의 span 으로 감싼다 (트레이서가 없으면 그대로 실행)."""
+    def deco(fn):
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(self, *a, **kw):
+            tracer = getattr(self, "_tracer", None)
+            if tracer is None:
+                return fn(self, *a, **kw)
+            with tracer.span(label):
+                return fn(self, *a, **kw)
+        return wrapper
+    return deco
@@ -0,0 +1,165 @@
+"""
+tests/test_cancel.py — 중지 지연: 워커의 사냥 중 감시(Phase 2) 와 같은 토큰 구조에서
+중지·사망·보스 타이머 만료가 대기를 몇 ms 안에 해제하는지 확인
++ SimScreen 위에서 실제 WatchWorker 를 돌려 긴 대기 중 stop() → FinishedEvent 지연 확인
+"""
+import threading
+import time
+
+import pytest
+
+from src.core.cancel import CancelToken
+from src.core.clock import VirtualClock
+from src.core.scheduler import Scheduler
+from src.sim.platform import install_platform_shims
+
+
+def _phase2_tokens(clock=None):
+    """워커와 같은 구조: 중지 토큰 → 사망 토큰(_subscribe_death) → 보스 토큰(death.child())."""
+    stop  = CancelToken(clock=clock)
+    death = stop.child()
+    boss  = death.child()
+    return stop, death, boss
+
+
+def _wake_latency(waiter: CancelToken, trigger) -> float:
+    """waiter.wait() 중인 스레드가 trigger() 후 깨어날 때까지 걸린 초."""
+    woke: "list[float]" = []
+    started = threading.Event()
+
+    def _run():
+        started.set()
+        waiter.wait()
+        woke.append(time.perf_counter())
+
+    t = threading.Thread(target=_run, daemon=True)
+    t.start()
+    started.wait()
+    time.sleep(0.02)   # 대기 진입
+    t0 = time.perf_counter()
+    trigger()
+    t.join(timeout=1.0)
+    assert not t.is_alive(), "대기가 해제되지 않음"
+    return woke[0] - t0
+
+
+def test_stop_releases_phase2_wait_within_ms():
+    stop, _, boss = _phase2_tokens()
+    assert _wake_latency(boss, stop.cancel) < 0.02
+
+
+def test_death_releases_phase2_wait_within_ms():
+    stop, death, boss = _phase2_tokens()
+    assert _wake_latency(boss, death.cancel) < 0.02
+    assert not stop.cancelled          # 사망은 중지 토큰에 영향 없음
+
+
+def test_boss_timer_releases_only_boss_token():
+    stop, death, boss = _phase2_tokens()
+    assert _wake_latency(boss, boss.set) < 0.02
+    assert not death.cancelled and not stop.cancelled
+
+
+def test_boss_timer_fires_at_virtual_deadline_and_stop_before_it():
+    clock = VirtualClock()
+    sched = Scheduler(clock=clock)
+    sched.start()
+    try:
+        # 보스 타이머 만료 → 가상 시간 600초에 깨어남 (실제로는 즉시)
+        stop, death, boss = _phase2_tokens(clock)
+        sched.call_later(600.0, boss.set)
+        with clock.participant():
+            t0 = time.perf_counter()
+            assert boss.wait(3600.0)
+            assert clock.now() == 600.0
+        assert time.perf_counter() - t0 < 0.5
+
+        # 중지가 먼저 오면 보스 타이머를 기다리지 않음
+        stop, death, boss = _phase2_tokens(clock)
+        sched.call_later(600.0, boss.set)
+        sched.call_later(5.0, stop.cancel)
+        with clock.participant():   # 블록을 나가면 남은 보스 타이머까지 시간이 점프하므로 안에서 확인
+            assert boss.wait(3600.0)
+            assert clock.now() == 605.0
+    finally:
+        sched.close()
+
+
+# ── 워커 전체: SimScreen + SimBackends + VirtualClock ──
+@pytest.fixture
+def sim_config(tmp_path):
+    """src.sim.bench.run_bench 와 같은 임시 설정 파일 (승객 흐름, 부가 루틴 OFF)."""
+    install_platform_shims()
+    from src.utils import config as _config
+    from src.utils.crypto import encrypt_password
+    from src.sim.bench import SIM_CONFIG
+
+    saved = _config.CONFIG_FILE
+    _config.CONFIG_FILE = str(tmp_path / "wc3_config.json")
+    _config._cfg_cache  = None
+    cfg = dict(SIM_CONFIG, bnet_password=encrypt_password("sim"))
+    _config.save_config(cfg)
+    try:
+        yield cfg
+    finally:
+        _config.CONFIG_FILE = saved
+        _config._cfg_cache  = None
+
+
+def _settle(clock: VirtualClock, timeout: float = 10.0):
+    """테스트 스레드를 뺀 참여 스레드가 모두 시계 대기에 들어갈 때까지 기다린다
+    (진행 중인 템플릿 매칭이 끝나고 워커가 긴 대기에 들어간 상태)."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with clock._cond:
+            if clock._blocked >= clock._registered - 1:
+                return
+        time.sleep(0.005)
+    raise AssertionError("워커가 대기 상태에 들어가지 않음")
+
+
+def _worker_stop_latency(cfg: dict, marker: str, trace_dir: str) -> float:
+    """marker 로그가 나온 직후(= 긴 대기 진입) stop() → FinishedEvent 까지 걸린 실제 초."""
+    from src.core.events import FinishedEvent
+    from src.macro.worker import WatchWorker
+    from src.sim.screen import SimScreen, guest_graph
+    from src.sim.backends import SimBackends
+    from src.utils.trace import Tracer
+
+    clock    = VirtualClock()
+    reached  = clock.event()
+    finished = clock.event()
+    screen   = SimScreen(graph=guest_graph(cfg.get("character")), clock=clock.now)
+
+    with SimBackends(screen):
+        worker = WatchWorker(clock=clock)
+        worker._tracer = Tracer(export_dir=trace_dir, clock=clock.now)
+        worker.log_signal.connect(lambda msg, _lvl: marker in msg and reached.set())
+        worker.events.subscribe(FinishedEvent, lambda _ev: finished.set())
+        th = threading.Thread(target=worker.start, name="test-worker", daemon=True)
+        # 테스트 스레드도 참여자: 시계 밖에서 멈춰 있는 동안 가상 시간이 흐르지 않아
+        # 워커가 marker 직후의 대기에 머문다
+        with clock.participant():
+            th.start()
+            try:
+                assert clock.wait(reached, 600.0), f"{marker!r} 단계에 도달하지 못함"
+                _settle(clock)
+                t0 = time.perf_counter()
+                worker.stop()
+                assert clock.wait(finished, 60.0), "FinishedEvent 미수신"
+                latency = time.perf_counter() - t0
+            finally:
+                worker.stop()
+        th.join(timeout=5.0)
+    assert not th.is_alive(), "워커 스레드가 종료되지 않음"
+    return latency
+
+
+def test_worker_stop_during_loading_wait(sim_config, tmp_path):
+    # 11.로딩완료.png 대기 (최대 300초) 중 중지
+    assert _worker_stop_latency(sim_config, "11.로딩완료.png 대기 중", str(tmp_path / "traces")) < 0.05
+
+
+def test_worker_stop_during_ingame_watch(sim_config, tmp_path):
+    # 인게임 루틴 완료 후 이벤트 감시 대기 중 중지
+    assert _worker_stop_latency(sim_config, "이벤트 대기 중", str(tmp_path / "traces")) < 0.05